@@ -17,6 +17,7 @@
 ################################################################################
 
 from enum import Enum
+from functools import lru_cache
 
 from typing import List
 
@@ -40,15 +41,45 @@ class RowKind(Enum):
             return '-D'
 
 
+# RowKind instances indexed by their values, which is cheaper than RowKind(value)
+_ROW_KINDS = tuple(RowKind(i) for i in range(len(RowKind)))
+
+
 def _create_row(fields, values, row_kind: RowKind = None):
     row = Row(*values)
     if fields is not None:
-        row._fields = fields
+        row.set_field_names(fields)
     if row_kind is not None:
         row.set_row_kind(row_kind)
     return row
 
 
+@lru_cache(maxsize=1024)
+def _create_field_index(fields: tuple) -> dict:
+    """
+    Creates the mapping from field name to field position, which is shared by all the rows with
+    the same field names. The first position wins for duplicate field names, the same as
+    list.index.
+    """
+    field_index = {}
+    for i, name in enumerate(fields):
+        field_index.setdefault(name, i)
+    return field_index
+
+
+def _create_row_with_schema(values: list, fields: List, field_index, row_kind_value: int):
+    """
+    Creates a Row without going through Row.__init__. It's used in the hot path of the coders
+    which decode rows of the same schema over and over again.
+    """
+    row = Row.__new__(Row)
+    row._values = values
+    row._fields = fields
+    row._field_index = field_index
+    row._row_kind = _ROW_KINDS[row_kind_value]
+    return row
+
+
 class Row(object):
     """
     A row in Table.
@@ -94,6 +125,8 @@ class Row(object):
         Row(name='Alice', age=11)
     """
 
+    __slots__ = ('_fields', '_values', '_from_dict', '_row_kind', '_field_index')
+
     def __init__(self, *args, **kwargs):
         if args and kwargs:
             raise ValueError("Can not use both args "
@@ -104,6 +137,7 @@ class Row(object):
             self._from_dict = True
         else:
             self._values = list(args)
+        self._field_index = None
         self._row_kind = RowKind.INSERT
 
     def as_dict(self, recursive=False):
@@ -149,16 +183,24 @@ class Row(object):
 
     def set_field_names(self, field_names: List):
         self._fields = field_names
+        self._field_index = None
 
     def get_fields_by_names(self, names: List[str]):
-        if not hasattr(self, '_fields') or names == self._fields:
+        if not hasattr(self, '_fields') or names is self._fields or names == self._fields:
             return self._values
 
-        difference = list(set(names).difference(set(self._fields)))
+        field_index = self._get_field_index()
+        difference = [name for name in names if name not in field_index]
         if difference:
             raise Exception("Field names {0} not exist in {1}.".format(difference, self._fields))
         else:
-            return [self._values[self._fields.index(name)] for name in names]
+            return [self._values[field_index[name]] for name in names]
+
+    def _get_field_index(self) -> dict:
+        field_index = self._field_index
+        if field_index is None:
+            field_index = self._field_index = _create_field_index(tuple(self._fields))
+        return field_index
 
     def _is_retract_msg(self):
         return self._row_kind == RowKind.UPDATE_BEFORE or self._row_kind == RowKind.DELETE
@@ -189,47 +231,37 @@ class Row(object):
         if isinstance(item, (int, slice)):
             return self._values[item]
         try:
-            # it will be slow when it has many fields,
-            # but this will not be used in normal cases
-            idx = self._fields.index(item)
+            idx = self._get_field_index()[item]
+        except KeyError:
+            raise ValueError(item)
+        try:
             return self._values[idx]
         except IndexError:
             raise KeyError(item)
-        except ValueError:
-            raise ValueError(item)
 
     def __setitem__(self, key, value):
         if isinstance(key, (int, slice)):
             self._values[key] = value
             return
         try:
-            # it will be slow when it has many fields,
-            # but this will not be used in normal cases
-            idx = self._fields.index(key)
-            self._values[idx] = value
-        except (IndexError, AttributeError):
+            idx = self._get_field_index()[key]
+        except AttributeError:
             raise KeyError(key)
-        except ValueError:
+        except KeyError:
             raise ValueError(value)
+        try:
+            self._values[idx] = value
+        except IndexError:
+            raise KeyError(key)
 
     def __getattr__(self, item):
         if item.startswith("_"):
             raise AttributeError(item)
         try:
-            # it will be slow when it has many fields,
-            # but this will not be used in normal cases
-            idx = self._fields.index(item)
-            return self[idx]
-        except IndexError:
-            raise AttributeError(item)
-        except ValueError:
+            return self._values[self._get_field_index()[item]]
+        except (IndexError, KeyError):
             raise AttributeError(item)
 
-    def __setattr__(self, key, value):
-        if key != '_fields' and key != "_from_dict" and key != "_row_kind" and key != "_values":
-            raise AttributeError(key)
-        self.__dict__[key] = value
-
     def __reduce__(self):
         """
         Returns a tuple so Python knows how to pickle Row.
@@ -258,10 +290,12 @@ class Row(object):
             if sorted(self._fields) != sorted(other._fields):
                 return False
             sorted_fields = sorted(self._fields)
+            self_field_index = self._get_field_index()
+            other_field_index = other._get_field_index()
             return (self.__class__ == other.__class__ and
                     self._row_kind == other._row_kind and
-                    [self._values[self._fields.index(name)] for name in sorted_fields] ==
-                    [other._values[other._fields.index(name)] for name in sorted_fields])
+                    [self._values[self_field_index[name]] for name in sorted_fields] ==
+                    [other._values[other_field_index[name]] for name in sorted_fields])
         else:
             if hasattr(other, "_fields"):
                 return False
@@ -17,7 +17,7 @@
 ################################################################################
 import abc
 
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from pyflink.common.time import Duration
 from pyflink.java_gateway import get_gateway
@@ -35,6 +35,7 @@ class WatermarkStrategy(object):
     def __init__(self, j_watermark_strategy):
         self._j_watermark_strategy = j_watermark_strategy
         self._timestamp_assigner = None
+        self._timestamp_field = None
 
     def with_timestamp_assigner(self, timestamp_assigner: 'TimestampAssigner') -> \
             'WatermarkStrategy':
@@ -52,6 +53,37 @@ class WatermarkStrategy(object):
         :return: A WaterMarkStrategy that wraps a TimestampAssigner.
         """
         self._timestamp_assigner = timestamp_assigner
+        self._timestamp_field = None
+        return self
+
+    def with_timestamp_field(self, field: Union[int, str]) -> 'WatermarkStrategy':
+        """
+        Creates a new WatermarkStrategy that wraps this strategy but instead uses the given field
+        of the elements as their timestamps, in milliseconds since the Epoch.
+
+        If the type of the DataStream is declared as :code:`Types.ROW`, :code:`Types.ROW_NAMED` or
+        :code:`Types.TUPLE`, the timestamps are extracted in the JVM without sending the elements
+        to the Python worker. The field should then be of type :code:`Types.BYTE`,
+        :code:`Types.SHORT`, :code:`Types.INT`, :code:`Types.LONG`, :code:`Types.INSTANT` or
+        :code:`Types.SQL_TIMESTAMP`. Otherwise, the field should be an int and it's extracted in
+        the Python worker.
+
+        Example:
+        ::
+
+            >>> watermark_strategy = WatermarkStrategy.for_monotonous_timestamps() \\
+            >>>     .with_timestamp_field("event_time")
+
+        :param field: The index or the name of the field which holds the timestamp.
+        :return: A WaterMarkStrategy that extracts the timestamps from the given field.
+
+        .. versionadded:: 1.16.0
+        """
+        if not isinstance(field, (int, str)):
+            raise TypeError("The timestamp field should be a field index or a field name, "
+                            "but is %s." % type(field))
+        self._timestamp_field = field
+        self._timestamp_assigner = None
         return self
 
     def with_idleness(self, idle_timeout: Duration) -> 'WatermarkStrategy':
@@ -176,6 +208,19 @@ class TimestampAssigner(abc.ABC):
         pass
 
 
+class FieldTimestampAssigner(TimestampAssigner):
+    """
+    Used to extract the timestamps from the given field of the elements in the Python worker, i.e.
+    when the type of the elements is not declared as a Row or Tuple type.
+    """
+
+    def __init__(self, field: Union[int, str]):
+        self._field = field
+
+    def extract_timestamp(self, value: Any, record_timestamp: int) -> int:
+        return value[self._field]
+
+
 class AssignerWithPeriodicWatermarksWrapper(object):
     """
     The AssignerWithPeriodicWatermarks assigns event time timestamps to elements, and generates
@@ -22,8 +22,10 @@ from py4j.java_collections import ListConverter
 from typing import Callable, Union, List, cast, Optional, overload
 
 from pyflink.common import typeinfo, ExecutionConfig, Row
-from pyflink.common.typeinfo import RowTypeInfo, Types, TypeInformation, _from_java_type
-from pyflink.common.watermark_strategy import WatermarkStrategy, TimestampAssigner
+from pyflink.common.typeinfo import RowTypeInfo, Types, TypeInformation, _from_java_type, \
+    TupleTypeInfo, BasicTypeInfo, BasicType, TimestampTypeInfo
+from pyflink.common.watermark_strategy import WatermarkStrategy, TimestampAssigner, \
+    FieldTimestampAssigner
 from pyflink.datastream.connectors import Sink
 from pyflink.datastream.functions import (_get_python_env, FlatMapFunction, MapFunction, Function,
                                           FunctionWrapper, SinkFunction, FilterFunction,
@@ -37,16 +39,17 @@ from pyflink.datastream.functions import (_get_python_env, FlatMapFunction, MapF
                                           InternalSingleValueWindowFunction,
                                           InternalSingleValueProcessWindowFunction,
                                           PassThroughWindowFunction, AggregateFunction,
-                                          NullByteKeySelector, AllWindowFunction,
+                                          NullByteKeySelector, FieldKeySelector,
+                                          AllWindowFunction,
                                           InternalIterableAllWindowFunction,
                                           ProcessAllWindowFunction,
                                           InternalIterableProcessAllWindowFunction,
-                                          BroadcastProcessFunction)
+                                          BroadcastProcessFunction, InternalBatchFunction)
 from pyflink.datastream.output_tag import OutputTag
 from pyflink.datastream.slot_sharing_group import SlotSharingGroup
 from pyflink.datastream.state import ValueStateDescriptor, ValueState, ListStateDescriptor, \
     StateDescriptor, ReducingStateDescriptor, AggregatingStateDescriptor, MapStateDescriptor
-from pyflink.datastream.utils import convert_to_python_obj
+from pyflink.datastream.utils import convert_to_python_objs, to_arrow_schema
 from pyflink.datastream.window import (CountTumblingWindowAssigner, CountSlidingWindowAssigner,
                                        CountWindowSerializer, TimeWindowSerializer, Trigger,
                                        WindowAssigner, WindowOperationDescriptor,
@@ -348,17 +351,114 @@ class DataStream(object):
         return self.process(FlatMapProcessFunctionAdapter(func), output_type) \
             .name("FlatMap")
 
+    def map_batch(self,
+                  func: Callable,
+                  batch_size: int = 1000,
+                  output_type: TypeInformation = None) -> 'DataStream':
+        """
+        Applies a vectorized Map transformation on a DataStream. The elements of the DataStream are
+        processed in batches of at most batch_size elements. Each batch is passed to the function
+        as a pyarrow.RecordBatch whose columns are the fields of the elements, or a single column
+        named 'f0' if the elements are not rows or tuples. The function returns a
+        pyarrow.RecordBatch, pyarrow.Table or pandas.DataFrame whose rows are the output elements,
+        exactly one row for every element of the batch. The output elements keep the timestamps of
+        the corresponding input elements.
+
+        Example:
+        ::
+
+            >>> import pyarrow as pa
+            >>> import pyarrow.compute as pc
+            >>> ds.map_batch(
+            ...     lambda batch: pa.RecordBatch.from_arrays(
+            ...         [batch.column(0), pc.multiply(batch.column(1), 2)], ['id', 'value']),
+            ...     batch_size=1000,
+            ...     output_type=Types.ROW_NAMED(['id', 'value'], [Types.STRING(), Types.LONG()]))
+
+        Note that the batches are formed within the bundles of the Python operator, see
+        'python.fn-execution.bundle.size' and 'python.fn-execution.bundle.time'.
+
+        :param func: The function that is called for each batch of elements of the DataStream.
+        :param batch_size: The maximum number of elements of a batch.
+        :param output_type: The type information of the output data. It's the type of the input
+                            data if not specified.
+        :return: The transformed DataStream.
+
+        .. versionadded:: 1.16.0
+        """
+        if not callable(func):
+            raise TypeError("The input must be a callable function")
+
+        return self.process(
+            _create_batch_function(self, func, batch_size, output_type, False),
+            output_type if output_type is not None else self.get_type()) \
+            .name("MapBatch")
+
+    def flat_map_batch(self,
+                       func: Callable,
+                       batch_size: int = 1000,
+                       output_type: TypeInformation = None) -> 'DataStream':
+        """
+        Applies a vectorized FlatMap transformation on a DataStream. It's similar to
+        :func:`map_batch` except that the function returns an iterable of pyarrow.RecordBatch,
+        pyarrow.Table or pandas.DataFrame for each batch, e.g. via :code:`yield` statement. The
+        output elements may be any number of rows and take the timestamp of the last element of the
+        batch.
+
+        :param func: The function that is called for each batch of elements of the DataStream.
+        :param batch_size: The maximum number of elements of a batch.
+        :param output_type: The type information of the output data. It's the type of the input
+                            data if not specified.
+        :return: The transformed DataStream.
+
+        .. versionadded:: 1.16.0
+        """
+        if not callable(func):
+            raise TypeError("The input must be a callable function")
+
+        return self.process(
+            _create_batch_function(self, func, batch_size, output_type, True),
+            output_type if output_type is not None else self.get_type()) \
+            .name("FlatMapBatch")
+
     def key_by(self,
-               key_selector: Union[Callable, KeySelector],
+               key_selector: Union[Callable, KeySelector, int, str, List[Union[int, str]]],
                key_type: TypeInformation = None) -> 'KeyedStream':
         """
         Creates a new KeyedStream that uses the provided key for partitioning its operator states.
 
-        :param key_selector: The KeySelector to be used for extracting the key for partitioning.
-        :param key_type: The type information describing the key type.
+        The key could also be specified as the index or the name of a field, or a list of them,
+        e.g. :code:`ds.key_by(0)` or :code:`ds.key_by(["name", "id"])`. If the type of the
+        DataStream is declared as :code:`Types.ROW`, :code:`Types.ROW_NAMED` or
+        :code:`Types.TUPLE`, the key is extracted in the JVM without sending the elements to the
+        Python worker and the key type is derived from the types of the fields. The key of a list
+        of fields is a Row of these fields.
+
+        Example:
+        ::
+
+            >>> ds = env.from_collection([('a', 1), ('b', 2)],
+            ...                          type_info=Types.ROW_NAMED(["name", "id"],
+            ...                                                    [Types.STRING(), Types.INT()]))
+            >>> ds.key_by("name")
+
+        :param key_selector: The KeySelector to be used for extracting the key for partitioning,
+                             or the field(s) to be used as the key.
+        :param key_type: The type information describing the key type. It's ignored when the key
+                         is extracted in the JVM from the fields.
         :return: The DataStream with partitioned state(i.e. KeyedStream).
         """
 
+        if isinstance(key_selector, (int, str, list)):
+            fields = key_selector if isinstance(key_selector, list) else [key_selector]
+            if len(fields) == 0 or not all(isinstance(f, (int, str)) for f in fields):
+                raise TypeError("The fields to key by should be a non-empty list of field indices "
+                                "or field names.")
+            key_stream = self._key_by_fields(fields)
+            if key_stream is not None:
+                return key_stream
+            key_selector = FieldKeySelector(key_selector)
+
         if not isinstance(key_selector, KeySelector) and not callable(key_selector):
             raise TypeError("Parameter key_selector should be type of KeySelector or a callable "
                             "function.")
@@ -406,6 +506,56 @@ class DataStream(object):
             self)
         return key_stream
 
+    def _key_by_fields(self, fields: List[Union[int, str]]) -> Optional['KeyedStream']:
+        """
+        Keys the DataStream by the given fields in the JVM. Returns None if the type of the
+        DataStream is not a Row or Tuple type, in which case the key is extracted in the Python
+        worker.
+        """
+        output_type_info = typeinfo._from_java_type(
+            self._j_data_stream.getTransformation().getOutputType())
+        if not isinstance(output_type_info, (RowTypeInfo, TupleTypeInfo)):
+            return None
+
+        field_types = output_type_info.get_field_types()
+        positions = []
+        for field in fields:
+            if isinstance(field, str):
+                if not isinstance(output_type_info, RowTypeInfo):
+                    raise ValueError("Field names could only be used to key by a DataStream of "
+                                     "Row type, but the type is %s." % output_type_info)
+                field_names = output_type_info.get_field_names()
+                if field not in field_names:
+                    raise ValueError("Field '%s' doesn't exist in %s." % (field, field_names))
+                positions.append(field_names.index(field))
+            else:
+                if not 0 <= field < len(field_types):
+                    raise ValueError("Field index %s is out of range, the type %s has %s fields."
+                                     % (field, output_type_info, len(field_types)))
+                positions.append(field)
+
+        if len(positions) == 1:
+            key_type = field_types[positions[0]]
+        else:
+            key_type = Types.ROW([field_types[position] for position in positions])
+
+        gateway = get_gateway()
+        j_positions = gateway.new_array(gateway.jvm.int, len(positions))
+        for i, position in enumerate(positions):
+            j_positions[i] = position
+        j_stream_with_key_info = self._j_data_stream.map(
+            gateway.jvm.KeyByFieldsMapFunction(
+                j_positions, output_type_info.get_java_type_info()),
+            Types.ROW([key_type, output_type_info]).get_java_type_info())
+        j_stream_with_key_info.name(gateway.jvm.org.apache.flink.python.util.PythonConfigUtil
+                                    .STREAM_KEY_BY_MAP_OPERATOR_NAME)
+
+        return KeyedStream(
+            j_stream_with_key_info.keyBy(
+                gateway.jvm.KeyByKeySelector(),
+                Types.ROW([key_type]).get_java_type_info()), output_type_info,
+            self)
+
     def filter(self, func: Union[Callable, FilterFunction]) -> 'DataStream':
         """
         Applies a Filter transformation on a DataStream. The transformation calls a FilterFunction
@@ -667,7 +817,20 @@ class DataStream(object):
         :param watermark_strategy: The strategy to generate watermarks based on event timestamps.
         :return: The stream after the transformation, with assigned timestamps and watermarks.
         """
-        if watermark_strategy._timestamp_assigner is not None:
+        timestamp_assigner = watermark_strategy._timestamp_assigner
+        if watermark_strategy._timestamp_field is not None:
+            position = self._get_timestamp_field_position(watermark_strategy._timestamp_field)
+            if position is not None:
+                # the timestamps are extracted from the field in the JVM directly
+                JFieldTimestampAssigner = get_gateway().jvm.org.apache.flink.streaming.api \
+                    .functions.python.eventtime.FieldTimestampAssigner
+                return DataStream(self._j_data_stream.assignTimestampsAndWatermarks(
+                    watermark_strategy._j_watermark_strategy.withTimestampAssigner(
+                        JFieldTimestampAssigner(
+                            position, self.get_type().get_java_type_info()))))
+            timestamp_assigner = FieldTimestampAssigner(watermark_strategy._timestamp_field)
+
+        if timestamp_assigner is not None:
             # in case users have specified custom TimestampAssigner, we need to extract and
             # generate watermark according to the specified TimestampAssigner.
 
@@ -681,7 +844,7 @@ class DataStream(object):
 
             # step 1: extract the timestamp according to the specified TimestampAssigner
             timestamped_data_stream = self.process(
-                TimestampAssignerProcessFunctionAdapter(watermark_strategy._timestamp_assigner),
+                TimestampAssignerProcessFunctionAdapter(timestamp_assigner),
                 Types.TUPLE([self.get_type(), Types.LONG()]))
             timestamped_data_stream.name("Extract-Timestamp")
 
@@ -707,6 +870,40 @@ class DataStream(object):
             return DataStream(self._j_data_stream.assignTimestampsAndWatermarks(
                 watermark_strategy._j_watermark_strategy))
 
+    def _get_timestamp_field_position(self, field: Union[int, str]) -> Optional[int]:
+        """
+        Returns the index of the timestamp field if the type of the DataStream is a Row or Tuple
+        type, otherwise None which means that the timestamps should be extracted in the Python
+        worker.
+        """
+        type_info = self.get_type()
+        if not isinstance(type_info, (RowTypeInfo, TupleTypeInfo)):
+            return None
+
+        field_types = type_info.get_field_types()
+        if isinstance(field, str):
+            if not isinstance(type_info, RowTypeInfo):
+                raise ValueError("Field names could only be used to locate the timestamp field of "
+                                 "a DataStream of Row type, but the type is %s." % type_info)
+            field_names = type_info.get_field_names()
+            if field not in field_names:
+                raise ValueError("Field '%s' doesn't exist in %s." % (field, field_names))
+            position = field_names.index(field)
+        else:
+            if not 0 <= field < len(field_types):
+                raise ValueError("Field index %s is out of range, the type %s has %s fields."
+                                 % (field, type_info, len(field_types)))
+            position = field
+
+        field_type = field_types[position]
+        if isinstance(field_type, TimestampTypeInfo) or (
+                isinstance(field_type, BasicTypeInfo) and field_type._basic_type in (
+                    BasicType.BYTE, BasicType.SHORT, BasicType.INT, BasicType.LONG,
+                    BasicType.INSTANT)):
+            return position
+        raise TypeError("The timestamp field %s should be of type BYTE, SHORT, INT, LONG, INSTANT "
+                        "or SQL_TIMESTAMP, but is %s." % (field, field_type))
+
     def partition_custom(self, partitioner: Union[Callable, Partitioner],
                          key_selector: Union[Callable, KeySelector]) -> 'DataStream':
         """
@@ -826,8 +1023,8 @@ class DataStream(object):
         """
         return DataStreamSink(self._j_data_stream.sinkTo(sink.get_java_function()))
 
-    def execute_and_collect(self, job_execution_name: str = None, limit: int = None) \
-            -> Union['CloseableIterator', list]:
+    def execute_and_collect(self, job_execution_name: str = None, limit: int = None,
+                            batch_size: int = 1000) -> Union['CloseableIterator', list]:
         """
         Triggers the distributed execution of the streaming dataflow and returns an iterator over
         the elements of the given DataStream.
@@ -840,21 +1037,25 @@ class DataStream(object):
 
         :param job_execution_name: The name of the job execution.
         :param limit: The limit for the collected elements.
+        :param batch_size: The maximum number of elements transferred from the JVM at once by the
+                           returned iterator. The elements are pulled in a background thread of
+                           the JVM and a batch holds the elements available when it's fetched, so
+                           it doesn't wait for a full batch.
         """
         JPythonConfigUtil = get_gateway().jvm.org.apache.flink.python.util.PythonConfigUtil
         JPythonConfigUtil.configPythonOperator(self._j_data_stream.getExecutionEnvironment())
         self._apply_chaining_optimization()
         if job_execution_name is None and limit is None:
-            return CloseableIterator(self._j_data_stream.executeAndCollect(), self.get_type())
+            return CloseableIterator(self._j_data_stream.executeAndCollect(), self.get_type(),
+                                     batch_size)
         elif job_execution_name is not None and limit is None:
             return CloseableIterator(self._j_data_stream.executeAndCollect(job_execution_name),
-                                     self.get_type())
+                                     self.get_type(), batch_size)
         if job_execution_name is None and limit is not None:
-            return list(map(lambda data: convert_to_python_obj(data, self.get_type()),
-                            self._j_data_stream.executeAndCollect(limit)))
+            j_results = self._j_data_stream.executeAndCollect(limit)
         else:
-            return list(map(lambda data: convert_to_python_obj(data, self.get_type()),
-                            self._j_data_stream.executeAndCollect(job_execution_name, limit)))
+            j_results = self._j_data_stream.executeAndCollect(job_execution_name, limit)
+        return convert_to_python_objs(j_results.iterator(), self.get_type(), limit)
 
     def print(self, sink_identifier: str = None) -> 'DataStreamSink':
         """
@@ -1169,6 +1370,42 @@ class KeyedStream(DataStream):
         return self.process(FlatMapKeyedProcessFunctionAdapter(func), output_type) \
             .name("FlatMap")
 
+    def map_batch(self,
+                  func: Callable,
+                  batch_size: int = 1000,
+                  output_type: TypeInformation = None) -> 'DataStream':
+        """
+        Applies a vectorized Map transformation on the elements of a KeyedStream. The batches are
+        not grouped by key. See :func:`DataStream.map_batch` for more details.
+
+        :param func: The function that is called for each batch of elements of the KeyedStream.
+        :param batch_size: The maximum number of elements of a batch.
+        :param output_type: The type information of the output data. It's the type of the input
+                            data if not specified.
+        :return: The transformed DataStream.
+
+        .. versionadded:: 1.16.0
+        """
+        return self._values().map_batch(func, batch_size, output_type)
+
+    def flat_map_batch(self,
+                       func: Callable,
+                       batch_size: int = 1000,
+                       output_type: TypeInformation = None) -> 'DataStream':
+        """
+        Applies a vectorized FlatMap transformation on the elements of a KeyedStream. The batches
+        are not grouped by key. See :func:`DataStream.flat_map_batch` for more details.
+
+        :param func: The function that is called for each batch of elements of the KeyedStream.
+        :param batch_size: The maximum number of elements of a batch.
+        :param output_type: The type information of the output data. It's the type of the input
+                            data if not specified.
+        :return: The transformed DataStream.
+
+        .. versionadded:: 1.16.0
+        """
+        return self._values().flat_map_batch(func, batch_size, output_type)
+
     def reduce(self, func: Union[Callable, ReduceFunction]) -> 'DataStream':
         """
         Applies a reduce transformation on the grouped data stream grouped on by the given
@@ -1287,6 +1524,22 @@ class KeyedStream(DataStream):
                             "calculate for min, max, min_by, max_by and sum."
                             "The given type is: %s" % type(position))
 
+        native_position = self._get_native_accumulate_position(position)
+        if native_position is not None:
+            # the values are aggregated in the Java operator directly as the field to aggregate
+            # is of a numeric type which the Java operator could handle natively
+            gateway = get_gateway()
+            j_aggregation_type = gateway.jvm.org.apache.flink.streaming.api.functions.aggregation \
+                .AggregationFunction.AggregationType.valueOf(acc_type.name.replace('_', ''))
+            j_reduce_function = gateway.jvm.KeyedAccumulateReduceFunction(
+                j_aggregation_type,
+                native_position,
+                self._original_data_type_info.get_java_type_info())
+            j_data_stream = self._j_data_stream.reduce(j_reduce_function) \
+                .map(gateway.jvm.RemoveKeyMapFunction(),
+                     self._original_data_type_info.get_java_type_info())
+            return DataStream(j_data_stream)
+
         class AccumulateReduceFunction(ReduceFunction):
 
             def __init__(self, position, agg_type):
@@ -1378,6 +1631,32 @@ class KeyedStream(DataStream):
 
         return self.reduce(AccumulateReduceFunction(position, acc_type))
 
+    def _get_native_accumulate_position(self, position: Union[int, str]) -> Optional[int]:
+        """
+        Returns the index of the field to aggregate if the values are of Row or Tuple type and the
+        field is of a numeric type, otherwise None which means that the values should be aggregated
+        in the Python worker.
+        """
+        type_info = self._original_data_type_info
+        if isinstance(type_info, RowTypeInfo):
+            if isinstance(position, str):
+                field_names = type_info.get_field_names()
+                if position not in field_names:
+                    return None
+                position = field_names.index(position)
+        elif not isinstance(type_info, TupleTypeInfo) or not isinstance(position, int):
+            return None
+
+        field_types = type_info.get_field_types()
+        if not 0 <= position < len(field_types):
+            return None
+        field_type = field_types[position]
+        if isinstance(field_type, BasicTypeInfo) and field_type._basic_type in (
+                BasicType.BYTE, BasicType.SHORT, BasicType.INT, BasicType.LONG,
+                BasicType.FLOAT, BasicType.DOUBLE):
+            return position
+        return None
+
     def sum(self, position_to_sum: Union[int, str] = 0) -> 'DataStream':
         """
         Applies an aggregation that gives a rolling sum of the data stream at the given position
@@ -1570,7 +1849,8 @@ class KeyedStream(DataStream):
     def add_sink(self, sink_func: SinkFunction) -> 'DataStreamSink':
         return self._values().add_sink(sink_func)
 
-    def key_by(self, key_selector: Union[Callable, KeySelector],
+    def key_by(self,
+               key_selector: Union[Callable, KeySelector, int, str, List[Union[int, str]]],
                key_type: TypeInformation = None) -> 'KeyedStream':
         return self._origin_stream.key_by(key_selector, key_type)
 
@@ -1863,6 +2143,11 @@ class WindowedStream(object):
         Arriving data is incrementally aggregated using the given aggregate function. This means
         that the window function typically has only a single value to process when called.
 
+        The elements of sliding windows are pre-aggregated per pane, i.e. the slices of the
+        windows, when the default trigger is used. The result of a window is then computed by
+        combining the accumulators of its panes with `AggregateFunction.merge`, so it must be
+        implemented for sliding windows as well as for merging windows.
+
         Example:
         ::
 
@@ -2602,6 +2887,35 @@ def _get_two_input_stream_operator(connected_streams: ConnectedStreams,
     return j_python_data_stream_function_operator, j_output_type_info
 
 
+def _create_batch_function(data_stream: DataStream,
+                           func: Callable,
+                           batch_size: int,
+                           output_type: Optional[TypeInformation],
+                           flat: bool) -> InternalBatchFunction:
+    if batch_size <= 0:
+        raise ValueError("The batch size must be positive, got %s." % batch_size)
+
+    def get_element_type(type_info: TypeInformation):
+        if isinstance(type_info, RowTypeInfo):
+            return Row
+        elif isinstance(type_info, TupleTypeInfo):
+            return tuple
+        else:
+            return None
+
+    input_type = data_stream.get_type()
+    if output_type is None:
+        output_type = input_type
+    return InternalBatchFunction(
+        func,
+        batch_size,
+        to_arrow_schema(input_type),
+        get_element_type(input_type),
+        to_arrow_schema(output_type),
+        get_element_type(output_type),
+        flat)
+
+
 def _create_j_data_stream_python_function_info(
     func: Union[Function, FunctionWrapper, WindowOperationDescriptor], func_type: int
 ) -> bytes:
@@ -2621,9 +2935,19 @@ class CloseableIterator(object):
     Representing an Iterator that is also auto closeable.
     """
 
-    def __init__(self, j_closeable_iterator, type_info: TypeInformation = None):
+    def __init__(self, j_closeable_iterator, type_info: TypeInformation = None,
+                 batch_size: int = 1000):
+        if batch_size <= 0:
+            raise ValueError("The batch size should be positive, got %s." % batch_size)
         self._j_closeable_iterator = j_closeable_iterator
+        # pulls the elements from the Java iterator in a background thread of the JVM
+        self._j_batch_fetcher = get_gateway().jvm.org.apache.flink.python.util \
+            .IncrementalBatchFetcher(j_closeable_iterator, batch_size)
         self._type_info = type_info
+        self._batch_size = batch_size
+        self._batch = []
+        self._next_index = 0
+        self._exhausted = False
 
     def __iter__(self):
         return self
@@ -2638,9 +2962,25 @@ class CloseableIterator(object):
         self.close()
 
     def next(self):
-        if not self._j_closeable_iterator.hasNext():
-            raise StopIteration('No more data.')
-        return convert_to_python_obj(self._j_closeable_iterator.next(), self._type_info)
+        if self._next_index == len(self._batch):
+            if self._exhausted:
+                raise StopIteration('No more data.')
+            # it only waits until at least one element is available instead of a full batch
+            self._batch = convert_to_python_objs(
+                self._j_batch_fetcher.nextBatch(self._batch_size).iterator(),
+                self._type_info,
+                self._batch_size)
+            self._next_index = 0
+            if not self._batch:
+                self._exhausted = True
+                raise StopIteration('No more data.')
+        value = self._batch[self._next_index]
+        self._next_index += 1
+        return value
 
     def close(self):
-        self._j_closeable_iterator.close()
+        self._exhausted = True
+        self._batch = []
+        self._next_index = 0
+        # stops the background thread of the JVM and closes the Java iterator
+        self._j_batch_fetcher.close()
@@ -18,8 +18,9 @@
 
 from abc import ABC, abstractmethod
 from py4j.java_gateway import JavaObject
-from typing import Union, Any, Generic, TypeVar, Iterable
+from typing import Union, Any, Generic, TypeVar, Iterable, List
 
+from pyflink.common import Row
 from pyflink.datastream.state import ValueState, ValueStateDescriptor, ListStateDescriptor, \
     ListState, MapStateDescriptor, MapState, ReducingStateDescriptor, ReducingState, \
     AggregatingStateDescriptor, AggregatingState, BroadcastState, ReadOnlyBroadcastState
@@ -447,6 +448,9 @@ class AggregateFunction(Function):
         return that. The assumption is that the given accumulators will not be used any more after
         having been passed to this function.
 
+        It's called to merge the accumulators of merging windows, e.g. session windows, and the
+        accumulators of the panes of sliding windows.
+
         :param acc_a: An accumulator to merge.
         :param acc_b: Another accumulator to merge.
         :return: The accumulator with the merged state.
@@ -482,6 +486,23 @@ class NullByteKeySelector(KeySelector):
         return 0
 
 
+class FieldKeySelector(KeySelector):
+    """
+    Used to key by the given field(s) of the elements which are extracted in the Python worker,
+    i.e. when the type of the elements is not declared as a Row or Tuple type. The key of a list
+    of fields is a Row of these fields.
+    """
+
+    def __init__(self, fields: Union[int, str, List[Union[int, str]]]):
+        self._fields = fields
+
+    def get_key(self, value):
+        if isinstance(self._fields, list):
+            return Row(*[value[field] for field in self._fields])
+        else:
+            return value[self._fields]
+
+
 class FilterFunction(Function):
     """
     A filter function is a predicate applied individually to each record. The predicate decides
@@ -1273,6 +1294,95 @@ class InternalIterableProcessWindowFunction(InternalWindowFunction[Iterable[IN],
         self._wrapped_function.clear(self._internal_context)
 
 
+class InternalBatchFunction(Function):
+    """
+    Internal function which applies a user-defined function on batches of the elements of a
+    stream. Each batch is converted to a :class:`pyarrow.RecordBatch` before being passed to the
+    user-defined function, and the record batches, pyarrow.Tables or pandas.DataFrames returned by
+    the user-defined function are converted back to the elements of the output stream.
+    """
+
+    def __init__(self,
+                 batch_func,
+                 batch_size: int,
+                 input_schema,
+                 input_element_type,
+                 output_schema,
+                 output_element_type,
+                 flat: bool):
+        """
+        :param batch_func: The user-defined function which is called for each batch.
+        :param batch_size: The maximum number of the elements of a batch.
+        :param input_schema: The pyarrow schema of the input record batches.
+        :param input_element_type: Row or tuple for composite input elements and None for the
+                                   input elements which are mapped to a single column.
+        :param output_schema: The pyarrow schema of the output record batches.
+        :param output_element_type: Row or tuple for composite output elements and None for the
+                                    output elements which are mapped to a single column.
+        :param flat: Whether the user-defined function returns an iterable of batches instead of
+                     a single batch.
+        """
+        self._batch_func = batch_func
+        self.batch_size = batch_size
+        self._input_schema = input_schema
+        self._input_element_type = input_element_type
+        self._output_schema = output_schema
+        self._output_element_type = output_element_type
+        self._flat = flat
+
+    def is_flat(self) -> bool:
+        """
+        Whether the user-defined function returns any number of output elements for a batch, as in
+        :func:`DataStream.flat_map_batch`, instead of one output element for every input element.
+        """
+        return self._flat
+
+    def process_batch(self, values: List) -> List:
+        import pyarrow as pa
+
+        if self._input_element_type is None:
+            columns = [values]
+        else:
+            columns = list(zip(*values))
+        record_batch = pa.RecordBatch.from_arrays(
+            [pa.array(column, type=field.type)
+             for column, field in zip(columns, self._input_schema)],
+            schema=self._input_schema)
+
+        results = self._batch_func(record_batch)
+        if not self._flat:
+            elements = self._to_elements(results)
+            if len(elements) != len(values):
+                raise ValueError("The number of the rows of the result %s doesn't match the number "
+                                 "of the input elements %s." % (len(elements), len(values)))
+            return elements
+        elements = []
+        for result in results:
+            elements.extend(self._to_elements(result))
+        return elements
+
+    def _to_elements(self, result) -> List:
+        import pyarrow as pa
+
+        if not isinstance(result, (pa.RecordBatch, pa.Table)):
+            result = pa.RecordBatch.from_pandas(result, preserve_index=False)
+        if result.num_columns != len(self._output_schema):
+            raise ValueError("The number of the columns of the result %s doesn't match the output "
+                             "schema %s." % (result.num_columns, self._output_schema))
+        columns = []
+        for column, field in zip(result.columns, self._output_schema):
+            if column.type != field.type:
+                column = column.cast(field.type)
+            columns.append(column.to_pylist())
+
+        if self._output_element_type is None:
+            return columns[0]
+        elif self._output_element_type is Row:
+            return [Row(*fields) for fields in zip(*columns)]
+        else:
+            return list(zip(*columns))
+
+
 class BaseBroadcastProcessFunction(Function):
     """
     The base class containing the functionality available to all broadcast process function. These
@@ -119,6 +119,31 @@ class DataStreamTests(object):
                     "<Row('deeefg', 7, Decimal('4'))>"]
         self.assert_equals_sorted(expected, results)
 
+    def test_map_batch_and_flat_map_batch(self):
+        ds = self.env.from_collection([('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5)],
+                                      type_info=Types.ROW([Types.STRING(), Types.INT()]))
+
+        def double(batch):
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            return pa.RecordBatch.from_arrays(
+                [batch.column(0), pc.multiply(batch.column(1), 2)], ['name', 'value'])
+
+        def split_even(batch):
+            df = batch.to_pandas()
+            yield df[df['value'] % 4 == 0]
+            yield df[df['value'] % 4 != 0].assign(value=lambda x: x['value'] + 100)
+
+        (ds.map_batch(double, batch_size=2,
+                      output_type=Types.ROW_NAMED(['name', 'value'],
+                                                  [Types.STRING(), Types.LONG()]))
+           .flat_map_batch(split_even, batch_size=3)
+           .add_sink(self.test_sink))
+        self.env.execute('test_map_batch_and_flat_map_batch')
+        results = self.test_sink.get_results()
+        expected = ['+I[a, 102]', '+I[b, 4]', '+I[c, 106]', '+I[d, 8]', '+I[e, 110]']
+        self.assert_equals_sorted(expected, results)
+
     def test_basic_co_operations(self):
         python_file_dir = os.path.join(self.tempdir, "python_file_dir_" + str(uuid.uuid4()))
         os.mkdir(python_file_dir)
@@ -289,6 +314,20 @@ class DataStreamTests(object):
                 actual.append(result)
             self.assertEqual(expected, actual)
 
+        # the elements are transferred in batches of at most 3 elements
+        ds = self.env.from_collection(collection=test_data, type_info=Types.STRING())
+        with ds.execute_and_collect(batch_size=3) as results:
+            actual = [result for result in results]
+            self.assertEqual(expected, actual)
+
+        # the elements of the current batch are dropped when the iterator is closed
+        ds = self.env.from_collection(collection=test_data, type_info=Types.STRING())
+        results = ds.execute_and_collect(batch_size=3)
+        self.assertEqual(expected[0], next(results))
+        results.close()
+        with self.assertRaises(StopIteration):
+            next(results)
+
         test_data = [(1, None, 1, True, 32767, -2147483648, 1.23, 1.98932,
                       bytearray(b'flink'), 'pyflink',
                       datetime.date(2014, 9, 13),
@@ -470,6 +509,56 @@ class DataStreamTests(object):
         expected = ['+I[d, 1]', '+I[c, 1]', '+I[a, 0]', '+I[b, 0]', '+I[e, 2]']
         self.assert_equals_sorted(expected, results)
 
+    def test_key_by_fields(self):
+        self.env.set_parallelism(1)
+        ds = self.env.from_collection([('a', 1, 1), ('b', 2, 1), ('a', 1, 2), ('a', 2, 3)],
+                                      type_info=Types.ROW_NAMED(
+                                          ["v1", "v2", "v3"],
+                                          [Types.STRING(), Types.INT(), Types.INT()]))
+
+        class CurrentKeyProcessFunction(KeyedProcessFunction):
+
+            def process_element(self, value, ctx: 'KeyedProcessFunction.Context'):
+                yield Row(str(ctx.get_current_key()), value[2])
+
+        ds.key_by("v1") \
+            .process(CurrentKeyProcessFunction(), Types.ROW([Types.STRING(), Types.INT()])) \
+            .add_sink(self.test_sink)
+        ds.key_by([0, "v2"]) \
+            .sum("v3") \
+            .map(lambda x: Row(x[0] + str(x[1]), x[2]),
+                 output_type=Types.ROW([Types.STRING(), Types.INT()])) \
+            .add_sink(self.test_sink)
+
+        self.env.execute("test key by fields")
+        results = self.test_sink.get_results(False)
+        expected = ['+I[a, 1]', '+I[b, 1]', '+I[a, 2]', '+I[a, 3]',
+                    '+I[a1, 1]', '+I[b2, 1]', '+I[a1, 3]', '+I[a2, 3]']
+        self.assert_equals_sorted(expected, results)
+
+    def test_key_by_fields_of_pickled_type(self):
+        ds = self.env.from_collection([('a', 1), ('b', 2), ('a', 3)])
+        ds.key_by(0) \
+            .reduce(lambda a, b: (a[0], a[1] + b[1])) \
+            .map(lambda x: Row(x[0], x[1]), output_type=Types.ROW([Types.STRING(), Types.INT()])) \
+            .add_sink(self.test_sink)
+
+        self.env.execute("test key by fields of pickled type")
+        results = self.test_sink.get_results(False)
+        expected = ['+I[a, 1]', '+I[b, 2]', '+I[a, 4]']
+        self.assert_equals_sorted(expected, results)
+
+    def test_key_by_invalid_fields(self):
+        ds = self.env.from_collection([('a', 1)],
+                                      type_info=Types.ROW_NAMED(["v1", "v2"],
+                                                                [Types.STRING(), Types.INT()]))
+        with self.assertRaises(ValueError):
+            ds.key_by("v3")
+        with self.assertRaises(ValueError):
+            ds.key_by(2)
+        with self.assertRaises(TypeError):
+            ds.key_by([])
+
     def test_print_without_align_output(self):
         # No need to align output typeinfo since we have specified the type info of the DataStream.
         ds = self.env.from_collection([('ab', 1), ('bdc', 2), ('cfgs', 3), ('deeefg', 4)],
@@ -1280,6 +1369,49 @@ class StreamingModeDataStreamTests(DataStreamTests, PyFlinkStreamingTestCase):
                     "on timer: 3"]
         self.assert_equals_sorted(expected, results)
 
+    def test_timestamp_field_and_watermark_strategy(self):
+        self.env.set_parallelism(1)
+        data_stream = self.env.from_collection([(1, 1603708211000),
+                                                (2, 1603708224000),
+                                                (3, 1603708226000)],
+                                               type_info=Types.ROW_NAMED(
+                                                   ["id", "ts"], [Types.INT(), Types.LONG()]))
+
+        class TimestampProcessFunction(ProcessFunction):
+
+            def process_element(self, value, ctx):
+                yield "current timestamp: {}, current_value: {}".format(
+                    str(ctx.timestamp()), str(value))
+
+        watermark_strategy = WatermarkStrategy.for_monotonous_timestamps() \
+            .with_timestamp_field("ts")
+        data_stream.assign_timestamps_and_watermarks(watermark_strategy) \
+            .process(TimestampProcessFunction(), output_type=Types.STRING()) \
+            .add_sink(self.test_sink)
+
+        # the timestamps are extracted in the JVM without an extra Python operator
+        plan = eval(str(self.env.get_execution_plan()))
+        node_types = [node['type'] for node in plan['nodes']]
+        self.assertNotIn('Extract-Timestamp', node_types)
+        self.assertNotIn('Remove-Timestamp', node_types)
+
+        self.env.execute('test timestamp field with process function')
+        results = self.test_sink.get_results()
+        expected = ["current timestamp: 1603708211000, current_value: "
+                    "Row(id=1, ts=1603708211000)",
+                    "current timestamp: 1603708224000, current_value: "
+                    "Row(id=2, ts=1603708224000)",
+                    "current timestamp: 1603708226000, current_value: "
+                    "Row(id=3, ts=1603708226000)"]
+        self.assert_equals_sorted(expected, results)
+
+    def test_timestamp_field_of_invalid_type(self):
+        data_stream = self.env.from_collection([(1, '1603708211000')],
+                                               type_info=Types.ROW([Types.INT(), Types.STRING()]))
+        with self.assertRaises(TypeError):
+            data_stream.assign_timestamps_and_watermarks(
+                WatermarkStrategy.for_monotonous_timestamps().with_timestamp_field(1))
+
     def test_reduce(self):
         ds = self.env.from_collection([(1, 'a'), (2, 'a'), (3, 'a'), (4, 'b')],
                                       type_info=Types.ROW([Types.INT(), Types.STRING()]))
@@ -1305,6 +1437,43 @@ class StreamingModeDataStreamTests(DataStreamTests, PyFlinkStreamingTestCase):
         expected = ['+I[a, 0]', '+I[ab, 0]', '+I[c, 1]', '+I[cd, 1]', '+I[cde, 1]']
         self.assert_equals_sorted(expected, results)
 
+    def test_keyed_process_function_with_state_read_ahead(self):
+        self.env.set_parallelism(1)
+        config = get_j_env_configuration(self.env._j_stream_execution_environment)
+        config.setString("python.state.read-ahead-size", "3")
+        ds = self.env.from_collection([('a', 1), ('b', 2), ('a', 3), ('c', 4), ('b', 5), ('a', 6)],
+                                      type_info=Types.ROW([Types.STRING(), Types.INT()]))
+
+        class MyProcessFunction(KeyedProcessFunction):
+
+            def __init__(self):
+                self.value_state = None
+                self.map_state = None
+
+            def open(self, runtime_context: RuntimeContext):
+                self.value_state = runtime_context.get_state(
+                    ValueStateDescriptor('value_state', Types.INT()))
+                self.map_state = runtime_context.get_map_state(
+                    MapStateDescriptor('map_state', Types.INT(), Types.INT()))
+
+            def process_element(self, value, ctx):
+                current_sum = self.value_state.async_value()
+                seen = self.map_state.async_contains(value[1] - 2)
+                new_sum = (current_sum.result() or 0) + value[1]
+                self.value_state.update(new_sum)
+                self.map_state.put(value[1], new_sum)
+                yield Row(value[0], new_sum, seen.result())
+
+        ds.key_by(lambda a: a[0], key_type=Types.STRING()) \
+            .process(MyProcessFunction(),
+                     output_type=Types.ROW([Types.STRING(), Types.INT(), Types.BOOLEAN()])) \
+            .add_sink(self.test_sink)
+        self.env.execute('test_keyed_process_function_with_state_read_ahead')
+        results = self.test_sink.get_results()
+        expected = ['+I[a, 1, false]', '+I[b, 2, false]', '+I[a, 4, true]', '+I[c, 4, false]',
+                    '+I[b, 7, false]', '+I[a, 10, false]']
+        self.assertEqual(expected, results)
+
     def test_keyed_sum(self):
         self.env.set_parallelism(1)
         ds = self.env.from_collection(
@@ -1385,6 +1554,31 @@ class StreamingModeDataStreamTests(DataStreamTests, PyFlinkStreamingTestCase):
         expected = ['a', 'a', 'a', 'a']
         self.assert_equals_sorted(expected, results)
 
+    def test_keyed_accumulate_on_numeric_field_in_java_operator(self):
+        self.env.set_parallelism(1)
+        ds = self.env.from_collection([('a', 3, 0), ('a', 1, 1), ('b', 5, 0), ('b', 3, 1)],
+                                      type_info=Types.ROW_NAMED(
+                                          ["v1", "v2", "v3"],
+                                          [Types.STRING(), Types.INT(), Types.INT()])
+                                      )
+        # the numeric field is aggregated by the Java operator, while the string field is
+        # aggregated in the Python worker
+        ds.key_by(lambda x: x[0]) \
+            .sum("v2") \
+            .key_by(lambda x: x[0]) \
+            .min(0) \
+            .add_sink(self.test_sink)
+
+        plan = eval(str(self.env.get_execution_plan()))
+        node_types = [node['type'] for node in plan['nodes']]
+        self.assertEqual(1, node_types.count('Keyed Reduce'))
+        self.assertEqual(1, node_types.count('Reduce'))
+
+        self.env.execute("key_by_accumulate_in_java_operator_test_stream")
+        results = self.test_sink.get_results(False)
+        expected = ['+I[a, 3, 0]', '+I[a, 4, 0]', '+I[b, 5, 0]', '+I[b, 8, 0]']
+        self.assert_equals_sorted(expected, results)
+
     def test_function_with_error(self):
         ds = self.env.from_collection([('a', 0), ('b', 0), ('c', 1), ('d', 1), ('e', 1)],
                                       type_info=Types.ROW([Types.STRING(), Types.INT()]))
@@ -105,6 +105,62 @@ class WindowTests(PyFlinkStreamingTestCase):
                     '(hi,8,13,2)', '(hi,12,17,1)', '(hi,14,19,1)']
         self.assert_equals_sorted(expected, results)
 
+    def test_event_time_sliding_window_reduce(self):
+        data_stream = self.env.from_collection([
+            ('hi', 1), ('hi', 2), ('hi', 3), ('hi', 4), ('hi', 5), ('hi', 8), ('hi', 9),
+            ('hi', 15)],
+            type_info=Types.TUPLE([Types.STRING(), Types.INT()]))  # type: DataStream
+        watermark_strategy = WatermarkStrategy.for_monotonous_timestamps() \
+            .with_timestamp_assigner(SecondColumnTimestampAssigner())
+
+        data_stream.assign_timestamps_and_watermarks(watermark_strategy) \
+            .key_by(lambda x: x[0], key_type=Types.STRING()) \
+            .window(SlidingEventTimeWindows.of(Time.milliseconds(5), Time.milliseconds(2))) \
+            .reduce(lambda a, b: (a[0], a[1] + b[1]),
+                    output_type=Types.TUPLE([Types.STRING(), Types.INT()])) \
+            .add_sink(self.test_sink)
+
+        self.env.execute('test_event_time_sliding_window_reduce')
+        results = self.test_sink.get_results()
+        expected = ['(hi,3)', '(hi,10)', '(hi,14)', '(hi,17)', '(hi,17)', '(hi,17)', '(hi,15)',
+                    '(hi,15)']
+        self.assert_equals_sorted(expected, results)
+
+    def test_event_time_sliding_window_aggregate(self):
+        data_stream = self.env.from_collection([
+            ('hi', 1), ('hi', 2), ('hi', 3), ('hi', 4), ('hi', 5), ('hi', 8), ('hi', 9),
+            ('hi', 15)],
+            type_info=Types.TUPLE([Types.STRING(), Types.INT()]))  # type: DataStream
+        watermark_strategy = WatermarkStrategy.for_monotonous_timestamps() \
+            .with_timestamp_assigner(SecondColumnTimestampAssigner())
+
+        class CountAggregateFunction(AggregateFunction):
+
+            def create_accumulator(self):
+                return 0
+
+            def add(self, value, accumulator):
+                return accumulator + 1
+
+            def get_result(self, accumulator):
+                return accumulator
+
+            def merge(self, acc_a, acc_b):
+                return acc_a + acc_b
+
+        data_stream.assign_timestamps_and_watermarks(watermark_strategy) \
+            .key_by(lambda x: x[0], key_type=Types.STRING()) \
+            .window(SlidingEventTimeWindows.of(Time.milliseconds(5), Time.milliseconds(2))) \
+            .aggregate(CountAggregateFunction(),
+                       accumulator_type=Types.LONG(),
+                       output_type=Types.LONG()) \
+            .add_sink(self.test_sink)
+
+        self.env.execute('test_event_time_sliding_window_aggregate')
+        results = self.test_sink.get_results()
+        expected = ['2', '4', '4', '3', '2', '2', '1', '1']
+        self.assert_equals_sorted(expected, results)
+
     def test_count_sliding_window(self):
         data_stream = self.env.from_collection([
             (1, 'hi'), (2, 'hello'), (3, 'hi'), (4, 'hello'), (5, 'hi'), (6, 'hello')],
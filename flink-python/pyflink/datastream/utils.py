@@ -23,7 +23,9 @@ from abc import abstractmethod
 from pyflink.common import Row, RowKind
 from pyflink.common.typeinfo import (RowTypeInfo, TupleTypeInfo, Types, BasicArrayTypeInfo,
                                      PrimitiveArrayTypeInfo, MapTypeInfo, ListTypeInfo,
-                                     ObjectArrayTypeInfo, ExternalTypeInfo, TypeInformation)
+                                     ObjectArrayTypeInfo, ExternalTypeInfo, TypeInformation,
+                                     BasicTypeInfo, BasicType, DateTypeInfo, TimeTypeInfo,
+                                     TimestampTypeInfo)
 from pyflink.java_gateway import get_gateway
 
 
@@ -43,20 +45,41 @@ def convert_to_python_obj(data, type_info):
         gateway = get_gateway()
         pickle_bytes = gateway.jvm.PythonBridgeUtils. \
             getPickledBytesFromJavaObject(data, type_info.get_java_type_info())
-        if isinstance(type_info, RowTypeInfo) or isinstance(type_info, TupleTypeInfo):
-            field_data = zip(list(pickle_bytes[1:]), type_info.get_field_types())
-            fields = []
-            for data, field_type in field_data:
-                if len(data) == 0:
-                    fields.append(None)
-                else:
-                    fields.append(pickled_bytes_to_python_converter(data, field_type))
-            if isinstance(type_info, RowTypeInfo):
-                return Row.of_kind(RowKind(int.from_bytes(pickle_bytes[0], 'little')), *fields)
+        return _pickled_bytes_to_python_obj(pickle_bytes, type_info)
+
+
+def convert_to_python_objs(j_iterator, type_info, batch_size: int) -> list:
+    """
+    Pulls at most `batch_size` elements from the given Java iterator in one Py4J call and converts
+    them to Python objects locally. An empty list is returned when the iterator is exhausted.
+    """
+    while isinstance(type_info, ExternalTypeInfo):
+        type_info = type_info._type_info
+    gateway = get_gateway()
+    pickled_batch = gateway.jvm.PythonBridgeUtils.getPickledBytesFromJavaObjects(
+        j_iterator, type_info.get_java_type_info(), batch_size)
+    if type_info == Types.PICKLED_BYTE_ARRAY():
+        return [pickle.loads(data) for data in pickle.loads(pickled_batch)]
+    else:
+        return [_pickled_bytes_to_python_obj(pickle_bytes, type_info)
+                for pickle_bytes in pickle.loads(pickled_batch)]
+
+
+def _pickled_bytes_to_python_obj(pickle_bytes, type_info):
+    if isinstance(type_info, RowTypeInfo) or isinstance(type_info, TupleTypeInfo):
+        field_data = zip(list(pickle_bytes[1:]), type_info.get_field_types())
+        fields = []
+        for data, field_type in field_data:
+            if len(data) == 0:
+                fields.append(None)
             else:
-                return tuple(fields)
+                fields.append(pickled_bytes_to_python_converter(data, field_type))
+        if isinstance(type_info, RowTypeInfo):
+            return Row.of_kind(RowKind(int.from_bytes(pickle_bytes[0], 'little')), *fields)
         else:
-            return pickled_bytes_to_python_converter(pickle_bytes, type_info)
+            return tuple(fields)
+    else:
+        return pickled_bytes_to_python_converter(pickle_bytes, type_info)
 
 
 def pickled_bytes_to_python_converter(data, field_type):
@@ -103,3 +126,72 @@ def pickled_bytes_to_python_converter(data, field_type):
             return elements
         else:
             return field_type.from_internal_type(data)
+
+
+def to_arrow_schema(type_info: TypeInformation):
+    """
+    Converts the type information of the elements of a stream to a pyarrow schema. The fields of
+    a RowTypeInfo or a TupleTypeInfo are mapped to the columns of the schema, the other types are
+    mapped to a schema with a single column named 'f0'.
+    """
+    import pyarrow as pa
+
+    if isinstance(type_info, ExternalTypeInfo):
+        return to_arrow_schema(type_info._type_info)
+    elif isinstance(type_info, RowTypeInfo):
+        field_names = type_info.get_field_names()
+        field_types = type_info.get_field_types()
+    elif isinstance(type_info, TupleTypeInfo):
+        field_types = type_info.get_field_types()
+        field_names = ['f%d' % i for i in range(len(field_types))]
+    else:
+        field_names = ['f0']
+        field_types = [type_info]
+    return pa.schema([pa.field(field_name, to_arrow_type(field_type))
+                      for field_name, field_type in zip(field_names, field_types)])
+
+
+def to_arrow_type(type_info: TypeInformation):
+    """
+    Converts the specified type information to pyarrow data type.
+    """
+    import pyarrow as pa
+
+    if isinstance(type_info, BasicTypeInfo):
+        basic_type = type_info._basic_type
+        if basic_type == BasicType.STRING:
+            return pa.string()
+        elif basic_type == BasicType.BYTE:
+            return pa.int8()
+        elif basic_type == BasicType.BOOLEAN:
+            return pa.bool_()
+        elif basic_type == BasicType.SHORT:
+            return pa.int16()
+        elif basic_type == BasicType.INT:
+            return pa.int32()
+        elif basic_type == BasicType.LONG:
+            return pa.int64()
+        elif basic_type == BasicType.FLOAT:
+            return pa.float32()
+        elif basic_type == BasicType.DOUBLE:
+            return pa.float64()
+        elif basic_type == BasicType.BIG_DEC:
+            return pa.decimal128(38, 18)
+    elif isinstance(type_info, DateTypeInfo):
+        return pa.date32()
+    elif isinstance(type_info, TimeTypeInfo):
+        return pa.time64('us')
+    elif isinstance(type_info, TimestampTypeInfo):
+        return pa.timestamp('us')
+    elif isinstance(type_info, PrimitiveArrayTypeInfo):
+        if type_info._element_type == Types.BYTE():
+            return pa.binary()
+        return pa.list_(to_arrow_type(type_info._element_type))
+    elif isinstance(type_info, (BasicArrayTypeInfo, ObjectArrayTypeInfo)):
+        return pa.list_(to_arrow_type(type_info._element_type))
+    elif isinstance(type_info, ListTypeInfo):
+        return pa.list_(to_arrow_type(type_info.elem_type))
+    elif isinstance(type_info, ExternalTypeInfo):
+        return to_arrow_type(type_info._type_info)
+    raise ValueError("Type information %s is not supported to be converted to an Arrow "
+                     "type." % type_info)
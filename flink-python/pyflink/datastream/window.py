@@ -608,6 +608,44 @@ class MergingWindowAssigner(WindowAssigner[T, W]):
         pass
 
 
+class PanedWindowAssigner(WindowAssigner[T, W]):
+    """
+    A `WindowAssigner` whose windows can be split into panes, i.e. disjoint windows, such that
+    each element belongs to exactly one pane and every window is the union of its panes. The
+    runtime pre-aggregates the elements per pane and assembles the windows from their panes when
+    they fire.
+    """
+
+    @abstractmethod
+    def assign_pane(self,
+                    element: T,
+                    timestamp: int,
+                    context: 'WindowAssigner.WindowAssignerContext') -> W:
+        """
+        :param element: The element to which the pane should be assigned.
+        :param timestamp: The timestamp of the element.
+        :param context: The :class:`WindowAssignerContext` in which the assigner operates.
+        :return: The pane the element belongs to.
+        """
+        pass
+
+    @abstractmethod
+    def split_into_panes(self, window: W) -> Iterable[W]:
+        """
+        :param window: The window to split.
+        :return: The panes the given window consists of.
+        """
+        pass
+
+    @abstractmethod
+    def get_last_window(self, pane: W) -> W:
+        """
+        :param pane: The pane.
+        :return: The last window that the given pane belongs to.
+        """
+        pass
+
+
 class WindowOperationDescriptor(object):
 
     def __init__(self,
@@ -1285,7 +1323,7 @@ class TumblingEventTimeWindows(WindowAssigner[T, TimeWindow]):
         return "TumblingEventTimeWindows(%s, %s)" % (self._size, self._offset)
 
 
-class SlidingProcessingTimeWindows(WindowAssigner[T, TimeWindow]):
+class SlidingProcessingTimeWindows(PanedWindowAssigner[T, TimeWindow]):
     """
     A WindowAssigner that windows elements into sliding windows based on the current system
     time of the machine the operation is running on. Windows can possibly overlap.
@@ -1346,6 +1384,23 @@ class SlidingProcessingTimeWindows(WindowAssigner[T, TimeWindow]):
                                       current_processing_time - self._size, -self._slide)]
         return windows
 
+    def assign_pane(self,
+                    element: T,
+                    timestamp: int,
+                    context: 'WindowAssigner.WindowAssignerContext') -> TimeWindow:
+        current_processing_time = context.get_current_processing_time()
+        start = TimeWindow.get_window_start_with_offset(
+            current_processing_time, self._offset, self._pane_size)
+        return TimeWindow(start, start + self._pane_size)
+
+    def split_into_panes(self, window: TimeWindow) -> Iterable[TimeWindow]:
+        return [TimeWindow(start, start + self._pane_size)
+                for start in range(window.start, window.end, self._pane_size)]
+
+    def get_last_window(self, pane: TimeWindow) -> TimeWindow:
+        last_start = TimeWindow.get_window_start_with_offset(pane.start, self._offset, self._slide)
+        return TimeWindow(last_start, last_start + self._size)
+
     def get_default_trigger(self, env) -> Trigger[T, TimeWindow]:
         return ProcessingTimeTrigger()
 
@@ -1359,7 +1414,7 @@ class SlidingProcessingTimeWindows(WindowAssigner[T, TimeWindow]):
         return "SlidingProcessingTimeWindows(%s, %s, %s)" % (self._size, self._slide, self._offset)
 
 
-class SlidingEventTimeWindows(WindowAssigner[T, TimeWindow]):
+class SlidingEventTimeWindows(PanedWindowAssigner[T, TimeWindow]):
     """
     A WindowAssigner that windows elements into sliding windows based on the timestamp of the
     elements. Windows can possibly overlap.
@@ -1424,6 +1479,21 @@ class SlidingEventTimeWindows(WindowAssigner[T, TimeWindow]):
                               "or did you forget to call "
                             + "'data_stream.assign_timestamps_and_watermarks(...)'?")
 
+    def assign_pane(self,
+                    element: T,
+                    timestamp: int,
+                    context: 'WindowAssigner.WindowAssignerContext') -> TimeWindow:
+        start = TimeWindow.get_window_start_with_offset(timestamp, self._offset, self._pane_size)
+        return TimeWindow(start, start + self._pane_size)
+
+    def split_into_panes(self, window: TimeWindow) -> Iterable[TimeWindow]:
+        return [TimeWindow(start, start + self._pane_size)
+                for start in range(window.start, window.end, self._pane_size)]
+
+    def get_last_window(self, pane: TimeWindow) -> TimeWindow:
+        last_start = TimeWindow.get_window_start_with_offset(pane.start, self._offset, self._slide)
+        return TimeWindow(last_start, last_start + self._size)
+
     def get_default_trigger(self, env) -> Trigger[T, TimeWindow]:
         return EventTimeTrigger()
 
@@ -36,14 +36,13 @@ class ResettableIO(io.RawIOBase):
         output_buffer_len = len(b)
         remaining = self._size - self._input_offset
 
-        if remaining >= output_buffer_len:
-            b[:] = self._input_bytes[self._input_offset:self._input_offset + output_buffer_len]
-            self._input_offset += output_buffer_len
-            return output_buffer_len
-        elif remaining > 0:
-            b[:remaining] = self._input_bytes[self._input_offset:self._input_offset + remaining]
-            self._input_offset = self._size
-            return remaining
+        if remaining > 0:
+            read_len = min(remaining, output_buffer_len)
+            # slice a memoryview so that the input bytes are copied only once into *b*
+            b[:read_len] = memoryview(self._input_bytes)[
+                self._input_offset:self._input_offset + read_len]
+            self._input_offset += read_len
+            return read_len
         else:
             return None
 
@@ -58,8 +57,9 @@ class ResettableIO(io.RawIOBase):
         if isinstance(b, bytes):
             self._output_stream.write(b)
         else:
-            # pyarrow.Buffer
-            self._output_stream.write(b.to_pybytes())
+            # pyarrow.Buffer, which is written without being materialized as an intermediate
+            # bytes object
+            self._output_stream.write_buffer(b)
         return len(b)
 
     def seekable(self):
@@ -39,3 +39,5 @@ cdef class FlinkFieldCoderBeamWrapper(StreamCoderImpl):
 cdef class FlinkLengthPrefixCoderBeamWrapper(StreamCoderImpl):
     cdef readonly LengthPrefixBaseCoderImpl _value_coder
     cdef readonly BeamTimeBasedOutputStream _output_stream
+
+    cpdef encode_columns_to_stream(self, list columns, BOutputStream out_stream)
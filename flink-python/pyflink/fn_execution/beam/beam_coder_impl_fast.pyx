@@ -27,6 +27,7 @@ from apache_beam.coders.coder_impl cimport StreamCoderImpl
 
 from pyflink.fn_execution.beam.beam_stream_fast cimport BeamInputStream
 from pyflink.fn_execution.beam.beam_stream_fast cimport BeamTimeBasedOutputStream
+from pyflink.fn_execution.coder_impl_fast cimport ValueCoderImpl
 from pyflink.fn_execution.stream_fast cimport InputStream
 
 cdef class PassThroughLengthPrefixCoderImpl(StreamCoderImpl):
@@ -100,6 +101,11 @@ cdef class FlinkLengthPrefixCoderBeamWrapper(StreamCoderImpl):
         self._output_stream.reset_output_stream(out_stream)
         self._value_coder.encode_to_stream(value, self._output_stream)
 
+    cpdef encode_columns_to_stream(self, list columns, BOutputStream out_stream):
+        self._output_stream.reset_output_stream(out_stream)
+        (<ValueCoderImpl?> self._value_coder).encode_columns_to_stream(
+            columns, self._output_stream)
+
     cpdef decode_from_stream(self, BInputStream in_stream, bint nested):
         cdef BeamInputStream input_stream = BeamInputStream(in_stream, in_stream.size())
         return self._value_coder.decode_from_stream(input_stream)
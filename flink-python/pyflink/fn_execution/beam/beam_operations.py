@@ -24,7 +24,8 @@ from apache_beam.utils import proto_utils
 from pyflink.fn_execution import flink_fn_execution_pb2
 from pyflink.fn_execution.coders import from_proto, from_type_info_proto, TimeWindowCoder, \
     CountWindowCoder, FlattenRowCoder
-from pyflink.fn_execution.state_impl import RemoteKeyedStateBackend, RemoteOperatorStateBackend
+from pyflink.fn_execution.state_impl import RemoteKeyedStateBackend, RemoteOperatorStateBackend, \
+    BatchKeyedStateBackend
 
 import pyflink.fn_execution.datastream.operations as datastream_operations
 import pyflink.fn_execution.table.operations as table_operations
@@ -130,7 +131,7 @@ def create_data_stream_keyed_process_function(factory, transform_id, transform_p
         return _create_user_defined_function_operation(
             factory, transform_proto, consumers, payload,
             beam_operations.StatelessFunctionOperation,
-            datastream_operations.StatelessOperation)
+            datastream_operations.create_stateless_operation)
     else:
         return _create_user_defined_function_operation(
             factory, transform_proto, consumers, payload,
@@ -195,13 +196,17 @@ def _create_user_defined_function_operation(factory, transform_proto, consumers,
         )
     elif internal_operation_cls == datastream_operations.StatefulOperation:
         key_row_coder = from_type_info_proto(serialized_fn.key_type_info)
-        keyed_state_backend = RemoteKeyedStateBackend(
-            factory.state_handler,
-            key_row_coder,
-            None,
-            serialized_fn.state_cache_size,
-            serialized_fn.map_state_read_cache_size,
-            serialized_fn.map_state_write_cache_size)
+        if serialized_fn.runtime_context.in_batch_execution_mode:
+            # the input is sorted by key, the state of the current key is kept in Python only
+            keyed_state_backend = BatchKeyedStateBackend(key_row_coder, None)
+        else:
+            keyed_state_backend = RemoteKeyedStateBackend(
+                factory.state_handler,
+                key_row_coder,
+                None,
+                serialized_fn.state_cache_size,
+                serialized_fn.map_state_read_cache_size,
+                serialized_fn.map_state_write_cache_size)
         return beam_operation_cls(
             name,
             spec,
@@ -34,9 +34,20 @@ cdef class IntermediateInputProcessor(InputProcessor):
     cdef object _input_values
     cdef object _next_value
 
+cdef class ReadAheadInputProcessor(InputProcessor):
+    cdef InputProcessor _input_processor
+    cdef object _operation
+    cdef size_t _read_ahead_size
+    cdef list _buffered_values
+    cdef size_t _buffered_num
+    cdef size_t _next_index
+
 cdef class OutputProcessor:
     cdef Operation _consumer
     cpdef process_outputs(self, WindowedValue windowed_value, results)
+    cpdef process_columns_outputs(self, WindowedValue windowed_value, list columns)
+    cpdef flush(self)
+    cpdef register_metrics(self, metric_group)
     cpdef close(self)
 
 cdef class NetworkOutputProcessor(OutputProcessor):
@@ -50,6 +61,9 @@ cdef class FunctionOperation(Operation):
     cdef OutputProcessor _main_output_processor
     cdef bint _has_side_output
     cdef bint _is_python_coder
+    cdef bint _columnar_coding_enabled
+    cdef bint _flush_on_idle
+    cdef size_t _state_read_ahead_size
     cdef object process_element
     cdef object operation
     cdef object operation_cls
@@ -31,6 +31,7 @@ from pyflink.fn_execution.coder_impl_fast cimport InputStreamWrapper
 from pyflink.fn_execution.flink_fn_execution_pb2 import UserDefinedDataStreamFunction
 from pyflink.fn_execution.table.operations import BundleOperation, BaseOperation as TableOperation
 from pyflink.fn_execution.profiler import Profiler
+from pyflink.fn_execution.utils.operation_utils import OutputFlushPolicy
 
 
 cdef class InputProcessor:
@@ -72,11 +73,54 @@ cdef class IntermediateInputProcessor(InputProcessor):
         return self._next_value
 
 
+cdef class ReadAheadInputProcessor(InputProcessor):
+    """
+    Decodes the input elements in batches and sends out the state reads of each batch before
+    handing out the elements of the batch one by one in the original order.
+    """
+
+    def __init__(self, InputProcessor input_processor, operation, size_t read_ahead_size):
+        self._input_processor = input_processor
+        self._operation = operation
+        self._read_ahead_size = read_ahead_size
+        self._buffered_values = []
+        self._buffered_num = 0
+        self._next_index = 0
+
+    cpdef has_next(self):
+        if self._next_index < self._buffered_num:
+            return True
+        self._buffered_values = []
+        while len(self._buffered_values) < self._read_ahead_size and \
+                self._input_processor.has_next():
+            self._buffered_values.append(self._input_processor.next())
+        self._buffered_num = len(self._buffered_values)
+        self._next_index = 0
+        if self._buffered_num > 0:
+            self._operation.prefetch_state(self._buffered_values)
+            return True
+        return False
+
+    cpdef next(self):
+        value = self._buffered_values[self._next_index]
+        self._next_index += 1
+        return value
+
+
 cdef class OutputProcessor:
 
     cpdef process_outputs(self, WindowedValue windowed_value, results):
         pass
 
+    cpdef process_columns_outputs(self, WindowedValue windowed_value, list columns):
+        pass
+
+    cpdef flush(self):
+        pass
+
+    cpdef register_metrics(self, metric_group):
+        pass
+
     cpdef close(self):
         pass
 
@@ -92,6 +136,17 @@ cdef class NetworkOutputProcessor(OutputProcessor):
         self._value_coder_impl.encode_to_stream(results, output_stream, True)
         self._value_coder_impl._output_stream.maybe_flush()
 
+    cpdef process_columns_outputs(self, WindowedValue windowed_value, list columns):
+        output_stream = self._consumer.output_stream
+        self._value_coder_impl.encode_columns_to_stream(columns, output_stream)
+        self._value_coder_impl._output_stream.maybe_flush()
+
+    cpdef flush(self):
+        self._value_coder_impl._output_stream.flush_buffered()
+
+    cpdef register_metrics(self, metric_group):
+        self._value_coder_impl._output_stream.get_flush_latency().register_metrics(metric_group)
+
     cpdef close(self):
         self._value_coder_impl._output_stream.close()
 
@@ -103,6 +158,10 @@ cdef class IntermediateOutputProcessor(OutputProcessor):
     cpdef process_outputs(self, WindowedValue windowed_value, results):
         self._consumer.process(windowed_value.with_value(results))
 
+    cpdef process_columns_outputs(self, WindowedValue windowed_value, list columns):
+        for row in zip(*columns):
+            self._consumer.process(windowed_value.with_value(list(row)))
+
 
 cdef class FunctionOperation(Operation):
     """
@@ -142,6 +201,12 @@ cdef class FunctionOperation(Operation):
             self._has_side_output = False
         if not self._has_side_output:
             self._main_output_processor = self._output_processors[DEFAULT_OUTPUT_TAG][0]
+        self._state_read_ahead_size = self.operation.get_state_read_ahead_size()
+        self._columnar_coding_enabled = \
+            not self._is_python_coder and not self._has_side_output and \
+            self.operation.is_columnar_coding_enabled()
+        self._flush_on_idle = OutputFlushPolicy.from_environment().flush_on_idle
+        self._register_output_metrics()
 
     cpdef start(self):
         with self.scoped_start_state:
@@ -170,11 +235,18 @@ cdef class FunctionOperation(Operation):
             if self._is_python_coder:
                 for value in o.value:
                     self._main_output_processor.process_outputs(o, self.process_element(value))
+            elif self._columnar_coding_enabled and isinstance(o.value, InputStreamWrapper):
+                input_stream_wrapper = <InputStreamWrapper> o.value
+                self._main_output_processor.process_columns_outputs(
+                    o, self.operation.process_columns(input_stream_wrapper.next_columns()))
             else:
                 if isinstance(o.value, InputStreamWrapper):
                     input_processor = NetworkInputProcessor(o.value)
                 else:
                     input_processor = IntermediateInputProcessor(o.value)
+                if self._state_read_ahead_size > 0:
+                    input_processor = ReadAheadInputProcessor(
+                        input_processor, self.operation, self._state_read_ahead_size)
 
                 if self._has_side_output:
                     while input_processor.has_next():
@@ -195,6 +267,11 @@ cdef class FunctionOperation(Operation):
                                 o,
                                 self.process_element(input_processor.next())
                             )
+            if self._flush_on_idle:
+                # all the received input elements have been processed
+                for ps in self._output_processors.values():
+                    for p in ps:
+                        (<OutputProcessor> p).flush()
 
     def progress_metrics(self):
         metrics = super(FunctionOperation, self).progress_metrics()
@@ -205,6 +282,16 @@ cdef class FunctionOperation(Operation):
             str(tag)] = receiver.opcounter.element_counter.value()
         return metrics
 
+    def _register_output_metrics(self):
+        metric_group = self.operation.base_metric_group
+        if metric_group is None:
+            return
+        for tag, ps in self._output_processors.items():
+            output_group = metric_group.add_group(
+                "outputFlushLatency", tag if tag != DEFAULT_OUTPUT_TAG else "main")
+            for p in ps:
+                (<OutputProcessor> p).register_metrics(output_group)
+
     cpdef monitoring_infos(self, transform_id, tag_to_pcollection_id):
         """
         Only pass user metric to Java
@@ -28,6 +28,7 @@ from pyflink.common.constants import DEFAULT_OUTPUT_TAG
 from pyflink.fn_execution.flink_fn_execution_pb2 import UserDefinedDataStreamFunction
 from pyflink.fn_execution.table.operations import BundleOperation
 from pyflink.fn_execution.profiler import Profiler
+from pyflink.fn_execution.utils.operation_utils import OutputFlushPolicy
 
 
 class OutputProcessor(abc.ABC):
@@ -36,6 +37,12 @@ class OutputProcessor(abc.ABC):
     def process_outputs(self, windowed_value: WindowedValue, results: Iterable[Any]):
         pass
 
+    def flush(self):
+        pass
+
+    def register_metrics(self, metric_group):
+        pass
+
     def close(self):
         pass
 
@@ -52,6 +59,12 @@ class NetworkOutputProcessor(OutputProcessor):
         self._value_coder_impl.encode_to_stream(results, output_stream, True)
         self._value_coder_impl._output_stream.maybe_flush()
 
+    def flush(self):
+        self._value_coder_impl._output_stream.flush_buffered()
+
+    def register_metrics(self, metric_group):
+        self._value_coder_impl._output_stream.get_flush_latency().register_metrics(metric_group)
+
     def close(self):
         self._value_coder_impl._output_stream.close()
 
@@ -94,6 +107,9 @@ class FunctionOperation(Operation):
             self._has_side_output = False
         if not self._has_side_output:
             self._main_output_processor = self._output_processors[DEFAULT_OUTPUT_TAG][0]
+        self._state_read_ahead_size = self.operation.get_state_read_ahead_size()
+        self._flush_on_idle = OutputFlushPolicy.from_environment().flush_on_idle
+        self._register_output_metrics()
 
     def setup(self):
         super(FunctionOperation, self).setup()
@@ -136,21 +152,56 @@ class FunctionOperation(Operation):
 
     def process(self, o: WindowedValue):
         with self.scoped_process_state:
+            if self._state_read_ahead_size > 0:
+                input_values = self._read_state_ahead(o.value)
+            else:
+                input_values = o.value
             if self._has_side_output:
-                for value in o.value:
+                for value in input_values:
                     for tag, row in self.process_element(value):
                         for p in self._output_processors.get(tag, []):
                             p.process_outputs(o, [row])
             else:
                 if isinstance(self.operation, BundleOperation):
-                    for value in o.value:
+                    for value in input_values:
                         self.process_element(value)
                     self._main_output_processor.process_outputs(o, self.operation.finish_bundle())
                 else:
-                    for value in o.value:
+                    for value in input_values:
                         self._main_output_processor.process_outputs(
                             o, self.operation.process_element(value)
                         )
+            if self._flush_on_idle:
+                # all the received input elements have been processed
+                for processors in self._output_processors.values():
+                    for p in processors:
+                        p.flush()
+
+    def _read_state_ahead(self, input_values):
+        """
+        Decodes the input elements in batches and sends out the state reads of each batch
+        before processing the elements of the batch one by one in the original order.
+        """
+        buffered_values = []
+        for value in input_values:
+            buffered_values.append(value)
+            if len(buffered_values) == self._state_read_ahead_size:
+                self.operation.prefetch_state(buffered_values)
+                yield from buffered_values
+                buffered_values = []
+        if buffered_values:
+            self.operation.prefetch_state(buffered_values)
+            yield from buffered_values
+
+    def _register_output_metrics(self):
+        metric_group = self.operation.base_metric_group
+        if metric_group is None:
+            return
+        for tag, processors in self._output_processors.items():
+            output_group = metric_group.add_group(
+                "outputFlushLatency", tag if tag != DEFAULT_OUTPUT_TAG else "main")
+            for p in processors:
+                p.register_metrics(output_group)
 
     def monitoring_infos(self, transform_id, tag_to_pcollection_id):
         """
@@ -34,9 +34,13 @@ cdef class BeamSizeBasedOutputStream(LengthPrefixOutputStream):
     cdef size_t _output_pos
     cdef size_t _output_buffer_size
     cdef BOutputStream _output_stream
+    cdef size_t _flush_size
+    cdef double _pending_since
+    cdef object _flush_latency
 
     cdef void reset_output_stream(self, BOutputStream output_stream)
     cpdef bint maybe_flush(self)
+    cpdef bint flush_buffered(self)
 
 cdef class BeamTimeBasedOutputStream(BeamSizeBasedOutputStream):
     cdef bint _flush_event
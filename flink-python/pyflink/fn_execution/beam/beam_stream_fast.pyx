@@ -20,10 +20,13 @@
 # cython: profile=True
 # cython: boundscheck=False, wraparound=False, initializedcheck=False, cdivision=True
 
+import time
+
 from libc.stdlib cimport realloc
 from libc.string cimport memcpy
 
-from pyflink.fn_execution.utils.operation_utils import PeriodicThread
+from pyflink.fn_execution.utils.operation_utils import LatencyHistogram, OutputFlushPolicy, \
+    PeriodicThread
 
 cdef class BeamInputStream(LengthPrefixInputStream):
     def __cinit__(self, input_stream, size):
@@ -57,6 +60,13 @@ cdef class BeamInputStream(LengthPrefixInputStream):
         self._input_pos = input_stream.pos
 
 cdef class BeamSizeBasedOutputStream(LengthPrefixOutputStream):
+    def __init__(self, flush_policy=None):
+        if flush_policy is None:
+            flush_policy = OutputFlushPolicy.from_environment()
+        self._flush_size = flush_policy.flush_size
+        self._pending_since = 0
+        self._flush_latency = LatencyHistogram()
+
     cdef void write(self, char*data, size_t length):
         cdef char bits
         cdef size_t size = length
@@ -88,25 +98,49 @@ cdef class BeamSizeBasedOutputStream(LengthPrefixOutputStream):
     cpdef void flush(self):
         self._output_stream.flush()
         self._output_pos = 0
+        if self._pending_since > 0:
+            self._flush_latency.record(<long> ((time.time() - self._pending_since) * 1000))
+            self._pending_since = 0
 
     cdef void reset_output_stream(self, BOutputStream output_stream):
+        if output_stream is not self._output_stream:
+            # the output buffered in the previous output stream was sent when its bundle finished
+            self._pending_since = 0
         self._output_stream = output_stream
         self._output_data = output_stream.data
         self._output_pos = output_stream.pos
         self._output_buffer_size = output_stream.buffer_size
 
     cpdef bint maybe_flush(self):
-        if self._output_pos > 10_000_000:
+        if self._output_pos > self._flush_size:
             self.flush()
             return True
+        if self._pending_since == 0 and self._output_pos > 0:
+            self._pending_since = time.time()
         return False
 
+    cpdef bint flush_buffered(self):
+        if self._output_pos > 0:
+            self.flush()
+            return True
+        return False
+
+    def get_flush_latency(self):
+        return self._flush_latency
+
 cdef class BeamTimeBasedOutputStream(BeamSizeBasedOutputStream):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, flush_policy=None):
+        if flush_policy is None:
+            flush_policy = OutputFlushPolicy.from_environment()
+        super(BeamTimeBasedOutputStream, self).__init__(flush_policy)
         self._flush_event = False
-        self._periodic_flusher = PeriodicThread(1, self.notify_flush)
-        self._periodic_flusher.daemon = True
-        self._periodic_flusher.start()
+        if flush_policy.flush_interval_millis > 0:
+            self._periodic_flusher = PeriodicThread(
+                flush_policy.flush_interval_millis / 1000, self.notify_flush)
+            self._periodic_flusher.daemon = True
+            self._periodic_flusher.start()
+        else:
+            self._periodic_flusher = None
 
     cpdef void notify_flush(self):
         self._flush_event = True
@@ -118,7 +152,13 @@ cdef class BeamTimeBasedOutputStream(BeamSizeBasedOutputStream):
 
     cpdef bint maybe_flush(self):
         if self._flush_event:
-            self.flush()
             self._flush_event = False
+            return BeamSizeBasedOutputStream.flush_buffered(self)
         elif BeamSizeBasedOutputStream.maybe_flush(self):
             self._flush_event = False
+            return True
+        return False
+
+    cpdef bint flush_buffered(self):
+        self._flush_event = False
+        return BeamSizeBasedOutputStream.flush_buffered(self)
@@ -15,10 +15,35 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
+import time
+
+from apache_beam import version as beam_version
+from apache_beam.coders import slow_stream
 from apache_beam.coders.coder_impl import create_InputStream, create_OutputStream
 
 from pyflink.fn_execution.stream_slow import InputStream
-from pyflink.fn_execution.utils.operation_utils import PeriodicThread
+from pyflink.fn_execution.utils.operation_utils import LatencyHistogram, OutputFlushPolicy, \
+    PeriodicThread
+
+# the pure Python input stream of Beam 2.x keeps its bytes in `data` and its position in `pos`,
+# the bytes of the input streams of the other Beam versions are only read via its public methods
+_READ_BEAM_INPUT_STREAM_IN_PLACE = beam_version.__version__.split('.')[0] == '2'
+
+
+def _read_beam_input_stream_in_place(input_stream, size):
+    """
+    Reads the next *size* bytes of a Beam input stream as a memoryview of its bytes without copying
+    them. None is returned if the bytes of the input stream aren't accessible, e.g. it's the
+    compiled input stream which doesn't expose its underlying bytes.
+    """
+    if not _READ_BEAM_INPUT_STREAM_IN_PLACE or type(input_stream) is not slow_stream.InputStream:
+        return None
+    data = getattr(input_stream, 'data', None)
+    pos = getattr(input_stream, 'pos', None)
+    if not isinstance(data, bytes) or not isinstance(pos, int):
+        return None
+    input_stream.pos = pos + size
+    return memoryview(data)[pos: pos + size]
 
 
 class BeamInputStream(InputStream):
@@ -29,6 +54,12 @@ class BeamInputStream(InputStream):
     def read(self, size):
         return self._input_stream.read(size)
 
+    def read_buffer(self, size):
+        data = _read_beam_input_stream_in_place(self._input_stream, size)
+        if data is None:
+            return self._input_stream.read(size)
+        return data
+
     def read_byte(self):
         return self._input_stream.read_byte()
 
@@ -37,18 +68,30 @@ class BeamInputStream(InputStream):
 
 
 class BeamTimeBasedOutputStream(create_OutputStream):
-    def __init__(self):
+    def __init__(self, flush_policy: OutputFlushPolicy = None):
         super(BeamTimeBasedOutputStream).__init__()
+        if flush_policy is None:
+            flush_policy = OutputFlushPolicy.from_environment()
+        self._flush_size = flush_policy.flush_size
         self._flush_event = False
-        self._periodic_flusher = PeriodicThread(1, self.notify_flush)
-        self._periodic_flusher.daemon = True
-        self._periodic_flusher.start()
+        if flush_policy.flush_interval_millis > 0:
+            self._periodic_flusher = PeriodicThread(
+                flush_policy.flush_interval_millis / 1000, self.notify_flush)
+            self._periodic_flusher.daemon = True
+            self._periodic_flusher.start()
+        else:
+            self._periodic_flusher = None
         self._output_stream = None
+        self._pending_since = 0
+        self._flush_latency = LatencyHistogram()
 
     def write(self, b: bytes):
         self._output_stream.write(b)
 
     def reset_output_stream(self, output_stream: create_OutputStream):
+        if output_stream is not self._output_stream:
+            # the output buffered in the previous output stream was sent when its bundle finished
+            self._pending_since = 0
         self._output_stream = output_stream
 
     def notify_flush(self):
@@ -59,9 +102,28 @@ class BeamTimeBasedOutputStream(create_OutputStream):
             self._periodic_flusher.cancel()
             self._periodic_flusher = None
 
+    def flush(self):
+        self._output_stream.flush()
+        if self._pending_since > 0:
+            self._flush_latency.record(int((time.time() - self._pending_since) * 1000))
+            self._pending_since = 0
+
+    def flush_buffered(self):
+        self._flush_event = False
+        if self._output_stream is not None and self._output_stream.size() > 0:
+            self.flush()
+            return True
+        return False
+
     def maybe_flush(self):
         if self._flush_event:
-            self._output_stream.flush()
-            self._flush_event = False
-        else:
-            self._output_stream.maybe_flush()
+            return self.flush_buffered()
+        elif self._output_stream.size() > self._flush_size:
+            self.flush()
+            return True
+        elif self._pending_since == 0 and self._output_stream.size() > 0:
+            self._pending_since = time.time()
+        return False
+
+    def get_flush_latency(self) -> LatencyHistogram:
+        return self._flush_latency
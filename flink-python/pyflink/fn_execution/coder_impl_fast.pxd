@@ -28,6 +28,14 @@ cdef enum InternalRowKind:
     UPDATE_AFTER = 2
     DELETE = 3
 
+cdef enum ColumnType:
+    GENERIC_COLUMN = 0
+    INT_COLUMN = 1
+    BIGINT_COLUMN = 2
+    BOOLEAN_COLUMN = 3
+    FLOAT_COLUMN = 4
+    DOUBLE_COLUMN = 5
+
 cdef class InternalRow:
     cdef readonly list values
     cdef readonly InternalRowKind row_kind
@@ -67,13 +75,14 @@ cdef class InputStreamWrapper:
 
     cpdef bint has_next(self)
     cpdef next(self)
+    cpdef list next_columns(self)
 
 cdef class IterableCoderImpl(LengthPrefixBaseCoderImpl):
     cdef char*_end_message
     cdef bint _separated_with_end_message
 
 cdef class ValueCoderImpl(LengthPrefixBaseCoderImpl):
-    pass
+    cpdef encode_columns_to_stream(self, list columns, LengthPrefixOutputStream output_stream)
 
 cdef unsigned char ROW_KIND_BIT_SIZE
 
@@ -82,11 +91,16 @@ cdef class FlattenRowCoderImpl(FieldCoderImpl):
     cdef list _reuse_flatten_row
     cdef size_t _field_count
     cdef MaskUtils _mask_utils
+    cdef ColumnType*_column_types
+
+    cpdef list decode_columns(self, LengthPrefixInputStream input_stream)
+    cdef encode_columns_row(self, list columns, size_t index, OutputStream out_stream)
 
 cdef class RowCoderImpl(FieldCoderImpl):
     cdef list _field_coders
     cdef size_t _field_count
     cdef list _field_names
+    cdef dict _field_index
     cdef MaskUtils _mask_utils
 
 cdef class ArrowCoderImpl(FieldCoderImpl):
@@ -94,9 +108,11 @@ cdef class ArrowCoderImpl(FieldCoderImpl):
     cdef list _field_types
     cdef object _timezone
     cdef object _resettable_io
-    cdef object _batch_reader
+    cdef object _batch_writer
+    cdef object _input_schema
 
     cdef list decode_one_batch_from_stream(self, InputStream in_stream, size_t size)
+    cdef object _read_batch(self, data)
 
 cdef class OverWindowArrowCoderImpl(FieldCoderImpl):
     cdef ArrowCoderImpl _arrow_coder
@@ -30,7 +30,8 @@ from typing import List, Union
 import cloudpickle
 import avro.schema as avro_schema
 
-from pyflink.common import Row, RowKind
+from pyflink.common import Row
+from pyflink.common.types import _create_field_index, _create_row_with_schema
 from pyflink.common.time import Instant
 from pyflink.datastream.window import CountWindow, TimeWindow, GlobalWindow
 from pyflink.fn_execution.formats.avro import FlinkAvroDecoder, FlinkAvroDatumReader, \
@@ -47,11 +48,7 @@ cdef class InternalRow:
         self.field_names = []
 
     cpdef object to_row(self):
-        row = Row()
-        row._values = self.values
-        row.set_field_names(self.field_names)
-        row.set_row_kind(RowKind(self.row_kind))
-        return row
+        return _create_row_with_schema(self.values, self.field_names, None, self.row_kind)
 
     @staticmethod
     def from_row(row: Row) -> InternalRow:
@@ -251,6 +248,13 @@ cdef class InputStreamWrapper:
     cpdef next(self):
         return self._value_coder.decode_from_stream(self._input_stream)
 
+    cpdef list next_columns(self):
+        """
+        Decodes all the remaining rows of the input stream into a list of columns.
+        """
+        return (<FlattenRowCoderImpl?> self._value_coder._field_coder).decode_columns(
+            self._input_stream)
+
 cdef class IterableCoderImpl(LengthPrefixBaseCoderImpl):
     """
     Encodes iterable data to output stream. The output mode will decide whether write a special end
@@ -311,6 +315,19 @@ cdef class ValueCoderImpl(LengthPrefixBaseCoderImpl):
 
         return self._field_coder.decode_from_stream(data_input_stream, size)
 
+    cpdef encode_columns_to_stream(self, list columns, LengthPrefixOutputStream output_stream):
+        """
+        Encodes the rows of the given columns one by one, which is equivalent to encoding every
+        row with :func:`encode_to_stream`.
+        """
+        cdef size_t i, row_count
+        cdef FlattenRowCoderImpl field_coder
+        field_coder = <FlattenRowCoderImpl?> self._field_coder
+        row_count = len(columns[0]) if columns else 0
+        for i in range(row_count):
+            field_coder.encode_columns_row(columns, i, self._data_out_stream)
+            self._write_data_to_output_stream(output_stream)
+
 cdef class FlattenRowCoderImpl(FieldCoderImpl):
     """
     A coder for flatten row (List) object (without field names and row kind value is 0).
@@ -321,6 +338,15 @@ cdef class FlattenRowCoderImpl(FieldCoderImpl):
         self._field_count = len(self._field_coders)
         self._mask_utils = MaskUtils(self._field_count)
         self._reuse_flatten_row = [None for i in range(self._field_count)]
+        self._column_types = <ColumnType*> malloc(self._field_count * sizeof(ColumnType))
+        if self._column_types == NULL and self._field_count > 0:
+            raise MemoryError()
+        for i in range(self._field_count):
+            self._column_types[i] = _get_column_type(self._field_coders[i])
+
+    def __dealloc__(self):
+        if self._column_types != NULL:
+            free(self._column_types)
 
     cpdef encode_to_stream(self, value, OutputStream out_stream):
         cdef list list_value, field_coders
@@ -362,9 +388,93 @@ cdef class FlattenRowCoderImpl(FieldCoderImpl):
                 flatten_row[i] = field_coder.decode_from_stream(in_stream, 0)
         return flatten_row
 
+    cpdef list decode_columns(self, LengthPrefixInputStream input_stream):
+        """
+        Decodes all the remaining rows of the length prefixed input stream in one pass. The values
+        of a field are collected in a list. The fixed-width values are read in place instead of
+        via the field coders.
+        """
+        cdef char*input_data
+        cdef bint*mask
+        cdef size_t i
+        cdef ColumnType column_type
+        cdef list columns, column, field_coders
+        cdef InputStream in_stream
+        cdef FieldCoderImpl field_coder
+
+        columns = [[] for _ in range(self._field_count)]
+        field_coders = self._field_coders
+        in_stream = InputStream()
+        while input_stream.available():
+            input_stream.read(&input_data)
+            in_stream._input_data = input_data
+            in_stream._input_pos = 0
+
+            mask = self._mask_utils.read_mask(in_stream)
+            for i in range(self._field_count):
+                column = <list> columns[i]
+                column_type = self._column_types[i]
+                if mask[i + ROW_KIND_BIT_SIZE]:
+                    column.append(None)
+                elif column_type == INT_COLUMN:
+                    column.append(in_stream.read_int32())
+                elif column_type == BIGINT_COLUMN:
+                    column.append(in_stream.read_int64())
+                elif column_type == BOOLEAN_COLUMN:
+                    column.append(in_stream.read_byte() != 0)
+                elif column_type == FLOAT_COLUMN:
+                    column.append(in_stream.read_float())
+                elif column_type == DOUBLE_COLUMN:
+                    column.append(in_stream.read_double())
+                else:
+                    field_coder = <FieldCoderImpl> field_coders[i]
+                    column.append(field_coder.decode_from_stream(in_stream, 0))
+        return columns
+
+    cdef encode_columns_row(self, list columns, size_t index, OutputStream out_stream):
+        cdef size_t i
+        cdef ColumnType column_type
+        cdef list row
+        cdef FieldCoderImpl field_coder
+
+        row = [column[index] for column in columns]
+        self._mask_utils.write_mask(row, 0, out_stream)
+        for i in range(self._field_count):
+            item = row[i]
+            if item is None:
+                continue
+            column_type = self._column_types[i]
+            if column_type == INT_COLUMN:
+                out_stream.write_int32(item)
+            elif column_type == BIGINT_COLUMN:
+                out_stream.write_int64(item)
+            elif column_type == BOOLEAN_COLUMN:
+                out_stream.write_byte(item)
+            elif column_type == FLOAT_COLUMN:
+                out_stream.write_float(item)
+            elif column_type == DOUBLE_COLUMN:
+                out_stream.write_double(item)
+            else:
+                field_coder = <FieldCoderImpl> self._field_coders[i]
+                field_coder.encode_to_stream(item, out_stream)
+
     def __repr__(self):
         return 'FlattenRowCoderImpl[%s]' % ', '.join(str(c) for c in self._field_coders)
 
+cdef ColumnType _get_column_type(FieldCoderImpl field_coder):
+    if isinstance(field_coder, IntCoderImpl):
+        return INT_COLUMN
+    elif isinstance(field_coder, BigIntCoderImpl):
+        return BIGINT_COLUMN
+    elif isinstance(field_coder, BooleanCoderImpl):
+        return BOOLEAN_COLUMN
+    elif isinstance(field_coder, FloatCoderImpl):
+        return FLOAT_COLUMN
+    elif isinstance(field_coder, DoubleCoderImpl):
+        return DOUBLE_COLUMN
+    else:
+        return GENERIC_COLUMN
+
 cdef class RowCoderImpl(FieldCoderImpl):
     """
     A coder for `Row` or `InternalRow` object.
@@ -374,6 +484,7 @@ cdef class RowCoderImpl(FieldCoderImpl):
         self._field_coders = field_coders  # type: List[FieldCoderImpl]
         self._field_count = len(self._field_coders)
         self._field_names = field_names  # type: List[str]
+        self._field_index = _create_field_index(tuple(field_names))
         self._mask_utils = MaskUtils(self._field_count)
 
     cpdef encode_to_stream(self, value: Union[Row, InternalRow], OutputStream out_stream):
@@ -414,13 +525,10 @@ cdef class RowCoderImpl(FieldCoderImpl):
             else:
                 field_coder = <FieldCoderImpl> self._field_coders[i]
                 field_values.append(field_coder.decode_from_stream(in_stream, 0))
-        row = Row()
-        row._values = field_values
         for i in range(ROW_KIND_BIT_SIZE):
             row_kind_value += mask[i] * 2 ** i
-        row.set_field_names(self._field_names)
-        row.set_row_kind(RowKind(row_kind_value))
-        return row
+        return _create_row_with_schema(
+            field_values, self._field_names, self._field_index, row_kind_value)
 
     def __repr__(self):
         return 'RowCoderImpl[%s, %s]' % \
@@ -436,30 +544,39 @@ cdef class ArrowCoderImpl(FieldCoderImpl):
         self._field_types = row_type.field_types()
         self._timezone = timezone
         self._resettable_io = ResettableIO()
-        self._batch_reader = self._load_from_stream(self._resettable_io)
+        self._batch_writer = None
+        self._input_schema = None
 
     cpdef encode_to_stream(self, cols, OutputStream out_stream):
         import pyarrow as pa
 
         self._resettable_io.set_output_stream(out_stream)
-        batch_writer = pa.RecordBatchStreamWriter(self._resettable_io, self._schema)
-        batch_writer.write_batch(
+        if self._batch_writer is None:
+            # the schema is only written before the first arrow batch, the following arrow
+            # batches are written as bare record batch messages
+            self._batch_writer = pa.RecordBatchStreamWriter(self._resettable_io, self._schema)
+        self._batch_writer.write_batch(
             pandas_to_arrow(self._schema, self._timezone, self._field_types, cols))
 
     cpdef decode_from_stream(self, InputStream in_stream, size_t size):
         return self.decode_one_batch_from_stream(in_stream, size)
 
     cdef list decode_one_batch_from_stream(self, InputStream in_stream, size_t size):
-        self._resettable_io.set_input_bytes(in_stream.read(size))
         # there is only one arrow batch in the underlying input stream
-        return arrow_to_pandas(self._timezone, self._field_types, [next(self._batch_reader)])
+        return arrow_to_pandas(
+            self._timezone, self._field_types, [self._read_batch(in_stream.read(size))])
 
-    def _load_from_stream(self, stream):
+    cdef object _read_batch(self, data):
         import pyarrow as pa
 
-        while stream.readable():
-            reader = pa.ipc.open_stream(stream)
-            yield reader.read_next_batch()
+        message_reader = pa.ipc.MessageReader.open_stream(data)
+        message = message_reader.read_next_message()
+        if message.type == 'schema':
+            # a new arrow stream begins, the schema is kept for the following arrow batches
+            # which are sent as bare record batch messages
+            self._input_schema = pa.ipc.read_schema(message)
+            message = message_reader.read_next_message()
+        return pa.ipc.read_record_batch(message, self._input_schema)
 
     def __repr__(self):
         return 'ArrowCoderImpl[%s]' % self._schema
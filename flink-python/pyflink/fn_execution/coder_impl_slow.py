@@ -24,7 +24,8 @@ from typing import List
 import cloudpickle
 import avro.schema as avro_schema
 
-from pyflink.common import Row, RowKind
+from pyflink.common import Row
+from pyflink.common.types import _create_field_index, _create_row_with_schema
 from pyflink.common.time import Instant
 from pyflink.datastream.window import TimeWindow, CountWindow
 from pyflink.fn_execution.ResettableIO import ResettableIO
@@ -237,6 +238,7 @@ class RowCoderImpl(FieldCoderImpl):
         self._field_coders = field_coders
         self._field_count = len(field_coders)
         self._field_names = field_names
+        self._field_index = _create_field_index(tuple(field_names))
         self._mask_utils = MaskUtils(self._field_count)
 
     def encode_to_stream(self, value: Row, out_stream: OutputStream):
@@ -261,10 +263,8 @@ class RowCoderImpl(FieldCoderImpl):
         for i in range(ROW_KIND_BIT_SIZE):
             row_kind_value += int(row_kind_and_null_mask[i]) * 2 ** i
 
-        row = Row(*fields)
-        row.set_field_names(self._field_names)
-        row.set_row_kind(RowKind(row_kind_value))
-        return row
+        return _create_row_with_schema(
+            fields, self._field_names, self._field_index, row_kind_value)
 
     def __repr__(self):
         return 'RowCoderImpl[%s, %s]' % \
@@ -281,31 +281,39 @@ class ArrowCoderImpl(FieldCoderImpl):
         self._field_types = row_type.field_types()
         self._timezone = timezone
         self._resettable_io = ResettableIO()
-        self._batch_reader = ArrowCoderImpl._load_from_stream(self._resettable_io)
+        self._batch_writer = None
+        self._input_schema = None
 
     def encode_to_stream(self, cols, out_stream: OutputStream):
         import pyarrow as pa
 
         self._resettable_io.set_output_stream(out_stream)
-        batch_writer = pa.RecordBatchStreamWriter(self._resettable_io, self._schema)
-        batch_writer.write_batch(
+        if self._batch_writer is None:
+            # the schema is only written before the first arrow batch, the following arrow
+            # batches are written as bare record batch messages
+            self._batch_writer = pa.RecordBatchStreamWriter(self._resettable_io, self._schema)
+        self._batch_writer.write_batch(
             pandas_to_arrow(self._schema, self._timezone, self._field_types, cols))
 
     def decode_from_stream(self, in_stream: InputStream, length=0):
         return self.decode_one_batch_from_stream(in_stream, length)
 
     def decode_one_batch_from_stream(self, in_stream: InputStream, size: int) -> List:
-        self._resettable_io.set_input_bytes(in_stream.read(size))
-        # there is only one arrow batch in the underlying input stream
-        return arrow_to_pandas(self._timezone, self._field_types, [next(self._batch_reader)])
+        # there is only one arrow batch in the underlying input stream, which is read in place
+        return arrow_to_pandas(
+            self._timezone, self._field_types, [self._read_batch(in_stream.read_buffer(size))])
 
-    @staticmethod
-    def _load_from_stream(stream):
+    def _read_batch(self, data):
         import pyarrow as pa
 
-        while stream.readable():
-            reader = pa.ipc.open_stream(stream)
-            yield reader.read_next_batch()
+        message_reader = pa.ipc.MessageReader.open_stream(pa.py_buffer(data))
+        message = message_reader.read_next_message()
+        if message.type == 'schema':
+            # a new arrow stream begins, the schema is kept for the following arrow batches
+            # which are sent as bare record batch messages
+            self._input_schema = pa.ipc.read_schema(message)
+            message = message_reader.read_next_message()
+        return pa.ipc.read_record_batch(message, self._input_schema)
 
     def __repr__(self):
         return 'ArrowCoderImpl[%s]' % self._schema
@@ -21,7 +21,7 @@ from typing import cast
 from pyflink.common import Row
 from pyflink.common.serializer import VoidNamespaceSerializer
 from pyflink.datastream import TimeDomain, RuntimeContext
-from pyflink.datastream.functions import BroadcastProcessFunction
+from pyflink.datastream.functions import BroadcastProcessFunction, InternalBatchFunction
 from pyflink.datastream.window import WindowOperationDescriptor
 from pyflink.fn_execution import pickle
 from pyflink.fn_execution.datastream.process_function import (
@@ -48,6 +48,8 @@ from pyflink.metrics.metricbase import GenericMetricGroup
 DATA_STREAM_STATELESS_FUNCTION_URN = "flink:transform:ds:stateless_function:v1"
 DATA_STREAM_STATEFUL_FUNCTION_URN = "flink:transform:ds:stateful_function:v1"
 
+STATE_READ_AHEAD_SIZE = "python.state.read-ahead-size"
+
 
 class Operation(abc.ABC):
     def __init__(self, serialized_fn, operator_state_backend=None):
@@ -74,6 +76,30 @@ class Operation(abc.ABC):
     def process_element(self, value):
         raise NotImplementedError
 
+    def get_state_read_ahead_size(self) -> int:
+        """
+        Returns the number of input elements whose state is read ahead of processing them. The
+        state reads of these elements are sent out by :func:`prefetch_state` at the same time,
+        and the elements are then processed one by one in the original order.
+        """
+        return 0
+
+    def prefetch_state(self, values) -> None:
+        pass
+
+    def is_columnar_coding_enabled(self) -> bool:
+        """
+        Returns whether all the rows of an input data element are handed to
+        :func:`process_columns` at once, decoded into a list of columns.
+        """
+        return False
+
+    def process_columns(self, columns):
+        """
+        Processes the rows of the given columns and returns the results as a list of columns.
+        """
+        raise NotImplementedError
+
     def open(self) -> None:
         pass
 
@@ -81,8 +107,13 @@ class Operation(abc.ABC):
         pass
 
 
+class BundleOperation(object):
+    def finish_bundle(self):
+        raise NotImplementedError
+
+
 class StatelessOperation(Operation):
-    def __init__(self, serialized_fn, operator_state_backend):
+    def __init__(self, serialized_fn, operator_state_backend, user_defined_func=None):
         super(StatelessOperation, self).__init__(serialized_fn, operator_state_backend)
         (
             self.open_func,
@@ -94,6 +125,7 @@ class StatelessOperation(Operation):
                 serialized_fn.runtime_context, self.base_metric_group
             ),
             operator_state_store=operator_state_backend,
+            user_defined_func=user_defined_func,
         )
 
     def open(self):
@@ -106,28 +138,103 @@ class StatelessOperation(Operation):
         return self.process_element_func(value)
 
 
+class StatelessBatchOperation(Operation, BundleOperation):
+    """
+    Operation which buffers the input elements of a bundle and processes them in batches with an
+    :class:`InternalBatchFunction` when the bundle finishes.
+    """
+
+    def __init__(self, serialized_fn, operator_state_backend, batch_function):
+        super(StatelessBatchOperation, self).__init__(serialized_fn, operator_state_backend)
+        self.batch_function = batch_function  # type: InternalBatchFunction
+        self.runtime_context = StreamingRuntimeContext.of(
+            serialized_fn.runtime_context, self.base_metric_group
+        )
+        self.batch_size = batch_function.batch_size
+        self._buffered_values = []
+
+    def open(self):
+        self.batch_function.open(self.runtime_context)
+
+    def close(self):
+        self.batch_function.close()
+
+    def process_element(self, value):
+        self._buffered_values.append(value)
+
+    def finish_bundle(self):
+        buffered_values, self._buffered_values = self._buffered_values, []
+        for start in range(0, len(buffered_values), self.batch_size):
+            # VALUE[CURRENT_TIMESTAMP, CURRENT_WATERMARK, NORMAL_DATA]
+            batch = buffered_values[start:start + self.batch_size]
+            results = self.batch_function.process_batch([value[2] for value in batch])
+            if not self.batch_function.is_flat():
+                # every result belongs to the input element at the same position
+                for value, result in zip(batch, results):
+                    yield Row(value[0], value[1], result)
+            else:
+                # the results can't be matched with the input elements, use the timestamp and
+                # watermark of the last element of the batch
+                timestamp = batch[-1][0]
+                watermark = batch[-1][1]
+                for result in results:
+                    yield Row(timestamp, watermark, result)
+
+
+def create_stateless_operation(serialized_fn, operator_state_backend=None):
+    """
+    Creates the operation for the stateless function of the given proto representation. The
+    functions of :func:`DataStream.map_batch` and :func:`DataStream.flat_map_batch` are executed
+    by a :class:`StatelessBatchOperation`, the other functions by a :class:`StatelessOperation`.
+    """
+    from pyflink.fn_execution import flink_fn_execution_pb2
+
+    if serialized_fn.function_type == \
+            flink_fn_execution_pb2.UserDefinedDataStreamFunction.PROCESS:
+        user_defined_func = pickle.loads(serialized_fn.payload)
+        if isinstance(user_defined_func, InternalBatchFunction):
+            return StatelessBatchOperation(
+                serialized_fn, operator_state_backend, user_defined_func)
+        return StatelessOperation(serialized_fn, operator_state_backend, user_defined_func)
+    return StatelessOperation(serialized_fn, operator_state_backend)
+
+
 class StatefulOperation(Operation):
     def __init__(self, serialized_fn, keyed_state_backend, operator_state_backend):
         super(StatefulOperation, self).__init__(serialized_fn, operator_state_backend)
         self.keyed_state_backend = keyed_state_backend
+        if self.base_metric_group is not None:
+            self.keyed_state_backend.register_metrics(
+                self.base_metric_group.add_group("stateCache"))
+        runtime_context = StreamingRuntimeContext.of(
+            serialized_fn.runtime_context,
+            self.base_metric_group,
+            self.keyed_state_backend,
+        )
         (
             self.open_func,
             self.close_func,
             self.process_element_func,
             self.process_timer_func,
             self.internal_timer_service,
+            self.state_key_extractor,
         ) = extract_stateful_function(
             user_defined_function_proto=serialized_fn,
-            runtime_context=StreamingRuntimeContext.of(
-                serialized_fn.runtime_context,
-                self.base_metric_group,
-                self.keyed_state_backend,
-            ),
+            runtime_context=runtime_context,
             keyed_state_backend=self.keyed_state_backend,
         )
+        # in BATCH execution mode the state is kept in the Python worker, see
+        # BatchKeyedStateBackend, so there is nothing to read ahead
+        if self.state_key_extractor is not None and \
+                not runtime_context._in_batch_execution_mode:
+            self._state_read_ahead_size = int(
+                runtime_context.get_job_parameter(STATE_READ_AHEAD_SIZE, "0"))
+        else:
+            self._state_read_ahead_size = 0
 
     def finish(self):
         super().finish()
+        self.internal_timer_service.flush()
         self.keyed_state_backend.commit()
 
     def open(self):
@@ -139,6 +246,13 @@ class StatefulOperation(Operation):
     def process_element(self, value):
         return self.process_element_func(value)
 
+    def get_state_read_ahead_size(self) -> int:
+        return self._state_read_ahead_size
+
+    def prefetch_state(self, values):
+        self.keyed_state_backend.prefetch_states(
+            [self.state_key_extractor(value) for value in values])
+
     def process_timer(self, timer_data):
         return self.process_timer_func(timer_data)
 
@@ -147,7 +261,10 @@ class StatefulOperation(Operation):
 
 
 def extract_stateless_function(
-    user_defined_function_proto, runtime_context: RuntimeContext, operator_state_store
+    user_defined_function_proto,
+    runtime_context: RuntimeContext,
+    operator_state_store,
+    user_defined_func=None,
 ):
     """
     Extracts user-defined-function from the proto representation of a
@@ -156,6 +273,7 @@ def extract_stateless_function(
     :param user_defined_function_proto: the proto representation of the Python :class:`Function`
     :param runtime_context: the streaming runtime context
     :param operator_state_store: operator state store for getting broadcast states
+    :param user_defined_func: the user-defined-function if it has already been deserialized
     """
     from pyflink.fn_execution import flink_fn_execution_pb2
 
@@ -180,7 +298,8 @@ def extract_stateless_function(
         process_element_func = revise_output
 
     else:
-        user_defined_func = pickle.loads(user_defined_function_proto.payload)
+        if user_defined_func is None:
+            user_defined_func = pickle.loads(user_defined_function_proto.payload)
 
         def open_func():
             if hasattr(user_defined_func, "open"):
@@ -332,6 +451,10 @@ def extract_stateful_function(
                     input_selector(normal_data), ctx
                 )
 
+            def state_key_extractor(value):
+                # VALUE[CURRENT_TIMESTAMP, CURRENT_WATERMARK, NORMAL_DATA]
+                return state_key_selector(value[2])
+
         elif func_type == UserDefinedDataStreamFunction.KEYED_CO_PROCESS:
 
             def process_element(normal_data, timestamp: int):
@@ -354,6 +477,11 @@ def extract_stateful_function(
                         input_selector(user_input), ctx
                     )
 
+            def state_key_extractor(value):
+                # VALUE[CURRENT_TIMESTAMP, CURRENT_WATERMARK, [isLeft, leftInput, rightInput]]
+                normal_data = value[2]
+                return state_key_selector(normal_data[1] if normal_data[0] else normal_data[2])
+
         else:
             raise Exception("Unsupported func_type: " + str(func_type))
 
@@ -403,6 +531,10 @@ def extract_stateful_function(
             keyed_state_backend.set_current_key(key)
             return window_operator.on_processing_time(timestamp, key, namespace)
 
+        # the window state is stored under the window namespaces which are only known after the
+        # elements have been assigned to windows, so it could not be read ahead
+        state_key_extractor = None
+
     else:
         raise Exception("Unsupported function_type: " + str(func_type))
 
@@ -424,4 +556,5 @@ def extract_stateful_function(
         process_element_func,
         process_timer_func,
         internal_timer_service,
+        state_key_extractor,
     )
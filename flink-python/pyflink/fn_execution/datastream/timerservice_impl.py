@@ -78,13 +78,25 @@ class LegacyInternalTimerServiceImpl(InternalTimerService[N]):
 class InternalTimerServiceImpl(InternalTimerService[N]):
     """
     Internal implementation of InternalTimerService.
+
+    The timer operations are not sent at once, but kept until the end of the bundle. Only the last
+    operation of every timer is sent, as the earlier ones don't affect the final state of the timer,
+    e.g. registering the same timer for every element results in only one registration.
     """
 
+    # the pending timer operations are sent once there are more of them than this
+    MAX_PENDING_TIMER_OPERATIONS = 10000
+
     def __init__(self, keyed_state_backend):
         self._keyed_state_backend = keyed_state_backend
         self._current_watermark = None
         self._timer_coder_impl = None
         self._output_stream = None
+        # (is event time timer, encoded key, encoded namespace, timestamp) ->
+        # (timer operation type, key)
+        self._pending_timer_operations = {}
+        self._last_namespace = None
+        self._last_encoded_namespace = None
 
         from apache_beam.transforms.window import GlobalWindow
 
@@ -122,27 +134,47 @@ class InternalTimerServiceImpl(InternalTimerService[N]):
         current_key = self._keyed_state_backend.get_current_key()
         self._set_timer(TimerOperandType.DELETE_EVENT_TIMER, ts, current_key, namespace)
 
-    def _set_timer(self, timer_operation_type, ts, key, namespace):
+    def flush(self):
+        """
+        Sends the pending timer operations.
+        """
+        if not self._pending_timer_operations:
+            return
         from apache_beam.transforms import userstate
 
-        bytes_io = BytesIO()
-        self._namespace_serializer.serialize(namespace, bytes_io)
-        encoded_namespace = bytes_io.getvalue()
-
-        timer_operand_type_value = timer_operation_type.value
-        timer_data = Row(timer_operand_type_value, -1, ts, key, encoded_namespace)
-
-        timer = userstate.Timer(
-            user_key=timer_data,
-            dynamic_timer_tag='',
-            windows=(self._global_window, ),
-            clear_bit=True,
-            fire_timestamp=None,
-            hold_timestamp=None,
-            paneinfo=None)
-        self._timer_coder_impl.encode_to_stream(timer, self._output_stream, True)
+        for (_, _, encoded_namespace, ts), (timer_operation_type, key) in \
+                self._pending_timer_operations.items():
+            timer_data = Row(timer_operation_type.value, -1, ts, key, encoded_namespace)
+            timer = userstate.Timer(
+                user_key=timer_data,
+                dynamic_timer_tag='',
+                windows=(self._global_window, ),
+                clear_bit=True,
+                fire_timestamp=None,
+                hold_timestamp=None,
+                paneinfo=None)
+            self._timer_coder_impl.encode_to_stream(timer, self._output_stream, True)
+        self._pending_timer_operations.clear()
         self._timer_coder_impl._key_coder_impl._value_coder._output_stream.maybe_flush()
 
+    def _set_timer(self, timer_operation_type, ts, key, namespace):
+        if self._last_encoded_namespace is None or namespace != self._last_namespace:
+            bytes_io = BytesIO()
+            self._namespace_serializer.serialize(namespace, bytes_io)
+            self._last_namespace = namespace
+            self._last_encoded_namespace = bytes_io.getvalue()
+
+        is_event_time_timer = timer_operation_type in (
+            TimerOperandType.REGISTER_EVENT_TIMER, TimerOperandType.DELETE_EVENT_TIMER)
+        # a later operation of a timer overrides the earlier one
+        self._pending_timer_operations[(
+            is_event_time_timer,
+            self._keyed_state_backend.get_encoded_current_key(),
+            self._last_encoded_namespace,
+            ts)] = (timer_operation_type, key)
+        if len(self._pending_timer_operations) > self.MAX_PENDING_TIMER_OPERATIONS:
+            self.flush()
+
 
 class TimerServiceImpl(TimerService):
     """
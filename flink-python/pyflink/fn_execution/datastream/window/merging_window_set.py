@@ -34,6 +34,13 @@ class MergeResultsCallback(MergingWindowAssigner.MergeCallback):
 
 
 class MergingWindowSet(Generic[W]):
+    """
+    Utility for keeping track of merging windows when using a MergingWindowAssigner.
+
+    It keeps the mapping from the in-flight windows to the windows under which their contents are
+    stored in the state. The mapping is read from the state once and only the changed entries are
+    written back by :func:`persist`, so that the set could be kept across the elements of a key.
+    """
 
     class MergeFunction(ABC, Generic[W]):
 
@@ -53,13 +60,24 @@ class MergingWindowSet(Generic[W]):
             self._mapping[window_for_user] = window_in_state
 
         self._state = state
-        self._initial_mapping = dict(self._mapping)
+        self._persisted_mapping = dict(self._mapping)
+        # the windows whose mapping may have changed since the last time it was persisted
+        self._changed_windows = set()
 
     def persist(self) -> None:
-        if self._mapping != self._initial_mapping:
-            self._state.clear()
-            for window_for_user, window_in_state in self._mapping.items():
-                self._state.put(window_for_user, window_in_state)
+        for window in self._changed_windows:
+            if window in self._mapping:
+                window_in_state = self._mapping[window]
+                if self._persisted_mapping.get(window) != window_in_state:
+                    self._state.put(window, window_in_state)
+                    self._persisted_mapping[window] = window_in_state
+            elif window in self._persisted_mapping:
+                self._state.remove(window)
+                del self._persisted_mapping[window]
+        self._changed_windows.clear()
+
+    def is_empty(self) -> bool:
+        return len(self._mapping) == 0
 
     def get_state_window(self, window: W) -> W:
         if window in self._mapping:
@@ -70,6 +88,7 @@ class MergingWindowSet(Generic[W]):
     def retire_window(self, window) -> None:
         if window in self._mapping:
             self._mapping.pop(window)
+            self._changed_windows.add(window)
         else:
             raise Exception("Window %s is not in in-flight window set." % window)
 
@@ -97,9 +116,11 @@ class MergingWindowSet(Generic[W]):
             for merged_window in merged_windows:
                 if merged_window in self._mapping:
                     res = self._mapping.pop(merged_window)
+                    self._changed_windows.add(merged_window)
                     merged_state_windows.append(res)
 
             self._mapping[merge_result] = merged_state_window
+            self._changed_windows.add(merge_result)
             merged_state_windows.remove(merged_state_window)
 
             if merge_result not in merged_windows or len(merged_windows) != 1:
@@ -111,5 +132,6 @@ class MergingWindowSet(Generic[W]):
 
         if len(merge_results) == 0 or (result_window == new_window and not merged_new_window):
             self._mapping[result_window] = result_window
+            self._changed_windows.add(result_window)
 
         return result_window
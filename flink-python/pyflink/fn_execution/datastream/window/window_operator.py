@@ -15,11 +15,13 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
+import copy
 import typing
 from typing import TypeVar, Iterable, Collection, Optional
 
 from pyflink.common.constants import MAX_LONG_VALUE
 from pyflink.datastream import WindowAssigner, Trigger, MergingWindowAssigner, TriggerResult
+from pyflink.datastream.window import PanedWindowAssigner, EventTimeTrigger, ProcessingTimeTrigger
 from pyflink.datastream.functions import KeyedStateStore, RuntimeContext, InternalWindowFunction
 from pyflink.datastream.output_tag import OutputTag
 from pyflink.datastream.state import StateDescriptor, ListStateDescriptor, \
@@ -28,7 +30,7 @@ from pyflink.datastream.state import StateDescriptor, ListStateDescriptor, \
 from pyflink.fn_execution.datastream.timerservice import InternalTimerService
 from pyflink.fn_execution.datastream.window.merging_window_set import MergingWindowSet
 from pyflink.fn_execution.internal_state import InternalMergingState, InternalKvState, \
-    InternalAppendingState
+    InternalAppendingState, InternalAggregatingState, InternalReducingState
 from pyflink.metrics import MetricGroup
 
 T = TypeVar("T")
@@ -210,10 +212,23 @@ class WindowAssignerContext(WindowAssigner.WindowAssignerContext):
                  runtime_context: RuntimeContext):
         self._internal_timer_service = internal_timer_service
         self._runtime_context = runtime_context
+        self._frozen_processing_time = None
 
     def get_current_processing_time(self) -> int:
+        if self._frozen_processing_time is not None:
+            return self._frozen_processing_time
         return self._internal_timer_service.current_processing_time()
 
+    def freeze_processing_time(self) -> None:
+        """
+        Makes the current processing time stay the same until it's unfrozen, so that the windows
+        and the pane of an element are assigned at the same processing time.
+        """
+        self._frozen_processing_time = self._internal_timer_service.current_processing_time()
+
+    def unfreeze_processing_time(self) -> None:
+        self._frozen_processing_time = None
+
     def get_runtime_context(self) -> RuntimeContext:
         return self._runtime_context
 
@@ -293,6 +308,14 @@ class WindowOperator(object):
         self.window_state = None  # type: InternalAppendingState
         self.window_merging_state = None  # type: InternalMergingState
         self.merging_sets_state = None
+        # the merging window set of the last accessed key, it is only changed by this operator
+        # and so stays valid across the elements of the key as long as the state cache token,
+        # which changes when the state is restored, stays the same
+        self.merging_window_set = None  # type: MergingWindowSet
+        self.merging_window_set_key = None
+        self.merging_window_set_cache_token = None
+        # whether the window contents are pre-aggregated per pane instead of per window
+        self.paned = False
 
         self.merge_function = None  # type: WindowMergeFunction
 
@@ -326,6 +349,12 @@ class WindowOperator(object):
             self.merging_sets_state = self.keyed_state_backend.get_map_state(
                 "merging-window-set", window_coder, window_coder)
 
+        # The panes are shared by the overlapping windows, so they could only be used when the
+        # window contents are incrementally aggregated and the trigger never purges them.
+        self.paned = isinstance(self.window_assigner, PanedWindowAssigner) and \
+            isinstance(self.window_state, (InternalReducingState, InternalAggregatingState)) and \
+            type(self.trigger) in (EventTimeTrigger, ProcessingTimeTrigger)
+
         self.merge_function = WindowMergeFunction(self)
 
     def close(self):
@@ -333,10 +362,24 @@ class WindowOperator(object):
         self.trigger_context = None
         self.process_context = None
         self.window_assigner_context = None
+        self.merging_window_set = None
+        self.merging_window_set_key = None
+        self.merging_window_set_cache_token = None
 
     def process_element(self, value, timestamp: int):
-        element_windows = self.window_assigner.assign_windows(
-            value, timestamp, self.window_assigner_context)
+        if self.paned:
+            self.window_assigner_context.freeze_processing_time()
+            try:
+                element_windows = self.window_assigner.assign_windows(
+                    value, timestamp, self.window_assigner_context)
+                element_pane = self.window_assigner.assign_pane(
+                    value, timestamp, self.window_assigner_context)
+            finally:
+                self.window_assigner_context.unfreeze_processing_time()
+        else:
+            element_windows = self.window_assigner.assign_windows(
+                value, timestamp, self.window_assigner_context)
+            element_pane = None
 
         is_skipped_element = True
 
@@ -385,10 +428,16 @@ class WindowOperator(object):
             for window in element_windows:
                 if self.is_window_late(window):
                     continue
-                is_skipped_element = False
 
-                self.window_state.set_current_namespace(window)
-                self.window_state.add(value)
+                if not self.paned:
+                    self.window_state.set_current_namespace(window)
+                    self.window_state.add(value)
+                elif is_skipped_element:
+                    # the element is added once to the pane it belongs to, which is shared by all
+                    # the windows of the element
+                    self.window_state.set_current_namespace(element_pane)
+                    self.window_state.add(value)
+                is_skipped_element = False
 
                 self.trigger_context.user_key = self.user_key_selector(key)
                 self.trigger_context.window = window
@@ -396,7 +445,10 @@ class WindowOperator(object):
                 trigger_result = self.trigger_context.on_element(value, timestamp)
 
                 if trigger_result.is_fire():
-                    contents = self.window_state.get()
+                    if self.paned:
+                        contents = self.merge_panes(window)
+                    else:
+                        contents = self.window_state.get()
                     # for list state the iterable will never be none
                     if isinstance(self.window_state, ListState):
                         contents = [i for i in contents]
@@ -437,7 +489,10 @@ class WindowOperator(object):
         trigger_result = self.trigger_context.on_event_time(timestamp)
 
         if trigger_result.is_fire():
-            contents = self.window_state.get()
+            if self.paned:
+                contents = self.merge_panes(self.trigger_context.window)
+            else:
+                contents = self.window_state.get()
             # for list state the iterable will never be none
             if isinstance(self.window_state, ListState):
                 contents = [i for i in contents]
@@ -477,7 +532,10 @@ class WindowOperator(object):
         trigger_result = self.trigger_context.on_processing_time(timestamp)
 
         if trigger_result.is_fire():
-            contents = self.window_state.get()
+            if self.paned:
+                contents = self.merge_panes(self.trigger_context.window)
+            else:
+                contents = self.window_state.get()
             # for list state the iterable will never be none
             if isinstance(self.window_state, ListState):
                 contents = [i for i in contents]
@@ -497,9 +555,16 @@ class WindowOperator(object):
             merging_windows.persist()
 
     def get_merging_window_set(self) -> MergingWindowSet:
-        return MergingWindowSet(
-            typing.cast(MergingWindowAssigner[T, W], self.window_assigner),
-            self.merging_sets_state)
+        key = self.keyed_state_backend.get_current_key()
+        cache_token = self.keyed_state_backend.get_state_cache_token()
+        if self.merging_window_set is None or self.merging_window_set_key != key or \
+                cache_token is None or self.merging_window_set_cache_token != cache_token:
+            self.merging_window_set = MergingWindowSet(
+                typing.cast(MergingWindowAssigner[T, W], self.window_assigner),
+                self.merging_sets_state)
+            self.merging_window_set_key = key
+            self.merging_window_set_cache_token = cache_token
+        return self.merging_window_set
 
     def cleanup_time(self, window) -> int:
         if self.window_assigner.is_event_time():
@@ -542,13 +607,65 @@ class WindowOperator(object):
 
     def clear_all_state(
             self, window, window_state: AppendingState, merging_windows: MergingWindowSet):
-        window_state.clear()
+        if self.paned:
+            self.clear_panes(window)
+        else:
+            window_state.clear()
         self.trigger_context.clear()
         self.process_context.window = window
         self.process_context.clear()
         if merging_windows is not None:
             merging_windows.retire_window(window)
             merging_windows.persist()
+            if merging_windows.is_empty():
+                # all the state of the key has been cleared, so there is no need to keep its
+                # merging window set
+                self.merging_window_set = None
+
+    def merge_panes(self, window):
+        """
+        Assembles the contents of the given window from the pre-aggregated contents of its panes.
+        The accumulators of the panes are combined with `AggregateFunction.merge`, so it's called
+        for the sliding windows, which aren't merging windows, too.
+        """
+        if isinstance(self.window_state, InternalAggregatingState):
+            agg_function = self.window_state_descriptor.get_agg_function()
+            accumulator = None
+            for pane in self.window_assigner.split_into_panes(window):
+                self.window_state.set_current_namespace(pane)
+                pane_accumulator = self.window_state.get_internal()
+                if pane_accumulator is not None:
+                    # merge may modify or return either of the accumulators, which must not be
+                    # the accumulator of a pane still in use
+                    if accumulator is None:
+                        accumulator = copy.deepcopy(pane_accumulator)
+                    else:
+                        accumulator = agg_function.merge(
+                            accumulator, copy.deepcopy(pane_accumulator))
+            if accumulator is None:
+                return None
+            return agg_function.get_result(accumulator)
+        else:
+            reduce_function = self.window_state_descriptor.get_reduce_function()
+            result = None
+            for pane in self.window_assigner.split_into_panes(window):
+                self.window_state.set_current_namespace(pane)
+                pane_result = self.window_state.get()
+                if pane_result is not None:
+                    if result is None:
+                        # the reduce function may modify the value passed in as the first argument,
+                        # which must not be the content of a pane still in use
+                        result = copy.deepcopy(pane_result)
+                    else:
+                        result = reduce_function.reduce(result, pane_result)
+            return result
+
+    def clear_panes(self, window) -> None:
+        # a pane is only cleared together with the last window it belongs to
+        for pane in self.window_assigner.split_into_panes(window):
+            if self.window_assigner.get_last_window(pane) == window:
+                self.window_state.set_current_namespace(pane)
+                self.window_state.clear()
 
     def emit_window_contents(self, window, contents) -> Iterable:
         self.process_context.window = window
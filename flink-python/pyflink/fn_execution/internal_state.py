@@ -96,7 +96,14 @@ class InternalAggregatingState(InternalMergingState[N, IN, OUT], AggregatingStat
     """
     The peer to the :class:AggregatingState in the internal state type hierarchy.
     """
-    pass
+
+    @abstractmethod
+    def get_internal(self):
+        """
+        Returns the accumulator stored in the state of the current namespace, or None if the state
+        is empty.
+        """
+        pass
 
 
 class InternalReducingState(InternalMergingState[N, T, T], ReducingState[T], ABC):
@@ -17,6 +17,8 @@
 ################################################################################
 import base64
 import collections
+import os
+import time
 from abc import ABC, abstractmethod
 from apache_beam.coders import coder_impl
 from apache_beam.portability.api import beam_fn_api_pb2
@@ -38,6 +40,49 @@ from pyflink.fn_execution.internal_state import InternalKvState, N, InternalValu
     InternalMapState, InternalReadOnlyBroadcastState, InternalBroadcastState
 
 
+PYTHON_STATE_CACHE_MEMORY_FRACTION = "PYTHON_STATE_CACHE_MEMORY_FRACTION"
+PYTHON_WORKER_MEMORY_LIMIT = "_PYTHON_WORKER_MEMORY_LIMIT"
+
+# the expiration time of the cached values which could not expire, e.g. an empty list
+NEVER_EXPIRES = float('inf')
+
+
+def get_state_cache_memory_budget():
+    """
+    Returns the number of bytes the state caches of an operator could use, which is the configured
+    fraction of the memory limit of the Python worker, or None if there is no such budget.
+    """
+    fraction = float(os.environ.get(PYTHON_STATE_CACHE_MEMORY_FRACTION, 0))
+    memory_limit = os.environ.get(PYTHON_WORKER_MEMORY_LIMIT)
+    if fraction <= 0 or not memory_limit:
+        return None
+    return int(int(memory_limit) * fraction)
+
+
+class CacheStatistics(object):
+    """
+    The statistics of one or more :class:`LRUCache`, which could be reported as metrics.
+    """
+
+    def __init__(self):
+        self.hit_count = 0
+        self.miss_count = 0
+        self.eviction_count = 0
+        self.resident_bytes = 0
+
+    def get_hit_rate_percent(self) -> int:
+        access_count = self.hit_count + self.miss_count
+        return self.hit_count * 100 // access_count if access_count > 0 else 0
+
+    def register_metrics(self, metric_group, with_resident_bytes=True):
+        metric_group.gauge("hitCount", lambda: self.hit_count)
+        metric_group.gauge("missCount", lambda: self.miss_count)
+        metric_group.gauge("hitRatePercent", self.get_hit_rate_percent)
+        metric_group.gauge("evictionCount", lambda: self.eviction_count)
+        if with_resident_bytes:
+            metric_group.gauge("residentBytes", lambda: self.resident_bytes)
+
+
 class LRUCache(object):
     """
     A simple LRUCache implementation used to manage the internal runtime state.
@@ -45,12 +90,19 @@ class LRUCache(object):
     So the number of the internal runtime states may keep growing during the streaming task
     execution. To prevent the OOM caused by the unlimited growth, we introduce this LRUCache
     to evict the inactive internal runtime states.
+
+    Besides the number of entries, the cache could also be bounded by the total estimated size of
+    the entries in bytes, which is given when putting an entry into the cache.
     """
 
-    def __init__(self, max_entries, default_entry):
+    def __init__(self, max_entries, default_entry, max_bytes=None, statistics=None):
         self._max_entries = max_entries
+        self._max_bytes = max_bytes
         self._default_entry = default_entry
         self._cache = collections.OrderedDict()
+        self._sizes = {}
+        self._resident_bytes = 0
+        self._statistics = statistics if statistics is not None else CacheStatistics()
         self._on_evict = None
 
     def get(self, key):
@@ -58,29 +110,60 @@ class LRUCache(object):
         if value != self._default_entry:
             # update the last access time
             self._cache[key] = value
+            self._statistics.hit_count += 1
+        else:
+            self._statistics.miss_count += 1
         return value
 
-    def put(self, key, value):
+    def put(self, key, value, size=0):
         self._cache[key] = value
-        while len(self._cache) > self._max_entries:
+        self._update_size(key, size)
+        while len(self._cache) > self._max_entries or \
+                (self._max_bytes is not None and self._resident_bytes > self._max_bytes):
             name, value = self._cache.popitem(last=False)
-            if self._on_evict is not None:
-                self._on_evict(name, value)
+            self._update_size(name, 0)
+            self._statistics.eviction_count += 1
+            self._evicted(name, value)
 
     def evict(self, key):
         value = self._cache.pop(key, self._default_entry)
-        if self._on_evict is not None:
-            self._on_evict(key, value)
+        self._update_size(key, 0)
+        self._evicted(key, value)
 
     def evict_all(self):
-        if self._on_evict is not None:
-            for item in self._cache.items():
-                self._on_evict(*item)
+        for item in self._cache.items():
+            self._evicted(*item)
         self._cache.clear()
+        self._update_resident_bytes(-self._resident_bytes)
+        self._sizes.clear()
+
+    def get_statistics(self) -> CacheStatistics:
+        return self._statistics
+
+    def get_size(self, key) -> int:
+        return self._sizes.get(key, 0)
+
+    def get_resident_bytes(self) -> int:
+        return self._resident_bytes
+
+    def _update_size(self, key, size):
+        old_size = self._sizes.pop(key, 0) if self._sizes else 0
+        if size > 0:
+            self._sizes[key] = size
+        if size != old_size:
+            self._update_resident_bytes(size - old_size)
+
+    def _update_resident_bytes(self, delta):
+        self._resident_bytes += delta
+        self._statistics.resident_bytes += delta
 
     def set_on_evict(self, func):
         self._on_evict = func
 
+    def _evicted(self, key, value):
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
     def __len__(self):
         return len(self._cache)
 
@@ -91,6 +174,107 @@ class LRUCache(object):
         return key in self._cache
 
 
+class ReadCacheBudget(object):
+    """
+    The memory budget of the read cache, i.e. the state cache of Beam, which is shared by the cached
+    map states and the cached values of the bag states of all the keys. The estimated sizes of the
+    cached values are tracked in the order they are used, and the least recently used values are
+    evicted from the read cache once their total size exceeds the budget.
+    """
+
+    def __init__(self, state_cache, max_entries, max_bytes):
+        self._state_cache = state_cache
+        self._max_bytes = max_bytes
+        self._sizes = LRUCache(max_entries, None, max_bytes)
+        self._sizes.set_on_evict(self._evict_from_read_cache)
+
+    def get_max_bytes(self) -> int:
+        return self._max_bytes
+
+    def get_statistics(self) -> CacheStatistics:
+        return self._sizes.get_statistics()
+
+    def track(self, cache_state_key, cache_token, value, size):
+        """
+        Records the estimated size of a value which is put into or updated in the read cache.
+        """
+        self._sizes.put(cache_state_key, (cache_token, value), size)
+
+    def track_extended(self, cache_state_key, cache_token, value, size):
+        """
+        Records that a value in the read cache is extended by the given estimated size.
+        """
+        tracked = self._sizes.get(cache_state_key)
+        if tracked is not None and tracked[1] is value:
+            size += self._sizes.get_size(cache_state_key)
+        self.track(cache_state_key, cache_token, value, size)
+
+    def touch(self, cache_state_key):
+        """
+        Marks a value in the read cache as the most recently used one.
+        """
+        self._sizes.get(cache_state_key)
+
+    def release(self, cache_state_key):
+        """
+        Stops tracking a value which is evicted from the read cache.
+        """
+        self._sizes.evict(cache_state_key)
+
+    def _evict_from_read_cache(self, cache_state_key, tracked):
+        if tracked is not None:
+            cache_token, value = tracked
+            # the value may have been replaced or dropped since it was tracked
+            if self._state_cache.get(cache_state_key, cache_token) is value:
+                self._state_cache.evict(cache_state_key, cache_token)
+
+
+class StateFuture(object):
+    """
+    The result of an asynchronous state read. The state request is sent out when the future is
+    created while the response is only waited for when the result is requested, so that the
+    round trips of several state reads which are in flight at the same time overlap.
+    """
+
+    def __init__(self, response_future=None, result_func=None, result=None):
+        self._response_future = response_future
+        self._result_func = result_func
+        self._result = result
+
+    @staticmethod
+    def completed(result) -> 'StateFuture':
+        return StateFuture(result=result)
+
+    def done(self) -> bool:
+        """
+        Returns true if the response of the state request has been received.
+        """
+        return self._response_future is None or self._response_future.wait(0)
+
+    def result(self):
+        """
+        Waits if necessary for the response of the state request, and then returns the result.
+        """
+        if self._response_future is not None:
+            response = self._response_future.get()
+            if response.error:
+                raise RuntimeError(response.error)
+            self._result = self._result_func(response.get.data, response.get.continuation_token)
+            self._response_future = None
+            self._result_func = None
+        return self._result
+
+    def then(self, func) -> 'StateFuture':
+        """
+        Returns a new future whose result is the result of this future transformed by func.
+        """
+        if self._response_future is None:
+            return StateFuture.completed(func(self._result))
+        result_func = self._result_func
+        return StateFuture(
+            self._response_future, lambda data, token: func(result_func(data, token)))
+
+
 class SynchronousKvRuntimeState(InternalKvState, ABC):
     """
     Base Class for partitioned State implementation.
@@ -101,28 +285,41 @@ class SynchronousKvRuntimeState(InternalKvState, ABC):
         self._remote_state_backend = remote_state_backend
         self._internal_state = None
         self.namespace = None
+        self._encoded_namespace = b''
         self._ttl_config = None
         self._cache_type = SynchronousKvRuntimeState.CacheType.ENABLE_READ_WRITE_CACHE
 
     def set_current_namespace(self, namespace: N) -> None:
         if namespace == self.namespace:
             return
-        if self.namespace is not None:
+        if self.namespace is not None and self._internal_state is not None:
             self._remote_state_backend.cache_internal_state(
                 self._remote_state_backend._encoded_current_key, self)
+        self._remote_state_backend.mark_accessed(self)
         self.namespace = namespace
+        self._encoded_namespace = self._remote_state_backend._encode_namespace(namespace)
         self._internal_state = None
 
     def enable_time_to_live(self, ttl_config: StateTtlConfig):
         self._ttl_config = ttl_config
-        if ttl_config.get_state_visibility() == StateTtlConfig.StateVisibility.NeverReturnExpired:
-            self._cache_type = SynchronousKvRuntimeState.CacheType.DISABLE_CACHE
-        elif ttl_config.get_update_type() == StateTtlConfig.UpdateType.OnReadAndWrite:
-            self._cache_type = SynchronousKvRuntimeState.CacheType.ENABLE_WRITE_CACHE
+        self._cache_type = SynchronousKvRuntimeState.get_cache_type(ttl_config)
 
-        if self._cache_type != SynchronousKvRuntimeState.CacheType.ENABLE_READ_WRITE_CACHE:
-            # disable read cache
-            self._remote_state_backend._state_handler._state_cache._cache._max_entries = 0
+    @staticmethod
+    def get_cache_type(ttl_config: StateTtlConfig) -> 'SynchronousKvRuntimeState.CacheType':
+        """
+        Returns how the state with the given TTL config could be cached. The read cache of the
+        states whose cache type isn't ENABLE_READ_WRITE_CACHE is aware of the TTL, see
+        :class:`TtlBagStateHandler` and :class:`TtlCachingMapStateHandler`.
+        """
+        if ttl_config is None:
+            return SynchronousKvRuntimeState.CacheType.ENABLE_READ_WRITE_CACHE
+        elif ttl_config.get_state_visibility() == \
+                StateTtlConfig.StateVisibility.NeverReturnExpired:
+            return SynchronousKvRuntimeState.CacheType.DISABLE_CACHE
+        elif ttl_config.get_update_type() == StateTtlConfig.UpdateType.OnReadAndWrite:
+            return SynchronousKvRuntimeState.CacheType.ENABLE_WRITE_CACHE
+        else:
+            return SynchronousKvRuntimeState.CacheType.ENABLE_READ_WRITE_CACHE
 
     @abstractmethod
     def get_internal_state(self):
@@ -144,8 +341,9 @@ class SynchronousBagKvRuntimeState(SynchronousKvRuntimeState, ABC):
 
     def get_internal_state(self):
         if self._internal_state is None:
+            self._remote_state_backend.mark_accessed(self)
             self._internal_state = self._remote_state_backend._get_internal_bag_state(
-                self.name, self.namespace, self._value_coder, self._ttl_config)
+                self.name, self._encoded_namespace, self._value_coder, self._ttl_config)
         return self._internal_state
 
     def _maybe_clear_write_cache(self):
@@ -155,6 +353,16 @@ class SynchronousBagKvRuntimeState(SynchronousKvRuntimeState, ABC):
             self._internal_state._cleared = False
             self._internal_state._added_elements = []
 
+    def _async_read(self) -> StateFuture:
+        internal_state = self.get_internal_state()
+        if internal_state._cleared or internal_state._added_elements or \
+                self._cache_type != SynchronousKvRuntimeState.CacheType.ENABLE_READ_WRITE_CACHE:
+            # there are local modifications which have not been committed yet, or the read cache
+            # has to check whether the cached values have expired
+            return StateFuture.completed(list(internal_state.read()))
+        return self._remote_state_backend._async_read_bag_state(
+            internal_state._state_key, internal_state._value_coder.get_impl())
+
 
 class SynchronousValueRuntimeState(SynchronousBagKvRuntimeState, InternalValueState):
     """
@@ -169,6 +377,12 @@ class SynchronousValueRuntimeState(SynchronousBagKvRuntimeState, InternalValueSt
             return i
         return None
 
+    def async_value(self) -> StateFuture:
+        """
+        Sends out the read request of the value without waiting for the response.
+        """
+        return self._async_read().then(lambda values: values[0] if values else None)
+
     def update(self, value) -> None:
         self.get_internal_state()
         self._internal_state.clear()
@@ -207,6 +421,12 @@ class SynchronousListRuntimeState(SynchronousMergingRuntimeState, InternalListSt
     def get(self):
         return self.get_internal_state().read()
 
+    def async_get(self) -> StateFuture:
+        """
+        Sends out the read request of the list without waiting for the response.
+        """
+        return self._async_read()
+
     def add_all(self, values):
         self.get_internal_state()._added_elements.extend(values)
         self._maybe_clear_write_cache()
@@ -270,7 +490,7 @@ class SynchronousAggregatingRuntimeState(SynchronousMergingRuntimeState, Interna
         if v is None:
             self.clear()
             return
-        accumulator = self._get_accumulator()
+        accumulator = self.get_internal()
         if accumulator is None:
             accumulator = self._agg_function.create_accumulator()
         accumulator = self._agg_function.add(v, accumulator)
@@ -279,13 +499,13 @@ class SynchronousAggregatingRuntimeState(SynchronousMergingRuntimeState, Interna
         self._maybe_clear_write_cache()
 
     def get(self):
-        accumulator = self._get_accumulator()
+        accumulator = self.get_internal()
         if accumulator is None:
             return None
         else:
             return self._agg_function.get_result(accumulator)
 
-    def _get_accumulator(self):
+    def get_internal(self):
         for i in self.get_internal_state().read():
             return i
         return None
@@ -296,16 +516,24 @@ class SynchronousAggregatingRuntimeState(SynchronousMergingRuntimeState, Interna
 
 class CachedMapState(LRUCache):
 
-    def __init__(self, max_entries):
-        super(CachedMapState, self).__init__(max_entries, None)
+    def __init__(self, max_entries, max_bytes=None, statistics=None):
+        super(CachedMapState, self).__init__(max_entries, None, max_bytes, statistics)
         self._all_data_cached = False
         self._cached_keys = set()
+        # the time until which the cached entries are known to be alive, which is only tracked
+        # for the map states with TTL, see TtlCachingMapStateHandler
+        self._expiration_times = {}
+
+    def _evicted(self, key, value):
+        self._cached_keys.discard(key)
+        if self._expiration_times:
+            self._expiration_times.pop(key, None)
+        self._all_data_cached = False
 
-        def on_evict(key, value):
-            self._cached_keys.remove(key)
-            self._all_data_cached = False
-
-        self.set_on_evict(on_evict)
+    def _update_resident_bytes(self, delta):
+        # the statistics are shared by the cached map states, which may be dropped by the read
+        # cache at any time, so their resident bytes are tracked by the ReadCacheBudget instead
+        self._resident_bytes += delta
 
     def set_all_data_cached(self):
         self._all_data_cached = True
@@ -313,14 +541,23 @@ class CachedMapState(LRUCache):
     def is_all_data_cached(self):
         return self._all_data_cached
 
-    def put(self, key, exists_and_value):
+    def put(self, key, exists_and_value, size=0):
         if exists_and_value[0]:
             self._cached_keys.add(key)
-        super(CachedMapState, self).put(key, exists_and_value)
+        else:
+            self._cached_keys.discard(key)
+        super(CachedMapState, self).put(key, exists_and_value, size)
 
     def get_cached_keys(self):
         return self._cached_keys
 
+    def get_expiration_time(self, key):
+        return self._expiration_times.get(key)
+
+    def set_expiration_time(self, key, expiration_time):
+        if key in self._cache:
+            self._expiration_times[key] = expiration_time
+
 
 class IterateType(Enum):
     ITEMS = 0
@@ -375,13 +612,51 @@ class CachingMapStateHandler(object):
     SET_NONE = 1
     SET_VALUE = 2
 
-    def __init__(self, caching_state_handler, max_cached_map_key_entries):
+    def __init__(self, caching_state_handler, max_cached_map_key_entries,
+                 read_cache_budget: 'ReadCacheBudget' = None):
         self._state_cache = caching_state_handler._state_cache
         self._underlying = caching_state_handler._underlying
         self._context = caching_state_handler._context
         self._max_cached_map_key_entries = max_cached_map_key_entries
+        self._read_cache_budget = read_cache_budget
+        # a single map state could use the whole memory budget of the read cache
+        self._max_cached_map_key_bytes = read_cache_budget.get_max_bytes() \
+            if read_cache_budget is not None else None
+        self._read_cache_statistics = CacheStatistics()
         self._cached_iterator_num = 0
 
+    def get_read_cache_statistics(self) -> CacheStatistics:
+        """
+        Returns the statistics of the read caches of all the map states.
+        """
+        return self._read_cache_statistics
+
+    def _create_cached_map_state(self):
+        return CachedMapState(self._max_cached_map_key_entries,
+                              self._max_cached_map_key_bytes,
+                              self._read_cache_statistics)
+
+    def _lookup_read_cache(self, cache_state_key, cache_token):
+        cached_value = self._state_cache.get(cache_state_key, cache_token)
+        if cached_value is not None and self._read_cache_budget is not None:
+            self._read_cache_budget.touch(cache_state_key)
+        return cached_value
+
+    def _cache_map_state(self, cache_state_key, cache_token, cached_map_state):
+        """
+        Puts the cached map state into the read cache after it's created or updated.
+        """
+        self._state_cache.put(cache_state_key, cache_token, cached_map_state)
+        if self._read_cache_budget is not None:
+            self._read_cache_budget.track(
+                cache_state_key, cache_token, cached_map_state,
+                cached_map_state.get_resident_bytes())
+
+    def _evict_read_cache(self, cache_state_key, cache_token):
+        self._state_cache.evict(cache_state_key, cache_token)
+        if self._read_cache_budget is not None:
+            self._read_cache_budget.release(cache_state_key)
+
     def _get_cache_token(self):
         if not self._state_cache.is_cache_enabled():
             return None
@@ -398,13 +673,14 @@ class CachingMapStateHandler(object):
 
         # lookup cache first
         cache_state_key = self._convert_to_cache_key(state_key)
-        cached_map_state = self._state_cache.get(cache_state_key, cache_token)
+        cached_map_state = self._lookup_read_cache(cache_state_key, cache_token)
         if cached_map_state is None:
             # request from remote
-            exists, value = self._get_raw(state_key, map_key, map_key_encoder, map_value_decoder)
-            cached_map_state = CachedMapState(self._max_cached_map_key_entries)
-            cached_map_state.put(map_key, (exists, value))
-            self._state_cache.put(cache_state_key, cache_token, cached_map_state)
+            exists, value, size = self._get_raw_with_size(
+                state_key, map_key, map_key_encoder, map_value_decoder)
+            cached_map_state = self._create_cached_map_state()
+            cached_map_state.put(map_key, (exists, value), size)
+            self._cache_map_state(cache_state_key, cache_token, cached_map_state)
             return exists, value
         else:
             cached_value = cached_map_state.get(map_key)
@@ -413,27 +689,65 @@ class CachingMapStateHandler(object):
                     return False, None
 
                 # request from remote
-                exists, value = self._get_raw(
+                exists, value, size = self._get_raw_with_size(
                     state_key, map_key, map_key_encoder, map_value_decoder)
-                cached_map_state.put(map_key, (exists, value))
+                cached_map_state.put(map_key, (exists, value), size)
+                self._cache_map_state(cache_state_key, cache_token, cached_map_state)
                 return exists, value
             else:
                 return cached_value
 
+    def async_get(self, state_key, map_key, map_key_encoder, map_value_decoder) -> StateFuture:
+        cache_token = self._get_cache_token()
+        cache_state_key = None
+        if cache_token:
+            cache_state_key = self._convert_to_cache_key(state_key)
+            cached_map_state = self._lookup_read_cache(cache_state_key, cache_token)
+            if cached_map_state is not None:
+                cached_value = cached_map_state.get(map_key)
+                if cached_value is not None:
+                    return StateFuture.completed(cached_value)
+                elif cached_map_state.is_all_data_cached():
+                    return StateFuture.completed((False, None))
+
+        request_token = self._get_request_token(map_key, map_key_encoder)
+
+        def on_response(data, response_token):
+            exists_and_value = self._parse_get_response(data, map_value_decoder)
+            if cache_token:
+                # the cached map state may have been evicted or updated after the request was
+                # sent out, so look it up again
+                size = len(request_token) + len(data)
+                map_state = self._lookup_read_cache(cache_state_key, cache_token)
+                if map_state is None:
+                    map_state = self._create_cached_map_state()
+                    map_state.put(map_key, exists_and_value, size)
+                    self._cache_map_state(cache_state_key, cache_token, map_state)
+                elif map_key not in map_state:
+                    map_state.put(map_key, exists_and_value, size)
+                    self._cache_map_state(cache_state_key, cache_token, map_state)
+            return exists_and_value
+
+        return StateFuture(
+            self._underlying._request(beam_fn_api_pb2.StateRequest(
+                state_key=state_key,
+                get=beam_fn_api_pb2.StateGetRequest(continuation_token=request_token))),
+            on_response)
+
     def lazy_iterator(self, state_key, iterate_type, map_key_decoder, map_value_decoder,
                       iterated_keys):
         cache_token = self._get_cache_token()
         if cache_token:
             # check if the data in the read cache can be used
             cache_state_key = self._convert_to_cache_key(state_key)
-            cached_map_state = self._state_cache.get(cache_state_key, cache_token)
+            cached_map_state = self._lookup_read_cache(cache_state_key, cache_token)
             if cached_map_state and cached_map_state.is_all_data_cached():
                 return create_cache_iterator(
                     cached_map_state._cache, iterate_type, iterated_keys)
 
         # request from remote
         last_iterator_token = IteratorToken.NOT_START
-        current_batch, iterator_token = self._iterate_raw(
+        current_batch, iterator_token, batch_size = self._iterate_raw_with_size(
             state_key, iterate_type,
             last_iterator_token,
             map_key_decoder,
@@ -442,15 +756,19 @@ class CachingMapStateHandler(object):
         if cache_token and \
                 iterator_token == IteratorToken.FINISHED and \
                 iterate_type != IterateType.KEYS and \
-                self._max_cached_map_key_entries >= len(current_batch):
+                self._max_cached_map_key_entries >= len(current_batch) and \
+                (self._max_cached_map_key_bytes is None or
+                 self._max_cached_map_key_bytes >= batch_size):
             # Special case: all the data of the map state is contained in current batch,
             # and can be stored in the cached map state.
-            cached_map_state = CachedMapState(self._max_cached_map_key_entries)
+            cached_map_state = self._create_cached_map_state()
             cache_state_key = self._convert_to_cache_key(state_key)
+            # the size of the batch is attributed to the entries evenly
+            entry_size = batch_size // max(len(current_batch), 1)
             for key, value in current_batch.items():
-                cached_map_state.put(key, (True, value))
+                cached_map_state.put(key, (True, value), entry_size)
             cached_map_state.set_all_data_cached()
-            self._state_cache.put(cache_state_key, cache_token, cached_map_state)
+            self._cache_map_state(cache_state_key, cache_token, cached_map_state)
 
         return self._lazy_remote_iterator(
             state_key,
@@ -517,35 +835,33 @@ class CachingMapStateHandler(object):
 
     def extend(self, state_key, items: List[Tuple[int, Any, Any]],
                map_key_encoder, map_value_encoder):
+        request, item_sizes = self._encode_append_request(
+            items, map_key_encoder, map_value_encoder)
         cache_token = self._get_cache_token()
         if cache_token:
             # Cache lookup
             cache_state_key = self._convert_to_cache_key(state_key)
-            cached_map_state = self._state_cache.get(cache_state_key, cache_token)
+            cached_map_state = self._lookup_read_cache(cache_state_key, cache_token)
             if cached_map_state is None:
-                cached_map_state = CachedMapState(self._max_cached_map_key_entries)
-                self._state_cache.put(cache_state_key, cache_token, cached_map_state)
-            for request_flag, map_key, map_value in items:
+                cached_map_state = self._create_cached_map_state()
+            for (request_flag, map_key, map_value), size in zip(items, item_sizes):
                 if request_flag == self.DELETE:
-                    cached_map_state.put(map_key, (False, None))
+                    cached_map_state.put(map_key, (False, None), size)
                 elif request_flag == self.SET_NONE:
-                    cached_map_state.put(map_key, (True, None))
+                    cached_map_state.put(map_key, (True, None), size)
                 elif request_flag == self.SET_VALUE:
-                    cached_map_state.put(map_key, (True, map_value))
+                    cached_map_state.put(map_key, (True, map_value), size)
                 else:
                     raise Exception("Unknown flag: " + str(request_flag))
-        return self._append_raw(
-            state_key,
-            items,
-            map_key_encoder,
-            map_value_encoder)
+            self._cache_map_state(cache_state_key, cache_token, cached_map_state)
+        return self._underlying.append_raw(state_key, request)
 
     def check_empty(self, state_key):
         cache_token = self._get_cache_token()
         if cache_token:
             # Cache lookup
             cache_state_key = self._convert_to_cache_key(state_key)
-            cached_map_state = self._state_cache.get(cache_state_key, cache_token)
+            cached_map_state = self._lookup_read_cache(cache_state_key, cache_token)
             if cached_map_state is not None:
                 if cached_map_state.is_all_data_cached() and \
                         len(cached_map_state.get_cached_keys()) == 0:
@@ -561,8 +877,7 @@ class CachingMapStateHandler(object):
     def clear_read_cache(self, state_key):
         cache_token = self._get_cache_token()
         if cache_token:
-            cache_key = self._convert_to_cache_key(state_key)
-            self._state_cache.evict(cache_key, cache_token)
+            self._evict_read_cache(self._convert_to_cache_key(state_key), cache_token)
 
     def get_cached_iterators_num(self):
         return self._cached_iterator_num
@@ -589,11 +904,26 @@ class CachingMapStateHandler(object):
             raise Exception("Unknown response flag: " + str(data[0]))
 
     def _get_raw(self, state_key, map_key, map_key_encoder, map_value_decoder):
+        exists, value, _ = self._get_raw_with_size(
+            state_key, map_key, map_key_encoder, map_value_decoder)
+        return exists, value
+
+    def _get_raw_with_size(self, state_key, map_key, map_key_encoder, map_value_decoder):
+        """
+        Returns whether the map key exists, the value and the encoded size of the entry.
+        """
+        continuation_token = self._get_request_token(map_key, map_key_encoder)
+        data, response_token = self._underlying.get_raw(state_key, continuation_token)
+        exists, value = self._parse_get_response(data, map_value_decoder)
+        return exists, value, len(continuation_token) + len(data)
+
+    def _get_request_token(self, map_key, map_key_encoder):
         output_stream = coder_impl.create_OutputStream()
         output_stream.write_byte(self.GET_FLAG)
         map_key_encoder(map_key, output_stream)
-        continuation_token = output_stream.get()
-        data, response_token = self._underlying.get_raw(state_key, continuation_token)
+        return output_stream.get()
+
+    def _parse_get_response(self, data, map_value_decoder):
         input_stream = coder_impl.create_InputStream(data)
         result_flag = input_stream.read_byte()
         if result_flag == self.EXIST_FLAG:
@@ -607,6 +937,16 @@ class CachingMapStateHandler(object):
 
     def _iterate_raw(self, state_key, iterate_type, iterator_token,
                      map_key_decoder, map_value_decoder):
+        current_batch, new_iterator_token, _ = self._iterate_raw_with_size(
+            state_key, iterate_type, iterator_token, map_key_decoder, map_value_decoder)
+        return current_batch, new_iterator_token
+
+    def _iterate_raw_with_size(self, state_key, iterate_type, iterator_token,
+                               map_key_decoder, map_value_decoder):
+        """
+        Returns the next batch of the iteration, the token of the iterator and the encoded size of
+        the batch.
+        """
         output_stream = coder_impl.create_OutputStream()
         output_stream.write_byte(self.ITERATE_FLAG)
         output_stream.write_byte(iterate_type.value)
@@ -651,12 +991,18 @@ class CachingMapStateHandler(object):
             while input_stream.size() > 0:
                 key = map_key_decoder(input_stream)
                 current_batch.append(key)
-        return current_batch, new_iterator_token
+        return current_batch, new_iterator_token, len(data)
 
-    def _append_raw(self, state_key, items, map_key_encoder, map_value_encoder):
+    def _encode_append_request(self, items, map_key_encoder, map_value_encoder):
+        """
+        Encodes the given write requests, and returns the encoded requests and the encoded size of
+        every request.
+        """
         output_stream = coder_impl.create_OutputStream()
         output_stream.write_bigendian_int32(len(items))
+        item_sizes = []
         for request_flag, map_key, map_value in items:
+            start = output_stream.size()
             output_stream.write_byte(request_flag)
             # Not all the coder impls will serialize the length of bytes when we set the "nested"
             # param to "True", so we need to encode the length of bytes manually.
@@ -671,13 +1017,305 @@ class CachingMapStateHandler(object):
                 serialized_data = tmp_out.get()
                 output_stream.write_bigendian_int32(len(serialized_data))
                 output_stream.write(serialized_data)
-        return self._underlying.append_raw(state_key, output_stream.get())
+            item_sizes.append(output_stream.size() - start)
+        return output_stream.get(), item_sizes
 
     @staticmethod
     def _convert_to_cache_key(state_key):
         return state_key.SerializeToString()
 
 
+def _current_time_millis():
+    # the same clock as the default TtlTimeProvider of the Java state backends
+    return int(time.time() * 1000)
+
+
+class TtlCachingMapStateHandler(CachingMapStateHandler):
+    """
+    The map state handler of a map state with a TTL which is refreshed on read or whose expired
+    entries should never be returned.
+
+    An entry is only served from the read cache as long as it is known to be alive in the remote
+    state backend, i.e. until the TTL has passed since it was last written, or last read when the
+    TTL is refreshed on read. The timestamps are taken before the requests are sent out, so that the
+    expiration times are never later than the ones in the remote state backend. When the TTL is
+    refreshed on read, reading a cached entry sends out a read request of the entry to refresh its
+    TTL in the remote state backend without waiting for the response.
+    """
+
+    def __init__(self, map_state_handler: CachingMapStateHandler, ttl_config: StateTtlConfig):
+        super(TtlCachingMapStateHandler, self).__init__(
+            map_state_handler,
+            map_state_handler._max_cached_map_key_entries,
+            map_state_handler._read_cache_budget)
+        self._map_state_handler = map_state_handler
+        self._read_cache_statistics = map_state_handler.get_read_cache_statistics()
+        self._ttl = ttl_config.get_ttl().to_milliseconds()
+        self._refresh_on_read = \
+            ttl_config.get_update_type() == StateTtlConfig.UpdateType.OnReadAndWrite
+
+    def blocking_get(self, state_key, map_key, map_key_encoder, map_value_decoder):
+        cache_token = self._get_cache_token()
+        if not cache_token:
+            return self._get_raw(state_key, map_key, map_key_encoder, map_value_decoder)
+
+        cache_state_key = self._convert_to_cache_key(state_key)
+        current_time = _current_time_millis()
+        cached_map_state = self._lookup_read_cache(cache_state_key, cache_token)
+        if cached_map_state is not None:
+            cached_value = cached_map_state.get(map_key)
+            if cached_value is not None:
+                if not cached_value[0]:
+                    # the entry doesn't exist until it's written
+                    return cached_value
+                expiration_time = cached_map_state.get_expiration_time(map_key)
+                if expiration_time is not None and expiration_time > current_time:
+                    if self._refresh_on_read:
+                        self._refresh_ttl(state_key, map_key, map_key_encoder)
+                        cached_map_state.set_expiration_time(map_key, current_time + self._ttl)
+                    return cached_value
+
+        # request from remote
+        exists, value, size = self._get_raw_with_size(
+            state_key, map_key, map_key_encoder, map_value_decoder)
+        if not exists or self._refresh_on_read:
+            if cached_map_state is None:
+                cached_map_state = self._create_cached_map_state()
+            cached_map_state.put(map_key, (exists, value), size)
+            if exists:
+                cached_map_state.set_expiration_time(map_key, current_time + self._ttl)
+            self._cache_map_state(cache_state_key, cache_token, cached_map_state)
+        elif cached_map_state is not None:
+            # it's unknown when the entry was last written
+            cached_map_state.evict(map_key)
+            self._cache_map_state(cache_state_key, cache_token, cached_map_state)
+        return exists, value
+
+    def async_get(self, state_key, map_key, map_key_encoder, map_value_decoder) -> StateFuture:
+        return StateFuture.completed(
+            self.blocking_get(state_key, map_key, map_key_encoder, map_value_decoder))
+
+    def lazy_iterator(self, state_key, iterate_type, map_key_decoder, map_value_decoder,
+                      iterated_keys):
+        # the cached entries may have expired, so the iteration is always served by the remote
+        # state backend, which also refreshes the TTL of the iterated entries if needed
+        current_batch, iterator_token = self._iterate_raw(
+            state_key, iterate_type,
+            IteratorToken.NOT_START,
+            map_key_decoder,
+            map_value_decoder)
+        return self._lazy_remote_iterator(
+            state_key,
+            iterate_type,
+            map_key_decoder,
+            map_value_decoder,
+            iterated_keys,
+            iterator_token,
+            current_batch)
+
+    def extend(self, state_key, items: List[Tuple[int, Any, Any]],
+               map_key_encoder, map_value_encoder):
+        current_time = _current_time_millis()
+        result = super(TtlCachingMapStateHandler, self).extend(
+            state_key, items, map_key_encoder, map_value_encoder)
+        cache_token = self._get_cache_token()
+        if cache_token:
+            cached_map_state = self._lookup_read_cache(
+                self._convert_to_cache_key(state_key), cache_token)
+            if cached_map_state is not None:
+                for request_flag, map_key, _ in items:
+                    if request_flag != self.DELETE:
+                        cached_map_state.set_expiration_time(map_key, current_time + self._ttl)
+        return result
+
+    def check_empty(self, state_key):
+        cache_token = self._get_cache_token()
+        if cache_token:
+            cached_map_state = self._lookup_read_cache(
+                self._convert_to_cache_key(state_key), cache_token)
+            if cached_map_state is not None:
+                current_time = _current_time_millis()
+                for map_key in cached_map_state.get_cached_keys():
+                    expiration_time = cached_map_state.get_expiration_time(map_key)
+                    if expiration_time is not None and expiration_time > current_time:
+                        return False
+        return self._check_empty_raw(state_key)
+
+    def _refresh_ttl(self, state_key, map_key, map_key_encoder):
+        # only the TTL of the entry is of interest, so the response isn't waited for
+        self._underlying._request(beam_fn_api_pb2.StateRequest(
+            state_key=state_key,
+            get=beam_fn_api_pb2.StateGetRequest(
+                continuation_token=self._get_request_token(map_key, map_key_encoder))))
+
+    def _inc_cached_iterators_num(self):
+        self._map_state_handler._inc_cached_iterators_num()
+
+    def _dec_cached_iterators_num(self):
+        self._map_state_handler._dec_cached_iterators_num()
+
+
+class TtlBagStateHandler(object):
+    """
+    The state handler of a bag state with a TTL which is refreshed on read or whose expired
+    values should never be returned. It wraps the caching state handler of Beam, see
+    :class:`TtlCachingMapStateHandler` for how the read cache is aware of the TTL.
+
+    The TTL of every value in a bag is tracked separately by the remote state backend, so the
+    cached values are only known to be alive until the earliest of them expires. The values read
+    from remote are not cached unless the TTL is refreshed on read, as it's unknown when they were
+    written.
+    """
+
+    def __init__(self,
+                 caching_state_handler,
+                 map_state_handler: CachingMapStateHandler,
+                 ttl_config: StateTtlConfig,
+                 expiration_times: LRUCache):
+        self._underlying = caching_state_handler
+        self._state_cache = caching_state_handler._state_cache
+        self._map_state_handler = map_state_handler
+        self._expiration_times = expiration_times
+        self._ttl = ttl_config.get_ttl().to_milliseconds()
+        self._refresh_on_read = \
+            ttl_config.get_update_type() == StateTtlConfig.UpdateType.OnReadAndWrite
+
+    def blocking_get(self, state_key, coder):
+        cache_token = self._map_state_handler._get_cache_token()
+        if not cache_token:
+            return self._underlying.blocking_get(state_key, coder)
+
+        cache_state_key = CachingMapStateHandler._convert_to_cache_key(state_key)
+        current_time = _current_time_millis()
+        cached_values = self._map_state_handler._lookup_read_cache(cache_state_key, cache_token)
+        if cached_values is not None:
+            expiration_time = self._expiration_times.get(cache_state_key)
+            if expiration_time is not None and expiration_time > current_time:
+                if self._refresh_on_read and expiration_time != NEVER_EXPIRES:
+                    self._refresh_ttl(state_key)
+                    self._expiration_times.put(cache_state_key, current_time + self._ttl)
+                return cached_values
+            # the cached values may have expired
+            self._map_state_handler._evict_read_cache(cache_state_key, cache_token)
+
+        # request from remote, the values are put into the read cache by the underlying handler
+        values = self._underlying.blocking_get(state_key, coder)
+        if isinstance(values, list) and not values:
+            self._expiration_times.put(cache_state_key, NEVER_EXPIRES)
+        elif self._refresh_on_read:
+            self._expiration_times.put(cache_state_key, current_time + self._ttl)
+        else:
+            self._expiration_times.evict(cache_state_key)
+        return values
+
+    def extend(self, state_key, coder, elements):
+        cache_token = self._map_state_handler._get_cache_token()
+        if not cache_token:
+            return self._underlying.extend(state_key, coder, elements)
+
+        cache_state_key = CachingMapStateHandler._convert_to_cache_key(state_key)
+        current_time = _current_time_millis()
+        expiration_time = self._expiration_times.get(cache_state_key)
+        if expiration_time is None or expiration_time <= current_time:
+            # the cached values, if any, can't be extended. Write the elements directly instead
+            # of reading the state first as the underlying handler does.
+            self._map_state_handler._evict_read_cache(cache_state_key, cache_token)
+            self._expiration_times.evict(cache_state_key)
+            output_stream = coder_impl.create_OutputStream()
+            for element in elements:
+                coder.encode_to_stream(element, output_stream, True)
+            return self._underlying._underlying.append_raw(state_key, output_stream.get())
+
+        if expiration_time == NEVER_EXPIRES:
+            # the bag was empty, the earliest expiring values are the ones written now
+            self._expiration_times.put(cache_state_key, current_time + self._ttl)
+        return self._underlying.extend(state_key, coder, elements)
+
+    def clear(self, state_key):
+        cache_token = self._map_state_handler._get_cache_token()
+        if cache_token:
+            self._expiration_times.put(
+                CachingMapStateHandler._convert_to_cache_key(state_key), NEVER_EXPIRES)
+        return self._underlying.clear(state_key)
+
+    def _refresh_ttl(self, state_key):
+        # only the TTL of the values is of interest, so the response isn't waited for
+        self._underlying._underlying._request(beam_fn_api_pb2.StateRequest(
+            state_key=state_key,
+            get=beam_fn_api_pb2.StateGetRequest()))
+
+
+class BudgetedBagStateHandler(object):
+    """
+    The state handler of the bag states when the read cache has a memory budget. It wraps the
+    caching state handler of Beam and caches the values of the bag states in the same way, and
+    tracks the encoded sizes of the cached values in the :class:`ReadCacheBudget`.
+    """
+
+    def __init__(self,
+                 caching_state_handler,
+                 map_state_handler: CachingMapStateHandler,
+                 read_cache_budget: ReadCacheBudget):
+        self._caching_state_handler = caching_state_handler
+        self._underlying = caching_state_handler._underlying
+        self._state_cache = caching_state_handler._state_cache
+        self._map_state_handler = map_state_handler
+        self._read_cache_budget = read_cache_budget
+
+    def blocking_get(self, state_key, coder):
+        cache_token = self._map_state_handler._get_cache_token()
+        if not cache_token:
+            return self._caching_state_handler.blocking_get(state_key, coder)
+
+        cache_state_key = CachingMapStateHandler._convert_to_cache_key(state_key)
+        cached_values = self._map_state_handler._lookup_read_cache(cache_state_key, cache_token)
+        if cached_values is not None:
+            return cached_values
+
+        data, continuation_token = self._underlying.get_raw(state_key)
+        if continuation_token:
+            # the values don't fit into one response, they are read by the caching state handler
+            # of Beam which only caches the values of the first response
+            values = self._caching_state_handler.blocking_get(state_key, coder)
+        else:
+            values = []
+            input_stream = coder_impl.create_InputStream(data)
+            while input_stream.size() > 0:
+                values.append(coder.decode_from_stream(input_stream, True))
+            self._state_cache.put(cache_state_key, cache_token, values)
+        self._read_cache_budget.track(cache_state_key, cache_token, values, len(data))
+        return values
+
+    def extend(self, state_key, coder, elements):
+        cache_token = self._map_state_handler._get_cache_token()
+        if not cache_token:
+            return self._caching_state_handler.extend(state_key, coder, elements)
+
+        elements = list(elements)
+        output_stream = coder_impl.create_OutputStream()
+        for element in elements:
+            coder.encode_to_stream(element, output_stream, True)
+        data = output_stream.get()
+        cache_state_key = CachingMapStateHandler._convert_to_cache_key(state_key)
+        cached_values = self._state_cache.get(cache_state_key, cache_token)
+        # the values which don't fit into one response are only cached partially and could not
+        # be extended, the values which aren't cached are not read to be extended
+        if isinstance(cached_values, list):
+            cached_values.extend(elements)
+            self._read_cache_budget.track_extended(
+                cache_state_key, cache_token, cached_values, len(data))
+        return self._underlying.append_raw(state_key, data)
+
+    def clear(self, state_key):
+        cache_token = self._map_state_handler._get_cache_token()
+        if cache_token:
+            cache_state_key = CachingMapStateHandler._convert_to_cache_key(state_key)
+            values = []
+            self._state_cache.put(cache_state_key, cache_token, values)
+            self._read_cache_budget.track(cache_state_key, cache_token, values, 0)
+        return self._underlying.clear(state_key)
+
+
 class RemovableConcatIterator(collections.abc.Iterator):
 
     def __init__(self, internal_map_state, first, second):
@@ -776,6 +1414,18 @@ class InternalSynchronousMapRuntimeState(object):
         else:
             return None
 
+    def async_get(self, map_key) -> StateFuture:
+        if self._is_empty:
+            return StateFuture.completed(None)
+        if map_key in self._write_cache:
+            exists, value = self._write_cache[map_key]
+            return StateFuture.completed(value if exists else None)
+        if self._cleared:
+            return StateFuture.completed(None)
+        return self._map_state_handler.async_get(
+            self._state_key, map_key, self._map_key_encoder, self._map_value_decoder).then(
+            lambda exists_and_value: exists_and_value[1] if exists_and_value[0] else None)
+
     def put(self, map_key, map_value):
         self._write_cache[map_key] = (True, map_value)
         self._is_empty = False
@@ -902,9 +1552,10 @@ class SynchronousMapRuntimeState(SynchronousKvRuntimeState, InternalMapState):
 
     def get_internal_state(self):
         if self._internal_state is None:
+            self._remote_state_backend.mark_accessed(self)
             self._internal_state = self._remote_state_backend._get_internal_map_state(
                 self.name,
-                self.namespace,
+                self._encoded_namespace,
                 self._map_key_coder,
                 self._map_value_coder,
                 self._ttl_config,
@@ -914,6 +1565,19 @@ class SynchronousMapRuntimeState(SynchronousKvRuntimeState, InternalMapState):
     def get(self, key):
         return self.get_internal_state().get(key)
 
+    def async_get(self, key) -> StateFuture:
+        """
+        Sends out the read request of the value of the given key without waiting for the response.
+        """
+        return self.get_internal_state().async_get(key)
+
+    def async_contains(self, key) -> StateFuture:
+        """
+        Sends out the request checking whether the given key exists without waiting for the
+        response.
+        """
+        return self.get_internal_state().async_get(key).then(lambda value: value is not None)
+
     def put(self, key, value):
         self.get_internal_state().put(key, value)
 
@@ -957,8 +1621,21 @@ class RemoteKeyedStateBackend(object):
                  map_state_read_cache_size,
                  map_state_write_cache_size):
         self._state_handler = state_handler
+        memory_budget = get_state_cache_memory_budget()
+        if memory_budget is not None:
+            # the read cache holds the values of at most state_cache_size states as it's
+            # configured by the same option
+            self._read_cache_budget = ReadCacheBudget(
+                state_handler._state_cache, max(state_cache_size, 0), memory_budget)
+        else:
+            self._read_cache_budget = None
         self._map_state_handler = CachingMapStateHandler(
-            state_handler, map_state_read_cache_size)
+            state_handler, map_state_read_cache_size, self._read_cache_budget)
+        if self._read_cache_budget is not None:
+            self._bag_state_handler = BudgetedBagStateHandler(
+                state_handler, self._map_state_handler, self._read_cache_budget)
+        else:
+            self._bag_state_handler = state_handler
         self._key_coder_impl = key_coder.get_impl()
         self.namespace_coder = namespace_coder
         if namespace_coder:
@@ -968,6 +1645,15 @@ class RemoteKeyedStateBackend(object):
         self._state_cache_size = state_cache_size
         self._map_state_write_cache_size = map_state_write_cache_size
         self._all_states = {}  # type: Dict[str, SynchronousKvRuntimeState]
+        # the states accessed under the current key
+        self._accessed_states = {}  # type: Dict[str, SynchronousKvRuntimeState]
+        # the encoded descriptors of the states, which are part of the state keys
+        self._state_ids = {}
+        # the state handlers of the states whose read cache is aware of the TTL
+        self._ttl_state_handlers = {}
+        # the expiration times of the values of the bag states in the read cache, which holds the
+        # values of at most state_cache_size states as it's configured by the same option
+        self._bag_state_expiration_times = LRUCache(self._state_cache_size, None)
         self._internal_state_cache = LRUCache(self._state_cache_size, None)
         self._internal_state_cache.set_on_evict(
             lambda key, value: self.commit_internal_state(value))
@@ -979,6 +1665,20 @@ class RemoteKeyedStateBackend(object):
                 side_input_id="clear_iterators",
                 key=self._encoded_current_key))
 
+    def register_metrics(self, metric_group):
+        """
+        Registers the statistics of the state caches as metrics of the given metric group.
+        """
+        # the internal state cache is bounded by the number of the states only, the values of
+        # the states are held by the read cache
+        self._internal_state_cache.get_statistics().register_metrics(
+            metric_group.add_group("internalStateCache"), with_resident_bytes=False)
+        self._map_state_handler.get_read_cache_statistics().register_metrics(
+            metric_group.add_group("mapStateReadCache"), with_resident_bytes=False)
+        if self._read_cache_budget is not None:
+            self._read_cache_budget.get_statistics().register_metrics(
+                metric_group.add_group("readCache"))
+
     def get_list_state(self, name, element_coder, ttl_config=None):
         return self._wrap_internal_bag_state(
             name,
@@ -1051,8 +1751,7 @@ class RemoteKeyedStateBackend(object):
         self._all_states[name] = wrapped_state
         return wrapped_state
 
-    def _get_internal_bag_state(self, name, namespace, element_coder, ttl_config):
-        encoded_namespace = self._encode_namespace(namespace)
+    def _get_internal_bag_state(self, name, encoded_namespace, element_coder, ttl_config):
         cached_state = self._internal_state_cache.get(
             (name, self._encoded_current_key, encoded_namespace))
         if cached_state is not None:
@@ -1068,8 +1767,7 @@ class RemoteKeyedStateBackend(object):
         return internal_state
 
     def _get_internal_map_state(
-            self, name, namespace, map_key_coder, map_value_coder, ttl_config, cache_type):
-        encoded_namespace = self._encode_namespace(namespace)
+            self, name, encoded_namespace, map_key_coder, map_value_coder, ttl_config, cache_type):
         cached_state = self._internal_state_cache.get(
             (name, self._encoded_current_key, encoded_namespace))
         if cached_state is not None:
@@ -1082,7 +1780,7 @@ class RemoteKeyedStateBackend(object):
             -> userstate.AccumulatingRuntimeState:
         if isinstance(state_spec, userstate.BagStateSpec):
             bag_state = SynchronousBagRuntimeState(
-                self._state_handler,
+                self._get_bag_state_handler(state_spec.name, ttl_config),
                 state_key=self.get_bag_state_key(
                     state_spec.name, self._encoded_current_key, encoded_namespace, ttl_config),
                 value_coder=state_spec.coder)
@@ -1094,27 +1792,44 @@ class RemoteKeyedStateBackend(object):
             self, name, encoded_namespace, map_key_coder, map_value_coder, ttl_config, cache_type):
         # Currently the `beam_fn_api.proto` does not support MapState, so we use the
         # the `MultimapSideInput` message to mark the state as a MapState for now.
-        state_proto = pb2_StateDescriptor()
-        state_proto.state_name = name
-        if ttl_config is not None:
-            state_proto.state_ttl_config.CopyFrom(ttl_config._to_proto())
         state_key = beam_fn_api_pb2.StateKey(
             multimap_side_input=beam_fn_api_pb2.StateKey.MultimapSideInput(
                 transform_id="",
                 window=encoded_namespace,
-                side_input_id=base64.b64encode(state_proto.SerializeToString()),
+                side_input_id=self._get_state_id(name, ttl_config),
                 key=self._encoded_current_key))
         if cache_type == SynchronousKvRuntimeState.CacheType.DISABLE_CACHE:
             write_cache_size = 0
         else:
             write_cache_size = self._map_state_write_cache_size
+        if cache_type == SynchronousKvRuntimeState.CacheType.ENABLE_READ_WRITE_CACHE:
+            map_state_handler = self._map_state_handler
+        else:
+            map_state_handler = self._ttl_state_handlers.get(name)
+            if map_state_handler is None:
+                map_state_handler = TtlCachingMapStateHandler(self._map_state_handler, ttl_config)
+                self._ttl_state_handlers[name] = map_state_handler
         return InternalSynchronousMapRuntimeState(
-            self._map_state_handler,
+            map_state_handler,
             state_key,
             map_key_coder,
             map_value_coder,
             write_cache_size)
 
+    def _get_bag_state_handler(self, name, ttl_config):
+        if SynchronousKvRuntimeState.get_cache_type(ttl_config) == \
+                SynchronousKvRuntimeState.CacheType.ENABLE_READ_WRITE_CACHE:
+            return self._bag_state_handler
+        bag_state_handler = self._ttl_state_handlers.get(name)
+        if bag_state_handler is None:
+            bag_state_handler = TtlBagStateHandler(
+                self._bag_state_handler,
+                self._map_state_handler,
+                ttl_config,
+                self._bag_state_expiration_times)
+            self._ttl_state_handlers[name] = bag_state_handler
+        return bag_state_handler
+
     def _encode_namespace(self, namespace):
         if namespace is not None:
             encoded_namespace = self._namespace_coder_impl.encode(namespace)
@@ -1123,32 +1838,138 @@ class RemoteKeyedStateBackend(object):
         return encoded_namespace
 
     def cache_internal_state(self, encoded_key, internal_kv_state: SynchronousKvRuntimeState):
-        encoded_old_namespace = self._encode_namespace(internal_kv_state.namespace)
         self._internal_state_cache.put(
-            (internal_kv_state.name, encoded_key, encoded_old_namespace),
+            (internal_kv_state.name, encoded_key, internal_kv_state._encoded_namespace),
             internal_kv_state.get_internal_state())
 
+    def mark_accessed(self, state: SynchronousKvRuntimeState):
+        """
+        Marks the given state as accessed under the current key. Only the accessed states are
+        cached and committed when the current key changes or the bundle finishes.
+        """
+        self._accessed_states[state.name] = state
+
     def set_current_key(self, key):
         if key == self._current_key:
             return
         encoded_old_key = self._encoded_current_key
-        for state_name, state_obj in self._all_states.items():
-            if self._state_cache_size > 0:
+        for state_obj in self._accessed_states.values():
+            if self._state_cache_size > 0 and state_obj._internal_state is not None:
                 # cache old internal state
                 self.cache_internal_state(encoded_old_key, state_obj)
             state_obj.namespace = None
+            state_obj._encoded_namespace = b''
             state_obj._internal_state = None
+        self._accessed_states.clear()
         self._current_key = key
         self._encoded_current_key = self._key_coder_impl.encode(self._current_key)
 
     def get_current_key(self):
         return self._current_key
 
+    def get_encoded_current_key(self):
+        return self._encoded_current_key
+
+    def get_state_cache_token(self):
+        """
+        Returns the token under which the state read from the Java operator is cached. The token
+        changes when the state could have been changed by others, e.g. when it's restored, and it
+        is None if the state isn't cached at all.
+        """
+        return self._map_state_handler._get_cache_token()
+
+    def get_prefetch_batch_size(self):
+        """
+        Returns the maximum number of the state values prefetched at once, which is 0 if the
+        state values should not be prefetched as the state cache is disabled.
+        """
+        # leave room in the read cache for the other states accessed in the same bundle, so
+        # that the prefetched values are not evicted before being accessed
+        return max(self._state_cache_size, 0) // 2
+
+    def prefetch_state(self, state: SynchronousBagKvRuntimeState, keys):
+        """
+        Prefetches the values of the given state under the given keys into the read cache.
+
+        All the state requests are sent out before waiting for any of the responses, so that
+        fetching the values of a batch of keys costs roughly one round trip to the Java state
+        backend instead of one round trip per key. The values which are already cached are not
+        fetched again.
+        """
+        self._prefetch_bag_states([state], keys)
+
+    def prefetch_states(self, keys):
+        """
+        Prefetches the values of all the registered value, list, reducing and aggregating states
+        under the given keys into the read cache. See :func:`prefetch_state`.
+        """
+        self._prefetch_bag_states(
+            [state for state in self._all_states.values()
+             if isinstance(state, SynchronousBagKvRuntimeState)],
+            keys)
+
+    def _prefetch_bag_states(self, states, keys):
+        max_requests = self.get_prefetch_batch_size()
+        if max_requests <= 0 or not self._map_state_handler._get_cache_token():
+            return
+        encoded_keys = [self._key_coder_impl.encode(key) for key in keys]
+        state_futures = []
+        for state in states:
+            if state._cache_type != SynchronousKvRuntimeState.CacheType.ENABLE_READ_WRITE_CACHE:
+                continue
+            value_coder = state._value_coder
+            if isinstance(value_coder, FieldCoder):
+                value_coder = FlinkCoder(value_coder)
+            value_coder_impl = value_coder.get_impl()
+            for encoded_key in encoded_keys:
+                if len(state_futures) >= max_requests:
+                    break
+                state_key = self.get_bag_state_key(
+                    state.name, encoded_key, b'', state._ttl_config)
+                state_futures.append(self._async_read_bag_state(state_key, value_coder_impl))
+        for state_future in state_futures:
+            state_future.result()
+
+    def _async_read_bag_state(self, state_key, value_coder_impl) -> StateFuture:
+        cache_token = self._map_state_handler._get_cache_token()
+        state_cache = self._state_handler._state_cache
+        cache_state_key = None
+        if cache_token:
+            cache_state_key = CachingMapStateHandler._convert_to_cache_key(state_key)
+            cached_values = self._map_state_handler._lookup_read_cache(
+                cache_state_key, cache_token)
+            if cached_values is not None:
+                return StateFuture.completed(list(cached_values))
+
+        def on_response(data, continuation_token):
+            if continuation_token:
+                # the values don't fit into one response, read the remaining ones synchronously
+                return list(self._bag_state_handler.blocking_get(state_key, value_coder_impl))
+            values = []
+            input_stream = coder_impl.create_InputStream(data)
+            while input_stream.size() > 0:
+                values.append(value_coder_impl.decode_from_stream(input_stream, True))
+            # the state may have been read or written since the request was sent out, in which
+            # case the cached values are more recent than the response
+            if cache_token and state_cache.get(cache_state_key, cache_token) is None:
+                state_cache.put(cache_state_key, cache_token, values)
+                if self._read_cache_budget is not None:
+                    self._read_cache_budget.track(
+                        cache_state_key, cache_token, values, len(data))
+                return list(values)
+            return values
+
+        return StateFuture(
+            self._state_handler._underlying._request(beam_fn_api_pb2.StateRequest(
+                state_key=state_key, get=beam_fn_api_pb2.StateGetRequest())),
+            on_response)
+
     def commit(self):
         for internal_state in self._internal_state_cache:
             self.commit_internal_state(internal_state)
-        for name, state in self._all_states.items():
-            if (name, self._encoded_current_key, self._encode_namespace(state.namespace)) \
+        for name, state in self._accessed_states.items():
+            if state._internal_state is not None and \
+                    (name, self._encoded_current_key, state._encoded_namespace) \
                     not in self._internal_state_cache:
                 self.commit_internal_state(state._internal_state)
 
@@ -1189,24 +2010,34 @@ class RemoteKeyedStateBackend(object):
                     (name, self._encoded_current_key, encoded_namespace))
                 # currently all the SynchronousMergingRuntimeState is based on bag state
                 state_key = self.get_bag_state_key(
-                    name, self._encoded_current_key, encoded_namespace, None)
+                    name, self._encoded_current_key, encoded_namespace, state._ttl_config)
                 # clear the read cache, the read cache is shared between map state handler and bag
                 # state handler. So we can use the map state handler instead.
                 self._map_state_handler.clear_read_cache(state_key)
 
     def get_bag_state_key(self, name, encoded_key, encoded_namespace, ttl_config):
-        from pyflink.fn_execution.flink_fn_execution_pb2 import StateDescriptor
-        state_proto = StateDescriptor()
-        state_proto.state_name = name
-        if ttl_config is not None:
-            state_proto.state_ttl_config.CopyFrom(ttl_config._to_proto())
         return beam_fn_api_pb2.StateKey(
             bag_user_state=beam_fn_api_pb2.StateKey.BagUserState(
                 transform_id="",
                 window=encoded_namespace,
-                user_state_id=base64.b64encode(state_proto.SerializeToString()),
+                user_state_id=self._get_state_id(name, ttl_config),
                 key=encoded_key))
 
+    def _get_state_id(self, name, ttl_config):
+        """
+        Returns the base64 encoded descriptor of the state with the given name and TTL config,
+        which identifies the state in the state keys. It's only built once for every state.
+        """
+        state_id = self._state_ids.get((name, ttl_config))
+        if state_id is None:
+            state_proto = pb2_StateDescriptor()
+            state_proto.state_name = name
+            if ttl_config is not None:
+                state_proto.state_ttl_config.CopyFrom(ttl_config._to_proto())
+            state_id = base64.b64encode(state_proto.SerializeToString())
+            self._state_ids[(name, ttl_config)] = state_id
+        return state_id
+
     @staticmethod
     def commit_internal_state(internal_state):
         if internal_state is not None:
@@ -1217,6 +2048,307 @@ class RemoteKeyedStateBackend(object):
             internal_state._added_elements = []
 
 
+class BatchKvState(InternalKvState, ABC):
+    """
+    Base class of the states of :class:`BatchKeyedStateBackend`, which are kept in the Python
+    worker for the current key only.
+    """
+
+    def __init__(self, name: str, batch_state_backend: 'BatchKeyedStateBackend'):
+        self.name = name
+        self._batch_state_backend = batch_state_backend
+        self.namespace = None
+
+    def set_current_namespace(self, namespace: N) -> None:
+        self.namespace = namespace
+
+    def _get_value(self):
+        return self._batch_state_backend._current_key_values.get((self.name, self.namespace))
+
+    def _set_value(self, value) -> None:
+        self._batch_state_backend._current_key_values[(self.name, self.namespace)] = value
+
+    def clear(self) -> None:
+        self._batch_state_backend._current_key_values.pop((self.name, self.namespace), None)
+
+
+class BatchValueState(BatchKvState, InternalValueState):
+    """
+    The ValueState implementation of :class:`BatchKeyedStateBackend`.
+    """
+
+    def value(self):
+        return self._get_value()
+
+    def update(self, value) -> None:
+        if value is None:
+            self.clear()
+        else:
+            self._set_value(value)
+
+
+class BatchMergingState(BatchKvState, InternalMergingState, ABC):
+    """
+    Base class of the MergingState implementations of :class:`BatchKeyedStateBackend`.
+    """
+
+    def merge_namespaces(self, target: N, sources: Collection[N]) -> None:
+        values = self._batch_state_backend._current_key_values
+        merged_value = None
+        for source in sources:
+            value = values.pop((self.name, source), None)
+            if value is not None:
+                merged_value = value if merged_value is None \
+                    else self._merge(merged_value, value)
+        if merged_value is not None:
+            target_value = values.get((self.name, target))
+            values[(self.name, target)] = merged_value if target_value is None \
+                else self._merge(merged_value, target_value)
+
+    @abstractmethod
+    def _merge(self, value, other):
+        """
+        Merges the values of two namespaces of the state.
+        """
+        pass
+
+
+class BatchListState(BatchMergingState, InternalListState):
+    """
+    The ListState implementation of :class:`BatchKeyedStateBackend`.
+    """
+
+    def add(self, v):
+        values = self._get_value()
+        if values is None:
+            self._set_value([v])
+        else:
+            values.append(v)
+
+    def get(self):
+        values = self._get_value()
+        return list(values) if values is not None else []
+
+    def add_all(self, values):
+        if not values:
+            return
+        current_values = self._get_value()
+        if current_values is None:
+            self._set_value(list(values))
+        else:
+            current_values.extend(values)
+
+    def update(self, values):
+        self.clear()
+        self.add_all(values)
+
+    def _merge(self, value, other):
+        value.extend(other)
+        return value
+
+
+class BatchReducingState(BatchMergingState, InternalReducingState):
+    """
+    The ReducingState implementation of :class:`BatchKeyedStateBackend`.
+    """
+
+    def __init__(self,
+                 name: str,
+                 batch_state_backend: 'BatchKeyedStateBackend',
+                 reduce_function: ReduceFunction):
+        super(BatchReducingState, self).__init__(name, batch_state_backend)
+        self._reduce_function = reduce_function
+
+    def add(self, v):
+        current_value = self._get_value()
+        if current_value is None:
+            self._set_value(v)
+        else:
+            self._set_value(self._reduce_function.reduce(current_value, v))
+
+    def get(self):
+        return self._get_value()
+
+    def _merge(self, value, other):
+        return self._reduce_function.reduce(value, other)
+
+
+class BatchAggregatingState(BatchMergingState, InternalAggregatingState):
+    """
+    The AggregatingState implementation of :class:`BatchKeyedStateBackend`.
+    """
+
+    def __init__(self,
+                 name: str,
+                 batch_state_backend: 'BatchKeyedStateBackend',
+                 agg_function: AggregateFunction):
+        super(BatchAggregatingState, self).__init__(name, batch_state_backend)
+        self._agg_function = agg_function
+
+    def add(self, v):
+        if v is None:
+            self.clear()
+            return
+        accumulator = self._get_value()
+        if accumulator is None:
+            accumulator = self._agg_function.create_accumulator()
+        self._set_value(self._agg_function.add(v, accumulator))
+
+    def get(self):
+        accumulator = self._get_value()
+        if accumulator is None:
+            return None
+        else:
+            return self._agg_function.get_result(accumulator)
+
+    def get_internal(self):
+        return self._get_value()
+
+    def _merge(self, value, other):
+        return self._agg_function.merge(value, other)
+
+
+class BatchMapState(BatchKvState, InternalMapState):
+    """
+    The MapState implementation of :class:`BatchKeyedStateBackend`.
+    """
+
+    def _get_or_create_map(self):
+        map_value = self._get_value()
+        if map_value is None:
+            map_value = {}
+            self._set_value(map_value)
+        return map_value
+
+    def get(self, key):
+        map_value = self._get_value()
+        return map_value.get(key) if map_value is not None else None
+
+    def put(self, key, value):
+        self._get_or_create_map()[key] = value
+
+    def put_all(self, dict_value):
+        self._get_or_create_map().update(dict_value)
+
+    def remove(self, key):
+        map_value = self._get_value()
+        if map_value is not None:
+            map_value.pop(key, None)
+
+    def contains(self, key):
+        map_value = self._get_value()
+        return map_value is not None and key in map_value
+
+    def items(self):
+        # copies the entries, so that the map state could be modified while iterating them
+        map_value = self._get_value()
+        return list(map_value.items()) if map_value is not None else []
+
+    def keys(self):
+        map_value = self._get_value()
+        return list(map_value.keys()) if map_value is not None else []
+
+    def values(self):
+        map_value = self._get_value()
+        return list(map_value.values()) if map_value is not None else []
+
+    def is_empty(self):
+        return not self._get_value()
+
+
+class BatchKeyedStateBackend(object):
+    """
+    A keyed state backend for the keyed operators executed in BATCH execution mode.
+
+    In BATCH execution mode the input of a keyed operator is sorted by key and all the timers of a
+    key are fired right after the last element of the key has been processed, before the elements
+    of the next key. So the state of a key is never accessed again once the current key changes.
+    Instead of reading the state from and writing it to the state backend of the Java operator,
+    the state of the current key is only kept in the Python worker and discarded when the current
+    key changes. The state TTL is ignored, as the state only lives while its key is processed.
+    """
+
+    def __init__(self, key_coder, namespace_coder):
+        self._key_coder_impl = key_coder.get_impl()
+        self.namespace_coder = namespace_coder
+        if namespace_coder:
+            self._namespace_coder_impl = namespace_coder.get_impl()
+        else:
+            self._namespace_coder_impl = None
+        self._all_states = {}  # type: Dict[str, BatchKvState]
+        # (state name, namespace) -> the value of the state under the current key
+        self._current_key_values = {}
+        self._current_key = None
+        self._encoded_current_key = None
+
+    def register_metrics(self, metric_group):
+        """
+        There are no state caches to report, as all the state of the current key is kept in the
+        Python worker.
+        """
+        pass
+
+    def get_list_state(self, name, element_coder, ttl_config=None):
+        return self._get_or_create_state(name, BatchListState, BatchListState)
+
+    def get_value_state(self, name, value_coder, ttl_config=None):
+        return self._get_or_create_state(name, BatchValueState, BatchValueState)
+
+    def get_map_state(self, name, map_key_coder, map_value_coder, ttl_config=None):
+        return self._get_or_create_state(name, BatchMapState, BatchMapState)
+
+    def get_reducing_state(self, name, coder, reduce_function, ttl_config=None):
+        return self._get_or_create_state(
+            name,
+            BatchReducingState,
+            partial(BatchReducingState, reduce_function=reduce_function))
+
+    def get_aggregating_state(self, name, coder, agg_function, ttl_config=None):
+        return self._get_or_create_state(
+            name,
+            BatchAggregatingState,
+            partial(BatchAggregatingState, agg_function=agg_function))
+
+    def _get_or_create_state(self, name, state_type, create_method):
+        if name in self._all_states:
+            state = self._all_states[name]
+            if not isinstance(state, state_type):
+                raise Exception("The state name '%s' is already in use and not a %s."
+                                % (name, state_type))
+            return state
+        state = create_method(name, self)
+        self._all_states[name] = state
+        return state
+
+    def set_current_key(self, key):
+        if key == self._current_key:
+            return
+        self._current_key_values.clear()
+        for state in self._all_states.values():
+            state.namespace = None
+        self._current_key = key
+        self._encoded_current_key = self._key_coder_impl.encode(self._current_key)
+
+    def get_current_key(self):
+        return self._current_key
+
+    def get_encoded_current_key(self):
+        return self._encoded_current_key
+
+    def get_state_cache_token(self):
+        """
+        The state of the current key is discarded when the current key changes, so it isn't
+        cached under any token.
+        """
+        return None
+
+    def prefetch_states(self, keys):
+        pass
+
+    def commit(self):
+        pass
+
+
 class SynchronousReadOnlyBroadcastRuntimeState(InternalReadOnlyBroadcastState):
     def __init__(self, name: str, internal_map_state: "InternalSynchronousMapRuntimeState"):
         self._name = name
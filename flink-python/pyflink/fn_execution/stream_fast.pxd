@@ -47,6 +47,7 @@ cdef class OutputStream:
     cdef size_t pos
 
     cpdef void write(self, bytes v)
+    cpdef void write_buffer(self, object v) except *
     cdef void write_byte(self, unsigned char val)
     cdef void write_int8(self, int8_t v)
     cdef void write_int16(self, int16_t v)
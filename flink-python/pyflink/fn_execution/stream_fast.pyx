@@ -16,6 +16,7 @@
 # limitations under the License.
 ################################################################################
 # cython: language_level = 3
+from cpython.buffer cimport PyBUF_SIMPLE, PyBuffer_Release, PyObject_GetBuffer
 from libc.stdint cimport uint32_t, uint64_t
 from libc.stdlib cimport free, malloc, realloc
 from libc.string cimport memcpy
@@ -115,6 +116,19 @@ cdef class OutputStream:
             memcpy(self.buffer + self.pos, b, length)
         self.pos += length
 
+    cpdef void write_buffer(self, object v) except *:
+        # copies the object supporting the buffer protocol, e.g. pyarrow.Buffer, directly into
+        # the output buffer without creating an intermediate bytes object
+        cdef Py_buffer view
+        PyObject_GetBuffer(v, &view, PyBUF_SIMPLE)
+        try:
+            if self.buffer_size < self.pos + view.len:
+                self._extend(view.len)
+            memcpy(self.buffer + self.pos, view.buf, view.len)
+            self.pos += view.len
+        finally:
+            PyBuffer_Release(&view)
+
     cdef void write_byte(self, unsigned char v):
         if self.buffer_size < self.pos + 1:
             self._extend(1)
@@ -31,6 +31,13 @@ class InputStream(object):
         self.pos += size
         return self.data[self.pos - size: self.pos]
 
+    def read_buffer(self, size):
+        """
+        Reads the next *size* bytes as a memoryview of the underlying data without copying them.
+        """
+        self.pos += size
+        return memoryview(self.data)[self.pos - size: self.pos]
+
     def read_byte(self):
         self.pos += 1
         return self.data[self.pos - 1]
@@ -93,6 +100,14 @@ class OutputStream(object):
         self.data.append(b)
         self.byte_count += len(b)
 
+    def write_buffer(self, b):
+        """
+        Writes an object supporting the buffer protocol, e.g. pyarrow.Buffer, without copying it.
+        """
+        view = memoryview(b)
+        self.data.append(view)
+        self.byte_count += view.nbytes
+
     def write_byte(self, v):
         self.data.append(chr(v).encode('latin-1'))
         self.byte_count += 1
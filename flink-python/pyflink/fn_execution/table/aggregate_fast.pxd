@@ -88,6 +88,7 @@ cdef class GroupAggFunctionBase:
     cpdef void process_element(self, InternalRow input_data)
     cpdef list finish_bundle(self)
     cpdef void on_timer(self, InternalRow key)
+    cdef void _prefetch_accumulators(self, list keys)
 
 cdef class GroupAggFunction(GroupAggFunctionBase):
     pass
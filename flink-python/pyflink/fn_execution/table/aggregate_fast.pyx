@@ -304,10 +304,16 @@ cdef class SimpleAggsHandleFunctionBase(AggsHandleFunctionBase):
 
     cdef void set_accumulators(self, list accumulators):
         cdef size_t i, index
+        cdef list accumulator
         if self._udf_data_views:
             for i in range(len(self._udf_data_views)):
+                accumulator = accumulators[i]
                 for index, data_view in self._udf_data_views[i].items():
-                    accumulators[i][index] = data_view
+                    if index >= len(accumulator):
+                        # the accumulator was restored from a layout with less fields, e.g. of a
+                        # previous version of a built-in function, the missing fields are None
+                        accumulator.extend([None] * (index + 1 - len(accumulator)))
+                    accumulator[index] = data_view
         self._accumulators = accumulators
 
     cdef list get_accumulators(self):
@@ -474,6 +480,15 @@ cdef class GroupAggFunctionBase:
     cpdef list finish_bundle(self):
         pass
 
+    cdef void _prefetch_accumulators(self, list keys):
+        """
+        Prefetches the accumulators of the given buffered keys with pipelined state requests
+        instead of blocking on one state request per key in the loop of finish_bundle.
+        """
+        accumulator_state = self.state_backend.get_value_state(
+            "accumulators", self.state_value_coder)
+        self.state_backend.prefetch_state(accumulator_state, [list(key) for key in keys])
+
 cdef class GroupAggFunction(GroupAggFunctionBase):
     def __init__(self,
                  aggs_handle,
@@ -495,12 +510,19 @@ cdef class GroupAggFunction(GroupAggFunctionBase):
         cdef SimpleAggsHandleFunction aggs_handle
         cdef InternalRowKind input_row_kind
         cdef tuple current_key
-        cdef size_t input_rows_num, start_index, i
+        cdef size_t input_rows_num, start_index, i, j, buffered_keys_num, prefetch_batch_size
+        cdef list buffered_keys
         cdef InternalRow input_data
         cdef object accumulator_state, state_backend
         aggs_handle = <SimpleAggsHandleFunction> self.aggs_handle
         state_backend = self.state_backend
-        for current_key in self.buffer:
+        buffered_keys = list(self.buffer)
+        buffered_keys_num = len(buffered_keys)
+        prefetch_batch_size = state_backend.get_prefetch_batch_size()
+        for j in range(buffered_keys_num):
+            current_key = buffered_keys[j]
+            if prefetch_batch_size > 0 and j % prefetch_batch_size == 0:
+                self._prefetch_accumulators(buffered_keys[j:j + prefetch_batch_size])
             input_rows = self.buffer[current_key]
             input_rows_num = len(input_rows)
             key = list(current_key)
@@ -601,12 +623,19 @@ cdef class GroupTableAggFunction(GroupAggFunctionBase):
         cdef InternalRowKind input_row_kind
         cdef tuple current_key
         cdef InternalRow input_data
-        cdef size_t start_index, i, input_rows_num
+        cdef size_t start_index, i, j, input_rows_num, buffered_keys_num, prefetch_batch_size
+        cdef list buffered_keys
         cdef object state_backend, accumulator_state
         results = []
         aggs_handle = <SimpleTableAggsHandleFunction> self.aggs_handle
         state_backend = self.state_backend
-        for current_key in self.buffer:
+        buffered_keys = list(self.buffer)
+        buffered_keys_num = len(buffered_keys)
+        prefetch_batch_size = state_backend.get_prefetch_batch_size()
+        for j in range(buffered_keys_num):
+            current_key = buffered_keys[j]
+            if prefetch_batch_size > 0 and j % prefetch_batch_size == 0:
+                self._prefetch_accumulators(buffered_keys[j:j + prefetch_batch_size])
             input_rows = self.buffer[current_key]
             input_rows_num = len(input_rows)
             key = list(current_key)
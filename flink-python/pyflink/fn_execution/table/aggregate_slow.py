@@ -287,8 +287,13 @@ class SimpleAggsHandleFunctionBase(AggsHandleFunctionBase):
     def set_accumulators(self, accumulators: List):
         if self._udf_data_views:
             for i in range(len(self._udf_data_views)):
+                accumulator = accumulators[i]
                 for index, data_view in self._udf_data_views[i].items():
-                    accumulators[i][index] = data_view
+                    if index >= len(accumulator):
+                        # the accumulator was restored from a layout with less fields, e.g. of a
+                        # previous version of a built-in function, the missing fields are None
+                        accumulator.extend([None] * (index + 1 - len(accumulator)))
+                    accumulator[index] = data_view
         self._accumulators = accumulators
 
     def get_accumulators(self):
@@ -448,6 +453,15 @@ class GroupAggFunctionBase(object):
     def finish_bundle(self):
         pass
 
+    def _prefetch_accumulators(self, keys):
+        """
+        Prefetches the accumulators of the given buffered keys with pipelined state requests
+        instead of blocking on one state request per key in the loop of finish_bundle.
+        """
+        accumulator_state = self.state_backend.get_value_state(
+            "accumulators", self.state_value_coder)
+        self.state_backend.prefetch_state(accumulator_state, [list(key) for key in keys])
+
 
 class GroupAggFunction(GroupAggFunctionBase):
 
@@ -464,7 +478,12 @@ class GroupAggFunction(GroupAggFunctionBase):
             state_cleaning_enabled, index_of_count_star)
 
     def finish_bundle(self):
-        for current_key, input_rows in self.buffer.items():
+        buffered_keys = list(self.buffer)
+        prefetch_batch_size = self.state_backend.get_prefetch_batch_size()
+        for i, current_key in enumerate(buffered_keys):
+            if prefetch_batch_size > 0 and i % prefetch_batch_size == 0:
+                self._prefetch_accumulators(buffered_keys[i:i + prefetch_batch_size])
+            input_rows = self.buffer[current_key]
             current_key = list(current_key)
             first_row = False
             self.state_backend.set_current_key(current_key)
@@ -559,7 +578,12 @@ class GroupTableAggFunction(GroupAggFunctionBase):
             state_cleaning_enabled, index_of_count_star)
 
     def finish_bundle(self):
-        for current_key, input_rows in self.buffer.items():
+        buffered_keys = list(self.buffer)
+        prefetch_batch_size = self.state_backend.get_prefetch_batch_size()
+        for i, current_key in enumerate(buffered_keys):
+            if prefetch_batch_size > 0 and i % prefetch_batch_size == 0:
+                self._prefetch_accumulators(buffered_keys[i:i + prefetch_batch_size])
+            input_rows = self.buffer[current_key]
             current_key = list(current_key)
             first_row = False
             self.state_backend.set_current_key(current_key)
@@ -16,13 +16,14 @@
 # limitations under the License.
 ################################################################################
 import abc
+import os
 from functools import reduce
 from itertools import chain
 from typing import Tuple
 
 from pyflink.fn_execution.coders import DataViewFilterCoder, PickleCoder
 from pyflink.fn_execution.datastream.timerservice import InternalTimer
-from pyflink.fn_execution.datastream.operations import Operation
+from pyflink.fn_execution.datastream.operations import Operation, BundleOperation
 from pyflink.fn_execution.datastream.timerservice_impl import TimerOperandType, InternalTimerImpl
 from pyflink.fn_execution.table.state_data_view import extract_data_view_specs
 
@@ -68,10 +69,8 @@ PANDAS_AGGREGATE_FUNCTION_URN = "flink:transform:aggregate_function:arrow:v1"
 PANDAS_BATCH_OVER_WINDOW_AGGREGATE_FUNCTION_URN = \
     "flink:transform:batch_over_window_aggregate_function:arrow:v1"
 
-
-class BundleOperation(object):
-    def finish_bundle(self):
-        raise NotImplementedError
+PYTHON_COLUMNAR_CODING_ENABLED = "PYTHON_COLUMNAR_CODING_ENABLED"
+PYTHON_OVER_WINDOW_INCREMENTAL_ENABLED = "PYTHON_OVER_WINDOW_INCREMENTAL_ENABLED"
 
 
 class BaseOperation(Operation):
@@ -102,6 +101,19 @@ class ScalarFunctionOperation(BaseOperation):
         self._one_arg_optimization = one_arg_optimization
         self._one_result_optimization = one_result_optimization
         super(ScalarFunctionOperation, self).__init__(serialized_fn)
+        # the columnar coding only applies to the flatten rows of the general Python functions,
+        # i.e. when no function takes the whole row as input. The Pandas functions are evaluated
+        # on the Arrow batches instead.
+        self._columnar_coding_enabled = \
+            os.environ.get(PYTHON_COLUMNAR_CODING_ENABLED, 'false') == 'true' and \
+            not one_arg_optimization and not one_result_optimization and \
+            not any(udf.takes_row_as_input or udf.is_pandas_udf for udf in serialized_fn.udfs)
+
+    def is_columnar_coding_enabled(self) -> bool:
+        return self._columnar_coding_enabled
+
+    def process_columns(self, columns):
+        return list(zip(*[self.func(value) for value in zip(*columns)]))
 
     def generate_func(self, serialized_fn):
         """
@@ -193,12 +205,28 @@ class PandasBatchOverWindowAggregateFunctionOperation(BaseOperation):
         user_defined_funcs = []
         self.window_indexes = []
         self.mapper = []
+        self.incremental_evaluators = []
+        incremental_enabled = \
+            os.environ.get(PYTHON_OVER_WINDOW_INCREMENTAL_ENABLED, 'false') == 'true'
         for udf in serialized_fn.udfs:
             pandas_agg_function, variable_dict, user_defined_func, window_index = \
                 operation_utils.extract_over_window_user_defined_function(udf)
             user_defined_funcs.extend(user_defined_func)
             self.window_indexes.append(window_index)
             self.mapper.append(eval('lambda value: %s' % pandas_agg_function, variable_dict))
+            # the inputs computed by other Python functions are not sliceable
+            if incremental_enabled and len(user_defined_func) == 1:
+                from pyflink.fn_execution.table.over_window_kernels import \
+                    create_over_window_evaluator
+
+                # map the input series to the arguments of the Pandas UDAF instead of calling it
+                func_name = pandas_agg_function[:pandas_agg_function.index('(')]
+                args_mapper = eval('lambda value: %s' % pandas_agg_function,
+                                   dict(variable_dict, **{func_name: lambda *args: args}))
+                self.incremental_evaluators.append(
+                    create_over_window_evaluator(user_defined_func[0].func, args_mapper))
+            else:
+                self.incremental_evaluators.append(None)
         return self.wrapped_over_window_function, user_defined_funcs
 
     def wrapped_over_window_function(self, boundaries_series):
@@ -217,68 +245,76 @@ class PandasBatchOverWindowAggregateFunctionOperation(BaseOperation):
             window = self.windows[window_index]
             window_type = window.window_type
             func = self.mapper[i]
-            result = []
-            if self.is_bounded_range_window[window_index]:
-                window_boundaries = boundaries_series[
-                    self.bounded_range_window_index[window_index]]
-                if window_type is OverWindow.RANGE_UNBOUNDED_PRECEDING:
-                    # range unbounded preceding window
-                    for j in range(input_cnt):
-                        end = window_boundaries[j]
-                        series_slices = [s.iloc[:end] for s in input_series]
-                        result.append(func(series_slices))
-                elif window_type is OverWindow.RANGE_UNBOUNDED_FOLLOWING:
-                    # range unbounded following window
-                    for j in range(input_cnt):
-                        start = window_boundaries[j]
-                        series_slices = [s.iloc[start:] for s in input_series]
-                        result.append(func(series_slices))
-                else:
-                    # range sliding window
-                    for j in range(input_cnt):
-                        start = window_boundaries[j * 2]
-                        end = window_boundaries[j * 2 + 1]
-                        series_slices = [s.iloc[start:end] for s in input_series]
-                        result.append(func(series_slices))
-            else:
+            if (window_type is OverWindow.RANGE_UNBOUNDED) or (
+                    window_type is OverWindow.ROW_UNBOUNDED):
                 # unbounded range window or unbounded row window
-                if (window_type is OverWindow.RANGE_UNBOUNDED) or (
-                        window_type is OverWindow.ROW_UNBOUNDED):
-                    series_slices = [s.iloc[:] for s in input_series]
-                    func_result = func(series_slices)
-                    result = [func_result for _ in range(input_cnt)]
-                elif window_type is OverWindow.ROW_UNBOUNDED_PRECEDING:
-                    # row unbounded preceding window
-                    window_end = window.upper_boundary
-                    for j in range(input_cnt):
-                        end = min(j + window_end + 1, input_cnt)
-                        series_slices = [s.iloc[: end] for s in input_series]
-                        result.append(func(series_slices))
-                elif window_type is OverWindow.ROW_UNBOUNDED_FOLLOWING:
-                    # row unbounded following window
-                    window_start = window.lower_boundary
-                    for j in range(input_cnt):
-                        start = max(j + window_start, 0)
-                        series_slices = [s.iloc[start: input_cnt] for s in input_series]
-                        result.append(func(series_slices))
-                else:
-                    # row sliding window
-                    window_start = window.lower_boundary
-                    window_end = window.upper_boundary
-                    for j in range(input_cnt):
-                        start = max(j + window_start, 0)
-                        end = min(j + window_end + 1, input_cnt)
-                        series_slices = [s.iloc[start: end] for s in input_series]
-                        result.append(func(series_slices))
-            results.append(pd.Series(result))
+                series_slices = [s.iloc[:] for s in input_series]
+                func_result = func(series_slices)
+                results.append(pd.Series([func_result for _ in range(input_cnt)]))
+                continue
+
+            starts, ends = self._window_offsets(window, window_index, boundaries_series, input_cnt)
+            result = None
+            if self.incremental_evaluators[i] is not None:
+                result = self.incremental_evaluators[i](input_series, starts, ends)
+            if result is None:
+                result = pd.Series([func([s.iloc[start:end] for s in input_series])
+                                    for start, end in zip(starts, ends)])
+            results.append(result)
         return results
 
+    def _window_offsets(self, window, window_index, boundaries_series, input_cnt):
+        """
+        Returns the start and the end offsets of the window of each row.
+        """
+        import numpy as np
+        from pyflink.fn_execution import flink_fn_execution_pb2
+
+        OverWindow = flink_fn_execution_pb2.OverWindow
+        window_type = window.window_type
+        if self.is_bounded_range_window[window_index]:
+            window_boundaries = np.asarray(
+                boundaries_series[self.bounded_range_window_index[window_index]],
+                dtype=np.int64)
+            if window_type is OverWindow.RANGE_UNBOUNDED_PRECEDING:
+                # range unbounded preceding window
+                starts = np.zeros(input_cnt, dtype=np.int64)
+                ends = window_boundaries
+            elif window_type is OverWindow.RANGE_UNBOUNDED_FOLLOWING:
+                # range unbounded following window
+                starts = window_boundaries
+                ends = np.full(input_cnt, input_cnt, dtype=np.int64)
+            else:
+                # range sliding window
+                starts = window_boundaries[0::2]
+                ends = window_boundaries[1::2]
+        else:
+            row_indexes = np.arange(input_cnt, dtype=np.int64)
+            if window_type is OverWindow.ROW_UNBOUNDED_PRECEDING:
+                # row unbounded preceding window
+                starts = np.zeros(input_cnt, dtype=np.int64)
+                ends = row_indexes + window.upper_boundary + 1
+            elif window_type is OverWindow.ROW_UNBOUNDED_FOLLOWING:
+                # row unbounded following window
+                starts = row_indexes + window.lower_boundary
+                ends = np.full(input_cnt, input_cnt, dtype=np.int64)
+            else:
+                # row sliding window
+                starts = row_indexes + window.lower_boundary
+                ends = row_indexes + window.upper_boundary + 1
+        starts = np.clip(starts, 0, input_cnt)
+        ends = np.clip(ends, starts, input_cnt)
+        return starts, ends
+
 
 class BaseStatefulOperation(BaseOperation, abc.ABC):
 
     def __init__(self, serialized_fn, keyed_state_backend):
         self.keyed_state_backend = keyed_state_backend
         super(BaseStatefulOperation, self).__init__(serialized_fn)
+        if self.keyed_state_backend and self.base_metric_group is not None:
+            self.keyed_state_backend.register_metrics(
+                self.base_metric_group.add_group("stateCache"))
 
     def finish(self):
         super().finish()
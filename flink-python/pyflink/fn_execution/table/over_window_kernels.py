@@ -0,0 +1,223 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import dis
+from functools import partial
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from pyflink.table.udf import AggregateFunction, DelegatingPandasAggregateFunction
+
+__all__ = ['create_over_window_evaluator']
+
+# the instructions which don't affect what a function computes
+_IGNORED_OPNAMES = {'RESUME', 'PRECALL', 'CACHE', 'NOP', 'PUSH_NULL'}
+
+
+def _window_counts(valid, starts, ends):
+    if valid is None:
+        return ends - starts
+    counts = np.concatenate(([0], np.cumsum(valid)))
+    return counts[ends] - counts[starts]
+
+
+def _window_sum(values, valid, starts, ends):
+    if valid is not None:
+        values = np.where(valid, values, 0)
+    if values.dtype.kind != 'f':
+        # the differences of the prefix sums are exact for integers
+        sums = np.concatenate(([0], np.cumsum(values)))
+        return sums[ends] - sums[starts]
+
+    # the differences of the prefix sums of floats are NaN for all the windows after an infinity
+    # and lose the precision of the windows after large values, so every window is summed on its
+    # own, i.e. the sums of the segments between the interleaved start and end offsets
+    non_empty = ends > starts
+    result = np.zeros(len(starts), dtype=values.dtype)
+    if np.any(non_empty):
+        offsets = np.empty(2 * np.count_nonzero(non_empty), dtype=np.int64)
+        offsets[0::2] = starts[non_empty]
+        offsets[1::2] = ends[non_empty]
+        # pads a value so that the end offset of the last row is a valid offset
+        padded_values = np.append(values, values.dtype.type(0))
+        result[non_empty] = np.add.reduceat(padded_values, offsets)[0::2]
+    return result
+
+
+def _window_mean(values, valid, starts, ends):
+    sums = _window_sum(values, valid, starts, ends)
+    counts = _window_counts(valid, starts, ends)
+    return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+
+def _window_extreme(ufunc, fill, values, valid, starts, ends):
+    if valid is not None:
+        values = np.where(valid, values, fill)
+    n = len(values)
+    lengths = ends - starts
+    non_empty = lengths > 0
+    result = np.zeros(len(starts), dtype=values.dtype)
+    if n > 0 and np.all(starts == 0):
+        # unbounded preceding windows: the extreme of the prefixes
+        result[non_empty] = ufunc.accumulate(values)[ends[non_empty] - 1]
+    elif n > 0 and np.all(ends == n):
+        # unbounded following windows: the extreme of the suffixes
+        result[non_empty] = ufunc.accumulate(values[::-1])[::-1][starts[non_empty]]
+    elif n > 0:
+        # sliding windows: level k holds the extremes of all the ranges of length 2^k, and every
+        # window is covered by two, possibly overlapping, ranges of the same level
+        levels = [values]
+        max_length = lengths.max()
+        while (len(levels[-1]) > 1) and (1 << len(levels)) <= max_length:
+            half = 1 << (len(levels) - 1)
+            levels.append(ufunc(levels[-1][:-half], levels[-1][half:]))
+        level_indexes = np.zeros(len(starts), dtype=np.int64)
+        level_indexes[non_empty] = np.floor(np.log2(lengths[non_empty])).astype(np.int64)
+        for k in np.unique(level_indexes[non_empty]):
+            selected = non_empty & (level_indexes == k)
+            level = levels[k]
+            result[selected] = ufunc(
+                level[starts[selected]], level[ends[selected] - (1 << k)])
+    empty = ~non_empty if valid is None else _window_counts(valid, starts, ends) == 0
+    if np.any(empty):
+        result = result.astype(np.float64)
+        result[empty] = np.nan
+    return result
+
+
+_KERNELS = {
+    'sum': _window_sum,
+    'mean': _window_mean,
+    'min': partial(_window_extreme, np.minimum, np.inf),
+    'max': partial(_window_extreme, np.maximum, -np.inf),
+    'count': lambda values, valid, starts, ends: _window_counts(valid, starts, ends),
+    'size': lambda values, valid, starts, ends: ends - starts,
+}
+
+_FUNCTION_KERNELS = {
+    len: 'size',
+    pd.Series.sum: 'sum',
+    pd.Series.mean: 'mean',
+    pd.Series.min: 'min',
+    pd.Series.max: 'max',
+    pd.Series.count: 'count',
+    np.sum: 'sum',
+    np.nansum: 'sum',
+    np.mean: 'mean',
+    np.nanmean: 'mean',
+    np.min: 'min',
+    np.nanmin: 'min',
+    np.max: 'max',
+    np.nanmax: 'max',
+}
+
+
+def _recognize_kernel(func) -> Optional[str]:
+    """
+    Recognizes the aggregation computed by a Pandas UDAF defined by a function, i.e. one of the
+    supported NumPy or Pandas functions itself, or a function which only calls one of the
+    supported methods on its single argument, e.g. `lambda v: v.mean()`.
+    """
+    try:
+        kernel = _FUNCTION_KERNELS.get(func)
+    except TypeError:
+        # unhashable callable object
+        return None
+    if kernel is not None:
+        return kernel
+
+    code = getattr(func, '__code__', None)
+    if code is None or code.co_argcount != 1 or code.co_kwonlyargcount != 0:
+        return None
+    instructions = [i for i in dis.get_instructions(func) if i.opname not in _IGNORED_OPNAMES]
+    if len(instructions) == 4 and \
+            instructions[0].opname == 'LOAD_FAST' and \
+            instructions[0].argval == code.co_varnames[0] and \
+            instructions[1].opname in ('LOAD_METHOD', 'LOAD_ATTR') and \
+            instructions[2].opname in ('CALL_METHOD', 'CALL') and \
+            instructions[2].arg == 0 and \
+            instructions[3].opname == 'RETURN_VALUE' and \
+            instructions[1].argval in ('sum', 'mean', 'min', 'max', 'count'):
+        return instructions[1].argval
+    return None
+
+
+def _slice_args(args, start, end):
+    return [arg.iloc[start:end] if isinstance(arg, (pd.Series, pd.DataFrame)) else arg
+            for arg in args]
+
+
+def _evaluate_with_kernel(kernel, args_mapper, input_series, starts, ends):
+    args = args_mapper(input_series)
+    if len(args) != 1 or not isinstance(args[0], pd.Series):
+        return None
+    series = args[0]
+    # only the numeric columns backed by NumPy arrays are supported
+    if not isinstance(series.dtype, np.dtype) or series.dtype.kind not in 'iuf':
+        return None
+    valid = series.notna().to_numpy()
+    if valid.all():
+        valid = None
+    values = series.to_numpy()
+    return pd.Series(_KERNELS[kernel](values, valid, starts, ends))
+
+
+def _evaluate_with_retraction(aggregate_function, args_mapper, input_series, starts, ends):
+    args = args_mapper(input_series)
+    results = []
+    accumulator = None
+    last_start = last_end = 0
+    for start, end in zip(starts, ends):
+        if accumulator is None or start < last_start or end < last_end or start >= last_end:
+            # the window doesn't overlap with the previous one
+            accumulator = aggregate_function.create_accumulator()
+            aggregate_function.accumulate(accumulator, *_slice_args(args, start, end))
+        else:
+            if end > last_end:
+                aggregate_function.accumulate(accumulator, *_slice_args(args, last_end, end))
+            if start > last_start:
+                aggregate_function.retract(accumulator, *_slice_args(args, last_start, start))
+        last_start, last_end = start, end
+        results.append(aggregate_function.get_value(accumulator))
+    return pd.Series(results)
+
+
+def create_over_window_evaluator(aggregate_function: AggregateFunction,
+                                 args_mapper: Callable) -> Optional[Callable]:
+    """
+    Creates the function which evaluates a Pandas UDAF over the bounded windows of all the rows of
+    a partition at once, instead of calling the Pandas UDAF with the slices of every window.
+    The returned function takes the input series of the partition and the start and end offsets
+    of the window of each row, and returns the result series, or None if the input series are
+    not supported by it. None is returned if the Pandas UDAF could not be evaluated incrementally.
+
+    The common aggregations, i.e. sum, mean, min, max and count, are evaluated with vectorized
+    cumulative kernels. The Pandas UDAFs which implement `retract` are evaluated incrementally by
+    accumulating the rows entering the window of each row and retracting the rows leaving it.
+
+    :param aggregate_function: The Pandas UDAF.
+    :param args_mapper: The function which maps the input series to the arguments of the UDAF.
+    """
+    if isinstance(aggregate_function, DelegatingPandasAggregateFunction):
+        kernel = _recognize_kernel(aggregate_function.func)
+        if kernel is not None:
+            return partial(_evaluate_with_kernel, kernel, args_mapper)
+    elif type(aggregate_function).retract is not AggregateFunction.retract:
+        return partial(_evaluate_with_retraction, aggregate_function, args_mapper)
+    return None
@@ -270,21 +270,31 @@ cdef class SimpleNamespaceAggsHandleFunction(NamespaceAggsHandleFunction):
 
     cpdef void merge(self, object namespace, list accumulators):
         cdef size_t i
+        cdef list accumulator
         if self._udf_data_views:
             for i in range(len(self._udf_data_views)):
+                accumulator = accumulators[i]
                 for index, data_view in self._udf_data_views[i].items():
                     data_view.set_current_namespace(namespace)
-                    accumulators[i][index] = data_view
+                    if index >= len(accumulator):
+                        # the accumulator was restored from a layout with less fields
+                        accumulator.extend([None] * (index + 1 - len(accumulator)))
+                    accumulator[index] = data_view
         for i in range(self._udf_num):
             self._udfs[i].merge(self._accumulators[i], [accumulators[i]])
 
     cpdef void set_accumulators(self, object namespace, list accumulators):
         cdef size_t i, index
+        cdef list accumulator
         if self._udf_data_views and namespace is not None:
             for i in range(len(self._udf_data_views)):
+                accumulator = accumulators[i]
                 for index, data_view in self._udf_data_views[i].items():
                     data_view.set_current_namespace(namespace)
-                    accumulators[i][index] = data_view
+                    if index >= len(accumulator):
+                        # the accumulator was restored from a layout with less fields
+                        accumulator.extend([None] * (index + 1 - len(accumulator)))
+                    accumulator[index] = data_view
         self._accumulators = accumulators
 
     cdef list get_accumulators(self):
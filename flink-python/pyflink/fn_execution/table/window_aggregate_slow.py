@@ -246,18 +246,26 @@ class SimpleNamespaceAggsHandleFunction(NamespaceAggsHandleFunction[N]):
     def merge(self, namespace: N, accumulators: List):
         if self._udf_data_views:
             for i in range(len(self._udf_data_views)):
+                accumulator = accumulators[i]
                 for index, data_view in self._udf_data_views[i].items():
                     data_view.set_current_namespace(namespace)
-                    accumulators[i][index] = data_view
+                    if index >= len(accumulator):
+                        # the accumulator was restored from a layout with less fields
+                        accumulator.extend([None] * (index + 1 - len(accumulator)))
+                    accumulator[index] = data_view
         for i in range(len(self._udfs)):
             self._udfs[i].merge(self._accumulators[i], [accumulators[i]])
 
     def set_accumulators(self, namespace: N, accumulators: List):
         if self._udf_data_views and namespace is not None:
             for i in range(len(self._udf_data_views)):
+                accumulator = accumulators[i]
                 for index, data_view in self._udf_data_views[i].items():
                     data_view.set_current_namespace(namespace)
-                    accumulators[i][index] = data_view
+                    if index >= len(accumulator):
+                        # the accumulator was restored from a layout with less fields
+                        accumulator.extend([None] * (index + 1 - len(accumulator)))
+                    accumulator[index] = data_view
         self._accumulators = accumulators
 
     def get_accumulators(self) -> List:
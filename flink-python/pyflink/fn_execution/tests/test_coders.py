@@ -25,7 +25,7 @@ from pyflink.fn_execution.coders import BigIntCoder, TinyIntCoder, BooleanCoder,
     SmallIntCoder, IntCoder, FloatCoder, DoubleCoder, BinaryCoder, CharCoder, DateCoder, \
     TimeCoder, TimestampCoder, GenericArrayCoder, MapCoder, DecimalCoder, FlattenRowCoder,\
     RowCoder, LocalZonedTimestampCoder, BigDecimalCoder, TupleCoder, PrimitiveArrayCoder,\
-    TimeWindowCoder, CountWindowCoder, InstantCoder
+    TimeWindowCoder, CountWindowCoder, InstantCoder, ValueCoder, IterableCoder
 from pyflink.datastream.window import TimeWindow, CountWindow
 from pyflink.testing.test_case_utils import PyFlinkTestCase
 
@@ -189,6 +189,135 @@ class CodersTest(PyFlinkTestCase):
         coder = CountWindowCoder()
         self.check_coder(coder, CountWindow(100))
 
+    def test_flatten_row_coder_columns(self):
+        try:
+            from pyflink.fn_execution.beam.beam_coder_impl_fast import \
+                FlinkLengthPrefixCoderBeamWrapper
+        except ImportError:
+            self.skipTest("The columnar coding is only supported by the Cython coders")
+        from apache_beam.coders.coder_impl import create_InputStream, create_OutputStream
+        import datetime
+
+        field_coder = FlattenRowCoder([IntCoder(), BigIntCoder(), BooleanCoder(), FloatCoder(),
+                                       DoubleCoder(), CharCoder(), DateCoder()])
+        rows = [[1, 1 << 40, True, 1.5, -2.25, 'flink', datetime.date(2021, 1, 1)],
+                [None, None, None, None, None, None, None],
+                [-2147483648, -1, False, 0.0, 1e300, '', datetime.date(1970, 1, 1)],
+                [2147483647, None, True, -0.25, None, 'python', None]]
+        columns = [list(column) for column in zip(*rows)]
+
+        # the rows encoded from the columns are the same as the rows encoded one by one
+        value_coder = FlinkLengthPrefixCoderBeamWrapper(ValueCoder(field_coder).get_impl())
+        expected_stream = create_OutputStream()
+        for row in rows:
+            value_coder.encode_to_stream(row, expected_stream, True)
+        output_stream = create_OutputStream()
+        value_coder.encode_columns_to_stream(columns, output_stream)
+        self.assertEqual(expected_stream.get(), output_stream.get())
+
+        iterable_coder = FlinkLengthPrefixCoderBeamWrapper(
+            IterableCoder(field_coder, False).get_impl())
+        input_stream_wrapper = iterable_coder.decode_from_stream(
+            create_InputStream(output_stream.get()), False)
+        self.assertEqual(columns, input_stream_wrapper.next_columns())
+
+        # no rows
+        output_stream = create_OutputStream()
+        value_coder.encode_columns_to_stream([[] for _ in columns], output_stream)
+        self.assertEqual(b'', output_stream.get())
+        input_stream_wrapper = iterable_coder.decode_from_stream(create_InputStream(b''), False)
+        self.assertEqual([[] for _ in columns], input_stream_wrapper.next_columns())
+
+    def test_arrow_coder(self):
+        import pandas as pd
+        from pyflink.table.types import DataTypes, RowType, RowField, create_arrow_schema
+        from pyflink.fn_execution.coders import ArrowCoder
+
+        row_type = RowType([RowField('f0', DataTypes.BIGINT()),
+                            RowField('f1', DataTypes.STRING())])
+        schema = create_arrow_schema(row_type.field_names(), row_type.field_types())
+        coder = ArrowCoder(schema, row_type, 'UTC').get_impl()
+        batches = [[pd.Series([1, 2, 3]), pd.Series(['a', 'b', 'c'])],
+                   [pd.Series([4]), pd.Series(['d'])],
+                   [pd.Series([5, 6]), pd.Series([None, 'f'])]]
+        encoded_batches = [coder.encode(batch) for batch in batches]
+        # the schema is only sent before the first arrow batch
+        self.assertGreater(len(encoded_batches[0]), len(encoded_batches[1]))
+        for batch, encoded_batch in zip(batches, encoded_batches):
+            result = coder.decode(encoded_batch)
+            self.assertEqual([list(s) for s in batch], [list(s) for s in result])
+
+        # the decoder accepts a new arrow stream which begins with the schema
+        result = ArrowCoder(schema, row_type, 'UTC').get_impl().decode(encoded_batches[0])
+        self.assertEqual([list(s) for s in batches[0]], [list(s) for s in result])
+
+    def test_read_buffer(self):
+        from apache_beam.coders import slow_stream
+        from apache_beam.coders.coder_impl import create_InputStream
+        from pyflink.fn_execution.beam.beam_stream_slow import BeamInputStream
+        from pyflink.fn_execution.stream_slow import InputStream
+
+        data = bytes(range(16))
+        for in_stream in [InputStream(data),
+                          BeamInputStream(slow_stream.InputStream(data)),
+                          BeamInputStream(create_InputStream(data))]:
+            # the buffer begins at the current position of the stream
+            self.assertEqual(data[:3], in_stream.read(3))
+            self.assertEqual(data[3:8], bytes(in_stream.read_buffer(5)))
+            # the following reads continue after the buffer
+            self.assertEqual(data[8], in_stream.read_byte())
+            # a partial read of the remaining bytes and a read which ends at the last byte
+            self.assertEqual(data[9:12], bytes(in_stream.read_buffer(3)))
+            self.assertEqual(data[12:], bytes(in_stream.read_buffer(4)))
+            self.assertEqual(0, in_stream.size())
+            self.assertEqual(b'', bytes(in_stream.read_buffer(0)))
+
+        # the bytes of the pure Python Beam input stream are read in place
+        self.assertIsInstance(
+            BeamInputStream(slow_stream.InputStream(data)).read_buffer(4), memoryview)
+
+    def test_arrow_coder_read_buffer(self):
+        import pandas as pd
+        from apache_beam.coders import slow_stream
+        from apache_beam.coders.coder_impl import create_InputStream
+        from pyflink.table.types import DataTypes, RowType, RowField, create_arrow_schema
+        from pyflink.fn_execution.beam.beam_stream_slow import BeamInputStream
+        from pyflink.fn_execution.coder_impl_slow import ArrowCoderImpl, IntCoderImpl, \
+            OverWindowArrowCoderImpl
+        from pyflink.fn_execution.stream_slow import InputStream
+
+        row_type = RowType([RowField('f0', DataTypes.BIGINT()),
+                            RowField('f1', DataTypes.STRING())])
+        schema = create_arrow_schema(row_type.field_names(), row_type.field_types())
+        batches = [[pd.Series([1, 2, 3]), pd.Series(['a', 'b', 'c'])],
+                   [pd.Series([4]), pd.Series(['d'])],
+                   [pd.Series([5, 6]), pd.Series([None, 'f'])]]
+        encoder = ArrowCoderImpl(schema, row_type, 'UTC')
+        encoded_batches = [encoder.encode(batch) for batch in batches]
+        # the window boundaries are encoded before the arrow batch of the over window aggregation
+        int_coder = IntCoderImpl()
+        window_data = b''.join(int_coder.encode(v) for v in [1, 2, 0, 3])
+        encoded_over_window_batch = window_data + encoded_batches[0]
+        data = b'prefix' + b''.join(encoded_batches) + encoded_over_window_batch + b'suffix'
+
+        for create_input_stream in [InputStream,
+                                    lambda d: BeamInputStream(slow_stream.InputStream(d)),
+                                    lambda d: BeamInputStream(create_InputStream(d))]:
+            in_stream = create_input_stream(data)
+            self.assertEqual(b'prefix', in_stream.read(6))
+            # the arrow batches span from the current position of the stream to their lengths
+            decoder = ArrowCoderImpl(schema, row_type, 'UTC')
+            for batch, encoded_batch in zip(batches, encoded_batches):
+                result = decoder.decode_from_stream(in_stream, len(encoded_batch))
+                self.assertEqual([list(s) for s in batch], [list(s) for s in result])
+            over_window_decoder = OverWindowArrowCoderImpl(
+                ArrowCoderImpl(schema, row_type, 'UTC'))
+            result = over_window_decoder.decode_from_stream(
+                in_stream, len(encoded_over_window_batch))
+            self.assertEqual([0, 3], result[0])
+            self.assertEqual([list(s) for s in batches[0]], [list(s) for s in result[1]])
+            self.assertEqual(b'suffix', bytes(in_stream.read(6)))
+
 
 if __name__ == '__main__':
     logging.getLogger().setLevel(logging.INFO)
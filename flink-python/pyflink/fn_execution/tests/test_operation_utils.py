@@ -0,0 +1,78 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import logging
+import os
+import unittest
+
+from pyflink.fn_execution.utils.operation_utils import LatencyHistogram, OutputFlushPolicy, \
+    PYTHON_OUTPUT_FLUSH_INTERVAL, PYTHON_OUTPUT_FLUSH_ON_IDLE, PYTHON_OUTPUT_FLUSH_SIZE
+from pyflink.testing.test_case_utils import PyFlinkTestCase
+
+
+class LatencyHistogramTests(PyFlinkTestCase):
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+        self.assertEqual(0, histogram.get_count())
+        self.assertEqual(0, histogram.get_percentile(0.99))
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for _ in range(98):
+            histogram.record(3)
+        histogram.record(150)
+        histogram.record(30000)
+        self.assertEqual(100, histogram.get_count())
+        self.assertEqual(30000, histogram.get_max())
+        self.assertEqual(5, histogram.get_percentile(0.5))
+        self.assertEqual(5, histogram.get_percentile(0.95))
+        self.assertEqual(200, histogram.get_percentile(0.99))
+        self.assertEqual(30000, histogram.get_percentile(1.0))
+
+    def test_percentile_bounded_by_max(self):
+        histogram = LatencyHistogram()
+        histogram.record(120)
+        self.assertEqual(120, histogram.get_percentile(0.5))
+
+
+class OutputFlushPolicyTests(PyFlinkTestCase):
+
+    def test_from_environment(self):
+        os.environ[PYTHON_OUTPUT_FLUSH_SIZE] = '1024'
+        os.environ[PYTHON_OUTPUT_FLUSH_INTERVAL] = '10'
+        os.environ[PYTHON_OUTPUT_FLUSH_ON_IDLE] = 'true'
+        try:
+            policy = OutputFlushPolicy.from_environment()
+        finally:
+            del os.environ[PYTHON_OUTPUT_FLUSH_SIZE]
+            del os.environ[PYTHON_OUTPUT_FLUSH_INTERVAL]
+            del os.environ[PYTHON_OUTPUT_FLUSH_ON_IDLE]
+        self.assertEqual(1024, policy.flush_size)
+        self.assertEqual(10, policy.flush_interval_millis)
+        self.assertTrue(policy.flush_on_idle)
+
+    def test_defaults(self):
+        policy = OutputFlushPolicy.from_environment()
+        self.assertEqual(10_000_000, policy.flush_size)
+        self.assertEqual(1000, policy.flush_interval_millis)
+        self.assertFalse(policy.flush_on_idle)
+
+
+if __name__ == '__main__':
+    logging.getLogger().setLevel(logging.INFO)
+    unittest.main()
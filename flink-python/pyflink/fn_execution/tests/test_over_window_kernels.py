@@ -0,0 +1,102 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from pyflink.fn_execution.table.over_window_kernels import _evaluate_with_kernel
+from pyflink.testing.test_case_utils import PyFlinkTestCase
+
+
+class OverWindowKernelsTests(PyFlinkTestCase):
+
+    @staticmethod
+    def sliding_windows(row_count, preceding):
+        ends = np.arange(1, row_count + 1, dtype=np.int64)
+        starts = np.maximum(ends - preceding - 1, 0)
+        return starts, ends
+
+    def check_kernels(self, series, starts, ends, kernels=('sum', 'mean', 'min', 'max', 'count')):
+        for kernel in kernels:
+            actual = _evaluate_with_kernel(
+                kernel, lambda input_series: input_series, [series], starts, ends)
+            expected = [getattr(series.iloc[start:end], kernel)()
+                        for start, end in zip(starts, ends)]
+            np.testing.assert_allclose(
+                np.asarray(actual, dtype=np.float64), np.asarray(expected, dtype=np.float64),
+                rtol=1e-12, err_msg="kernel %s of %s" % (kernel, list(series)))
+
+    def test_sliding_windows(self):
+        series = pd.Series([1.5, -2.0, 3.25, 4.0, 0.5, -7.75, 8.0])
+        for preceding in range(4):
+            self.check_kernels(series, *self.sliding_windows(len(series), preceding))
+
+    def test_integer_values(self):
+        series = pd.Series([1, 5, -3, 2 ** 40, 7], dtype=np.int64)
+        starts, ends = self.sliding_windows(len(series), 1)
+        self.check_kernels(series, starts, ends)
+        result = _evaluate_with_kernel(
+            'sum', lambda input_series: input_series, [series], starts, ends)
+        self.assertEqual([1, 6, 2, 2 ** 40 - 3, 2 ** 40 + 7], list(result))
+
+    def test_infinite_values(self):
+        series = pd.Series([1.0, np.inf, 2.0, 3.0, -np.inf, 4.0, 5.0, 6.0])
+        starts, ends = self.sliding_windows(len(series), 1)
+        self.check_kernels(series, starts, ends)
+        result = _evaluate_with_kernel(
+            'sum', lambda input_series: input_series, [series], starts, ends)
+        # the windows after the infinities are not affected by them
+        self.assertEqual([1.0, np.inf, np.inf, 5.0, -np.inf, -np.inf, 9.0, 11.0], list(result))
+
+    def test_missing_values(self):
+        series = pd.Series([1.0, None, np.nan, 4.0, None, 6.0])
+        for preceding in range(3):
+            self.check_kernels(series, *self.sliding_windows(len(series), preceding))
+
+        # the windows without any valid value
+        starts = np.array([1, 1, 0, 4], dtype=np.int64)
+        ends = np.array([2, 3, 0, 5], dtype=np.int64)
+        self.check_kernels(series, starts, ends)
+
+    def test_large_values(self):
+        series = pd.Series([1e20, 1.0, -1e20, 3.0, 4.0, 1e-5])
+        starts, ends = self.sliding_windows(len(series), 1)
+        self.check_kernels(series, starts, ends)
+        result = _evaluate_with_kernel(
+            'sum', lambda input_series: input_series, [series], starts, ends)
+        # the small windows after the large values keep their precision
+        self.assertEqual(7.0, result[4])
+        self.assertEqual(4.0 + 1e-5, result[5])
+
+    def test_unbounded_windows(self):
+        series = pd.Series([3.0, np.inf, None, -1.0, 2.0])
+        row_count = len(series)
+        ends = np.arange(1, row_count + 1, dtype=np.int64)
+        self.check_kernels(series, np.zeros(row_count, dtype=np.int64), ends)
+        self.check_kernels(series, ends - 1, np.full(row_count, row_count, dtype=np.int64))
+
+
+if __name__ == '__main__':
+    try:
+        import xmlrunner
+
+        testRunner = xmlrunner.XMLTestRunner(output='target/test-reports')
+    except ImportError:
+        testRunner = None
+    unittest.main(testRunner=testRunner, verbosity=2)
@@ -0,0 +1,678 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import logging
+import time
+import unittest
+
+from apache_beam.coders import coder_impl, coders
+from apache_beam.portability.api import beam_fn_api_pb2
+
+from pyflink.common import Time
+from pyflink.datastream import ReduceFunction
+from pyflink.datastream.functions import AggregateFunction
+from pyflink.datastream.state import StateTtlConfig
+from pyflink.fn_execution.coders import PickleCoder
+from pyflink.fn_execution.state_impl import CacheStatistics, CachedMapState, LRUCache, \
+    CachingMapStateHandler, TtlBagStateHandler, BatchKeyedStateBackend, RemoteKeyedStateBackend, \
+    ReadCacheBudget, BudgetedBagStateHandler, TtlCachingMapStateHandler
+from pyflink.testing.test_case_utils import PyFlinkTestCase
+
+
+class LRUCacheTests(PyFlinkTestCase):
+
+    def test_bounded_by_entries(self):
+        cache = LRUCache(2, None)
+        evicted = []
+        cache.set_on_evict(lambda key, value: evicted.append(key))
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(1, cache.get('a'))
+        cache.put('c', 3)
+        self.assertEqual(['b'], evicted)
+        self.assertIsNone(cache.get('b'))
+
+        statistics = cache.get_statistics()
+        self.assertEqual(1, statistics.hit_count)
+        self.assertEqual(1, statistics.miss_count)
+        self.assertEqual(50, statistics.get_hit_rate_percent())
+        self.assertEqual(1, statistics.eviction_count)
+
+    def test_bounded_by_bytes(self):
+        cache = LRUCache(100, None, max_bytes=10)
+        cache.put('a', 1, 4)
+        cache.put('b', 2, 4)
+        self.assertEqual(8, cache.get_statistics().resident_bytes)
+        cache.put('c', 3, 4)
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(8, cache.get_statistics().resident_bytes)
+
+        # replacing an entry accounts for the new size only
+        cache.put('b', 2, 6)
+        self.assertEqual(10, cache.get_statistics().resident_bytes)
+
+        cache.evict('b')
+        self.assertEqual(4, cache.get_statistics().resident_bytes)
+        cache.evict_all()
+        self.assertEqual(0, cache.get_statistics().resident_bytes)
+
+    def test_shared_statistics(self):
+        statistics = CacheStatistics()
+        map_state_1 = CachedMapState(10, 10, statistics)
+        map_state_2 = CachedMapState(10, 10, statistics)
+        map_state_1.put('a', (True, 1), 6)
+        map_state_2.put('a', (False, None), 6)
+        self.assertEqual((True, 1), map_state_1.get('a'))
+        self.assertIsNone(map_state_2.get('b'))
+        self.assertEqual(1, statistics.hit_count)
+        self.assertEqual(1, statistics.miss_count)
+        self.assertEqual({'a'}, map_state_1.get_cached_keys())
+        self.assertEqual(set(), map_state_2.get_cached_keys())
+
+        map_state_1.put('b', (True, 2), 6)
+        self.assertEqual({'b'}, map_state_1.get_cached_keys())
+        self.assertEqual(1, statistics.eviction_count)
+
+        # the resident bytes of the cached map states are tracked by the ReadCacheBudget
+        self.assertEqual(6, map_state_1.get_resident_bytes())
+        self.assertEqual(6, map_state_2.get_resident_bytes())
+        self.assertEqual(0, statistics.resident_bytes)
+
+
+class ReadCacheBudgetTests(PyFlinkTestCase):
+
+    def setUp(self):
+        super(ReadCacheBudgetTests, self).setUp()
+        self.state_handler = FakeCachingStateHandler()
+        self.state_cache = self.state_handler._state_cache
+        self.budget = ReadCacheBudget(self.state_cache, 10, 100)
+        self.map_state_handler = CachingMapStateHandler(self.state_handler, 10, self.budget)
+        self.bag_state_handler = BudgetedBagStateHandler(
+            self.state_handler, self.map_state_handler, self.budget)
+        self.coder = coders.BytesCoder().get_impl()
+
+    @staticmethod
+    def create_state_key(name):
+        return beam_fn_api_pb2.StateKey(
+            bag_user_state=beam_fn_api_pb2.StateKey.BagUserState(
+                transform_id="", user_state_id=name, window=b'', key=b'key'))
+
+    def put_map_entry(self, state_key, map_key, map_value):
+        self.map_state_handler.extend(
+            state_key,
+            [(CachingMapStateHandler.SET_VALUE, map_key, map_value)],
+            lambda v, out: self.coder.encode_to_stream(v, out, True),
+            lambda v, out: self.coder.encode_to_stream(v, out, True))
+
+    def write_remote_bag(self, state_key, values):
+        output_stream = coder_impl.create_OutputStream()
+        for value in values:
+            self.coder.encode_to_stream(value, output_stream, True)
+        self.state_handler.raw_values[state_key.SerializeToString()] = output_stream.get()
+
+    def test_shared_by_map_states_and_bag_values(self):
+        map_state_key = self.create_state_key("map")
+        bag_state_key = self.create_state_key("bag")
+        # the flag, the lengths and the encoded key and value, i.e. 1 + 4 + 2 + 4 + 51 bytes
+        self.put_map_entry(map_state_key, b'k', b'v' * 50)
+        self.assertEqual(62, self.budget.get_statistics().resident_bytes)
+
+        self.write_remote_bag(bag_state_key, [b'x' * 40])
+        self.assertEqual(
+            [b'x' * 40], self.bag_state_handler.blocking_get(bag_state_key, self.coder))
+        # the least recently used map state is evicted from the read cache to fit the bag values
+        self.assertEqual(41, self.budget.get_statistics().resident_bytes)
+        self.assertEqual(1, self.budget.get_statistics().eviction_count)
+        self.assertIsNone(self.state_cache.get(map_state_key.SerializeToString(), None))
+
+        self.bag_state_handler.extend(bag_state_key, self.coder, [b'y' * 40])
+        self.assertEqual(82, self.budget.get_statistics().resident_bytes)
+        self.assertEqual([b'x' * 40, b'y' * 40],
+                         self.bag_state_handler.blocking_get(bag_state_key, self.coder))
+        self.assertEqual(1, self.state_handler.get_requests)
+
+    def test_evict_least_recently_used(self):
+        map_state_key = self.create_state_key("map")
+        bag_state_key = self.create_state_key("bag")
+        other_bag_state_key = self.create_state_key("other_bag")
+        self.write_remote_bag(bag_state_key, [b'x' * 40])
+        self.write_remote_bag(other_bag_state_key, [b'z' * 40])
+        self.put_map_entry(map_state_key, b'k', b'v' * 20)
+        self.bag_state_handler.blocking_get(bag_state_key, self.coder)
+        # the map state is used after the bag values
+        self.assertEqual(
+            (True, b'v' * 20),
+            self.map_state_handler.blocking_get(map_state_key, b'k', None, None))
+
+        self.bag_state_handler.blocking_get(other_bag_state_key, self.coder)
+        self.assertIsNone(self.state_cache.get(bag_state_key.SerializeToString(), None))
+        self.assertIsNotNone(self.state_cache.get(map_state_key.SerializeToString(), None))
+        self.assertEqual(32 + 41, self.budget.get_statistics().resident_bytes)
+
+    def test_release_evicted_values(self):
+        bag_state_key = self.create_state_key("bag")
+        self.write_remote_bag(bag_state_key, [b'x' * 40])
+        self.bag_state_handler.blocking_get(bag_state_key, self.coder)
+        self.assertEqual(41, self.budget.get_statistics().resident_bytes)
+
+        self.map_state_handler.clear_read_cache(bag_state_key)
+        self.assertEqual(0, self.budget.get_statistics().resident_bytes)
+        self.assertIsNone(self.state_cache.get(bag_state_key.SerializeToString(), None))
+
+
+class TtlBagStateHandlerTests(PyFlinkTestCase):
+
+    def setUp(self):
+        super(TtlBagStateHandlerTests, self).setUp()
+        self.state_handler = FakeCachingStateHandler()
+        self.state_key = beam_fn_api_pb2.StateKey(
+            bag_user_state=beam_fn_api_pb2.StateKey.BagUserState(
+                transform_id="", user_state_id="state", window=b'', key=b'key'))
+
+    def create_ttl_bag_state_handler(self, ttl, update_type):
+        ttl_config = StateTtlConfig.new_builder(ttl) \
+            .set_update_type(update_type) \
+            .set_state_visibility(StateTtlConfig.StateVisibility.NeverReturnExpired) \
+            .build()
+        return TtlBagStateHandler(
+            self.state_handler,
+            CachingMapStateHandler(self.state_handler, 10),
+            ttl_config,
+            LRUCache(10, None))
+
+    def test_cache_written_values(self):
+        handler = self.create_ttl_bag_state_handler(
+            Time.hours(1), StateTtlConfig.UpdateType.OnCreateAndWrite)
+        self.state_handler.remote_values[self.state_key.SerializeToString()] = [1]
+        # it's unknown when the remote values were written
+        self.assertEqual([1], handler.blocking_get(self.state_key, None))
+        self.assertEqual([1], handler.blocking_get(self.state_key, None))
+        self.assertEqual(2, self.state_handler.get_requests)
+
+        handler.clear(self.state_key)
+        handler.extend(self.state_key, None, [2])
+        self.assertEqual([2], handler.blocking_get(self.state_key, None))
+        self.assertEqual(2, self.state_handler.get_requests)
+
+    def test_expired_values_not_served_from_cache(self):
+        handler = self.create_ttl_bag_state_handler(
+            Time.milliseconds(10), StateTtlConfig.UpdateType.OnCreateAndWrite)
+        handler.clear(self.state_key)
+        handler.extend(self.state_key, None, [1])
+        self.assertEqual([1], handler.blocking_get(self.state_key, None))
+        self.assertEqual(0, self.state_handler.get_requests)
+
+        time.sleep(0.05)
+        self.state_handler.remote_values.clear()
+        self.assertEqual([], handler.blocking_get(self.state_key, None))
+        self.assertEqual(1, self.state_handler.get_requests)
+
+    def test_refresh_on_read(self):
+        handler = self.create_ttl_bag_state_handler(
+            Time.hours(1), StateTtlConfig.UpdateType.OnReadAndWrite)
+        self.state_handler.remote_values[self.state_key.SerializeToString()] = [1]
+        self.assertEqual([1], handler.blocking_get(self.state_key, None))
+        self.assertEqual([1], handler.blocking_get(self.state_key, None))
+        self.assertEqual(1, self.state_handler.get_requests)
+        # the cached read refreshes the TTL without waiting for the response
+        self.assertEqual(1, self.state_handler.async_requests)
+
+
+class TtlCachingMapStateHandlerTests(PyFlinkTestCase):
+
+    def setUp(self):
+        super(TtlCachingMapStateHandlerTests, self).setUp()
+        self.state_handler = FakeCachingStateHandler()
+        self.state_key = beam_fn_api_pb2.StateKey(
+            bag_user_state=beam_fn_api_pb2.StateKey.BagUserState(
+                transform_id="", user_state_id="state", window=b'', key=b'key'))
+        self.coder = coders.BytesCoder().get_impl()
+
+    def create_ttl_map_state_handler(self, ttl, update_type):
+        ttl_config = StateTtlConfig.new_builder(ttl) \
+            .set_update_type(update_type) \
+            .set_state_visibility(StateTtlConfig.StateVisibility.NeverReturnExpired) \
+            .build()
+        return TtlCachingMapStateHandler(
+            CachingMapStateHandler(self.state_handler, 10), ttl_config)
+
+    def encode(self, value, output_stream):
+        self.coder.encode_to_stream(value, output_stream, True)
+
+    def decode(self, input_stream):
+        return self.coder.decode_from_stream(input_stream, True)
+
+    def put(self, handler, items):
+        handler.extend(self.state_key, items, self.encode, self.encode)
+
+    def get(self, handler, map_key):
+        return handler.blocking_get(self.state_key, map_key, self.encode, self.decode)
+
+    def set_remote_response(self, flag, value=None):
+        # the fake state handler answers every request of the state with the same response
+        output_stream = coder_impl.create_OutputStream()
+        output_stream.write_byte(flag)
+        if value is not None:
+            self.encode(value, output_stream)
+        self.state_handler.raw_values[self.state_key.SerializeToString()] = output_stream.get()
+
+    def get_expiration_time(self, map_key):
+        cached_map_state = self.state_handler._state_cache.get(
+            self.state_key.SerializeToString(), None)
+        return cached_map_state.get_expiration_time(map_key)
+
+    def test_live_entries_served_from_cache(self):
+        handler = self.create_ttl_map_state_handler(
+            Time.hours(1), StateTtlConfig.UpdateType.OnCreateAndWrite)
+        self.put(handler, [(CachingMapStateHandler.SET_VALUE, b'k', b'v')])
+        self.assertEqual((True, b'v'), self.get(handler, b'k'))
+        self.assertEqual(0, self.state_handler.get_requests)
+
+        # it's unknown when the remote entry was written
+        self.set_remote_response(CachingMapStateHandler.EXIST_FLAG, b'remote')
+        self.assertEqual((True, b'remote'), self.get(handler, b'remote_key'))
+        self.assertEqual((True, b'remote'), self.get(handler, b'remote_key'))
+        self.assertEqual(2, self.state_handler.get_requests)
+
+        # the entry doesn't exist until it's written
+        self.set_remote_response(CachingMapStateHandler.NOT_EXIST_FLAG)
+        self.assertEqual((False, None), self.get(handler, b'absent_key'))
+        self.assertEqual((False, None), self.get(handler, b'absent_key'))
+        self.assertEqual(3, self.state_handler.get_requests)
+
+    def test_expired_entries_not_served_from_cache(self):
+        handler = self.create_ttl_map_state_handler(
+            Time.milliseconds(10), StateTtlConfig.UpdateType.OnCreateAndWrite)
+        self.put(handler, [(CachingMapStateHandler.SET_VALUE, b'k', b'v')])
+        self.assertEqual((True, b'v'), self.get(handler, b'k'))
+        self.assertEqual(0, self.state_handler.get_requests)
+
+        time.sleep(0.05)
+        self.set_remote_response(CachingMapStateHandler.NOT_EXIST_FLAG)
+        self.assertEqual((False, None), self.get(handler, b'k'))
+        self.assertEqual(1, self.state_handler.get_requests)
+
+    def test_refresh_on_read(self):
+        handler = self.create_ttl_map_state_handler(
+            Time.hours(1), StateTtlConfig.UpdateType.OnReadAndWrite)
+        self.set_remote_response(CachingMapStateHandler.EXIST_FLAG, b'v')
+        self.assertEqual((True, b'v'), self.get(handler, b'k'))
+        expiration_time = self.get_expiration_time(b'k')
+        self.assertIsNotNone(expiration_time)
+        self.assertEqual(0, self.state_handler.async_requests)
+
+        time.sleep(0.01)
+        self.assertEqual((True, b'v'), self.get(handler, b'k'))
+        self.assertEqual(1, self.state_handler.get_requests)
+        # the cached read refreshes the TTL without waiting for the response
+        self.assertEqual(1, self.state_handler.async_requests)
+        self.assertGreater(self.get_expiration_time(b'k'), expiration_time)
+
+    def test_no_refresh_on_read(self):
+        handler = self.create_ttl_map_state_handler(
+            Time.hours(1), StateTtlConfig.UpdateType.OnCreateAndWrite)
+        self.put(handler, [(CachingMapStateHandler.SET_VALUE, b'k', b'v')])
+        expiration_time = self.get_expiration_time(b'k')
+
+        time.sleep(0.01)
+        self.assertEqual((True, b'v'), self.get(handler, b'k'))
+        self.assertEqual(0, self.state_handler.async_requests)
+        self.assertEqual(expiration_time, self.get_expiration_time(b'k'))
+
+    def test_check_empty(self):
+        handler = self.create_ttl_map_state_handler(
+            Time.milliseconds(10), StateTtlConfig.UpdateType.OnCreateAndWrite)
+        self.put(handler, [(CachingMapStateHandler.SET_VALUE, b'k', b'v')])
+        self.assertFalse(handler.check_empty(self.state_key))
+        self.assertEqual(0, self.state_handler.get_requests)
+
+        # the cached entry may have expired in the remote state backend
+        time.sleep(0.05)
+        self.set_remote_response(CachingMapStateHandler.IS_EMPTY_FLAG)
+        self.assertTrue(handler.check_empty(self.state_key))
+        self.assertEqual(1, self.state_handler.get_requests)
+
+    def test_extend(self):
+        handler = self.create_ttl_map_state_handler(
+            Time.milliseconds(10), StateTtlConfig.UpdateType.OnCreateAndWrite)
+        self.put(handler, [(CachingMapStateHandler.SET_VALUE, b'k', b'v'),
+                           (CachingMapStateHandler.DELETE, b'deleted_key', None)])
+        self.assertIsNotNone(self.get_expiration_time(b'k'))
+        self.assertIsNone(self.get_expiration_time(b'deleted_key'))
+        self.assertEqual((False, None), self.get(handler, b'deleted_key'))
+
+        # writing an expired entry again makes it live
+        time.sleep(0.05)
+        self.put(handler, [(CachingMapStateHandler.SET_VALUE, b'k', b'v2')])
+        self.assertEqual((True, b'v2'), self.get(handler, b'k'))
+        self.assertEqual(0, self.state_handler.get_requests)
+
+
+class RemoteKeyedStateBackendTests(PyFlinkTestCase):
+
+    def test_bag_state_expiration_times_bounded_by_state_cache_size(self):
+        state_backend = RemoteKeyedStateBackend(
+            FakeCachingStateHandler(), PickleCoder(), None, 3, 10, 10)
+        expiration_times = state_backend._bag_state_expiration_times
+        for i in range(5):
+            expiration_times.put(i, time.time())
+        self.assertEqual(3, len(expiration_times))
+
+    def test_prefetch_bounded_by_state_cache_size(self):
+        state_handler = FakeCachingStateHandler()
+        state_backend = RemoteKeyedStateBackend(state_handler, PickleCoder(), None, 6, 10, 10)
+        state = state_backend.get_value_state("state", PickleCoder())
+        keys = [[i] for i in range(5)]
+        # at most half of the state cache is filled up by the prefetched values
+        self.assertEqual(3, state_backend.get_prefetch_batch_size())
+        state_backend.prefetch_state(state, keys)
+        self.assertEqual(3, state_handler.async_requests)
+
+        # the values which are already cached are not fetched again
+        state_backend.prefetch_state(state, keys[:3])
+        self.assertEqual(3, state_handler.async_requests)
+        state_backend.prefetch_state(state, keys[2:])
+        self.assertEqual(5, state_handler.async_requests)
+
+    def test_no_prefetch_when_state_cache_disabled(self):
+        state_handler = FakeCachingStateHandler()
+        state_backend = RemoteKeyedStateBackend(state_handler, PickleCoder(), None, 0, 10, 10)
+        state = state_backend.get_value_state("state", PickleCoder())
+        self.assertEqual(0, state_backend.get_prefetch_batch_size())
+        state_backend.prefetch_state(state, [[i] for i in range(5)])
+        state_backend.prefetch_states([[i] for i in range(5)])
+        self.assertEqual(0, state_handler.async_requests)
+
+    def test_state_id_cached_per_name_and_ttl_config(self):
+        state_backend = RemoteKeyedStateBackend(
+            FakeCachingStateHandler(), PickleCoder(), PickleCoder(), 10, 10, 10)
+        encoded_key = PickleCoder().get_impl().encode("key")
+
+        def get_state_id(name, namespace, ttl_config):
+            return state_backend.get_bag_state_key(
+                name, encoded_key, state_backend._encode_namespace(namespace),
+                ttl_config).bag_user_state.user_state_id
+
+        state_id = get_state_id("state", 1, None)
+        self.assertIs(state_id, get_state_id("state", 1, None))
+        # the namespace isn't part of the state id
+        self.assertIs(state_id, get_state_id("state", 2, None))
+        self.assertNotEqual(state_id, get_state_id("other_state", 1, None))
+
+        # the same state name used with different TTL configs identifies different states
+        ttl_config = StateTtlConfig.new_builder(Time.hours(1)).build()
+        other_ttl_config = StateTtlConfig.new_builder(Time.minutes(1)).build()
+        ttl_state_id = get_state_id("state", 1, ttl_config)
+        other_ttl_state_id = get_state_id("state", 1, other_ttl_config)
+        self.assertNotEqual(state_id, ttl_state_id)
+        self.assertNotEqual(state_id, other_ttl_state_id)
+        self.assertNotEqual(ttl_state_id, other_ttl_state_id)
+        self.assertIs(ttl_state_id, get_state_id("state", 2, ttl_config))
+        self.assertIs(other_ttl_state_id, get_state_id("state", 2, other_ttl_config))
+
+
+class RemoteKeyedStateBackendCommitTests(PyFlinkTestCase):
+
+    def setUp(self):
+        super(RemoteKeyedStateBackendCommitTests, self).setUp()
+        self.state_handler = FakeCachingStateHandler()
+        self.backend = RemoteKeyedStateBackend(
+            self.state_handler, PickleCoder(), PickleCoder(), 10, 10, 10)
+
+    def get_remote_values(self, name, key, namespace=None):
+        state_key = self.backend.get_bag_state_key(
+            name,
+            PickleCoder().get_impl().encode(key),
+            self.backend._encode_namespace(namespace),
+            None)
+        return self.state_handler.remote_values.get(state_key.SerializeToString())
+
+    def test_commit_after_key_switch(self):
+        value_state = self.backend.get_value_state("value", PickleCoder())
+        self.backend.set_current_key("a")
+        value_state.update(1)
+        self.backend.set_current_key("b")
+        value_state.update(2)
+        # the writes are kept in the internal state cache until they are committed
+        self.assertEqual(0, self.state_handler.write_requests)
+
+        self.backend.commit()
+        self.assertEqual([1], self.get_remote_values("value", "a"))
+        self.assertEqual([2], self.get_remote_values("value", "b"))
+
+    def test_commit_after_namespace_switch(self):
+        list_state = self.backend.get_list_state("list", PickleCoder())
+        self.backend.set_current_key("a")
+        list_state.set_current_namespace(1)
+        list_state.add(1)
+        list_state.set_current_namespace(2)
+        list_state.add(2)
+        list_state.set_current_namespace(1)
+        list_state.add(3)
+
+        self.backend.commit()
+        self.assertEqual([1, 3], self.get_remote_values("list", "a", 1))
+        self.assertEqual([2], self.get_remote_values("list", "a", 2))
+
+    def test_commit_untouched_states(self):
+        touched_state = self.backend.get_value_state("touched", PickleCoder())
+        self.backend.get_value_state("untouched", PickleCoder())
+        self.backend.get_list_state("untouched_list", PickleCoder())
+        self.backend.set_current_key("a")
+        touched_state.update(1)
+        self.backend.set_current_key("b")
+
+        self.backend.commit()
+        self.assertEqual([1], self.get_remote_values("touched", "a"))
+        self.assertIsNone(self.get_remote_values("untouched", "a"))
+        self.assertIsNone(self.get_remote_values("untouched_list", "a"))
+        # the clear and the append request of the touched state only
+        self.assertEqual(2, self.state_handler.write_requests)
+
+        # nothing is written again when nothing has changed since the last commit
+        self.backend.commit()
+        self.assertEqual(2, self.state_handler.write_requests)
+
+    def test_state_accessed_under_two_keys(self):
+        value_state = self.backend.get_value_state("value", PickleCoder())
+        self.backend.set_current_key("a")
+        value_state.update(1)
+        self.backend.set_current_key("b")
+        value_state.update(2)
+        self.backend.set_current_key("a")
+        # the pending write of the key is served from the internal state cache
+        self.assertEqual(1, value_state.value())
+        value_state.update(3)
+        self.backend.set_current_key("b")
+        self.assertEqual(2, value_state.value())
+
+        self.backend.commit()
+        self.assertEqual([3], self.get_remote_values("value", "a"))
+        self.assertEqual([2], self.get_remote_values("value", "b"))
+
+
+class BatchKeyedStateBackendTests(PyFlinkTestCase):
+
+    def setUp(self):
+        self.backend = BatchKeyedStateBackend(PickleCoder(), None)
+
+    def test_state_discarded_on_key_change(self):
+        value_state = self.backend.get_value_state("value", PickleCoder())
+        map_state = self.backend.get_map_state("map", PickleCoder(), PickleCoder())
+        list_state = self.backend.get_list_state("list", PickleCoder())
+
+        self.backend.set_current_key("a")
+        value_state.update(1)
+        map_state.put("k", None)
+        list_state.add_all([1, 2])
+        list_state.add(3)
+
+        # setting the same key again keeps the state
+        self.backend.set_current_key("a")
+        self.assertEqual(1, value_state.value())
+        self.assertTrue(map_state.contains("k"))
+        self.assertIsNone(map_state.get("k"))
+        self.assertEqual([1, 2, 3], list_state.get())
+        self.assertEqual(self.backend.get_encoded_current_key(),
+                         PickleCoder().get_impl().encode("a"))
+
+        self.backend.set_current_key("b")
+        self.assertIsNone(value_state.value())
+        self.assertTrue(map_state.is_empty())
+        self.assertEqual([], list_state.get())
+
+    def test_same_state_returned_for_name(self):
+        value_state = self.backend.get_value_state("state", PickleCoder())
+        self.assertIs(value_state, self.backend.get_value_state("state", PickleCoder()))
+        with self.assertRaises(Exception):
+            self.backend.get_list_state("state", PickleCoder())
+
+    def test_merge_namespaces(self):
+        class SumReduceFunction(ReduceFunction):
+
+            def reduce(self, value1, value2):
+                return value1 + value2
+
+        class AverageAggregateFunction(AggregateFunction):
+
+            def create_accumulator(self):
+                return 0, 0
+
+            def add(self, value, accumulator):
+                return accumulator[0] + value, accumulator[1] + 1
+
+            def get_result(self, accumulator):
+                return accumulator[0] / accumulator[1]
+
+            def merge(self, acc_a, acc_b):
+                return acc_a[0] + acc_b[0], acc_a[1] + acc_b[1]
+
+        reducing_state = self.backend.get_reducing_state(
+            "reducing", PickleCoder(), SumReduceFunction())
+        aggregating_state = self.backend.get_aggregating_state(
+            "aggregating", PickleCoder(), AverageAggregateFunction())
+        self.backend.set_current_key("a")
+        for namespace, value in [(1, 1), (2, 2), (2, 3), (3, 6)]:
+            reducing_state.set_current_namespace(namespace)
+            reducing_state.add(value)
+            aggregating_state.set_current_namespace(namespace)
+            aggregating_state.add(value)
+
+        reducing_state.merge_namespaces(3, [1, 2])
+        aggregating_state.merge_namespaces(3, [1, 2])
+        reducing_state.set_current_namespace(3)
+        self.assertEqual(12, reducing_state.get())
+        aggregating_state.set_current_namespace(3)
+        self.assertEqual(3, aggregating_state.get())
+        self.assertEqual((12, 4), aggregating_state.get_internal())
+        aggregating_state.set_current_namespace(1)
+        self.assertIsNone(aggregating_state.get())
+
+
+class FakeStateCache(object):
+
+    def __init__(self):
+        self._values = {}
+
+    def is_cache_enabled(self):
+        return True
+
+    def get(self, state_key, cache_token):
+        return self._values.get(state_key)
+
+    def put(self, state_key, cache_token, value):
+        self._values[state_key] = value
+
+    def evict(self, state_key, cache_token):
+        self._values.pop(state_key, None)
+
+    def clear(self, state_key, cache_token):
+        self._values[state_key] = []
+
+
+class FakeCachingStateHandler(object):
+    """
+    A caching state handler which keeps the remote values in memory.
+    """
+
+    class Context(object):
+        user_state_cache_token = b'token'
+        bundle_cache_token = None
+
+    def __init__(self):
+        self._state_cache = FakeStateCache()
+        self._underlying = self
+        self._context = FakeCachingStateHandler.Context()
+        self.remote_values = {}
+        # the encoded remote values, which are read and written by the raw requests
+        self.raw_values = {}
+        self.get_requests = 0
+        self.async_requests = 0
+        self.write_requests = 0
+
+    def blocking_get(self, state_key, coder):
+        cache_state_key = state_key.SerializeToString()
+        values = self._state_cache.get(cache_state_key, None)
+        if values is None:
+            self.get_requests += 1
+            values = list(self.remote_values.get(cache_state_key, []))
+            self._state_cache.put(cache_state_key, None, values)
+        return values
+
+    def extend(self, state_key, coder, elements):
+        cache_state_key = state_key.SerializeToString()
+        self.write_requests += 1
+        self.blocking_get(state_key, coder).extend(elements)
+        self.remote_values.setdefault(cache_state_key, []).extend(elements)
+
+    def clear(self, state_key):
+        cache_state_key = state_key.SerializeToString()
+        self.write_requests += 1
+        self._state_cache.clear(cache_state_key, None)
+        self.remote_values[cache_state_key] = []
+
+    def get_raw(self, state_key, continuation_token=None):
+        self.get_requests += 1
+        return self.raw_values.get(state_key.SerializeToString(), b''), None
+
+    def append_raw(self, state_key, data):
+        cache_state_key = state_key.SerializeToString()
+        self.raw_values[cache_state_key] = self.raw_values.get(cache_state_key, b'') + data
+
+    def _request(self, request):
+        self.async_requests += 1
+        # the remote values are always empty
+        return FakeResponseFuture(
+            beam_fn_api_pb2.StateResponse(get=beam_fn_api_pb2.StateGetResponse(data=b'')))
+
+
+class FakeResponseFuture(object):
+
+    def __init__(self, response):
+        self._response = response
+
+    def wait(self, timeout=None):
+        return True
+
+    def get(self):
+        return self._response
+
+
+if __name__ == '__main__':
+    logging.getLogger().setLevel(logging.INFO)
+    unittest.main()
@@ -0,0 +1,203 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import unittest
+
+from pyflink.fn_execution.datastream.operations import StatefulOperation
+from pyflink.fn_execution.datastream.timerservice_impl import InternalTimerServiceImpl, \
+    TimerOperandType
+from pyflink.testing.test_case_utils import PyFlinkTestCase
+
+
+class KeyedStateBackend(object):
+
+    def __init__(self):
+        self.current_key = None
+        self.committed = False
+
+    def commit(self):
+        self.committed = True
+
+    def get_current_key(self):
+        return self.current_key
+
+    def get_encoded_current_key(self):
+        return str(self.current_key).encode('utf-8')
+
+
+class NamespaceSerializer(object):
+
+    def serialize(self, namespace, bytes_io):
+        bytes_io.write(str(namespace).encode('utf-8'))
+
+
+class OutputStream(object):
+
+    def __init__(self):
+        self.flush_count = 0
+
+    def maybe_flush(self):
+        self.flush_count += 1
+
+
+class TimerCoderImpl(object):
+    """
+    Records the timer operations instead of encoding them.
+    """
+
+    class ValueCoder(object):
+
+        def __init__(self, output_stream):
+            self._output_stream = output_stream
+
+    class KeyCoderImpl(object):
+
+        def __init__(self, output_stream):
+            self._value_coder = TimerCoderImpl.ValueCoder(output_stream)
+
+    def __init__(self, output_stream):
+        self._key_coder_impl = TimerCoderImpl.KeyCoderImpl(output_stream)
+        self.timer_operations = []
+
+    def encode_to_stream(self, timer, output_stream, nested):
+        timer_data = timer.user_key
+        self.timer_operations.append(
+            (TimerOperandType(timer_data[0]), timer_data[2], timer_data[3],
+             timer_data[4].decode('utf-8')))
+
+
+class TimerInfo(object):
+
+    def __init__(self, timer_coder_impl):
+        self.timer_coder_impl = timer_coder_impl
+        self.output_stream = None
+
+
+class InternalTimerServiceImplTests(PyFlinkTestCase):
+
+    def setUp(self):
+        self.keyed_state_backend = KeyedStateBackend()
+        self.output_stream = OutputStream()
+        self.timer_coder_impl = TimerCoderImpl(self.output_stream)
+        self.timer_service = InternalTimerServiceImpl(self.keyed_state_backend)
+        self.timer_service.add_timer_info(TimerInfo(self.timer_coder_impl))
+        self.timer_service.set_namespace_serializer(NamespaceSerializer())
+
+    def flush(self):
+        self.timer_service.flush()
+        timer_operations = self.timer_coder_impl.timer_operations
+        self.timer_coder_impl.timer_operations = []
+        return timer_operations
+
+    def test_register_then_delete(self):
+        self.keyed_state_backend.current_key = 'a'
+        self.timer_service.register_event_time_timer('w', 10)
+        self.timer_service.delete_event_time_timer('w', 10)
+        self.timer_service.register_processing_time_timer('w', 10)
+        self.timer_service.delete_processing_time_timer('w', 10)
+        # the deletions are still sent, as the timers may have been registered in earlier bundles
+        self.assertEqual(
+            [(TimerOperandType.DELETE_EVENT_TIMER, 10, 'a', 'w'),
+             (TimerOperandType.DELETE_PROC_TIMER, 10, 'a', 'w')],
+            self.flush())
+
+    def test_delete_then_register(self):
+        self.keyed_state_backend.current_key = 'a'
+        self.timer_service.delete_event_time_timer('w', 10)
+        self.timer_service.register_event_time_timer('w', 10)
+        self.timer_service.delete_processing_time_timer('w', 20)
+        self.timer_service.register_processing_time_timer('w', 20)
+        self.assertEqual(
+            [(TimerOperandType.REGISTER_EVENT_TIMER, 10, 'a', 'w'),
+             (TimerOperandType.REGISTER_PROC_TIMER, 20, 'a', 'w')],
+            self.flush())
+
+    def test_duplicate_registrations(self):
+        for key in ['a', 'b', 'a', 'b', 'a']:
+            self.keyed_state_backend.current_key = key
+            self.timer_service.register_event_time_timer('w1', 10)
+            self.timer_service.register_event_time_timer('w2', 10)
+            self.timer_service.register_event_time_timer('w1', 20)
+        self.assertEqual(
+            [(TimerOperandType.REGISTER_EVENT_TIMER, 10, 'a', 'w1'),
+             (TimerOperandType.REGISTER_EVENT_TIMER, 10, 'a', 'w2'),
+             (TimerOperandType.REGISTER_EVENT_TIMER, 20, 'a', 'w1'),
+             (TimerOperandType.REGISTER_EVENT_TIMER, 10, 'b', 'w1'),
+             (TimerOperandType.REGISTER_EVENT_TIMER, 10, 'b', 'w2'),
+             (TimerOperandType.REGISTER_EVENT_TIMER, 20, 'b', 'w1')],
+            self.flush())
+
+    def test_flush(self):
+        self.keyed_state_backend.current_key = 'a'
+        self.timer_service.register_event_time_timer('w', 10)
+        # nothing is sent before the end of the bundle
+        self.assertEqual([], self.timer_coder_impl.timer_operations)
+        self.assertEqual(0, self.output_stream.flush_count)
+
+        self.assertEqual([(TimerOperandType.REGISTER_EVENT_TIMER, 10, 'a', 'w')], self.flush())
+        self.assertEqual(1, self.output_stream.flush_count)
+
+        # the timers sent in a previous bundle are sent again when they are set again
+        self.timer_service.register_event_time_timer('w', 10)
+        self.assertEqual([(TimerOperandType.REGISTER_EVENT_TIMER, 10, 'a', 'w')], self.flush())
+
+        # nothing is sent when there is no pending timer operation
+        self.assertEqual([], self.flush())
+        self.assertEqual(2, self.output_stream.flush_count)
+
+    def test_flush_too_many_pending_timer_operations(self):
+        self.timer_service.MAX_PENDING_TIMER_OPERATIONS = 3
+        self.keyed_state_backend.current_key = 'a'
+        for ts in range(3):
+            self.timer_service.register_event_time_timer('w', ts)
+            self.timer_service.register_event_time_timer('w', ts)
+        self.assertEqual([], self.timer_coder_impl.timer_operations)
+
+        self.timer_service.register_event_time_timer('w', 3)
+        self.assertEqual(1, self.output_stream.flush_count)
+        # the pending timer operations have been sent, so the flush at the end of the bundle
+        # doesn't send anything
+        self.assertEqual(
+            [(TimerOperandType.REGISTER_EVENT_TIMER, ts, 'a', 'w') for ts in range(4)],
+            self.flush())
+        self.assertEqual(1, self.output_stream.flush_count)
+
+    def test_flush_on_finish(self):
+        operation = StatefulOperation.__new__(StatefulOperation)
+        operation.base_metric_group = None
+        operation.operator_state_backend = None
+        operation.keyed_state_backend = self.keyed_state_backend
+        operation.internal_timer_service = self.timer_service
+
+        self.keyed_state_backend.current_key = 'a'
+        self.timer_service.register_processing_time_timer('w', 10)
+        operation.finish()
+        self.assertEqual(
+            [(TimerOperandType.REGISTER_PROC_TIMER, 10, 'a', 'w')],
+            self.timer_coder_impl.timer_operations)
+        self.assertEqual(1, self.output_stream.flush_count)
+        self.assertTrue(self.keyed_state_backend.committed)
+
+
+if __name__ == '__main__':
+    try:
+        import xmlrunner
+
+        testRunner = xmlrunner.XMLTestRunner(output='target/test-reports')
+    except ImportError:
+        testRunner = None
+    unittest.main(testRunner=testRunner, verbosity=2)
@@ -0,0 +1,362 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import unittest
+
+from pyflink.common import Time
+from pyflink.common.typeinfo import Types
+from pyflink.datastream.functions import AggregateFunction
+from pyflink.datastream.state import AggregatingStateDescriptor, ReducingStateDescriptor
+from pyflink.datastream.window import (SlidingEventTimeWindows, SlidingProcessingTimeWindows,
+                                       EventTimeTrigger, TimeWindow, EventTimeSessionWindows)
+from pyflink.fn_execution.datastream.window.merging_window_set import MergingWindowSet
+from pyflink.fn_execution.datastream.window.window_operator import WindowOperator, \
+    WindowAssignerContext
+from pyflink.fn_execution.internal_state import InternalAggregatingState
+from pyflink.testing.test_case_utils import PyFlinkTestCase
+
+
+class PaneState(object):
+    """
+    The window state which keeps the values of the panes in a dict.
+    """
+
+    def __init__(self):
+        self.panes = {}
+        self.namespace = None
+
+    def set_current_namespace(self, namespace):
+        self.namespace = namespace
+
+    def get(self):
+        return self.panes.get(self.namespace)
+
+    def clear(self):
+        self.panes.pop(self.namespace, None)
+
+
+class AggregatingPaneState(PaneState, InternalAggregatingState):
+
+    def add(self, value):
+        raise NotImplementedError()
+
+    def merge_namespaces(self, target, sources):
+        raise NotImplementedError()
+
+    def get_internal(self):
+        return self.panes.get(self.namespace)
+
+
+class ListAggregateFunction(AggregateFunction):
+
+    def create_accumulator(self):
+        return []
+
+    def add(self, value, accumulator):
+        accumulator.append(value)
+        return accumulator
+
+    def get_result(self, accumulator):
+        return sorted(accumulator)
+
+    def merge(self, acc_a, acc_b):
+        acc_a.extend(acc_b)
+        return acc_a
+
+
+class PrependingListAggregateFunction(ListAggregateFunction):
+
+    def merge(self, acc_a, acc_b):
+        # modifies and returns the accumulator passed in as the second argument
+        acc_b[:0] = acc_a
+        return acc_b
+
+
+class MapState(object):
+    """
+    The merging window set state which records the writes.
+    """
+
+    def __init__(self, mapping=None):
+        self.mapping = dict(mapping or {})
+        self.writes = []
+
+    def items(self):
+        return list(self.mapping.items())
+
+    def put(self, key, value):
+        self.writes.append(('put', key, value))
+        self.mapping[key] = value
+
+    def remove(self, key):
+        self.writes.append(('remove', key))
+        del self.mapping[key]
+
+
+class KeyedStateBackend(object):
+
+    def __init__(self, key, state_cache_token):
+        self.key = key
+        self.state_cache_token = state_cache_token
+
+    def get_current_key(self):
+        return self.key
+
+    def get_state_cache_token(self):
+        return self.state_cache_token
+
+
+class ClearableContext(object):
+
+    def __init__(self):
+        self.window = None
+
+    def clear(self):
+        pass
+
+
+class MergeFunction(MergingWindowSet.MergeFunction):
+
+    def __init__(self):
+        self.merges = []
+
+    def merge(self, merge_result, merged_windows, state_window_result, merged_state_windows):
+        self.merges.append((merge_result, state_window_result, list(merged_state_windows)))
+
+
+class TimerService(object):
+
+    def __init__(self):
+        self.processing_time = 0
+
+    def current_processing_time(self):
+        # the processing time advances whenever it's read
+        self.processing_time += 1
+        return self.processing_time
+
+
+def create_operator(window_assigner, window_state_descriptor, window_state):
+    operator = WindowOperator(window_assigner, None, None, window_state_descriptor, None,
+                              EventTimeTrigger(), 0, None)
+    operator.window_state = window_state
+    return operator
+
+
+class WindowOperatorPaneTests(PyFlinkTestCase):
+
+    def test_merge_reduced_panes(self):
+        def reduce(value1, value2):
+            # modifies the value passed in as the first argument in-place
+            value1.extend(value2)
+            return value1
+
+        window_state = PaneState()
+        operator = create_operator(
+            SlidingEventTimeWindows(6, 2, 0),
+            ReducingStateDescriptor("window", reduce, Types.PICKLED_BYTE_ARRAY()),
+            window_state)
+        window_state.panes = {
+            TimeWindow(0, 2): [1],
+            TimeWindow(2, 4): [2],
+            TimeWindow(4, 6): [3],
+            TimeWindow(6, 8): [4]}
+
+        self.assertEqual([1, 2, 3], operator.merge_panes(TimeWindow(0, 6)))
+        self.assertEqual([2, 3, 4], operator.merge_panes(TimeWindow(2, 8)))
+        self.assertEqual([3, 4], operator.merge_panes(TimeWindow(4, 10)))
+        # the contents of the panes are not changed by merging them
+        self.assertEqual({
+            TimeWindow(0, 2): [1],
+            TimeWindow(2, 4): [2],
+            TimeWindow(4, 6): [3],
+            TimeWindow(6, 8): [4]}, window_state.panes)
+
+        self.assertIsNone(operator.merge_panes(TimeWindow(10, 16)))
+
+    def test_merge_aggregated_panes(self):
+        window_state = AggregatingPaneState()
+        operator = create_operator(
+            SlidingEventTimeWindows(6, 2, 0),
+            AggregatingStateDescriptor(
+                "window", ListAggregateFunction(), Types.PICKLED_BYTE_ARRAY()),
+            window_state)
+        window_state.panes = {
+            TimeWindow(0, 2): [2, 1],
+            TimeWindow(4, 6): [3]}
+
+        self.assertEqual([1, 2, 3], operator.merge_panes(TimeWindow(0, 6)))
+        self.assertEqual([3], operator.merge_panes(TimeWindow(2, 8)))
+        self.assertEqual({
+            TimeWindow(0, 2): [2, 1],
+            TimeWindow(4, 6): [3]}, window_state.panes)
+
+        self.assertIsNone(operator.merge_panes(TimeWindow(6, 12)))
+
+    def test_merge_aggregated_panes_into_second_accumulator(self):
+        window_state = AggregatingPaneState()
+        operator = create_operator(
+            SlidingEventTimeWindows(6, 2, 0),
+            AggregatingStateDescriptor(
+                "window", PrependingListAggregateFunction(), Types.PICKLED_BYTE_ARRAY()),
+            window_state)
+        window_state.panes = {
+            TimeWindow(0, 2): [1],
+            TimeWindow(2, 4): [2],
+            TimeWindow(4, 6): [3],
+            TimeWindow(6, 8): [4]}
+
+        self.assertEqual([1, 2, 3], operator.merge_panes(TimeWindow(0, 6)))
+        self.assertEqual([2, 3, 4], operator.merge_panes(TimeWindow(2, 8)))
+        self.assertEqual([3, 4], operator.merge_panes(TimeWindow(4, 10)))
+        # the accumulators of the panes are not changed by merging them
+        self.assertEqual({
+            TimeWindow(0, 2): [1],
+            TimeWindow(2, 4): [2],
+            TimeWindow(4, 6): [3],
+            TimeWindow(6, 8): [4]}, window_state.panes)
+
+    def test_split_into_panes(self):
+        window_assigner = SlidingEventTimeWindows(6, 4, 0)
+        self.assertEqual(
+            [TimeWindow(4, 6), TimeWindow(6, 8), TimeWindow(8, 10)],
+            window_assigner.split_into_panes(TimeWindow(4, 10)))
+        self.assertEqual(TimeWindow(4, 10), window_assigner.get_last_window(TimeWindow(4, 6)))
+        self.assertEqual(TimeWindow(8, 14), window_assigner.get_last_window(TimeWindow(8, 10)))
+
+    def test_assign_processing_time_pane(self):
+        window_assigner = SlidingProcessingTimeWindows(3, 2, 0)
+        timer_service = TimerService()
+        context = WindowAssignerContext(timer_service, None)
+        for _ in range(10):
+            context.freeze_processing_time()
+            windows = window_assigner.assign_windows(None, 0, context)
+            pane = window_assigner.assign_pane(None, 0, context)
+            context.unfreeze_processing_time()
+            # the pane is part of every window of the element
+            for window in windows:
+                self.assertIn(pane, window_assigner.split_into_panes(window))
+        self.assertNotEqual(
+            context.get_current_processing_time(), context.get_current_processing_time())
+
+
+class MergingWindowSetTests(PyFlinkTestCase):
+
+    def setUp(self):
+        self.window_assigner = EventTimeSessionWindows.with_gap(Time.milliseconds(5))
+
+    def test_persist_removed_window(self):
+        state = MapState(
+            {TimeWindow(0, 5): TimeWindow(0, 5), TimeWindow(10, 15): TimeWindow(10, 15)})
+        merging_windows = MergingWindowSet(self.window_assigner, state)
+        merging_windows.retire_window(TimeWindow(0, 5))
+        merging_windows.persist()
+        self.assertEqual([('remove', TimeWindow(0, 5))], state.writes)
+        self.assertEqual({TimeWindow(10, 15): TimeWindow(10, 15)}, state.mapping)
+
+    def test_persist_merged_windows(self):
+        state = MapState({TimeWindow(0, 5): TimeWindow(0, 5)})
+        merging_windows = MergingWindowSet(self.window_assigner, state)
+        merge_function = MergeFunction()
+        self.assertEqual(
+            TimeWindow(0, 8), merging_windows.add_window(TimeWindow(3, 8), merge_function))
+        self.assertEqual([(TimeWindow(0, 8), TimeWindow(0, 5), [])], merge_function.merges)
+
+        merging_windows.persist()
+        # the merged window is removed and the merge result keeps the state window
+        self.assertEqual({TimeWindow(0, 8): TimeWindow(0, 5)}, state.mapping)
+        self.assertEqual(
+            sorted([('put', TimeWindow(0, 8), TimeWindow(0, 5)), ('remove', TimeWindow(0, 5))]),
+            sorted(state.writes))
+
+    def test_persist_unchanged_mapping(self):
+        state = MapState(
+            {TimeWindow(0, 5): TimeWindow(0, 5), TimeWindow(10, 15): TimeWindow(10, 15)})
+        merging_windows = MergingWindowSet(self.window_assigner, state)
+        merging_windows.persist()
+        self.assertEqual([], state.writes)
+
+        # the window is mapped to the same state window again
+        self.assertEqual(
+            TimeWindow(0, 5), merging_windows.add_window(TimeWindow(0, 5), MergeFunction()))
+        merging_windows.persist()
+        self.assertEqual([], state.writes)
+
+        merging_windows.add_window(TimeWindow(20, 25), MergeFunction())
+        merging_windows.persist()
+        merging_windows.persist()
+        self.assertEqual([('put', TimeWindow(20, 25), TimeWindow(20, 25))], state.writes)
+
+
+class WindowOperatorMergingWindowSetTests(PyFlinkTestCase):
+
+    def setUp(self):
+        self.keyed_state_backend = KeyedStateBackend('a', b'token')
+        self.operator = WindowOperator(
+            EventTimeSessionWindows.with_gap(Time.milliseconds(5)), self.keyed_state_backend,
+            None, None, None, EventTimeTrigger(), 0, None)
+        self.operator.merging_sets_state = MapState({TimeWindow(0, 5): TimeWindow(0, 5)})
+
+    def test_merging_window_set_kept_for_current_key(self):
+        merging_windows = self.operator.get_merging_window_set()
+        self.assertIs(merging_windows, self.operator.get_merging_window_set())
+
+        self.keyed_state_backend.key = 'b'
+        self.assertIsNot(merging_windows, self.operator.get_merging_window_set())
+
+    def test_merging_window_set_reloaded_after_restore(self):
+        merging_windows = self.operator.get_merging_window_set()
+        self.assertEqual(TimeWindow(0, 5), merging_windows.get_state_window(TimeWindow(0, 5)))
+
+        # the restored state is cached under a new token
+        self.operator.merging_sets_state.mapping = {TimeWindow(10, 15): TimeWindow(10, 15)}
+        self.keyed_state_backend.state_cache_token = b'restored'
+        merging_windows = self.operator.get_merging_window_set()
+        self.assertIsNone(merging_windows.get_state_window(TimeWindow(0, 5)))
+        self.assertEqual(TimeWindow(10, 15), merging_windows.get_state_window(TimeWindow(10, 15)))
+
+    def test_merging_window_set_reloaded_without_state_cache(self):
+        self.keyed_state_backend.state_cache_token = None
+        merging_windows = self.operator.get_merging_window_set()
+        self.operator.merging_sets_state.mapping = {TimeWindow(10, 15): TimeWindow(10, 15)}
+        self.assertIsNot(merging_windows, self.operator.get_merging_window_set())
+        self.assertEqual(
+            TimeWindow(10, 15),
+            self.operator.get_merging_window_set().get_state_window(TimeWindow(10, 15)))
+
+    def test_merging_window_set_dropped_after_state_cleared(self):
+        self.operator.window_state = PaneState()
+        self.operator.trigger_context = ClearableContext()
+        self.operator.process_context = ClearableContext()
+        merging_windows = self.operator.get_merging_window_set()
+        self.operator.clear_all_state(TimeWindow(0, 5), self.operator.window_state, merging_windows)
+        self.assertEqual({}, self.operator.merging_sets_state.mapping)
+        self.assertIsNone(self.operator.merging_window_set)
+
+        self.operator.merging_sets_state.mapping = {TimeWindow(10, 15): TimeWindow(10, 15)}
+        self.assertEqual(
+            TimeWindow(10, 15),
+            self.operator.get_merging_window_set().get_state_window(TimeWindow(10, 15)))
+
+
+if __name__ == '__main__':
+    try:
+        import xmlrunner
+
+        testRunner = xmlrunner.XMLTestRunner(output='target/test-reports')
+    except ImportError:
+        testRunner = None
+    unittest.main(testRunner=testRunner, verbosity=2)
@@ -15,7 +15,9 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
+import bisect
 import datetime
+import os
 import threading
 import time
 from collections.abc import Generator
@@ -31,6 +33,10 @@ from pyflink.table import functions
 from pyflink.table.udf import DelegationTableFunction, DelegatingScalarFunction, \
     ImperativeAggregateFunction, PandasAggregateFunctionWrapper
 
+PYTHON_OUTPUT_FLUSH_SIZE = "PYTHON_OUTPUT_FLUSH_SIZE"
+PYTHON_OUTPUT_FLUSH_INTERVAL = "PYTHON_OUTPUT_FLUSH_INTERVAL"
+PYTHON_OUTPUT_FLUSH_ON_IDLE = "PYTHON_OUTPUT_FLUSH_ON_IDLE"
+
 _func_num = 0
 _constant_num = 0
 
@@ -349,3 +355,72 @@ class PeriodicThread(threading.Thread):
     def cancel(self) -> None:
         """Stop the thread if it hasn't finished yet."""
         self._finished.set()
+
+
+class OutputFlushPolicy(object):
+    """
+    Decides when the results buffered in the Python worker are sent to the Java operator: once
+    the buffered bytes exceed the flush size, once the flush interval elapses, and, if flush on
+    idle is enabled, as soon as all the received input elements have been processed.
+    """
+
+    def __init__(self,
+                 flush_size: int = 10_000_000,
+                 flush_interval_millis: int = 1000,
+                 flush_on_idle: bool = False):
+        self.flush_size = flush_size
+        self.flush_interval_millis = flush_interval_millis
+        self.flush_on_idle = flush_on_idle
+
+    @staticmethod
+    def from_environment() -> 'OutputFlushPolicy':
+        return OutputFlushPolicy(
+            int(os.environ.get(PYTHON_OUTPUT_FLUSH_SIZE, 10_000_000)),
+            int(os.environ.get(PYTHON_OUTPUT_FLUSH_INTERVAL, 1000)),
+            os.environ.get(PYTHON_OUTPUT_FLUSH_ON_IDLE, 'false') == 'true')
+
+
+class LatencyHistogram(object):
+    """
+    Counts the recorded latencies in exponentially growing buckets of milliseconds. The
+    percentiles are estimated by the upper bound of the bucket they fall into.
+    """
+
+    BUCKET_BOUNDS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+
+    def __init__(self):
+        self._bucket_counts = [0] * (len(self.BUCKET_BOUNDS) + 1)
+        self._count = 0
+        self._max = 0
+
+    def record(self, latency_millis: int):
+        self._bucket_counts[bisect.bisect_left(self.BUCKET_BOUNDS, latency_millis)] += 1
+        self._count += 1
+        if latency_millis > self._max:
+            self._max = latency_millis
+
+    def get_count(self) -> int:
+        return self._count
+
+    def get_max(self) -> int:
+        return self._max
+
+    def get_percentile(self, percentile: float) -> int:
+        if self._count == 0:
+            return 0
+        threshold = self._count * percentile
+        accumulated = 0
+        for i, bucket_count in enumerate(self._bucket_counts):
+            accumulated += bucket_count
+            if accumulated >= threshold:
+                if i < len(self.BUCKET_BOUNDS):
+                    return min(self.BUCKET_BOUNDS[i], self._max)
+                break
+        return self._max
+
+    def register_metrics(self, metric_group):
+        metric_group.gauge("count", self.get_count)
+        metric_group.gauge("max", self.get_max)
+        metric_group.gauge("p50", lambda: self.get_percentile(0.5))
+        metric_group.gauge("p95", lambda: self.get_percentile(0.95))
+        metric_group.gauge("p99", lambda: self.get_percentile(0.99))
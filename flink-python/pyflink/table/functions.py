@@ -17,6 +17,7 @@
 ################################################################################
 import time
 from abc import abstractmethod
+from bisect import bisect_left, bisect_right, insort
 from decimal import Decimal
 
 from pyflink.common.constants import MAX_LONG_VALUE, MIN_LONG_VALUE
@@ -460,7 +461,21 @@ class MaxAggFunction(AggregateFunction):
                     accumulator[0] = acc[0]
 
 
-class MaxWithRetractAggFunction(AggregateFunction):
+class ExtremeWithRetractAggFunction(AggregateFunction):
+    """
+    Base class of the max and min aggregate functions which support retraction.
+
+    Besides the count of each value, the values whose count is positive are kept in sorted buckets
+    which are stored in a MapView under the first value of each bucket. The sorted first values
+    of the buckets are part of the accumulator. When the current max or min value is retracted,
+    the next one is looked up in the first or the last bucket instead of scanning all the values.
+
+    The accumulators restored from the layout without the buckets, i.e.
+    [extreme, map_size, value_to_count_map], are upgraded when they are accessed the first time.
+    """
+
+    # the buckets are split when they grow larger than twice of the load
+    BUCKET_LOAD = 128
 
     def get_value(self, accumulator):
         if accumulator[1] > 0:
@@ -469,15 +484,13 @@ class MaxWithRetractAggFunction(AggregateFunction):
             return None
 
     def create_accumulator(self):
-        # [max, map_size, value_to_count_map]
-        return [None, 0, MapView()]
+        # [extreme, map_size, value_to_count_map, bucket_keys, bucket_key_to_values_map]
+        return [None, 0, MapView(), [], MapView()]
 
     def accumulate(self, accumulator, *args):
         if args[0] is not None:
+            self._upgrade_accumulator(accumulator)
             value = args[0]
-            if accumulator[1] == 0 or accumulator[0] < value:
-                accumulator[0] = value
-
             if value in accumulator[2]:
                 count = accumulator[2][value]
             else:
@@ -489,10 +502,14 @@ class MaxWithRetractAggFunction(AggregateFunction):
             else:
                 accumulator[2][value] = count
             if count == 1:
+                self._add_value(accumulator, value)
+                if accumulator[1] == 0 or self._precedes(value, accumulator[0]):
+                    accumulator[0] = value
                 accumulator[1] += 1
 
     def retract(self, accumulator, *args):
         if args[0] is not None:
+            self._upgrade_accumulator(accumulator)
             value = args[0]
             if value in accumulator[2]:
                 count = accumulator[2][value]
@@ -502,6 +519,10 @@ class MaxWithRetractAggFunction(AggregateFunction):
             count -= 1
             if count == 0:
                 del accumulator[2][value]
+            else:
+                accumulator[2][value] = count
+            if count == 0:
+                self._remove_value(accumulator, value)
                 accumulator[1] -= 1
 
                 if accumulator[1] == 0:
@@ -509,31 +530,12 @@ class MaxWithRetractAggFunction(AggregateFunction):
                     return
 
                 if value == accumulator[0]:
-                    self.update_max(accumulator)
-
-    @staticmethod
-    def update_max(acc):
-        has_max = False
-        for value in acc[2]:
-            if not has_max or acc[0] < value:
-                acc[0] = value
-                has_max = True
-
-        # The behavior of deleting expired data in the state backend is uncertain.
-        # so `mapSize` data may exist, while `map` data may have been deleted
-        # when both of them are expired.
-        if not has_max:
-            acc[0] = None
-            # we should also override max value, because it may have an old value.
-            acc[1] = 0
+                    self._update_extreme(accumulator)
 
     def merge(self, acc, accumulators):
-        need_update_max = False
+        self._upgrade_accumulator(acc)
+        need_update_extreme = False
         for a in accumulators:
-            # set max element
-            if acc[1] == 0 or (a[1] > 0 and a[0] is not None and acc[0] < a[0]):
-                acc[0] = a[0]
-
             # merge the count for each key
             for value, count in a[2].items():
                 if value in acc[2]:
@@ -544,26 +546,142 @@ class MaxWithRetractAggFunction(AggregateFunction):
                 if merged_count == 0:
                     # remove it when count is increased from -1 to 0
                     del acc[2][value]
-                    # origin is > 0, and retract to 0
-                    if this_count > 0:
-                        acc[1] -= 1
-                        if value == acc[0]:
-                            need_update_max = True
-                elif merged_count < 0:
-                    acc[2][value] = merged_count
-                    if this_count > 0:
-                        # origin is > 0, and retract to < 0
-                        acc[1] -= 1
-                        if value == acc[0]:
-                            need_update_max = True
-                else:  # merged_count > 0
+                else:
                     acc[2][value] = merged_count
-                    if this_count <= 0:
-                        # origin is <= 0, and accumulate to > 0
-                        acc[1] += 1
 
-        if need_update_max:
-            self.update_max(acc)
+                if this_count > 0 and merged_count <= 0:
+                    # origin is > 0, and retract to <= 0
+                    self._remove_value(acc, value)
+                    acc[1] -= 1
+                    if value == acc[0]:
+                        need_update_extreme = True
+                elif this_count <= 0 and merged_count > 0:
+                    # origin is <= 0, and accumulate to > 0
+                    self._add_value(acc, value)
+                    if acc[1] == 0 or self._precedes(value, acc[0]):
+                        acc[0] = value
+                    acc[1] += 1
+
+        if acc[1] <= 0:
+            acc[0] = None
+        elif need_update_extreme:
+            self._update_extreme(acc)
+
+    @abstractmethod
+    def _precedes(self, value, other):
+        """
+        Returns whether the value should replace the other one as the result.
+        """
+        pass
+
+    @abstractmethod
+    def _get_extreme(self, acc):
+        """
+        Returns the result among the values kept in the buckets, or None if there is no value.
+        """
+        pass
+
+    def _update_extreme(self, acc):
+        extreme = self._get_extreme(acc)
+        # The behavior of deleting expired data in the state backend is uncertain.
+        # so `mapSize` data may exist, while the buckets may have been deleted
+        # when both of them are expired.
+        if extreme is None:
+            acc[0] = None
+            # we should also override the map size, because it may have an old value.
+            acc[1] = 0
+        else:
+            acc[0] = extreme
+
+    def _upgrade_accumulator(self, acc):
+        # the bucket keys are None when the accumulator was restored from the layout without the
+        # buckets, the buckets are then built once from all the values with a positive count
+        if acc[3] is not None:
+            return
+        values = sorted(value for value, count in acc[2].items() if count > 0)
+        keys = []
+        for i in range(0, len(values), self.BUCKET_LOAD):
+            bucket = values[i:i + self.BUCKET_LOAD]
+            acc[4][bucket[0]] = bucket
+            keys.append(bucket[0])
+        acc[3] = keys
+
+    @staticmethod
+    def _get_bucket(acc, key):
+        if key in acc[4]:
+            return acc[4][key]
+        else:
+            return []
+
+    def _add_value(self, acc, value):
+        keys = acc[3]
+        buckets = acc[4]
+        pos = max(bisect_right(keys, value) - 1, 0)
+        if pos < len(keys):
+            key = keys[pos]
+            bucket = self._get_bucket(acc, key)
+            insort(bucket, value)
+        else:
+            key = value
+            bucket = [value]
+            keys.append(value)
+
+        if bucket[0] != key:
+            # the value is inserted before all the values kept in the buckets
+            if key in buckets:
+                del buckets[key]
+            keys[pos] = bucket[0]
+        if len(bucket) > 2 * self.BUCKET_LOAD:
+            half = len(bucket) // 2
+            buckets[bucket[0]] = bucket[:half]
+            buckets[bucket[half]] = bucket[half:]
+            keys.insert(pos + 1, bucket[half])
+        else:
+            buckets[bucket[0]] = bucket
+
+    def _remove_value(self, acc, value):
+        keys = acc[3]
+        buckets = acc[4]
+        pos = bisect_right(keys, value) - 1
+        if pos < 0:
+            return
+        key = keys[pos]
+        bucket = self._get_bucket(acc, key)
+        index = bisect_left(bucket, value)
+        if index < len(bucket) and bucket[index] == value:
+            del bucket[index]
+
+        # merge the small bucket with the next one to bound the number of the buckets
+        if len(bucket) < self.BUCKET_LOAD // 2 and pos + 1 < len(keys):
+            next_key = keys[pos + 1]
+            next_bucket = self._get_bucket(acc, next_key)
+            if len(bucket) + len(next_bucket) <= 2 * self.BUCKET_LOAD:
+                if next_key in buckets:
+                    del buckets[next_key]
+                del keys[pos + 1]
+                bucket.extend(next_bucket)
+
+        if key in buckets and (not bucket or bucket[0] != key):
+            del buckets[key]
+        if bucket:
+            keys[pos] = bucket[0]
+            buckets[bucket[0]] = bucket
+        else:
+            del keys[pos]
+
+
+class MaxWithRetractAggFunction(ExtremeWithRetractAggFunction):
+
+    def _precedes(self, value, other):
+        return value > other
+
+    def _get_extreme(self, acc):
+        while acc[3]:
+            bucket = self._get_bucket(acc, acc[3][-1])
+            if bucket:
+                return bucket[-1]
+            del acc[3][-1]
+        return None
 
 
 class MinAggFunction(AggregateFunction):
@@ -590,110 +708,18 @@ class MinAggFunction(AggregateFunction):
                     accumulator[0] = acc[0]
 
 
-class MinWithRetractAggFunction(AggregateFunction):
-
-    def get_value(self, accumulator):
-        if accumulator[1] > 0:
-            return accumulator[0]
-        else:
-            return None
-
-    def create_accumulator(self):
-        # [min, map_size, value_to_count_map]
-        return [None, 0, MapView()]
-
-    def accumulate(self, accumulator, *args):
-        if args[0] is not None:
-            value = args[0]
-            if accumulator[1] == 0 or accumulator[0] > value:
-                accumulator[0] = value
-
-            if value in accumulator[2]:
-                count = accumulator[2][value]
-            else:
-                count = 0
-
-            count += 1
-            if count == 0:
-                del accumulator[2][value]
-            else:
-                accumulator[2][value] = count
-            if count == 1:
-                accumulator[1] += 1
-
-    def retract(self, accumulator, *args):
-        if args[0] is not None:
-            value = args[0]
-            if value in accumulator[2]:
-                count = accumulator[2][value]
-            else:
-                count = 0
-
-            count -= 1
-            if count == 0:
-                del accumulator[2][value]
-                accumulator[1] -= 1
-
-                if accumulator[1] == 0:
-                    accumulator[0] = None
-                    return
-
-                if value == accumulator[0]:
-                    self.update_min(accumulator)
-
-    @staticmethod
-    def update_min(acc):
-        has_max = False
-        for value in acc[2]:
-            if not has_max or acc[0] > value:
-                acc[0] = value
-                has_max = True
-
-        # The behavior of deleting expired data in the state backend is uncertain.
-        # so `mapSize` data may exist, while `map` data may have been deleted
-        # when both of them are expired.
-        if not has_max:
-            acc[0] = None
-            # we should also override min value, because it may have an old value.
-            acc[1] = 0
+class MinWithRetractAggFunction(ExtremeWithRetractAggFunction):
 
-    def merge(self, acc, accumulators):
-        need_update_min = False
-        for a in accumulators:
-            # set min element
-            if acc[1] == 0 or (a[1] > 0 and a[0] is not None and acc[0] > a[0]):
-                acc[0] = a[0]
-
-            # merge the count for each key
-            for value, count in a[2].items():
-                if value in acc[2]:
-                    this_count = acc[2][value]
-                else:
-                    this_count = 0
-                merged_count = count + this_count
-                if merged_count == 0:
-                    # remove it when count is increased from -1 to 0
-                    del acc[2][value]
-                    # origin is > 0, and retract to 0
-                    if this_count > 0:
-                        acc[1] -= 1
-                        if value == acc[0]:
-                            need_update_min = True
-                elif merged_count < 0:
-                    acc[2][value] = merged_count
-                    if this_count > 0:
-                        # origin is > 0, and retract to < 0
-                        acc[1] -= 1
-                        if value == acc[0]:
-                            need_update_min = True
-                else:  # merged_count > 0
-                    acc[2][value] = merged_count
-                    if this_count <= 0:
-                        # origin is <= 0, and accumulate to > 0
-                        acc[1] += 1
+    def _precedes(self, value, other):
+        return value < other
 
-        if need_update_min:
-            self.update_min(acc)
+    def _get_extreme(self, acc):
+        while acc[3]:
+            bucket = self._get_bucket(acc, acc[3][0])
+            if bucket:
+                return bucket[0]
+            del acc[3][0]
+        return None
 
 
 class Sum0AggFunction(AggregateFunction):
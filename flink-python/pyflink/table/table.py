@@ -929,33 +929,92 @@ class Table(object):
 
         .. versionadded:: 1.11.0
         """
+        import pyarrow as pa
+        batches = list(self.to_arrow_batches())
+        if batches:
+            pdf = pa.Table.from_batches(batches).to_pandas()
+            return self._tz_convert_from_internal(pdf)
+        else:
+            import pandas as pd
+            return pd.DataFrame.from_records([], columns=self.get_schema().get_field_names())
+
+    def to_pandas_batches(self, types_mapper=None, self_destruct: bool = False):
+        """
+        Converts the table to an iterator of pandas DataFrames, one per Arrow record batch. Unlike
+        :func:`to_pandas`, the batches are converted as they arrive, so only one batch needs to be
+        held in memory at a time. The size of the batches is controlled by the configuration
+        `python.fn-execution.arrow.batch.size`.
+
+        Example:
+        ::
+
+            >>> for pdf in table.to_pandas_batches():
+            ...     pdf.to_csv(path, mode='a', header=False)
+
+        :param types_mapper: A function mapping a pyarrow DataType to a pandas ExtensionDtype,
+                             which is passed to pyarrow.Table.to_pandas as is.
+        :param self_destruct: Whether to release the memory of each Arrow batch while converting
+                              it to pandas, which avoids holding both copies at the same time.
+        :return: A generator of pandas DataFrames.
+
+        .. versionadded:: 1.16.0
+        """
+        import pyarrow as pa
+        to_pandas_kwargs = {}
+        if types_mapper is not None:
+            to_pandas_kwargs['types_mapper'] = types_mapper
+        if self_destruct:
+            to_pandas_kwargs['self_destruct'] = True
+            to_pandas_kwargs['split_blocks'] = True
+        for batch in self.to_arrow_batches():
+            arrow_table = pa.Table.from_batches([batch])
+            del batch
+            pdf = arrow_table.to_pandas(**to_pandas_kwargs)
+            del arrow_table
+            yield self._tz_convert_from_internal(pdf)
+
+    def to_arrow_batches(self):
+        """
+        Converts the table to an iterator of pyarrow.RecordBatch. The results are fetched from the
+        JVM lazily and the job is cancelled when the returned generator is closed before all the
+        results have been consumed. The size of the batches is controlled by the configuration
+        `python.fn-execution.arrow.batch.size`.
+
+        Note that the values of the TIMESTAMP_LTZ columns are in UTC, without time zone.
+
+        :return: A generator of pyarrow.RecordBatch.
+
+        .. versionadded:: 1.16.0
+        """
         self._t_env._before_execute()
         gateway = get_gateway()
         max_arrow_batch_size = self._j_table.getTableEnvironment().getConfig()\
             .get(gateway.jvm.org.apache.flink.python.PythonOptions.MAX_ARROW_BATCH_SIZE)
         batches_iterator = gateway.jvm.org.apache.flink.table.runtime.arrow.ArrowUtils\
             .collectAsPandasDataFrame(self._j_table, max_arrow_batch_size)
-        if batches_iterator.hasNext():
-            import pytz
-            timezone = pytz.timezone(
-                self._j_table.getTableEnvironment().getConfig().getLocalTimeZone().getId())
-            serializer = ArrowSerializer(
-                create_arrow_schema(self.get_schema().get_field_names(),
-                                    self.get_schema().get_field_data_types()),
-                self.get_schema().to_row_data_type(),
-                timezone)
-            import pyarrow as pa
-            table = pa.Table.from_batches(serializer.load_from_iterator(batches_iterator))
-            pdf = table.to_pandas()
-
-            schema = self.get_schema()
-            for field_name in schema.get_field_names():
-                pdf[field_name] = tz_convert_from_internal(
-                    pdf[field_name], schema.get_field_data_type(field_name), timezone)
-            return pdf
-        else:
-            import pandas as pd
-            return pd.DataFrame.from_records([], columns=self.get_schema().get_field_names())
+        try:
+            if batches_iterator.hasNext():
+                serializer = ArrowSerializer(
+                    create_arrow_schema(self.get_schema().get_field_names(),
+                                        self.get_schema().get_field_data_types()),
+                    self.get_schema().to_row_data_type(),
+                    self._get_local_timezone())
+                yield from serializer.load_from_iterator(batches_iterator)
+        finally:
+            batches_iterator.close()
+
+    def _get_local_timezone(self):
+        import pytz
+        return pytz.timezone(
+            self._j_table.getTableEnvironment().getConfig().getLocalTimeZone().getId())
+
+    def _tz_convert_from_internal(self, pdf):
+        timezone = self._get_local_timezone()
+        schema = self.get_schema()
+        for field_name in schema.get_field_names():
+            pdf[field_name] = tz_convert_from_internal(
+                pdf[field_name], schema.get_field_data_type(field_name), timezone)
+        return pdf
 
     def get_schema(self) -> TableSchema:
         """
@@ -16,6 +16,7 @@
 # limitations under the License.
 ################################################################################
 import atexit
+import itertools
 import os
 import sys
 import tempfile
@@ -36,17 +37,16 @@ from pyflink.serializers import BatchedSerializer, PickleSerializer
 from pyflink.table import Table, EnvironmentSettings, Expression, ExplainDetail, \
     Module, ModuleEntry, TableSink, Schema, ChangelogMode
 from pyflink.table.catalog import Catalog
-from pyflink.table.serializers import ArrowSerializer
 from pyflink.table.statement_set import StatementSet
 from pyflink.table.table_config import TableConfig
 from pyflink.table.table_descriptor import TableDescriptor
 from pyflink.table.table_result import TableResult
 from pyflink.table.types import _create_type_verifier, RowType, DataType, \
     _infer_schema_from_data, _create_converter, from_arrow_type, RowField, create_arrow_schema, \
-    _to_java_data_type
+    _to_java_data_type, LocalZonedTimestampType
 from pyflink.table.udf import UserDefinedFunctionWrapper, AggregateFunction, udaf, \
     udtaf, TableAggregateFunction
-from pyflink.table.utils import to_expression_jarray
+from pyflink.table.utils import to_expression_jarray, pandas_to_arrow, tz_convert_to_internal
 from pyflink.util import java_utils
 from pyflink.util.java_utils import get_j_env_configuration, is_local_deployment, load_java_class, \
     to_j_explain_detail_arr, to_jarray, get_field
@@ -1486,38 +1486,127 @@ class TableEnvironment(object):
 
         import pyarrow as pa
         arrow_schema = pa.Schema.from_pandas(pdf, preserve_index=False)
+        result_type = self._infer_row_type(arrow_schema, schema)
 
+        import pytz
+        timezone = pytz.timezone(self.get_config().get_local_timezone())
+        target_schema = create_arrow_schema(result_type.field_names(), result_type.field_types())
+        field_types = result_type.field_types()
+
+        def create_batches():
+            step = -(-len(pdf) // splits_num)
+            for start in range(0, len(pdf), step):
+                pdf_slice = pdf.iloc[start:start + step]
+                yield pandas_to_arrow(
+                    target_schema, timezone, field_types,
+                    [pdf_slice.iloc[:, i] for i in range(len(pdf_slice.columns))])
+
+        return self._from_arrow_batches(create_batches(), target_schema, result_type)
+
+    def from_arrow(self, data,
+                   schema: Union[RowType, List[str], Tuple[str], List[DataType],
+                                 Tuple[DataType]] = None,
+                   splits_num: int = 1) -> Table:
+        """
+        Creates a table from Arrow data without going through pandas.
+
+        Example:
+        ::
+
+            >>> arrow_table = pa.Table.from_pydict({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+            >>> table_env.from_arrow(arrow_table)
+            # use the second parameter to specify custom field names
+            >>> table_env.from_arrow(arrow_table.to_batches(), ["c", "d"])
+
+        :param data: A pyarrow.Table, a pyarrow.RecordBatch or an iterable of pyarrow.RecordBatch
+                     which share the same schema.
+        :param schema: The schema of the converted table. It could be specified the same way as
+                       in :func:`from_pandas`.
+        :param splits_num: The number of splits the given pyarrow.Table or pyarrow.RecordBatch
+                           will be split into. It determines the number of parallel source tasks.
+                           It's ignored for an iterable of pyarrow.RecordBatch, whose batches are
+                           kept as they are.
+        :return: The result table.
+
+        .. versionadded:: 1.16.0
+        """
+        import pyarrow as pa
+        if isinstance(data, pa.RecordBatch):
+            data = pa.Table.from_batches([data])
+        if isinstance(data, pa.Table):
+            step = max(-(-data.num_rows // splits_num), 1)
+            batches = iter(data.to_batches(max_chunksize=step))
+            arrow_schema = data.schema
+        else:
+            batches = iter(data)
+            first_batch = next(batches, None)
+            if first_batch is None:
+                raise ValueError("Could not create a table from an empty iterable of "
+                                 "pyarrow.RecordBatch.")
+            arrow_schema = first_batch.schema
+            batches = itertools.chain([first_batch], batches)
+        result_type = self._infer_row_type(arrow_schema, schema)
+
+        import pytz
+        timezone = pytz.timezone(self.get_config().get_local_timezone())
+        target_schema = create_arrow_schema(result_type.field_names(), result_type.field_types())
+        field_types = result_type.field_types()
+
+        def convert_column(column, field_type, target_type):
+            if isinstance(field_type, LocalZonedTimestampType) and \
+                    getattr(column.type, 'tz', None) is not None:
+                s = tz_convert_to_internal(column.to_pandas(), field_type, timezone)
+                return pa.Array.from_pandas(s, mask=s.isnull(), type=target_type)
+            elif column.type != target_type:
+                return column.cast(target_type)
+            else:
+                return column
+
+        def create_batches():
+            for batch in batches:
+                yield pa.RecordBatch.from_arrays(
+                    [convert_column(batch.column(i), field_types[i], target_schema.types[i])
+                     for i in range(batch.num_columns)],
+                    target_schema)
+
+        return self._from_arrow_batches(create_batches(), target_schema, result_type)
+
+    @staticmethod
+    def _infer_row_type(arrow_schema, schema) -> RowType:
         if schema is not None:
             if isinstance(schema, RowType):
-                result_type = schema
+                return schema
             elif isinstance(schema, (list, tuple)) and isinstance(schema[0], str):
-                result_type = RowType(
+                return RowType(
                     [RowField(field_name, from_arrow_type(field.type, field.nullable))
                      for field_name, field in zip(schema, arrow_schema)])
             elif isinstance(schema, (list, tuple)) and isinstance(schema[0], DataType):
-                result_type = RowType(
+                return RowType(
                     [RowField(field_name, field_type) for field_name, field_type in zip(
                         arrow_schema.names, schema)])
             else:
                 raise TypeError("Unsupported schema type, it could only be of RowType, a "
                                 "list of str or a list of DataType, got %s" % schema)
         else:
-            result_type = RowType([RowField(field.name, from_arrow_type(field.type, field.nullable))
-                                   for field in arrow_schema])
+            return RowType([RowField(field.name, from_arrow_type(field.type, field.nullable))
+                            for field in arrow_schema])
 
-        # serializes to a file, and we read the file in java
+    def _from_arrow_batches(self, batches, arrow_schema, result_type: RowType) -> Table:
+        """
+        Streams the given Arrow record batches to a file in the Arrow IPC format one by one, and
+        we read the file in java.
+        """
+        import pyarrow as pa
         temp_file = tempfile.NamedTemporaryFile(delete=False, dir=tempfile.mkdtemp())
-        import pytz
-        serializer = ArrowSerializer(
-            create_arrow_schema(result_type.field_names(), result_type.field_types()),
-            result_type,
-            pytz.timezone(self.get_config().get_local_timezone()))
-        step = -(-len(pdf) // splits_num)
-        pdf_slices = [pdf.iloc[start:start + step] for start in range(0, len(pdf), step)]
-        data = [[c for (_, c) in pdf_slice.iteritems()] for pdf_slice in pdf_slices]
+        temp_file.close()
         try:
-            with temp_file:
-                serializer.serialize(data, temp_file)
+            with pa.OSFile(temp_file.name, 'wb') as sink:
+                writer = pa.RecordBatchStreamWriter(sink, arrow_schema)
+                try:
+                    for batch in batches:
+                        writer.write_batch(batch)
+                finally:
+                    writer.close()
             jvm = get_gateway().jvm
 
             data_type = _to_java_data_type(result_type).notNull()
@@ -15,6 +15,7 @@
 #  See the License for the specific language governing permissions and
 # limitations under the License.
 ################################################################################
+import pickle
 from typing import Optional
 
 from py4j.java_gateway import get_method
@@ -24,9 +25,10 @@ from pyflink.common import Row
 from pyflink.common.job_client import JobClient
 from pyflink.java_gateway import get_gateway
 from pyflink.table.result_kind import ResultKind
+from pyflink.table.serializers import ArrowSerializer
 from pyflink.table.table_schema import TableSchema
-from pyflink.table.types import _from_java_data_type
-from pyflink.table.utils import pickled_bytes_to_python_converter
+from pyflink.table.types import _from_java_data_type, create_arrow_schema
+from pyflink.table.utils import create_pickled_bytes_to_python_converter
 
 __all__ = ['TableResult', 'CloseableIterator']
 
@@ -156,7 +158,7 @@ class TableResult(object):
         """
         return ResultKind._from_j_result_kind(self._j_table_result.getResultKind())
 
-    def collect(self) -> 'CloseableIterator':
+    def collect(self, batch_size: int = 1000) -> 'CloseableIterator':
         """
         Get the result contents as a closeable row iterator.
 
@@ -185,6 +187,9 @@ class TableResult(object):
         In order to fetch result to local, you can call either collect() and print(). But, they can
         not be called both on the same TableResult instance.
 
+        :param batch_size: The maximum number of rows transferred from the JVM at once. The rows
+                           are pulled in a background thread of the JVM and a batch holds the rows
+                           available when it's fetched, so it doesn't wait for a full batch.
         :return: A CloseableIterator.
 
         .. versionadded:: 1.12.0
@@ -193,7 +198,47 @@ class TableResult(object):
 
         j_iter = self._j_table_result.collect()
 
-        return CloseableIterator(j_iter, field_data_types)
+        return CloseableIterator(j_iter, field_data_types, batch_size)
+
+    def collect_batches(self, batch_size: int = 10000):
+        """
+        Get the result contents as an iterator of pyarrow.RecordBatch, each of which contains at
+        most `batch_size` rows. Only insert-only results are supported, as the row kinds could not
+        be represented in the record batches. Use :func:`collect` for the other results.
+
+        The job is cancelled when the returned generator is closed before all the results have
+        been consumed.
+
+        Example:
+        ::
+
+            >>> table_result = t_env.execute_sql("select ...")
+            >>> for batch in table_result.collect_batches():
+            ...     print(batch.num_rows)
+
+        Like collect(), it can not be called together with collect() or print() on the same
+        TableResult instance.
+
+        :param batch_size: The maximum number of rows of each record batch.
+        :return: A generator of pyarrow.RecordBatch.
+
+        .. versionadded:: 1.16.0
+        """
+        if batch_size <= 0:
+            raise ValueError("The batch size should be positive, got %s." % batch_size)
+        gateway = get_gateway()
+        batches_iterator = gateway.jvm.org.apache.flink.table.runtime.arrow.ArrowUtils \
+            .collectAsArrowBatches(self._j_table_result, batch_size)
+        try:
+            if batches_iterator.hasNext():
+                schema = self.get_table_schema()
+                serializer = ArrowSerializer(
+                    create_arrow_schema(schema.get_field_names(), schema.get_field_data_types()),
+                    schema.to_row_data_type(),
+                    None)
+                yield from serializer.load_from_iterator(batches_iterator)
+        finally:
+            batches_iterator.close()
 
     def print(self):
         """
@@ -222,41 +267,65 @@ class TableResult(object):
 class CloseableIterator(object):
     """
     Representing an Iterator that is also auto closeable.
+
+    The rows are fetched from the Java side in batches of at most `batch_size` rows to reduce the
+    number of round trips between the Python process and the JVM. A batch holds the rows which are
+    available when it's fetched, so the rows of an unbounded result are returned as they arrive.
     """
-    def __init__(self, j_closeable_iterator, field_data_types):
+    def __init__(self, j_closeable_iterator, field_data_types, batch_size: int = 1000):
+        if batch_size <= 0:
+            raise ValueError("The batch size should be positive, got %s." % batch_size)
         self._j_closeable_iterator = j_closeable_iterator
+        # pulls the rows from the Java iterator in a background thread of the JVM
+        self._j_batch_fetcher = get_gateway().jvm.org.apache.flink.python.util \
+            .IncrementalBatchFetcher(j_closeable_iterator, batch_size)
         self._j_field_data_types = field_data_types
         self._data_types = [_from_java_data_type(j_field_data_type)
                             for j_field_data_type in self._j_field_data_types]
+        self._field_converters = [create_pickled_bytes_to_python_converter(data_type)
+                                  for data_type in self._data_types]
+        self._batch_size = batch_size
+        self._batch = []
+        self._next_index = 0
+        self._exhausted = False
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        if not self._j_closeable_iterator.hasNext():
-            raise StopIteration("No more data.")
-        gateway = get_gateway()
-        pickle_bytes = gateway.jvm.PythonBridgeUtils. \
-            getPickledBytesFromRow(self._j_closeable_iterator.next(),
-                                   self._j_field_data_types)
+        if self._next_index >= len(self._batch):
+            if self._exhausted:
+                raise StopIteration("No more data.")
+            self._fetch_batch()
+            if not self._batch:
+                self._exhausted = True
+                raise StopIteration("No more data.")
+        pickle_bytes = self._batch[self._next_index]
+        self._next_index += 1
         row_kind = RowKind(int.from_bytes(pickle_bytes[0], byteorder='big', signed=False))
-        pickle_bytes = list(pickle_bytes[1:])
-        field_data = zip(pickle_bytes, self._data_types)
-        fields = []
-        for data, field_type in field_data:
-            if len(data) == 0:
-                fields.append(None)
-            else:
-                fields.append(pickled_bytes_to_python_converter(data, field_type))
+        fields = [None if len(data) == 0 else converter(data)
+                  for converter, data in zip(self._field_converters, pickle_bytes[1:])]
         result_row = Row(*fields)
         result_row.set_row_kind(row_kind)
         return result_row
 
+    def _fetch_batch(self):
+        gateway = get_gateway()
+        # it only waits until at least one row is available instead of a full batch
+        j_rows = self._j_batch_fetcher.nextBatch(self._batch_size)
+        self._batch = pickle.loads(gateway.jvm.PythonBridgeUtils.getPickledBytesFromRows(
+            j_rows.iterator(), self._j_field_data_types, self._batch_size))
+        self._next_index = 0
+
     def next(self):
         return self.__next__()
 
     def close(self):
-        self._j_closeable_iterator.close()
+        self._exhausted = True
+        self._batch = []
+        self._next_index = 0
+        # stops the background thread of the JVM and closes the Java iterator
+        self._j_batch_fetcher.close()
 
     def __enter__(self):
         return self
@@ -0,0 +1,215 @@
+################################################################################
+#  Licensed to the Apache Software Foundation (ASF) under one
+#  or more contributor license agreements.  See the NOTICE file
+#  distributed with this work for additional information
+#  regarding copyright ownership.  The ASF licenses this file
+#  to you under the Apache License, Version 2.0 (the
+#  "License"); you may not use this file except in compliance
+#  with the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+import random
+import unittest
+from collections import Counter
+
+from pyflink.table import MapView
+from pyflink.table.functions import MaxWithRetractAggFunction, MinWithRetractAggFunction
+from pyflink.testing.test_case_utils import PyFlinkTestCase
+
+
+class CountingMapView(MapView):
+    """
+    A MapView which counts the accessed entries, as each of them is a state access when the
+    MapView is backed by the state backend.
+    """
+
+    def __init__(self):
+        super(CountingMapView, self).__init__()
+        self.accessed_entries = 0
+
+    def get(self, key):
+        self.accessed_entries += 1
+        return super(CountingMapView, self).get(key)
+
+    def contains(self, key):
+        self.accessed_entries += 1
+        return super(CountingMapView, self).contains(key)
+
+    def items(self):
+        for item in list(super(CountingMapView, self).items()):
+            self.accessed_entries += 1
+            yield item
+
+    def keys(self):
+        for key in list(super(CountingMapView, self).keys()):
+            self.accessed_entries += 1
+            yield key
+
+
+class ScanningMaxWithRetractAggFunction(object):
+    """
+    Keeps only the count of each value and scans all of them when the max value is retracted,
+    which is how MaxWithRetractAggFunction worked before the values were kept sorted.
+    """
+
+    def create_accumulator(self):
+        return [None, 0, CountingMapView()]
+
+    def get_value(self, accumulator):
+        return accumulator[0] if accumulator[1] > 0 else None
+
+    def accumulate(self, accumulator, value):
+        count = accumulator[2][value] + 1 if value in accumulator[2] else 1
+        accumulator[2][value] = count
+        if count == 1:
+            if accumulator[1] == 0 or accumulator[0] < value:
+                accumulator[0] = value
+            accumulator[1] += 1
+
+    def retract(self, accumulator, value):
+        count = accumulator[2][value] - 1
+        if count == 0:
+            del accumulator[2][value]
+            accumulator[1] -= 1
+            if accumulator[1] > 0 and value == accumulator[0]:
+                accumulator[0] = max(accumulator[2].keys())
+        else:
+            accumulator[2][value] = count
+
+
+class ExtremeWithRetractAggFunctionTests(PyFlinkTestCase):
+
+    @staticmethod
+    def create_accumulator(agg_function):
+        accumulator = agg_function.create_accumulator()
+        accumulator[2] = CountingMapView()
+        accumulator[4] = CountingMapView()
+        return accumulator
+
+    def check_accumulator(self, agg_function, accumulator, counts, expected_func):
+        values = sorted(value for value, count in counts.items() if count > 0)
+        self.assertEqual(
+            expected_func(values) if values else None, agg_function.get_value(accumulator))
+        self.assertEqual(len(values), accumulator[1])
+        self.assertEqual(
+            values, [value for key in accumulator[3] for value in accumulator[4][key]])
+        self.assertEqual(sorted(accumulator[3]), sorted(accumulator[4].keys()))
+
+    def check_random_accumulate_and_retract(self, agg_function, expected_func):
+        agg_function.BUCKET_LOAD = 4
+        random.seed(1)
+        for _ in range(50):
+            accumulators = [self.create_accumulator(agg_function) for _ in range(3)]
+            counts = [Counter() for _ in range(3)]
+            for _ in range(200):
+                i = random.randrange(3)
+                value = random.randrange(50)
+                if random.random() < 0.55:
+                    agg_function.accumulate(accumulators[i], value)
+                    counts[i][value] += 1
+                else:
+                    agg_function.retract(accumulators[i], value)
+                    counts[i][value] -= 1
+                self.check_accumulator(
+                    agg_function, accumulators[i], counts[i], expected_func)
+
+            agg_function.merge(accumulators[0], accumulators[1:])
+            merged_counts = Counter()
+            for c in counts:
+                for value, count in c.items():
+                    merged_counts[value] += count
+            self.check_accumulator(agg_function, accumulators[0], merged_counts, expected_func)
+
+    def test_max_with_retract(self):
+        self.check_random_accumulate_and_retract(MaxWithRetractAggFunction(), max)
+
+    def test_min_with_retract(self):
+        self.check_random_accumulate_and_retract(MinWithRetractAggFunction(), min)
+
+    def test_retract_max_accesses_bounded_entries(self):
+        # retracts the max value one by one, which rescans all the remaining values each time
+        # when the values are not kept sorted
+        value_count = 2000
+        values = list(range(value_count))
+        random.seed(1)
+        random.shuffle(values)
+
+        results = {}
+        for name, agg_function in [("scanning", ScanningMaxWithRetractAggFunction()),
+                                   ("sorted", MaxWithRetractAggFunction())]:
+            if isinstance(agg_function, MaxWithRetractAggFunction):
+                accumulator = self.create_accumulator(agg_function)
+                map_views = [accumulator[2], accumulator[4]]
+            else:
+                accumulator = agg_function.create_accumulator()
+                map_views = [accumulator[2]]
+            for value in values:
+                agg_function.accumulate(accumulator, value)
+            for map_view in map_views:
+                map_view.accessed_entries = 0
+
+            for value in reversed(range(value_count)):
+                self.assertEqual(value, agg_function.get_value(accumulator))
+                agg_function.retract(accumulator, value)
+            self.assertIsNone(agg_function.get_value(accumulator))
+
+            accessed_entries = sum(map_view.accessed_entries for map_view in map_views)
+            results[name] = accessed_entries
+
+        self.assertLess(results["sorted"], 10 * value_count)
+        self.assertGreater(results["scanning"], value_count * value_count // 4)
+
+    def check_upgrade_accumulator(self, agg_function, expected_func):
+        agg_function.BUCKET_LOAD = 4
+        values = [3, 7, 1, 9, 4, 12, 5, 8, 2, 11, 6, 10]
+        counts = Counter(values + [7, 12])
+        # the accumulator restored from the layout without the buckets, whose missing fields
+        # are filled with None before the data views are set
+        accumulator = [expected_func(values), len(counts), CountingMapView(), None,
+                       CountingMapView()]
+        for value, count in counts.items():
+            accumulator[2][value] = count
+
+        agg_function.retract(accumulator, expected_func(values))
+        counts[expected_func(values)] -= 1
+        self.check_accumulator(agg_function, accumulator, counts, expected_func)
+        for value in sorted(counts):
+            for _ in range(counts[value]):
+                agg_function.retract(accumulator, value)
+            counts[value] = 0
+            self.check_accumulator(agg_function, accumulator, counts, expected_func)
+
+    def test_upgrade_max_with_retract_accumulator(self):
+        self.check_upgrade_accumulator(MaxWithRetractAggFunction(), max)
+
+    def test_upgrade_min_with_retract_accumulator(self):
+        self.check_upgrade_accumulator(MinWithRetractAggFunction(), min)
+
+    def test_expired_buckets(self):
+        # the buckets may have been expired in the state backend while the bucket keys are kept
+        for agg_function in [MaxWithRetractAggFunction(), MinWithRetractAggFunction()]:
+            accumulator = self.create_accumulator(agg_function)
+            for value in range(5):
+                agg_function.accumulate(accumulator, value)
+            accumulator[4].clear()
+            agg_function.retract(accumulator, agg_function.get_value(accumulator))
+            self.assertIsNone(agg_function.get_value(accumulator))
+            self.assertEqual(0, accumulator[1])
+            self.assertEqual([], accumulator[3])
+
+
+if __name__ == '__main__':
+    try:
+        import xmlrunner
+
+        testRunner = xmlrunner.XMLTestRunner(output='target/test-reports')
+    except ImportError:
+        testRunner = None
+    unittest.main(testRunner=testRunner, verbosity=2)
@@ -176,6 +176,42 @@ class PandasConversionITTests(PandasConversionTestBase):
         result_pdf = table.group_by(table.f2).select(table.f1.max.alias('f2')).to_pandas()
         assert_frame_equal(result_pdf, pd.DataFrame(data={'f2': np.int8([1, 1])}))
 
+    def test_to_pandas_batches(self):
+        self.t_env.get_config().set("python.fn-execution.arrow.batch.size", "1")
+        table = self.t_env.from_pandas(self.pdf, self.data_type)
+        for self_destruct in [False, True]:
+            result_pdfs = list(table.to_pandas_batches(self_destruct=self_destruct))
+            self.assertEqual([1, 1], [len(pdf) for pdf in result_pdfs])
+            expected_arrow = self.pdf.to_records(index=False)
+            for r in range(len(expected_arrow)):
+                result_arrow = result_pdfs[r].to_records(index=False)[0]
+                for e in range(len(expected_arrow[r])):
+                    self.assert_equal_field(expected_arrow[r][e], result_arrow[e])
+
+    def test_to_arrow_batches(self):
+        table = self.t_env.from_pandas(self.pdf, self.data_type)
+        batches = list(table.select(table.f1, table.f8).to_arrow_batches())
+        self.assertEqual(['f1', 'f8'], batches[0].schema.names)
+        self.assertEqual(['hello', 'world'],
+                         [v for batch in batches for v in batch.column(1).to_pylist()])
+        self.assertEqual([], list(table.filter(table.f1 < 0).to_arrow_batches()))
+
+    def test_from_arrow(self):
+        import pyarrow as pa
+        arrow_table = pa.Table.from_pydict({'a': [1, 2, 3], 'b': ['x', 'y', None]})
+
+        table = self.t_env.from_arrow(arrow_table, splits_num=2)
+        self.assertEqual(['a', 'b'], table.get_schema().get_field_names())
+        self.assertEqual([Row(1, 'x'), Row(2, 'y'), Row(3, None)],
+                         sorted(table.execute().collect(), key=lambda r: r[0]))
+
+        table = self.t_env.from_arrow(
+            arrow_table.to_batches(max_chunksize=1), [DataTypes.INT(), DataTypes.STRING()])
+        self.assertEqual([DataTypes.INT(), DataTypes.STRING()],
+                         table.get_schema().get_field_data_types())
+        self.assertEqual([Row(1, 'x'), Row(2, 'y'), Row(3, None)],
+                         sorted(table.execute().collect(), key=lambda r: r[0]))
+
     def assert_equal_field(self, expected_field, result_field):
         import numpy as np
         result_type = type(result_field)
@@ -269,6 +269,50 @@ class BatchPandasUDAFITTests(PyFlinkBatchTableTestCase):
                             "+I[2, 2.0, 3, 2.0, 2.0, 4.0, 1.0, 2.0, 4.0, 2.0]",
                             "+I[3, 2.0, 3, 2.0, 1.0, 1.0, 2.0, 2.0, 1.0, 1.0]"])
 
+    def test_incremental_over_window_aggregate_function(self):
+        self.t_env.get_config().set(
+            "python.fn-execution.over-window.incremental.enabled", "true")
+        self.test_over_window_aggregate_function()
+
+    def test_incremental_over_window_aggregate_function_with_retract(self):
+        import datetime
+        self.t_env.get_config().set(
+            "python.fn-execution.over-window.incremental.enabled", "true")
+        t = self.t_env.from_elements(
+            [
+                (1, 1, datetime.datetime(2018, 3, 11, 3, 10, 0, 0)),
+                (1, 2, datetime.datetime(2018, 3, 11, 3, 20, 0, 0)),
+                (1, 4, datetime.datetime(2018, 3, 11, 3, 30, 0, 0)),
+                (2, 8, datetime.datetime(2018, 3, 11, 3, 10, 0, 0)),
+                (2, 16, datetime.datetime(2018, 3, 11, 3, 20, 0, 0))
+            ],
+            DataTypes.ROW(
+                [DataTypes.FIELD("a", DataTypes.TINYINT()),
+                 DataTypes.FIELD("b", DataTypes.INT()),
+                 DataTypes.FIELD("rowtime", DataTypes.TIMESTAMP(3))]))
+        sink_table_ddl = """
+            CREATE TABLE Results(a TINYINT, b BIGINT, c BIGINT) WITH ('connector'='test-sink')
+        """
+        self.t_env.execute_sql(sink_table_ddl)
+        self.t_env.create_temporary_system_function(
+            "sum_retract", udaf(SumRetract(), result_type=DataTypes.BIGINT(), func_type="pandas"))
+        self.t_env.register_table("T", t)
+        self.t_env.execute_sql("""
+            insert into Results
+            select a,
+             sum_retract(b)
+             over (PARTITION BY a ORDER BY rowtime
+             ROWS BETWEEN 1 PRECEDING AND CURRENT ROW),
+             sum_retract(b)
+             over (PARTITION BY a ORDER BY rowtime
+             ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW)
+            from T
+        """).wait()
+        actual = source_sink_utils.results()
+        self.assert_equals(actual,
+                           ["+I[1, 1, 1]", "+I[1, 3, 3]", "+I[1, 6, 7]", "+I[2, 8, 8]",
+                            "+I[2, 24, 24]"])
+
 
 class StreamPandasUDAFITTests(PyFlinkStreamTableTestCase):
     def test_sliding_group_window_over_time(self):
@@ -842,6 +886,20 @@ class MaxAdd(AggregateFunction, unittest.TestCase):
         accumulator.append(result)
 
 
+class SumRetract(AggregateFunction):
+
+    def get_value(self, accumulator):
+        return accumulator[0]
+
+    def create_accumulator(self):
+        return [0]
+
+    def accumulate(self, accumulator, *args):
+        accumulator[0] += int(args[0].sum())
+
+    def retract(self, accumulator, *args):
+        accumulator[0] -= int(args[0].sum())
+
 if __name__ == '__main__':
     import unittest
 
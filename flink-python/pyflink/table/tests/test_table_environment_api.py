@@ -535,6 +535,32 @@ class StreamTableEnvironmentTests(TableEnvironmentTest, PyFlinkStreamTableTestCa
                 collected_result.append(i)
             self.assertEqual(expected_result, collected_result)
 
+    def test_collect_with_batch_size(self):
+        source = self.t_env.from_elements([(i, str(i)) for i in range(10)], ['a', 'b'])
+        with source.execute().collect(batch_size=3) as result:
+            collected_result = [i for i in result]
+        self.assertEqual([Row(i, str(i)) for i in range(10)], collected_result)
+
+        # the rows of the current batch are dropped when the iterator is closed
+        result = source.execute().collect(batch_size=3)
+        self.assertEqual(Row(0, '0'), next(result))
+        result.close()
+        with self.assertRaises(StopIteration):
+            next(result)
+
+        with self.assertRaises(ValueError):
+            source.execute().collect(batch_size=0)
+
+    def test_collect_batches(self):
+        source = self.t_env.from_elements([(i, str(i)) for i in range(10)], ['a', 'b'])
+        batches = list(source.execute().collect_batches(batch_size=4))
+        self.assertEqual([4, 4, 2], [batch.num_rows for batch in batches])
+        self.assertEqual(['a', 'b'], batches[0].schema.names)
+        self.assertEqual(list(range(10)),
+                         [v for batch in batches for v in batch.column(0).to_pylist()])
+        self.assertEqual([str(i) for i in range(10)],
+                         [v for batch in batches for v in batch.column(1).to_pylist()])
+
 
 class VectorUDT(UserDefinedType):
 
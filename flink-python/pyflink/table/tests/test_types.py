@@ -32,8 +32,9 @@ from pyflink.table.types import (_infer_schema_from_data, _infer_type,
                                  _array_signed_int_typecode_ctype_mappings,
                                  _array_unsigned_int_typecode_ctype_mappings,
                                  _array_type_mappings, _merge_type,
-                                 _create_type_verifier, UserDefinedType, DataTypes, Row, RowField,
-                                 RowType, ArrayType, BigIntType, VarCharType, MapType, DataType,
+                                 _create_type_verifier, _create_converter, UserDefinedType,
+                                 DataTypes, Row, RowField, RowType, ArrayType, BigIntType,
+                                 VarCharType, MapType, DataType,
                                  _from_java_data_type, ZonedTimestampType,
                                  LocalZonedTimestampType, _to_java_data_type)
 from pyflink.testing.test_case_utils import PyFlinkTestCase
@@ -590,6 +591,28 @@ class TypesTests(PyFlinkTestCase):
         row_class = Row("c1", "c2")
         self.assertRaises(ValueError, lambda: row_class(1, 2, 3))
 
+    def test_row_field_access(self):
+        row = Row(a=1, b=2, c=3)
+        self.assertEqual(2, row.b)
+        self.assertEqual(3, row['c'])
+        row['b'] = 4
+        self.assertEqual([1, 4, 3], list(row))
+        self.assertEqual([3, 1], row.get_fields_by_names(['c', 'a']))
+        self.assertRaises(ValueError, lambda: row['d'])
+        self.assertRaises(AttributeError, lambda: row.d)
+
+        # the field names could be changed after the field access
+        row.set_field_names(['x', 'y', 'x'])
+        self.assertEqual(4, row.y)
+        self.assertEqual(1, row.x)
+        self.assertRaises(AttributeError, lambda: row.a)
+
+        row = Row(1, 2)
+        self.assertFalse(hasattr(row, '_fields'))
+        self.assertRaises(AttributeError, lambda: row['a'])
+        with self.assertRaises(AttributeError):
+            row.a = 1
+
     def test_nullable(self):
         t = DataType(nullable=False)
 
@@ -619,6 +642,20 @@ class DataTypeVerificationTests(PyFlinkTestCase):
             TypeError,
             lambda: _create_type_verifier(schema)([["data"]]))
 
+    def test_verify_positional_row(self):
+        schema = DataTypes.ROW(
+            [DataTypes.FIELD('a', DataTypes.INT()),
+             DataTypes.FIELD('b', DataTypes.ROW([DataTypes.FIELD('c', DataTypes.INT()),
+                                                 DataTypes.FIELD('d', DataTypes.STRING())]))])
+        verifier = _create_type_verifier(schema)
+        verifier(Row(1, Row(2, 'x')))
+        verifier((1, Row(2, 'x')))
+        self.assertRaises(TypeError, lambda: verifier(Row(1, Row('x', 'x'))))
+        self.assertRaises(ValueError, lambda: verifier(Row(1, Row(2))))
+
+        converter = _create_converter(_infer_schema_from_data([Row(1, Row(2, 'x'))]))
+        self.assertEqual((1, (2, 'x')), converter(Row(1, Row(2, 'x'))))
+
     def test_verify_type_ok_nullable(self):
         obj = None
         types = [DataTypes.INT(), DataTypes.FLOAT(), DataTypes.STRING(), DataTypes.ROW([])]
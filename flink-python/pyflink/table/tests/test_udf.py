@@ -741,6 +741,40 @@ class PyFlinkStreamUserDefinedFunctionTests(UserDefinedFunctionTests,
         actual = source_sink_utils.results()
         self.assert_equals(actual, ["+I[1970-01-01T00:00:00.123Z]"])
 
+    def test_columnar_coding(self):
+        self.t_env.get_config().set('python.fn-execution.columnar-coding.enabled', 'true')
+
+        add_one = udf(lambda i: i + 1 if i is not None else None,
+                      result_type=DataTypes.BIGINT())
+        double = udf(lambda d: d * 2 if d is not None else None,
+                     result_type=DataTypes.DOUBLE())
+        negate = udf(lambda b: not b if b is not None else None,
+                     result_type=DataTypes.BOOLEAN())
+        upper = udf(lambda s: s.upper() if s is not None else None,
+                    result_type=DataTypes.STRING())
+
+        sink_table_ddl = """
+        CREATE TABLE Results(a BIGINT, b DOUBLE, c BOOLEAN, d STRING, e INT)
+        WITH ('connector'='test-sink')
+        """
+        self.t_env.execute_sql(sink_table_ddl)
+
+        t = self.t_env.from_elements(
+            [(1, 2.5, True, 'a', 1), (2, None, False, None, 2), (None, 1.0, None, 'c', 3)],
+            DataTypes.ROW([DataTypes.FIELD("a", DataTypes.BIGINT()),
+                           DataTypes.FIELD("b", DataTypes.DOUBLE()),
+                           DataTypes.FIELD("c", DataTypes.BOOLEAN()),
+                           DataTypes.FIELD("d", DataTypes.STRING()),
+                           DataTypes.FIELD("e", DataTypes.INT())]))
+
+        t.select(add_one(t.a), double(t.b), negate(t.c), upper(t.d), t.e) \
+            .execute_insert("Results") \
+            .wait()
+        actual = source_sink_utils.results()
+        self.assert_equals(actual, ["+I[2, 5.0, false, A, 1]",
+                                    "+I[3, null, true, null, 2]",
+                                    "+I[null, 2.0, null, C, 3]"])
+
     @unittest.skip("Python UDFs are currently unsupported in JSON plan")
     def test_execute_from_json_plan(self):
         # create source file path
@@ -1654,7 +1654,7 @@ def _create_converter(data_type):
         if obj is None:
             return
 
-        if isinstance(obj, (tuple, list)):
+        if isinstance(obj, (tuple, list)) or (isinstance(obj, Row) and not hasattr(obj, "_fields")):
             if convert_fields:
                 return tuple(conv(v) for v, conv in zip(obj, converters))
             else:
@@ -1662,6 +1662,8 @@ def _create_converter(data_type):
 
         if isinstance(obj, dict):
             d = obj
+        elif isinstance(obj, Row):
+            d = obj.as_dict()
         elif hasattr(obj, "__dict__"):  # object
             d = obj.__dict__
         else:
@@ -2150,7 +2152,7 @@ def _create_type_verifier(data_type: DataType, name: str = None):
                 # the order in obj could be different than dataType.fields
                 for f, verifier in verifiers:
                     verifier(obj[f])
-            elif isinstance(obj, (tuple, list)):
+            elif isinstance(obj, (tuple, list, Row)):
                 if len(obj) != len(verifiers):
                     raise ValueError(
                         new_msg("Length of object (%d) does not match with "
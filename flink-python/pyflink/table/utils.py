@@ -21,7 +21,7 @@ from pyflink.common.types import RowKind
 
 from pyflink.java_gateway import get_gateway
 from pyflink.table.types import DataType, LocalZonedTimestampType, Row, RowType, \
-    TimeType, DateType, ArrayType, MapType, TimestampType, FloatType, RawType
+    TimeType, ArrayType, MapType, TimestampType, FloatType
 from pyflink.util.java_utils import to_jarray
 import datetime
 import pickle
@@ -105,42 +105,53 @@ def to_expression_jarray(exprs):
 
 
 def pickled_bytes_to_python_converter(data, field_type: DataType):
+    """
+    Converts the pickled bytes of the given type to Python object. Use
+    :func:`create_pickled_bytes_to_python_converter` instead to convert many values of the same
+    type.
+    """
+    return create_pickled_bytes_to_python_converter(field_type)(data)
+
+
+def create_pickled_bytes_to_python_converter(field_type: DataType):
+    """
+    Creates a function which converts the pickled bytes of the given type to Python object. The
+    dispatching on the type is done once when the function is created instead of once per value.
+    """
     if isinstance(field_type, RowType):
-        row_kind = RowKind(int.from_bytes(data[0], byteorder='big', signed=False))
-        data = zip(list(data[1:]), field_type.field_types())
-        fields = []
-        for d, d_type in data:
-            fields.append(pickled_bytes_to_python_converter(d, d_type))
-        result_row = Row(fields)
-        result_row.set_row_kind(row_kind)
-        return result_row
-    else:
-        data = pickle.loads(data)
-        if isinstance(field_type, TimeType):
-            seconds, microseconds = divmod(data, 10 ** 6)
+        field_converters = [create_pickled_bytes_to_python_converter(t)
+                            for t in field_type.field_types()]
+
+        def convert_row(data):
+            row_kind = RowKind(int.from_bytes(data[0], byteorder='big', signed=False))
+            result_row = Row([converter(d) for converter, d in zip(field_converters, data[1:])])
+            result_row.set_row_kind(row_kind)
+            return result_row
+
+        return convert_row
+    elif isinstance(field_type, TimeType):
+        def convert_time(data):
+            seconds, microseconds = divmod(pickle.loads(data), 10 ** 6)
             minutes, seconds = divmod(seconds, 60)
             hours, minutes = divmod(minutes, 60)
             return datetime.time(hours, minutes, seconds, microseconds)
-        elif isinstance(field_type, DateType):
-            return field_type.from_sql_type(data)
-        elif isinstance(field_type, TimestampType):
-            return field_type.from_sql_type(int(data.timestamp() * 10**6))
-        elif isinstance(field_type, MapType):
-            key_type = field_type.key_type
-            value_type = field_type.value_type
-            zip_kv = zip(data[0], data[1])
-            return dict((pickled_bytes_to_python_converter(k, key_type),
-                         pickled_bytes_to_python_converter(v, value_type))
-                        for k, v in zip_kv)
-        elif isinstance(field_type, FloatType):
-            return field_type.from_sql_type(ast.literal_eval(data))
-        elif isinstance(field_type, ArrayType):
-            element_type = field_type.element_type
-            elements = []
-            for element_bytes in data:
-                elements.append(pickled_bytes_to_python_converter(element_bytes, element_type))
-            return elements
-        elif isinstance(field_type, RawType):
-            return field_type.from_sql_type(data)
-        else:
-            return field_type.from_sql_type(data)
+
+        return convert_time
+    elif isinstance(field_type, TimestampType):
+        return lambda data: field_type.from_sql_type(int(pickle.loads(data).timestamp() * 10**6))
+    elif isinstance(field_type, MapType):
+        key_converter = create_pickled_bytes_to_python_converter(field_type.key_type)
+        value_converter = create_pickled_bytes_to_python_converter(field_type.value_type)
+
+        def convert_map(data):
+            keys, values = pickle.loads(data)
+            return dict((key_converter(k), value_converter(v)) for k, v in zip(keys, values))
+
+        return convert_map
+    elif isinstance(field_type, FloatType):
+        return lambda data: field_type.from_sql_type(ast.literal_eval(pickle.loads(data)))
+    elif isinstance(field_type, ArrayType):
+        element_converter = create_pickled_bytes_to_python_converter(field_type.element_type)
+        return lambda data: [element_converter(e) for e in pickle.loads(data)]
+    else:
+        return lambda data: field_type.from_sql_type(pickle.loads(data))
@@ -60,6 +60,7 @@ import java.time.LocalDateTime;
 import java.time.LocalTime;
 import java.util.ArrayList;
 import java.util.Arrays;
+import java.util.Iterator;
 import java.util.LinkedList;
 import java.util.List;
 import java.util.Map;
@@ -323,6 +324,29 @@ public final class PythonBridgeUtils {
         }
     }
 
+    /**
+     * Pulls at most {@code batchSize} elements from the given iterator and pickles them as a list
+     * in one blob, so that they could be transferred to Python in one call. Every element of the
+     * list is what {@link #getPickledBytesFromJavaObject(Object, TypeInformation)} returns for the
+     * element, except for the pickled byte arrays, which are kept as they are. An empty list is
+     * returned when the iterator has no more elements.
+     */
+    public static byte[] getPickledBytesFromJavaObjects(
+            Iterator<?> iterator, TypeInformation<?> dataType, int batchSize) throws IOException {
+        List<Object> batch = new ArrayList<>();
+        while (batch.size() < batchSize && iterator.hasNext()) {
+            Object obj = iterator.next();
+            if (dataType instanceof PickledByteArrayTypeInfo) {
+                batch.add(obj);
+            } else {
+                batch.add(getPickledBytesFromJavaObject(obj, dataType));
+            }
+        }
+        Pickler pickler = new Pickler();
+        initialize();
+        return pickler.dumps(batch);
+    }
+
     public static Object getPickledBytesFromRow(Row row, DataType[] dataTypes) throws IOException {
         LogicalType[] logicalTypes =
                 Arrays.stream(dataTypes).map(f -> f.getLogicalType()).toArray(LogicalType[]::new);
@@ -330,6 +354,27 @@ public final class PythonBridgeUtils {
         return getPickledBytesFromJavaObject(row, RowType.of(logicalTypes));
     }
 
+    /**
+     * Pulls at most {@code batchSize} rows from the given iterator and pickles them as a list in
+     * one blob. Every element of the list is what {@link #getPickledBytesFromRow(Row, DataType[])}
+     * returns for the row. An empty list is returned when the iterator has no more rows.
+     */
+    public static byte[] getPickledBytesFromRows(
+            Iterator<Row> iterator, DataType[] dataTypes, int batchSize) throws IOException {
+        RowType rowType =
+                RowType.of(
+                        Arrays.stream(dataTypes)
+                                .map(DataType::getLogicalType)
+                                .toArray(LogicalType[]::new));
+        List<Object> batch = new ArrayList<>();
+        while (batch.size() < batchSize && iterator.hasNext()) {
+            batch.add(getPickledBytesFromJavaObject(iterator.next(), rowType));
+        }
+        Pickler pickler = new Pickler();
+        initialize();
+        return pickler.dumps(batch);
+    }
+
     private static boolean initialized = false;
 
     private static void initialize() {
@@ -96,6 +96,24 @@ public class PythonConfig implements ReadableConfig {
             config.set(PythonOptions.PYTHON_JOB_OPTIONS, jobOptions);
         }
         jobOptions.put("TABLE_LOCAL_TIME_ZONE", getLocalTimeZone(configuration).getId());
+        jobOptions.put(
+                "PYTHON_COLUMNAR_CODING_ENABLED",
+                String.valueOf(config.get(PythonOptions.PYTHON_COLUMNAR_CODING_ENABLED)));
+        jobOptions.put(
+                "PYTHON_OVER_WINDOW_INCREMENTAL_ENABLED",
+                String.valueOf(config.get(PythonOptions.PYTHON_OVER_WINDOW_INCREMENTAL_ENABLED)));
+        jobOptions.put(
+                "PYTHON_OUTPUT_FLUSH_SIZE",
+                String.valueOf(config.get(PythonOptions.PYTHON_OUTPUT_FLUSH_SIZE)));
+        jobOptions.put(
+                "PYTHON_OUTPUT_FLUSH_INTERVAL",
+                String.valueOf(config.get(PythonOptions.PYTHON_OUTPUT_FLUSH_INTERVAL)));
+        jobOptions.put(
+                "PYTHON_OUTPUT_FLUSH_ON_IDLE",
+                String.valueOf(config.get(PythonOptions.PYTHON_OUTPUT_FLUSH_ON_IDLE)));
+        jobOptions.put(
+                "PYTHON_STATE_CACHE_MEMORY_FRACTION",
+                String.valueOf(config.get(PythonOptions.STATE_CACHE_MEMORY_FRACTION)));
         if (config.contains(PYTHON_LOOPBACK_SERVER_ADDRESS)) {
             jobOptions.put(
                     "PYTHON_LOOPBACK_SERVER_ADDRESS", config.get(PYTHON_LOOPBACK_SERVER_ADDRESS));
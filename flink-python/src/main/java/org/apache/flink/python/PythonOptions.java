@@ -63,6 +63,78 @@ public class PythonOptions {
                                     + "user-defined function execution. The arrow batch size should not exceed the "
                                     + "bundle size. Otherwise, the bundle size will be used as the arrow batch size.");
 
+    /** Whether to decode and encode the rows of Python scalar functions in columnar form. */
+    @Experimental
+    public static final ConfigOption<Boolean> PYTHON_COLUMNAR_CODING_ENABLED =
+            ConfigOptions.key("python.fn-execution.columnar-coding.enabled")
+                    .booleanType()
+                    .defaultValue(false)
+                    .withDescription(
+                            "When it is true, all the rows of a data element sent to a general Python "
+                                    + "scalar function are decoded into columns in one pass, and the results "
+                                    + "are encoded from columns, instead of decoding and encoding them row by "
+                                    + "row. The values of the fixed-width types, e.g. INT, BIGINT, FLOAT, DOUBLE "
+                                    + "and BOOLEAN, are decoded in place. Note that this is an experimental "
+                                    + "flag and might not be available in future releases.");
+
+    /** Whether to evaluate the Pandas UDAFs over bounded over windows incrementally. */
+    @Experimental
+    public static final ConfigOption<Boolean> PYTHON_OVER_WINDOW_INCREMENTAL_ENABLED =
+            ConfigOptions.key("python.fn-execution.over-window.incremental.enabled")
+                    .booleanType()
+                    .defaultValue(false)
+                    .withDescription(
+                            "When it is true, the Pandas UDAFs over the bounded over windows of a "
+                                    + "batch job are evaluated for all the rows of a partition at once "
+                                    + "instead of once per row. The sum, mean, min, max and count "
+                                    + "aggregations, e.g. lambda v: v.mean(), are computed with "
+                                    + "cumulative kernels and the Pandas UDAFs which implement retract "
+                                    + "are evaluated by accumulating the rows entering and retracting "
+                                    + "the rows leaving the window of each row. The floating point "
+                                    + "results may differ in the least significant digits. Note that "
+                                    + "this is an experimental flag and might not be available in "
+                                    + "future releases.");
+
+    /** The number of buffered output bytes which triggers a flush of the Python worker. */
+    @Experimental
+    public static final ConfigOption<Integer> PYTHON_OUTPUT_FLUSH_SIZE =
+            ConfigOptions.key("python.fn-execution.output.flush-size")
+                    .intType()
+                    .defaultValue(10_000_000)
+                    .withDescription(
+                            "The number of bytes of the results buffered in the Python worker which "
+                                    + "triggers sending them to the Java operator before the bundle "
+                                    + "finishes. Lower values lead to lower latencies, but may affect "
+                                    + "throughput. Note that this is an experimental flag and might not "
+                                    + "be available in future releases.");
+
+    /** The interval in milliseconds at which the Python worker flushes its buffered output. */
+    @Experimental
+    public static final ConfigOption<Long> PYTHON_OUTPUT_FLUSH_INTERVAL =
+            ConfigOptions.key("python.fn-execution.output.flush-interval")
+                    .longType()
+                    .defaultValue(1000L)
+                    .withDescription(
+                            "The interval(in milliseconds) at which the results buffered in the "
+                                    + "Python worker are sent to the Java operator before the bundle "
+                                    + "finishes. The value 0 disables the time based flush. Note that "
+                                    + "this is an experimental flag and might not be available in "
+                                    + "future releases.");
+
+    /** Whether to flush the output of the Python worker once its received input is drained. */
+    @Experimental
+    public static final ConfigOption<Boolean> PYTHON_OUTPUT_FLUSH_ON_IDLE =
+            ConfigOptions.key("python.fn-execution.output.flush-on-idle")
+                    .booleanType()
+                    .defaultValue(false)
+                    .withDescription(
+                            "When it is true, the results buffered in the Python worker are sent to "
+                                    + "the Java operator as soon as all the received input elements "
+                                    + "have been processed, instead of waiting for the size or the time "
+                                    + "based flush. It trades throughput for lower latencies at low "
+                                    + "input rates. Note that this is an experimental flag and might not "
+                                    + "be available in future releases.");
+
     /** The configuration to enable or disable metric for Python execution. */
     public static final ConfigOption<Boolean> PYTHON_METRIC_ENABLED =
             ConfigOptions.key("python.metric.enabled")
@@ -189,6 +261,45 @@ public class PythonOptions {
                             "The maximum number of states cached in a Python UDF worker. Note that this "
                                     + "is an experimental flag and might not be available in future releases.");
 
+    /**
+     * The fraction of the memory limit of the Python worker which the state caches of a Python
+     * operator could use.
+     */
+    @Experimental
+    public static final ConfigOption<Double> STATE_CACHE_MEMORY_FRACTION =
+            ConfigOptions.key("python.state.cache-memory-fraction")
+                    .doubleType()
+                    .defaultValue(0.0)
+                    .withDescription(
+                            "The fraction of the memory limit of the Python worker, i.e. the managed "
+                                    + "memory reserved for it, which the state read cache of a Python "
+                                    + "operator could use. The budget is shared by the cached values of all "
+                                    + "the states, e.g. map, list and value states. The cached values are "
+                                    + "weighted by their encoded sizes and the least recently used ones are "
+                                    + "evicted once the budget is exceeded, in addition to the entry count "
+                                    + "limits. It only takes "
+                                    + "effect when the Python worker uses managed memory. The value 0 "
+                                    + "disables the memory budget. Note that this is an experimental flag "
+                                    + "and might not be available in future releases.");
+
+    /**
+     * The maximum number of input elements whose state is read ahead of processing them in a
+     * Python keyed DataStream operator.
+     */
+    @Experimental
+    public static final ConfigOption<Integer> STATE_READ_AHEAD_SIZE =
+            ConfigOptions.key("python.state.read-ahead-size")
+                    .intType()
+                    .defaultValue(0)
+                    .withDescription(
+                            "The maximum number of input elements of a Python keyed DataStream "
+                                    + "operator whose state reads are sent to the state backend (managed in the "
+                                    + "Java operator) at the same time, ahead of processing these elements one by "
+                                    + "one in the original order. It allows to overlap the latency of the state "
+                                    + "reads of different keys. The value 0 disables reading state ahead. Note "
+                                    + "that this is an experimental flag and might not be available in future "
+                                    + "releases.");
+
     /** The maximum number of cached items which read from Java side in a Python MapState. */
     @Experimental
     public static final ConfigOption<Integer> MAP_STATE_READ_CACHE_SIZE =
@@ -0,0 +1,177 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one or more
+ * contributor license agreements.  See the NOTICE file distributed with
+ * this work for additional information regarding copyright ownership.
+ * The ASF licenses this file to You under the Apache License, Version 2.0
+ * (the "License"); you may not use this file except in compliance with
+ * the License.  You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.apache.flink.python.util;
+
+import org.apache.flink.annotation.Internal;
+import org.apache.flink.annotation.VisibleForTesting;
+import org.apache.flink.util.Preconditions;
+
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+
+import java.util.ArrayList;
+import java.util.Iterator;
+import java.util.List;
+import java.util.concurrent.ArrayBlockingQueue;
+import java.util.concurrent.BlockingQueue;
+import java.util.concurrent.TimeUnit;
+
+/**
+ * Pulls the elements of an iterator in a background thread, so that the elements which are
+ * already available could be fetched in batches without waiting for a batch to be full. It's used
+ * to transfer the collected results to Python, where the results of an unbounded job should be
+ * visible as soon as they arrive.
+ *
+ * <p>The iterator is only accessed by the fetch thread, which also closes it, as the iterators of
+ * the collected results aren't thread-safe.
+ */
+@Internal
+public final class IncrementalBatchFetcher<T> implements AutoCloseable {
+
+    private static final Logger LOG = LoggerFactory.getLogger(IncrementalBatchFetcher.class);
+
+    /** The marker put into the queue after the last element. */
+    private static final Object END = new Object();
+
+    /** The interval to check whether it's closed when the queue is full. */
+    private static final long OFFER_TIMEOUT_MILLIS = 100;
+
+    /** The max time to wait for the fetch thread to stop when it's closed. */
+    private static final long CLOSE_TIMEOUT_MILLIS = 10_000;
+
+    private final Iterator<T> iterator;
+
+    private final BlockingQueue<Object> queue;
+
+    private final Thread fetchThread;
+
+    private final long closeTimeoutMillis;
+
+    private volatile Throwable error;
+
+    private volatile boolean closed;
+
+    private boolean ended;
+
+    public IncrementalBatchFetcher(Iterator<T> iterator, int capacity) {
+        this(iterator, capacity, CLOSE_TIMEOUT_MILLIS);
+    }
+
+    @VisibleForTesting
+    IncrementalBatchFetcher(Iterator<T> iterator, int capacity, long closeTimeoutMillis) {
+        Preconditions.checkArgument(capacity > 0, "The capacity should be positive.");
+        this.iterator = Preconditions.checkNotNull(iterator);
+        this.closeTimeoutMillis = closeTimeoutMillis;
+        this.queue = new ArrayBlockingQueue<>(capacity);
+        this.fetchThread = new Thread(this::fetch, "IncrementalBatchFetcher");
+        this.fetchThread.setDaemon(true);
+        this.fetchThread.start();
+    }
+
+    /**
+     * Returns at most {@code maxSize} elements. It blocks until at least one element is available
+     * and doesn't wait for more elements than the available ones. An empty list is returned when
+     * the iterator has no more elements.
+     */
+    @SuppressWarnings("unchecked")
+    public List<T> nextBatch(int maxSize) throws Exception {
+        Preconditions.checkArgument(maxSize > 0, "The max size should be positive.");
+        List<Object> batch = new ArrayList<>();
+        if (!ended) {
+            batch.add(queue.take());
+            queue.drainTo(batch, maxSize - 1);
+            if (batch.get(batch.size() - 1) == END) {
+                batch.remove(batch.size() - 1);
+                ended = true;
+            }
+        }
+        if (ended && batch.isEmpty() && error != null) {
+            Throwable t = error;
+            error = null;
+            if (t instanceof Exception) {
+                throw (Exception) t;
+            }
+            throw new RuntimeException(t);
+        }
+        return (List<T>) (List<?>) batch;
+    }
+
+    /**
+     * Stops fetching. The fetch thread is interrupted and closes the iterator once it returns from
+     * the iterator, which is waited for at most the close timeout.
+     */
+    @Override
+    public void close() throws Exception {
+        closed = true;
+        fetchThread.interrupt();
+        fetchThread.join(closeTimeoutMillis);
+        if (fetchThread.isAlive()) {
+            LOG.warn(
+                    "The fetch thread didn't stop within {} ms, the iterator will be closed once "
+                            + "the pending fetch returns.",
+                    closeTimeoutMillis);
+        }
+        queue.clear();
+    }
+
+    private void fetch() {
+        try {
+            while (!closed && iterator.hasNext()) {
+                if (!offer(iterator.next())) {
+                    break;
+                }
+            }
+        } catch (Throwable t) {
+            // the failures caused by closing it aren't reported
+            if (!closed) {
+                error = t;
+            }
+        } finally {
+            closeIterator();
+        }
+        offer(END);
+    }
+
+    private void closeIterator() {
+        if (iterator instanceof AutoCloseable) {
+            try {
+                ((AutoCloseable) iterator).close();
+            } catch (Throwable t) {
+                if (!closed && error == null) {
+                    error = t;
+                } else {
+                    LOG.warn("Failed to close the iterator.", t);
+                }
+            }
+        }
+    }
+
+    /** Puts the element into the queue, returns false if it's closed before there is space. */
+    private boolean offer(Object element) {
+        try {
+            while (!closed) {
+                if (queue.offer(element, OFFER_TIMEOUT_MILLIS, TimeUnit.MILLISECONDS)) {
+                    return true;
+                }
+            }
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+        }
+        return false;
+    }
+}
@@ -0,0 +1,74 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one or more
+ * contributor license agreements.  See the NOTICE file distributed with
+ * this work for additional information regarding copyright ownership.
+ * The ASF licenses this file to You under the Apache License, Version 2.0
+ * (the "License"); you may not use this file except in compliance with
+ * the License.  You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.apache.flink.streaming.api.functions.python;
+
+import org.apache.flink.annotation.Internal;
+import org.apache.flink.api.common.functions.MapFunction;
+import org.apache.flink.api.common.typeinfo.TypeInformation;
+import org.apache.flink.api.java.tuple.Tuple;
+import org.apache.flink.api.java.typeutils.RowTypeInfo;
+import org.apache.flink.api.java.typeutils.TupleTypeInfoBase;
+import org.apache.flink.types.Row;
+import org.apache.flink.util.Preconditions;
+
+/**
+ * {@link KeyByFieldsMapFunction} extracts the key from the given fields of the Row or Tuple input
+ * and emits it with the input in the format of (key, value) tuple2, which is the same as the
+ * Python DataStream key_by with a Python key selector. The key of a single field is the field
+ * itself and the key of several fields is a Row of these fields.
+ */
+@Internal
+public class KeyByFieldsMapFunction implements MapFunction<Object, Row> {
+    private static final long serialVersionUID = 1L;
+
+    private final int[] positions;
+
+    private final boolean isRow;
+
+    public KeyByFieldsMapFunction(int[] positions, TypeInformation<?> valueType) {
+        Preconditions.checkArgument(
+                valueType instanceof TupleTypeInfoBase,
+                "The value type must be a Row or Tuple type, but is %s.",
+                valueType);
+        Preconditions.checkArgument(positions.length > 0, "No key fields are specified.");
+        for (int position : positions) {
+            Preconditions.checkElementIndex(position, valueType.getArity());
+        }
+        this.positions = positions;
+        this.isRow = valueType instanceof RowTypeInfo;
+    }
+
+    @Override
+    public Row map(Object value) {
+        Object key;
+        if (positions.length == 1) {
+            key = getField(value, positions[0]);
+        } else {
+            Row keyRow = new Row(positions.length);
+            for (int i = 0; i < positions.length; i++) {
+                keyRow.setField(i, getField(value, positions[i]));
+            }
+            key = keyRow;
+        }
+        return Row.of(key, value);
+    }
+
+    private Object getField(Object value, int position) {
+        return isRow ? ((Row) value).getField(position) : ((Tuple) value).getField(position);
+    }
+}
@@ -0,0 +1,116 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one or more
+ * contributor license agreements.  See the NOTICE file distributed with
+ * this work for additional information regarding copyright ownership.
+ * The ASF licenses this file to You under the Apache License, Version 2.0
+ * (the "License"); you may not use this file except in compliance with
+ * the License.  You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.apache.flink.streaming.api.functions.python;
+
+import org.apache.flink.annotation.Internal;
+import org.apache.flink.api.common.functions.ReduceFunction;
+import org.apache.flink.api.common.typeinfo.TypeInformation;
+import org.apache.flink.api.java.tuple.Tuple;
+import org.apache.flink.api.java.typeutils.RowTypeInfo;
+import org.apache.flink.api.java.typeutils.TupleTypeInfoBase;
+import org.apache.flink.streaming.api.functions.aggregation.AggregationFunction.AggregationType;
+import org.apache.flink.streaming.api.functions.aggregation.SumFunction;
+import org.apache.flink.types.Row;
+import org.apache.flink.util.Preconditions;
+
+/**
+ * {@link KeyedAccumulateReduceFunction} applies the sum, min, max, minBy and maxBy aggregations of
+ * the Python KeyedStream on a field of the Row or Tuple values. The input rows are generated by
+ * the Python DataStream key_by in the format of (key, value) tuple2. The aggregated value keeps
+ * the other fields of the first value of the key, the same as the Python implementation.
+ */
+@Internal
+public class KeyedAccumulateReduceFunction implements ReduceFunction<Row> {
+    private static final long serialVersionUID = 1L;
+
+    private final AggregationType aggregationType;
+
+    private final int position;
+
+    private final boolean isRow;
+
+    private final SumFunction adder;
+
+    public KeyedAccumulateReduceFunction(
+            AggregationType aggregationType, int position, TypeInformation<?> valueType) {
+        Preconditions.checkArgument(
+                valueType instanceof TupleTypeInfoBase,
+                "The value type must be a Row or Tuple type, but is %s.",
+                valueType);
+        TupleTypeInfoBase<?> tupleType = (TupleTypeInfoBase<?>) valueType;
+        Preconditions.checkElementIndex(position, tupleType.getArity());
+        this.aggregationType = Preconditions.checkNotNull(aggregationType);
+        this.position = position;
+        this.isRow = valueType instanceof RowTypeInfo;
+        this.adder =
+                aggregationType == AggregationType.SUM
+                        ? SumFunction.getForClass(tupleType.getTypeAt(position).getTypeClass())
+                        : null;
+    }
+
+    @Override
+    public Row reduce(Row value1, Row value2) throws Exception {
+        Object v1 = value1.getField(1);
+        Object v2 = value2.getField(1);
+        Object f1 = getField(v1);
+        Object f2 = getField(v2);
+        Object result;
+        switch (aggregationType) {
+            case SUM:
+                result = copyWithField(v1, adder.add(f1, f2));
+                break;
+            case MIN:
+                result = compare(f2, f1) < 0 ? copyWithField(v1, f2) : v1;
+                break;
+            case MAX:
+                result = compare(f2, f1) > 0 ? copyWithField(v1, f2) : v1;
+                break;
+            case MINBY:
+                result = compare(f2, f1) < 0 ? v2 : v1;
+                break;
+            case MAXBY:
+                result = compare(f2, f1) > 0 ? v2 : v1;
+                break;
+            default:
+                throw new UnsupportedOperationException(
+                        "Unsupported aggregation type: " + aggregationType);
+        }
+        return Row.of(value1.getField(0), result);
+    }
+
+    private Object getField(Object value) {
+        return isRow ? ((Row) value).getField(position) : ((Tuple) value).getField(position);
+    }
+
+    private Object copyWithField(Object value, Object field) {
+        if (isRow) {
+            Row row = Row.copy((Row) value);
+            row.setField(position, field);
+            return row;
+        } else {
+            Tuple tuple = ((Tuple) value).copy();
+            tuple.setField(field, position);
+            return tuple;
+        }
+    }
+
+    @SuppressWarnings("unchecked")
+    private static int compare(Object o1, Object o2) {
+        return ((Comparable<Object>) o1).compareTo(o2);
+    }
+}
@@ -0,0 +1,77 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one or more
+ * contributor license agreements.  See the NOTICE file distributed with
+ * this work for additional information regarding copyright ownership.
+ * The ASF licenses this file to You under the Apache License, Version 2.0
+ * (the "License"); you may not use this file except in compliance with
+ * the License.  You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.apache.flink.streaming.api.functions.python.eventtime;
+
+import org.apache.flink.annotation.Internal;
+import org.apache.flink.api.common.eventtime.SerializableTimestampAssigner;
+import org.apache.flink.api.common.typeinfo.TypeInformation;
+import org.apache.flink.api.java.tuple.Tuple;
+import org.apache.flink.api.java.typeutils.RowTypeInfo;
+import org.apache.flink.api.java.typeutils.TupleTypeInfoBase;
+import org.apache.flink.types.Row;
+import org.apache.flink.util.Preconditions;
+
+import java.sql.Timestamp;
+import java.time.Instant;
+
+/**
+ * TimestampAssigner which extracts timestamp from the given field of the Row or Tuple input
+ * element. The field could be a number of milliseconds since the Epoch, an {@link Instant} or a
+ * {@link Timestamp}.
+ */
+@Internal
+public class FieldTimestampAssigner implements SerializableTimestampAssigner<Object> {
+
+    private static final long serialVersionUID = 1L;
+
+    private final int position;
+
+    private final boolean isRow;
+
+    public FieldTimestampAssigner(int position, TypeInformation<?> valueType) {
+        Preconditions.checkArgument(
+                valueType instanceof TupleTypeInfoBase,
+                "The value type must be a Row or Tuple type, but is %s.",
+                valueType);
+        Preconditions.checkElementIndex(position, valueType.getArity());
+        this.position = position;
+        this.isRow = valueType instanceof RowTypeInfo;
+    }
+
+    @Override
+    public long extractTimestamp(Object element, long recordTimestamp) {
+        Object field =
+                isRow
+                        ? ((Row) element).getField(position)
+                        : ((Tuple) element).getField(position);
+        if (field instanceof Number) {
+            return ((Number) field).longValue();
+        } else if (field instanceof Instant) {
+            return ((Instant) field).toEpochMilli();
+        } else if (field instanceof Timestamp) {
+            return ((Timestamp) field).getTime();
+        } else {
+            throw new IllegalArgumentException(
+                    String.format(
+                            "The timestamp field %s of the element %s is not a number of "
+                                    + "milliseconds, an Instant or a Timestamp.",
+                            position,
+                            element));
+        }
+    }
+}
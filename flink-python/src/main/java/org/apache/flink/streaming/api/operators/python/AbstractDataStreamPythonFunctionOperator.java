@@ -38,6 +38,7 @@ import java.util.Collection;
 import java.util.HashMap;
 import java.util.Map;
 
+import static org.apache.flink.python.PythonOptions.STATE_READ_AHEAD_SIZE;
 import static org.apache.flink.streaming.api.utils.ProtoUtils.createRawTypeCoderInfoDescriptorProto;
 
 /** Base class for all Python DataStream operators. */
@@ -108,6 +109,8 @@ public abstract class AbstractDataStreamPythonFunctionOperator<OUT>
         if (numPartitions != null) {
             internalParameters.put(NUM_PARTITIONS, String.valueOf(numPartitions));
         }
+        internalParameters.put(
+                STATE_READ_AHEAD_SIZE.key(), String.valueOf(config.get(STATE_READ_AHEAD_SIZE)));
         return internalParameters;
     }
 
@@ -25,6 +25,7 @@ import org.apache.flink.configuration.ExecutionOptions;
 import org.apache.flink.core.memory.ByteArrayOutputStreamWithPos;
 import org.apache.flink.table.api.Table;
 import org.apache.flink.table.api.TableEnvironment;
+import org.apache.flink.table.api.TableResult;
 import org.apache.flink.table.api.internal.TableEnvironmentImpl;
 import org.apache.flink.table.api.internal.TableImpl;
 import org.apache.flink.table.data.ArrayData;
@@ -87,6 +88,7 @@ import org.apache.flink.table.types.logical.utils.LogicalTypeDefaultVisitor;
 import org.apache.flink.table.types.utils.TypeConversions;
 import org.apache.flink.types.Row;
 import org.apache.flink.types.RowKind;
+import org.apache.flink.util.CloseableIterator;
 
 import org.apache.flink.shaded.guava30.com.google.common.collect.LinkedHashMultiset;
 
@@ -474,54 +476,91 @@ public final class ArrowUtils {
     public static CustomIterator<byte[]> collectAsPandasDataFrame(
             Table table, int maxArrowBatchSize) throws Exception {
         checkArrowUsable();
-        BufferAllocator allocator =
-                getRootAllocator().newChildAllocator("collectAsPandasDataFrame", 0, Long.MAX_VALUE);
         RowType rowType =
                 (RowType) table.getResolvedSchema().toSourceRowDataType().getLogicalType();
-        DataType defaultRowDataType = TypeConversions.fromLogicalToDataType(rowType);
-        VectorSchemaRoot root =
-                VectorSchemaRoot.create(ArrowUtils.toArrowSchema(rowType), allocator);
-        ByteArrayOutputStream baos = new ByteArrayOutputStream();
-        ArrowStreamWriter arrowStreamWriter = new ArrowStreamWriter(root, null, baos);
-        arrowStreamWriter.start();
 
-        Iterator<Row> results = table.execute().collect();
+        CloseableIterator<Row> results = table.execute().collect();
         Iterator<Row> appendOnlyResults;
         if (isAppendOnlyTable(table)) {
             appendOnlyResults = results;
         } else {
             appendOnlyResults = filterOutRetractRows(results);
         }
+        return serializeAsArrowBatches(
+                "collectAsPandasDataFrame", appendOnlyResults, results, rowType, maxArrowBatchSize);
+    }
 
-        ArrowWriter arrowWriter = createRowDataArrowWriter(root, rowType);
-        Iterator convertedResults =
-                new Iterator<RowData>() {
+    /**
+     * Collects the results of the given {@link TableResult} as Arrow record batches. Only
+     * insert-only results are supported as the row kinds could not be represented in the batches.
+     */
+    public static CustomIterator<byte[]> collectAsArrowBatches(
+            TableResult tableResult, int maxArrowBatchSize) throws Exception {
+        checkArrowUsable();
+        RowType rowType =
+                (RowType) tableResult.getResolvedSchema().toSourceRowDataType().getLogicalType();
+
+        CloseableIterator<Row> results = tableResult.collect();
+        Iterator<Row> insertOnlyResults =
+                new Iterator<Row>() {
                     @Override
                     public boolean hasNext() {
-                        return appendOnlyResults.hasNext();
+                        return results.hasNext();
                     }
 
                     @Override
-                    public RowData next() {
-                        DataFormatConverters.DataFormatConverter converter =
-                                DataFormatConverters.getConverterForDataType(defaultRowDataType);
-                        return (RowData) converter.toInternal(appendOnlyResults.next());
+                    public Row next() {
+                        Row row = results.next();
+                        if (row.getKind() != RowKind.INSERT) {
+                            throw new UnsupportedOperationException(
+                                    String.format(
+                                            "Only insert-only results could be collected as Arrow "
+                                                    + "record batches, but got a row of kind %s. "
+                                                    + "Please use collect() instead.",
+                                            row.getKind()));
+                        }
+                        return row;
                     }
                 };
+        return serializeAsArrowBatches(
+                "collectAsArrowBatches", insertOnlyResults, results, rowType, maxArrowBatchSize);
+    }
+
+    private static CustomIterator<byte[]> serializeAsArrowBatches(
+            String allocatorName,
+            Iterator<Row> rows,
+            AutoCloseable source,
+            RowType rowType,
+            int maxArrowBatchSize)
+            throws Exception {
+        BufferAllocator allocator =
+                getRootAllocator().newChildAllocator(allocatorName, 0, Long.MAX_VALUE);
+        DataType defaultRowDataType = TypeConversions.fromLogicalToDataType(rowType);
+        VectorSchemaRoot root =
+                VectorSchemaRoot.create(ArrowUtils.toArrowSchema(rowType), allocator);
+        ByteArrayOutputStream baos = new ByteArrayOutputStream();
+        ArrowStreamWriter arrowStreamWriter = new ArrowStreamWriter(root, null, baos);
+        arrowStreamWriter.start();
+
+        ArrowWriter arrowWriter = createRowDataArrowWriter(root, rowType);
+        DataFormatConverters.DataFormatConverter converter =
+                DataFormatConverters.getConverterForDataType(defaultRowDataType);
 
         return new CustomIterator<byte[]>() {
+            private boolean closed = false;
+
             @Override
             public boolean hasNext() {
-                return convertedResults.hasNext();
+                return rows.hasNext();
             }
 
             @Override
             public byte[] next() {
                 try {
                     int i = 0;
-                    while (convertedResults.hasNext() && i < maxArrowBatchSize) {
+                    while (rows.hasNext() && i < maxArrowBatchSize) {
                         i++;
-                        arrowWriter.write(convertedResults.next());
+                        arrowWriter.write((RowData) converter.toInternal(rows.next()));
                     }
                     arrowWriter.finish();
                     arrowStreamWriter.writeBatch();
@@ -535,11 +574,26 @@ public final class ArrowUtils {
                     baos.reset();
 
                     if (!hasNext()) {
-                        root.close();
-                        allocator.close();
+                        close();
                     }
                 }
             }
+
+            @Override
+            public void close() {
+                if (closed) {
+                    return;
+                }
+                closed = true;
+                try {
+                    source.close();
+                } catch (Exception e) {
+                    LOG.warn("Failed to close the source of the Arrow record batches.", e);
+                } finally {
+                    root.close();
+                    allocator.close();
+                }
+            }
         };
     }
 
@@ -612,6 +666,8 @@ public final class ArrowUtils {
         boolean hasNext();
 
         T next();
+
+        void close();
     }
 
     private static class LogicalTypeToArrowTypeConverter
@@ -25,17 +25,30 @@ import org.apache.flink.table.runtime.arrow.ArrowUtils;
 import org.apache.flink.table.runtime.arrow.ArrowWriter;
 import org.apache.flink.table.types.logical.RowType;
 
+import org.apache.arrow.flatbuf.MessageHeader;
+import org.apache.arrow.memory.ArrowBuf;
 import org.apache.arrow.memory.BufferAllocator;
+import org.apache.arrow.vector.VectorLoader;
 import org.apache.arrow.vector.VectorSchemaRoot;
-import org.apache.arrow.vector.ipc.ArrowStreamReader;
 import org.apache.arrow.vector.ipc.ArrowStreamWriter;
+import org.apache.arrow.vector.ipc.ReadChannel;
+import org.apache.arrow.vector.ipc.message.ArrowRecordBatch;
+import org.apache.arrow.vector.ipc.message.MessageChannelReader;
+import org.apache.arrow.vector.ipc.message.MessageResult;
+import org.apache.arrow.vector.ipc.message.MessageSerializer;
 
 import java.io.IOException;
 import java.io.InputStream;
 import java.io.OutputStream;
+import java.nio.channels.Channels;
 
 /**
  * The base class ArrowSerializer which will serialize/deserialize RowType data to/from arrow bytes.
+ *
+ * <p>The schema is only written before the first arrow batch of an arrow stream and the following
+ * arrow batches are written as bare record batch messages until {@link #resetWriter()} is called.
+ * When reading, the schema is only expected when a new arrow stream begins and it's kept for the
+ * following bare record batch messages.
  */
 @Internal
 public final class ArrowSerializer {
@@ -57,9 +70,16 @@ public final class ArrowSerializer {
     private transient ArrowReader arrowReader;
 
     /**
-     * Reader which is responsible for convert the execution result from byte array to arrow format.
+     * Reader which is responsible for reading the arrow messages of the execution results from the
+     * byte array.
      */
-    private transient ArrowStreamReader arrowStreamReader;
+    private transient MessageChannelReader messageReader;
+
+    /** Container that holds a set of vectors for the execution results. */
+    private transient VectorSchemaRoot rootReader;
+
+    /** Loader which loads the arrow record batches of the execution results into rootReader. */
+    private transient VectorLoader vectorLoader;
 
     /**
      * Container that holds a set of vectors for the input elements to be sent to the Python worker.
@@ -87,21 +107,53 @@ public final class ArrowSerializer {
         this.bais = bais;
         this.baos = baos;
         allocator = ArrowUtils.getRootAllocator().newChildAllocator("allocator", 0, Long.MAX_VALUE);
-        arrowStreamReader = new ArrowStreamReader(bais, allocator);
+        messageReader =
+                new MessageChannelReader(new ReadChannel(Channels.newChannel(bais)), allocator);
 
         rootWriter = VectorSchemaRoot.create(ArrowUtils.toArrowSchema(inputType), allocator);
         arrowWriter = createArrowWriter();
-        arrowStreamWriter = new ArrowStreamWriter(rootWriter, null, baos);
-        arrowStreamWriter.start();
+        // the arrow stream writer is created lazily when the first arrow batch is finished
+        arrowStreamWriter = null;
     }
 
+    /**
+     * Loads the next arrow batch of the execution results. The arrow batch may be preceded by the
+     * schema if a new arrow stream begins.
+     */
     public int load() throws IOException {
-        arrowStreamReader.loadNextBatch();
-        VectorSchemaRoot root = arrowStreamReader.getVectorSchemaRoot();
-        if (arrowReader == null) {
-            arrowReader = createArrowReader(root);
+        MessageResult result = messageReader.readNext();
+        if (result != null && result.getMessage().headerType() == MessageHeader.Schema) {
+            if (rootReader != null) {
+                rootReader.close();
+            }
+            rootReader =
+                    VectorSchemaRoot.create(
+                            MessageSerializer.deserializeSchema(result.getMessage()), allocator);
+            vectorLoader = new VectorLoader(rootReader);
+            arrowReader = createArrowReader(rootReader);
+            result = messageReader.readNext();
+        }
+        if (result == null) {
+            throw new IOException("Unexpected end of the arrow stream.");
+        }
+        if (result.getMessage().headerType() != MessageHeader.RecordBatch) {
+            throw new IOException(
+                    "Expected RecordBatch but header was " + result.getMessage().headerType());
+        }
+        if (rootReader == null) {
+            throw new IOException("The schema should be received before the arrow batches.");
+        }
+
+        ArrowBuf bodyBuffer = result.getBodyBuffer();
+        // for zero-length batches, need an empty buffer to deserialize the batch
+        if (bodyBuffer == null) {
+            bodyBuffer = allocator.getEmpty();
+        }
+        try (ArrowRecordBatch batch =
+                MessageSerializer.deserializeRecordBatch(result.getMessage(), bodyBuffer)) {
+            vectorLoader.load(batch);
         }
-        return root.getRowCount();
+        return rootReader.getRowCount();
     }
 
     public RowData read(int i) {
@@ -113,8 +165,12 @@ public final class ArrowSerializer {
     }
 
     public void close() throws Exception {
-        arrowStreamWriter.end();
-        arrowStreamReader.close();
+        if (arrowStreamWriter != null) {
+            arrowStreamWriter.end();
+        }
+        if (rootReader != null) {
+            rootReader.close();
+        }
         rootWriter.close();
         allocator.close();
     }
@@ -134,18 +190,20 @@ public final class ArrowSerializer {
      */
     public void finishCurrentBatch() throws Exception {
         arrowWriter.finish();
+        if (arrowStreamWriter == null) {
+            arrowStreamWriter = new ArrowStreamWriter(rootWriter, null, baos);
+            arrowStreamWriter.start();
+        }
         arrowStreamWriter.writeBatch();
         arrowWriter.reset();
     }
 
-    public void resetReader() throws IOException {
-        arrowReader = null;
-        arrowStreamReader.close();
-        arrowStreamReader = new ArrowStreamReader(bais, allocator);
-    }
-
-    public void resetWriter() throws IOException {
-        arrowStreamWriter = new ArrowStreamWriter(rootWriter, null, baos);
-        arrowStreamWriter.start();
+    /**
+     * Starts a new arrow stream for the next arrow batch, i.e. the schema will be written again
+     * before it. It should be called when a bundle is finished as the next bundle may be processed
+     * by a new Python coder which has not received the schema yet.
+     */
+    public void resetWriter() {
+        arrowStreamWriter = null;
     }
 }
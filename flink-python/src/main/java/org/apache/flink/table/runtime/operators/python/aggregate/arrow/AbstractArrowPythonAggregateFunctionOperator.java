@@ -115,6 +115,15 @@ public abstract class AbstractArrowPythonAggregateFunctionOperator
         emitResults();
     }
 
+    @Override
+    protected void invokeFinishBundle() throws Exception {
+        super.invokeFinishBundle();
+        if (arrowSerializer != null) {
+            // the next bundle may be processed by a new Python coder, send the schema again
+            arrowSerializer.resetWriter();
+        }
+    }
+
     @Override
     public boolean isBundleFinished() {
         return elementCount == 0 && currentBatchCount == 0;
@@ -64,7 +64,6 @@ public class BatchArrowPythonGroupAggregateFunctionOperator
             elementCount += currentBatchCount;
             checkInvokeFinishBundleByCount();
             currentBatchCount = 0;
-            arrowSerializer.resetWriter();
         }
     }
 
@@ -100,6 +99,5 @@ public class BatchArrowPythonGroupAggregateFunctionOperator
             RowData result = arrowSerializer.read(i);
             rowDataWrapper.collect(reuseJoinedRow.replace(key, result));
         }
-        arrowSerializer.resetReader();
     }
 }
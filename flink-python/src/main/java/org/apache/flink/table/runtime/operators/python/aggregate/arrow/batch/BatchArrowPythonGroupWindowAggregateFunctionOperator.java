@@ -172,7 +172,6 @@ public class BatchArrowPythonGroupWindowAggregateFunctionOperator
             windowAggResult.replace(key, arrowSerializer.read(i));
             rowDataWrapper.collect(reuseJoinedRow.replace(windowAggResult, windowProperty));
         }
-        arrowSerializer.resetReader();
     }
 
     private void triggerWindowProcess() throws Exception {
@@ -193,7 +192,6 @@ public class BatchArrowPythonGroupWindowAggregateFunctionOperator
                 checkInvokeFinishBundleByCount();
                 currentBatchCount = 0;
                 baos.reset();
-                arrowSerializer.resetWriter();
             }
         }
     }
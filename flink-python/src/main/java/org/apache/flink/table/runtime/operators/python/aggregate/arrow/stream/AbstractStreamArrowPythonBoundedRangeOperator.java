@@ -126,7 +126,6 @@ public abstract class AbstractStreamArrowPythonBoundedRangeOperator<K>
                 rowDataWrapper.collect(reuseJoinedRow.replace(ele, data));
             }
         }
-        arrowSerializer.resetReader();
     }
 
     void registerCleanupTimer(long timestamp, TimeDomain domain) throws Exception {
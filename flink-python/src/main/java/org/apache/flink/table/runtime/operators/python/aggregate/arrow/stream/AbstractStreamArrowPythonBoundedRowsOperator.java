@@ -155,7 +155,6 @@ public abstract class AbstractStreamArrowPythonBoundedRowsOperator<K>
             reuseJoinedRow.setRowKind(key.getRowKind());
             rowDataWrapper.collect(reuseJoinedRow.replace(key, data));
         }
-        arrowSerializer.resetReader();
     }
 
     void registerProcessingCleanupTimer(long currentTime) throws Exception {
@@ -129,7 +129,6 @@ public abstract class AbstractStreamArrowPythonOverWindowAggregateFunctionOperat
             checkInvokeFinishBundleByCount();
             currentBatchCount = 0;
             baos.reset();
-            arrowSerializer.resetWriter();
         }
     }
 }
@@ -254,7 +254,6 @@ public class StreamArrowPythonGroupWindowAggregateFunctionOperator<K, W extends
             windowAggResult.replace(key, arrowSerializer.read(i));
             rowDataWrapper.collect(reuseJoinedRow.replace(windowAggResult, windowProperty));
         }
-        arrowSerializer.resetReader();
     }
 
     @Override
@@ -361,7 +360,6 @@ public class StreamArrowPythonGroupWindowAggregateFunctionOperator<K, W extends
                 checkInvokeFinishBundleByCount();
                 currentBatchCount = 0;
                 baos.reset();
-                arrowSerializer.resetWriter();
             }
         }
     }
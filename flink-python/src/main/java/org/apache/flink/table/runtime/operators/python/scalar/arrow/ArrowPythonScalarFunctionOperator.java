@@ -91,6 +91,10 @@ public class ArrowPythonScalarFunctionOperator extends AbstractPythonScalarFunct
     protected void invokeFinishBundle() throws Exception {
         invokeCurrentBatch();
         super.invokeFinishBundle();
+        if (arrowSerializer != null) {
+            // the next bundle may be processed by a new Python coder, send the schema again
+            arrowSerializer.resetWriter();
+        }
     }
 
     @Override
@@ -126,7 +130,6 @@ public class ArrowPythonScalarFunctionOperator extends AbstractPythonScalarFunct
             reuseJoinedRow.setRowKind(input.getRowKind());
             rowDataWrapper.collect(reuseJoinedRow.replace(input, arrowSerializer.read(i)));
         }
-        arrowSerializer.resetReader();
     }
 
     @Override
@@ -145,7 +148,6 @@ public class ArrowPythonScalarFunctionOperator extends AbstractPythonScalarFunct
             pythonFunctionRunner.process(baos.toByteArray());
             checkInvokeFinishBundleByCount();
             baos.reset();
-            arrowSerializer.resetWriter();
         }
     }
 }
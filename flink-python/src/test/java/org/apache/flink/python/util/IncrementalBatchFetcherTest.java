@@ -0,0 +1,201 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one or more
+ * contributor license agreements.  See the NOTICE file distributed with
+ * this work for additional information regarding copyright ownership.
+ * The ASF licenses this file to You under the Apache License, Version 2.0
+ * (the "License"); you may not use this file except in compliance with
+ * the License.  You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.apache.flink.python.util;
+
+import org.apache.flink.util.CloseableIterator;
+
+import org.junit.jupiter.api.Test;
+
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Iterator;
+import java.util.List;
+import java.util.concurrent.CountDownLatch;
+import java.util.concurrent.LinkedBlockingQueue;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.assertj.core.api.Assertions.assertThatThrownBy;
+
+/** Tests for {@link IncrementalBatchFetcher}. */
+class IncrementalBatchFetcherTest {
+
+    private static final Integer END = -1;
+
+    @Test
+    void testFetchFullAndPartialBatches() throws Exception {
+        try (IncrementalBatchFetcher<Integer> fetcher =
+                new IncrementalBatchFetcher<>(Arrays.asList(1, 2, 3, 4, 5).iterator(), 2)) {
+            assertThat(fetchAll(fetcher, 2)).containsExactly(1, 2, 3, 4, 5);
+            assertThat(fetcher.nextBatch(2)).isEmpty();
+        }
+    }
+
+    @Test
+    void testReturnAvailableElementsWithoutWaiting() throws Exception {
+        ManualIterator iterator = new ManualIterator();
+        try (IncrementalBatchFetcher<Integer> fetcher =
+                new IncrementalBatchFetcher<>(iterator, 100)) {
+            iterator.elements.put(1);
+            // only one element is available, the batch isn't filled up to the max size
+            assertThat(fetcher.nextBatch(100)).containsExactly(1);
+
+            iterator.elements.put(2);
+            iterator.elements.put(3);
+            iterator.elements.put(END);
+            assertThat(fetchAll(fetcher, 100)).containsExactly(2, 3);
+            assertThat(fetcher.nextBatch(100)).isEmpty();
+        }
+    }
+
+    @Test
+    void testCloseStopsFetching() throws Exception {
+        ManualIterator iterator = new ManualIterator();
+        IncrementalBatchFetcher<Integer> fetcher = new IncrementalBatchFetcher<>(iterator, 1);
+        // the fetch thread blocks on the full queue until it is closed
+        iterator.elements.put(1);
+        iterator.elements.put(2);
+        iterator.elements.put(END);
+        fetcher.close();
+        assertThat(iterator.closed).isTrue();
+    }
+
+    @Test
+    void testCloseWhileFetchIsBlocked() throws Exception {
+        ManualIterator iterator = new ManualIterator();
+        IncrementalBatchFetcher<Integer> fetcher = new IncrementalBatchFetcher<>(iterator, 1);
+        // the fetch thread blocks in hasNext until it is interrupted by closing the fetcher
+        fetcher.close();
+        assertThat(iterator.closed).isTrue();
+        // the iterator is only accessed by the fetch thread
+        assertThat(iterator.closingThread).isNotSameAs(Thread.currentThread());
+    }
+
+    @Test
+    void testCloseDoesNotWaitForUninterruptibleFetch() throws Exception {
+        CountDownLatch hasNextReleased = new CountDownLatch(1);
+        CountDownLatch iteratorClosed = new CountDownLatch(1);
+        CloseableIterator<Integer> iterator =
+                new CloseableIterator<Integer>() {
+                    @Override
+                    public boolean hasNext() {
+                        while (true) {
+                            try {
+                                hasNextReleased.await();
+                                return false;
+                            } catch (InterruptedException ignored) {
+                                // the interruption is ignored like in a busy retry loop
+                            }
+                        }
+                    }
+
+                    @Override
+                    public Integer next() {
+                        throw new UnsupportedOperationException();
+                    }
+
+                    @Override
+                    public void close() {
+                        iteratorClosed.countDown();
+                    }
+                };
+        IncrementalBatchFetcher<Integer> fetcher = new IncrementalBatchFetcher<>(iterator, 1, 10);
+        // returns after the close timeout although the fetch thread is still blocked
+        fetcher.close();
+        assertThat(iteratorClosed.getCount()).isOne();
+
+        // the iterator is closed by the fetch thread once the pending fetch returns
+        hasNextReleased.countDown();
+        iteratorClosed.await();
+    }
+
+    @Test
+    void testRethrowFailureAfterElements() throws Exception {
+        Iterator<Integer> iterator =
+                new Iterator<Integer>() {
+                    private int next = 0;
+
+                    @Override
+                    public boolean hasNext() {
+                        if (next == 2) {
+                            throw new IllegalStateException("expected failure");
+                        }
+                        return true;
+                    }
+
+                    @Override
+                    public Integer next() {
+                        return next++;
+                    }
+                };
+        try (IncrementalBatchFetcher<Integer> fetcher =
+                new IncrementalBatchFetcher<>(iterator, 10)) {
+            assertThat(fetchAll(fetcher, 10)).containsExactly(0, 1);
+            assertThatThrownBy(() -> fetcher.nextBatch(10))
+                    .isInstanceOf(IllegalStateException.class)
+                    .hasMessage("expected failure");
+        }
+    }
+
+    private static List<Integer> fetchAll(IncrementalBatchFetcher<Integer> fetcher, int maxSize)
+            throws Exception {
+        List<Integer> result = new ArrayList<>();
+        List<Integer> batch;
+        while (!(batch = fetcher.nextBatch(maxSize)).isEmpty()) {
+            assertThat(batch.size()).isLessThanOrEqualTo(maxSize);
+            result.addAll(batch);
+        }
+        return result;
+    }
+
+    /** An iterator whose elements are added by the test, it ends with {@link #END}. */
+    private static class ManualIterator implements CloseableIterator<Integer> {
+
+        private final LinkedBlockingQueue<Integer> elements = new LinkedBlockingQueue<>();
+
+        private Integer next;
+
+        private volatile boolean closed;
+
+        private volatile Thread closingThread;
+
+        @Override
+        public boolean hasNext() {
+            if (next == null) {
+                try {
+                    next = elements.take();
+                } catch (InterruptedException e) {
+                    throw new RuntimeException(e);
+                }
+            }
+            return !END.equals(next);
+        }
+
+        @Override
+        public Integer next() {
+            Integer result = next;
+            next = null;
+            return result;
+        }
+
+        @Override
+        public void close() {
+            closingThread = Thread.currentThread();
+            closed = true;
+        }
+    }
+}
@@ -131,16 +131,13 @@ public class PassThroughPythonAggregateFunctionRunner extends BeamTablePythonFun
                             RowData firstData = arrowSerializer.read(lowerBoundary);
                             arrowSerializer.write(firstData);
                         }
-                        arrowSerializer.resetReader();
                     } else {
                         arrowSerializer.load();
                         arrowSerializer.write(arrowSerializer.read(0));
-                        arrowSerializer.resetReader();
                     }
                     arrowSerializer.finishCurrentBatch();
                     buffer.add(baos.toByteArray());
                     baos.reset();
-                    arrowSerializer.resetWriter();
                 };
     }
 